@@ -14,7 +14,9 @@
 
 #pragma once
 
+#include <cstdint>
 #include <memory>
+#include <mutex>
 #include <string>
 
 #include "rclcpp/rclcpp.hpp"
@@ -149,6 +151,10 @@ class FaultManagerNode : public rclcpp::Node {
   /// Publisher for fault events (SSE streaming via gateway)
   rclcpp::Publisher<ros2_medkit_msgs::msg::FaultEvent>::SharedPtr event_publisher_;
 
+  /// Sequence number of the last published event (guarded by event_mutex_ so sequences go out in order)
+  uint64_t last_event_sequence_{0};
+  std::mutex event_mutex_;
+
   /// Snapshot capture for capturing topic data on fault confirmation.
   /// shared_ptr to allow safe capture-by-value in detached capture threads.
   std::shared_ptr<SnapshotCapture> snapshot_capture_;
@@ -579,7 +579,11 @@ void FaultManagerNode::publish_fault_event(const std::string & event_type, const
   event.timestamp = get_wall_clock_time();
   event.auto_cleared_codes = auto_cleared_codes;
 
-  event_publisher_->publish(event);
+  {
+    std::lock_guard<std::mutex> lock(event_mutex_);
+    event.sequence = ++last_event_sequence_;
+    event_publisher_->publish(event);
+  }
 
   RCLCPP_DEBUG(get_logger(), "Published fault event: %s for fault_code=%s", event_type.c_str(),
                fault.fault_code.c_str());
@@ -18,7 +18,9 @@
 #include <rclcpp/serialization.hpp>
 #include <rclcpp/serialized_message.hpp>
 #include <set>
+#include <string>
 #include <thread>
+#include <utility>
 
 #include "ros2_medkit_fault_manager/time_utils.hpp"
 #include "ros2_medkit_serialization/json_serializer.hpp"
@@ -212,14 +214,14 @@ bool SnapshotCapture::capture_topic_on_demand(const std::string & fault_code, co
     }
 
     ros2_medkit_serialization::JsonSerializer serializer;
-    auto json_data = serializer.deserialize(msg_type, captured_msg);
+    std::string json_data = serializer.deserialize_to_string(msg_type, captured_msg);
 
     // Store snapshot (use wall clock time, not sim time, for proper timestamps)
     SnapshotData snapshot;
     snapshot.fault_code = fault_code;
     snapshot.topic = topic;
     snapshot.message_type = msg_type;
-    snapshot.data = json_data.dump();
+    snapshot.data = std::move(json_data);
     snapshot.captured_at_ns = get_wall_clock_ns();
 
     storage_->store_snapshot(snapshot);
@@ -292,14 +294,15 @@ void SnapshotCapture::init_background_subscriptions() {
             return;  // Skip oversized messages silently
           }
 
+          // Runs for every message on the topic - stream CDR straight to JSON text
           ros2_medkit_serialization::JsonSerializer ser;
-          auto json_data = ser.deserialize(msg_type, *msg);
+          std::string json_data = ser.deserialize_to_string(msg_type, *msg);
 
           std::lock_guard<std::mutex> lock(cache_mutex_);
           auto & cached = message_cache_[topic];
           cached.topic = topic;
           cached.message_type = msg_type;
-          cached.data = json_data.dump();
+          cached.data = std::move(json_data);
           // Use wall clock time, not sim time, for proper timestamps
           cached.timestamp_ns = get_wall_clock_ns();
 
@@ -885,6 +885,19 @@ TEST_F(FaultEventPublishingTest, ClearNonExistentFaultNoEvent) {
   EXPECT_EQ(received_events_.size(), 0u);
 }
 
+TEST_F(FaultEventPublishingTest, EventsCarryConsecutiveSequenceNumbers) {
+  ASSERT_TRUE(call_report_fault("SEQ_FAULT", Fault::SEVERITY_ERROR, "/test_node"));
+  ASSERT_TRUE(call_report_fault("SEQ_FAULT", Fault::SEVERITY_ERROR, "/test_node"));
+  ASSERT_TRUE(call_clear_fault("SEQ_FAULT"));
+  spin_for(std::chrono::milliseconds(100));
+
+  // Subscribers rely on consecutive numbers to detect lost events
+  ASSERT_EQ(received_events_.size(), 3u);
+  for (size_t i = 0; i < received_events_.size(); ++i) {
+    EXPECT_EQ(received_events_[i].sequence, i + 1);
+  }
+}
+
 TEST_F(FaultEventPublishingTest, EventContainsCorrectTimestamp) {
   auto before = fault_manager_->now();
 
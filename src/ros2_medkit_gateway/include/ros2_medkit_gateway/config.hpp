@@ -14,6 +14,7 @@
 
 #pragma once
 
+#include <cstddef>
 #include <string>
 #include <vector>
 
@@ -116,4 +117,68 @@ class CorsConfigBuilder {
   CorsConfig config_;
 };
 
+/**
+ * @brief HTTP response compression settings
+ *
+ * Responses are compressed with gzip or zstd when the client advertises
+ * support via Accept-Encoding. Streaming responses (SSE, bulk-data
+ * downloads) and already-compressed content types are never compressed.
+ */
+struct CompressionConfig {
+  /// Whether response compression is enabled
+  bool enabled{true};
+
+  /// Responses smaller than this are sent uncompressed
+  size_t min_size_bytes{1024};
+
+  /// zlib compression level for gzip (1 = fastest, 9 = smallest)
+  int gzip_level{6};
+
+  /// zstd compression level (1 = fastest, 19 = smallest)
+  int zstd_level{3};
+
+  /// Request path substrings that opt a route out of compression
+  std::vector<std::string> excluded_paths;
+
+  /// Validate the configuration
+  /// @return Empty string if valid, error message otherwise
+  [[nodiscard]] std::string validate() const;
+};
+
+/**
+ * @brief HTTP worker pool, keep-alive and backpressure settings
+ *
+ * Connections are served by a fixed pool of worker threads. Routes that make
+ * ROS round-trips (topic sampling, parameter and service calls) are further
+ * limited to a share of those workers, so cache-served routes and /health
+ * keep a reserve of workers under load. When either queue is full the
+ * request is answered with 503 Service Unavailable and a Retry-After header.
+ */
+struct ServerLimitsConfig {
+  /// Worker threads serving HTTP connections
+  size_t worker_threads{32};
+
+  /// Accepted connections allowed to wait for a free worker
+  size_t max_queued_connections{128};
+
+  /// Slow (ROS round-trip) requests allowed to run concurrently
+  size_t slow_route_concurrency{8};
+
+  /// Slow requests allowed to wait for a slow-route slot
+  size_t slow_route_queue{8};
+
+  /// Requests served per keep-alive connection before it is closed
+  size_t keep_alive_max_count{100};
+
+  /// Idle time in seconds before a keep-alive connection is closed
+  int keep_alive_timeout_sec{5};
+
+  /// Value of the Retry-After header sent with 503 responses, in seconds
+  int retry_after_sec{1};
+
+  /// Validate the configuration
+  /// @return Empty string if valid, error message otherwise
+  [[nodiscard]] std::string validate() const;
+};
+
 }  // namespace ros2_medkit_gateway
@@ -14,14 +14,25 @@
 
 #pragma once
 
+#include <atomic>
+#include <chrono>
+#include <condition_variable>
+#include <cstdint>
 #include <map>
 #include <memory>
 #include <mutex>
 #include <nlohmann/json.hpp>
+#include <optional>
+#include <rcl_interfaces/msg/parameter_event.hpp>
 #include <rclcpp/rclcpp.hpp>
 #include <string>
+#include <thread>
+#include <utility>
 #include <vector>
 
+#include "ros2_medkit_gateway/metrics_registry.hpp"
+#include "ros2_medkit_gateway/single_flight.hpp"
+
 namespace ros2_medkit_gateway {
 
 using json = nlohmann::json;
@@ -50,20 +61,34 @@ struct ParameterResult {
 /// Manager for ROS2 node parameters
 /// Provides CRUD operations on node parameters via native rclcpp APIs
 /// Also caches initial parameter values as "defaults" for reset operations
+///
+/// Parameter values read from a node are cached and kept current from
+/// /parameter_events, so repeated reads are served from memory
+/// (parameter_cache.enabled; bypass per call with fresh = true).
+///
+/// Thread-safe. Operations on different nodes run concurrently (up to
+/// parameter_max_concurrent_requests at a time); operations on the same node
+/// are serialized so writes and resets are applied in request order.
 class ConfigurationManager {
  public:
   explicit ConfigurationManager(rclcpp::Node * node);
+  ~ConfigurationManager();
+
+  ConfigurationManager(const ConfigurationManager &) = delete;
+  ConfigurationManager & operator=(const ConfigurationManager &) = delete;
 
   /// List all parameters for a node
   /// @param node_name Fully qualified node name (e.g., "/powertrain/engine/engine_temp_sensor")
+  /// @param fresh Query the node even if its parameters are cached
   /// @return ParameterResult with array of {name, value, type} objects
-  ParameterResult list_parameters(const std::string & node_name);
+  ParameterResult list_parameters(const std::string & node_name, bool fresh = false);
 
   /// Get a specific parameter value
   /// @param node_name Fully qualified node name
   /// @param param_name Parameter name
+  /// @param fresh Query the node even if the parameter is cached
   /// @return ParameterResult with {name, value, type, description, read_only}
-  ParameterResult get_parameter(const std::string & node_name, const std::string & param_name);
+  ParameterResult get_parameter(const std::string & node_name, const std::string & param_name, bool fresh = false);
 
   /// Set a parameter value
   /// @param node_name Fully qualified node name
@@ -72,6 +97,15 @@ class ConfigurationManager {
   /// @return ParameterResult with {name, value, type}
   ParameterResult set_parameter(const std::string & node_name, const std::string & param_name, const json & value);
 
+  /// Set several parameters of one node with a single set_parameters call
+  /// @param node_name Fully qualified node name
+  /// @param values Parameter names and new values (converted as in set_parameter())
+  /// @param atomic Apply all values or none (set_parameters_atomically); nothing is sent if any value is invalid
+  /// @return One ParameterResult per entry of @p values, in the same order, each with {name, value, type}
+  std::vector<ParameterResult> set_parameters(const std::string & node_name,
+                                              const std::vector<std::pair<std::string, json>> & values,
+                                              bool atomic = false);
+
   /// Reset a specific parameter to its default (initial) value
   /// @param node_name Fully qualified node name
   /// @param param_name Parameter name
@@ -83,13 +117,77 @@ class ConfigurationManager {
   /// @return ParameterResult with count of reset parameters
   ParameterResult reset_all_parameters(const std::string & node_name);
 
+  /// Record parameter service latency per target node in @p metrics (nullptr disables)
+  void set_metrics_registry(MetricsRegistry * metrics);
+
  private:
-  /// Get or create a SyncParametersClient for the given node
-  std::shared_ptr<rclcpp::SyncParametersClient> get_param_client(const std::string & node_name);
+  /// Parameters of one node as last read from it, updated from /parameter_events
+  struct CachedNodeParameters {
+    std::map<std::string, rclcpp::Parameter> values;
+    std::map<std::string, rcl_interfaces::msg::ParameterDescriptor> descriptors;
+    bool complete{false};  ///< values holds every parameter of the node (stored from a full listing)
+    std::chrono::steady_clock::time_point loaded_at;
+  };
+
+  /// Serve list_parameters() / get_parameter() from the cache (nullopt on a miss)
+  std::optional<ParameterResult> cached_list_parameters(const std::string & node_name);
+  std::optional<ParameterResult> cached_get_parameter(const std::string & node_name, const std::string & param_name);
+
+  /// Cached entry for a node if usable: present, not expired, and the node still serves parameters
+  /// Must be called with cache_mutex_ held
+  CachedNodeParameters * find_cached_node(const std::string & node_name);
+
+  /// Change counter of a node's parameters; a read that started at an older version is not cached
+  uint64_t cache_version(const std::string & node_name);
+
+  /// Store results of reads that started at @p version (dropped if the node changed meanwhile)
+  void cache_listing(const std::string & node_name, uint64_t version, const std::vector<rclcpp::Parameter> & params);
+  void cache_parameter(const std::string & node_name, uint64_t version, const rclcpp::Parameter & param,
+                       const std::optional<rcl_interfaces::msg::ParameterDescriptor> & descriptor);
+
+  /// Record values written by this gateway (before their parameter event arrives)
+  void cache_written(const std::string & node_name, const std::vector<rclcpp::Parameter> & params);
+
+  /// /parameter_events callback
+  void on_parameter_event(const rcl_interfaces::msg::ParameterEvent & event);
+
+  /// Round trips behind list_parameters() / get_parameter(), run once per set of concurrent identical calls
+  ParameterResult call_list_parameters(const std::string & node_name);
+  ParameterResult call_get_parameter(const std::string & node_name, const std::string & param_name);
+
+  /// Get or create an AsyncParametersClient for the given node
+  std::shared_ptr<rclcpp::AsyncParametersClient> get_param_client(const std::string & node_name);
+
+  /// Mutex serializing operations on one target node
+  std::shared_ptr<std::mutex> get_node_mutex(const std::string & node_name);
+
+  /// Holds one of the max_concurrent_requests_ slots for its lifetime
+  class RequestSlot {
+   public:
+    explicit RequestSlot(ConfigurationManager & manager);
+    ~RequestSlot();
+    RequestSlot(const RequestSlot &) = delete;
+    RequestSlot & operator=(const RequestSlot &) = delete;
+
+   private:
+    ConfigurationManager & manager_;
+  };
+
+  /// Current types of @p names on a node (cached types first, then one batch get)
+  std::map<std::string, rclcpp::ParameterType>
+  fetch_parameter_types(const std::shared_ptr<rclcpp::AsyncParametersClient> & client, const std::string & node_name,
+                        const std::vector<std::string> & names);
 
   /// Cache default values for a node (called on first access)
   void cache_default_values(const std::string & node_name);
 
+  /// Store @p parameters as the defaults of @p node_name unless defaults are already cached
+  void store_default_values(const std::string & node_name, const std::vector<rclcpp::Parameter> & parameters);
+
+  /// Fetch values of all parameters of a node (batch get, falling back to one by one)
+  std::vector<rclcpp::Parameter> fetch_all_parameters(const std::shared_ptr<rclcpp::AsyncParametersClient> & client,
+                                                      const std::string & node_name);
+
   /// Convert ROS2 parameter type to string
   static std::string parameter_type_to_string(rclcpp::ParameterType type);
 
@@ -102,30 +200,57 @@ class ConfigurationManager {
   /// Get the service timeout as a chrono duration
   std::chrono::duration<double> get_service_timeout() const;
 
+  /// Get parameter_cache.max_age_sec as a chrono duration
+  std::chrono::duration<double> get_max_age() const;
+
   rclcpp::Node * node_;
 
-  /// Internal node for parameter client operations
-  /// SyncParametersClient requires a node that is NOT in an executor
-  /// to perform synchronous operations (spinning internally)
+  /// Internal node owning the parameter clients
+  /// Spun by param_executor_ on param_spin_thread_, so any number of callers can
+  /// wait on client futures at the same time (nothing spins on the caller thread)
   std::shared_ptr<rclcpp::Node> param_node_;
+  std::shared_ptr<rclcpp::executors::SingleThreadedExecutor> param_executor_;
+  std::thread param_spin_thread_;
+  std::atomic<bool> param_spinning_{true};
 
-  /// Timeout for waiting for parameter services (configurable via parameter_service_timeout_sec parameter)
+  /// Timeout for waiting for parameter services and their responses
+  /// (configurable via parameter_service_timeout_sec parameter)
   double service_timeout_sec_{2.0};
 
+  /// Maximum parameter operations in flight (configurable via parameter_max_concurrent_requests)
+  size_t max_concurrent_requests_{32};
+  std::mutex slots_mutex_;
+  std::condition_variable slots_cv_;
+  size_t requests_in_flight_{0};
+
+  /// Parameter value cache (parameter_cache.* parameters)
+  bool cache_enabled_{true};
+  double cache_max_age_sec_{60.0};  ///< 0 = entries never expire
+  std::mutex cache_mutex_;
+  std::map<std::string, CachedNodeParameters> parameter_cache_;
+  std::map<std::string, uint64_t> cache_versions_;
+  rclcpp::Subscription<rcl_interfaces::msg::ParameterEvent>::SharedPtr parameter_events_sub_;
+
+  /// Gateway metrics (owned by GatewayNode, may be null)
+  MetricsRegistry * metrics_{nullptr};
+
   /// Cache of parameter clients per node (avoids recreating clients)
   mutable std::mutex clients_mutex_;
-  std::map<std::string, std::shared_ptr<rclcpp::SyncParametersClient>> param_clients_;
+  std::map<std::string, std::shared_ptr<rclcpp::AsyncParametersClient>> param_clients_;
+
+  /// Per-node operation mutexes (created on first use, never removed)
+  std::mutex node_mutexes_mutex_;
+  std::map<std::string, std::shared_ptr<std::mutex>> node_mutexes_;
 
   /// Cache of default parameter values per node
   /// Key: node_name, Value: map of param_name -> Parameter
   mutable std::mutex defaults_mutex_;
   std::map<std::string, std::map<std::string, rclcpp::Parameter>> default_values_;
 
-  /// Mutex to serialize all parameter operations.
-  /// SyncParametersClient internally spins param_node_ via spin_node_until_future_complete(),
-  /// which is not thread-safe. Concurrent HTTP requests would cause:
-  /// "Node '/_param_client_node' has already been added to an executor"
-  mutable std::mutex param_operations_mutex_;
+  /// Concurrent reads of the same node/parameter share one round trip instead of
+  /// queueing on the node mutex one after another
+  SingleFlight<ParameterResult> list_flights_;
+  SingleFlight<ParameterResult> get_flights_;
 };
 
 }  // namespace ros2_medkit_gateway
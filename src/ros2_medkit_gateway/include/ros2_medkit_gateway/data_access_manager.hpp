@@ -24,6 +24,7 @@
 #include <vector>
 
 #include "ros2_medkit_gateway/native_topic_sampler.hpp"
+#include "ros2_medkit_gateway/single_flight.hpp"
 #include "ros2_medkit_gateway/type_introspection.hpp"
 #include "ros2_medkit_serialization/json_serializer.hpp"
 
@@ -68,6 +69,13 @@ class DataAccessManager {
     return type_introspection_.get();
   }
 
+  /**
+   * @brief Whether type info should be prebuilt for discovered topic types on cache refresh
+   */
+  bool is_type_cache_prewarm_enabled() const {
+    return type_cache_prewarm_;
+  }
+
   /**
    * @brief Get the native topic sampler instance
    *
@@ -88,6 +96,29 @@ class DataAccessManager {
    */
   json get_topic_sample_native(const std::string & topic_name, double timeout_sec = 1.0);
 
+  /**
+   * @brief Sample a topic with an optional projection
+   *
+   * Concurrent calls for the same topic, timeout and projection share one
+   * sample instead of each opening a subscription.
+   *
+   * @param topic_name Full topic path
+   * @param projection Fields and array decimation applied to the sample
+   * @param timeout_sec Timeout for sampling. Use -1.0 to use the topic_sample_timeout_sec parameter (default)
+   * @return Sample result (metadata only if no message arrived in time)
+   * @throws ros2_medkit_serialization::FieldProjectionError if a selected field does not exist in the type
+   */
+  TopicSampleResult sample_topic(const std::string & topic_name,
+                                 const ros2_medkit_serialization::ProjectionOptions & projection,
+                                 double timeout_sec = -1.0);
+
+  /**
+   * @brief Number of sample requests that joined an identical sample already in flight
+   */
+  uint64_t coalesced_samples() const {
+    return sample_flights_.shared_calls();
+  }
+
   /**
    * @brief Get the configured topic sample timeout
    * @return Timeout in seconds for topic sampling
@@ -126,6 +157,10 @@ class DataAccessManager {
   std::unique_ptr<NativeTopicSampler> native_sampler_;
   int max_parallel_samples_;
   double topic_sample_timeout_sec_;
+  bool type_cache_prewarm_;
+
+  /// Concurrent samples of the same topic and projection share one subscription round trip
+  SingleFlight<TopicSampleResult> sample_flights_;
 
   /**
    * @brief Get default timeout for topic sampling (from parameter)
@@ -44,6 +44,7 @@ struct DiscoveryConfig {
   DiscoveryMode mode{DiscoveryMode::RUNTIME_ONLY};
   std::string manifest_path;
   bool manifest_strict_validation{true};
+  std::string manifest_cache_dir;  ///< Compiled manifest cache directory (empty = disabled)
 
   /**
    * @brief Runtime (heuristic) discovery options
@@ -21,6 +21,7 @@
 
 #include <rclcpp/rclcpp.hpp>
 
+#include <cstdint>
 #include <memory>
 #include <mutex>
 #include <string>
@@ -91,7 +92,9 @@ class HybridDiscoveryStrategy : public DiscoveryStrategy {
    * @brief Refresh runtime linking
    *
    * Call this after runtime discovery refresh to update app-node bindings.
-   * This will re-run the RuntimeLinker with fresh runtime component data.
+   * This will re-run the RuntimeLinker with fresh runtime component data,
+   * unless neither the manifest revision nor the runtime graph changed since
+   * the last linking, in which case the cached result is kept.
    */
   void refresh_linking();
 
@@ -127,6 +130,8 @@ class HybridDiscoveryStrategy : public DiscoveryStrategy {
   RuntimeDiscoveryStrategy * runtime_strategy_;
   RuntimeLinker linker_;
   LinkingResult linking_result_;
+  uint64_t linked_revision_{0};  ///< Manifest revision linking_result_ was computed from
+  bool has_linked_{false};
   mutable std::mutex mutex_;
 };
 
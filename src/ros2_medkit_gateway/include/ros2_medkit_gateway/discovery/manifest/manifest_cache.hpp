@@ -0,0 +1,88 @@
+// Copyright 2026 bburda
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+#pragma once
+
+#include "ros2_medkit_gateway/discovery/manifest/manifest.hpp"
+#include "ros2_medkit_gateway/discovery/manifest/validation_error.hpp"
+
+#include <optional>
+#include <string>
+
+namespace ros2_medkit_gateway {
+namespace discovery {
+
+/**
+ * @brief A parsed manifest together with the validation result it passed with
+ */
+struct CompiledManifest {
+  Manifest manifest;
+  ValidationResult validation;
+};
+
+/**
+ * @brief On-disk cache of parsed and validated manifests
+ *
+ * Parsing and validating a large manifest dominates gateway startup and
+ * hot reload. The cache stores the result in a compact binary file (MessagePack)
+ * keyed by a hash of the manifest YAML, so an unchanged manifest is loaded by
+ * memory-mapping that file instead of parsing and validating it again.
+ *
+ * Only manifests without validation errors are stored. Warnings are kept so
+ * strict mode still rejects the cached manifest, and so they can be reported.
+ * Unreadable, truncated or outdated cache files are treated as a miss.
+ *
+ * Not thread-safe: ManifestManager calls it under its own lock.
+ */
+class ManifestCache {
+ public:
+  /**
+   * @brief Constructor
+   * @param cache_dir Directory for cache files (created on first store)
+   */
+  explicit ManifestCache(std::string cache_dir);
+
+  /**
+   * @brief Stable content hash used as cache key
+   * @param content Manifest YAML
+   * @return 16 hex digit FNV-1a 64-bit hash
+   */
+  static std::string content_hash(const std::string & content);
+
+  /**
+   * @brief Load the compiled manifest stored for a content hash
+   * @param hash Hash returned by content_hash()
+   * @return Compiled manifest, or nullopt on a miss or an unusable file
+   */
+  std::optional<CompiledManifest> load(const std::string & hash) const;
+
+  /**
+   * @brief Store a compiled manifest for a content hash
+   *
+   * Writes to a temporary file and renames it into place, then removes cache
+   * files of other hashes (only the current manifest is kept).
+   *
+   * @return true if the cache file was written
+   */
+  bool store(const std::string & hash, const CompiledManifest & compiled) const;
+
+  /// Path of the cache file for a content hash
+  std::string cache_path(const std::string & hash) const;
+
+ private:
+  std::string cache_dir_;
+};
+
+}  // namespace discovery
+}  // namespace ros2_medkit_gateway
@@ -15,12 +15,15 @@
 #pragma once
 
 #include "ros2_medkit_gateway/discovery/manifest/manifest.hpp"
+#include "ros2_medkit_gateway/discovery/manifest/manifest_cache.hpp"
 #include "ros2_medkit_gateway/discovery/manifest/manifest_parser.hpp"
 #include "ros2_medkit_gateway/discovery/manifest/manifest_validator.hpp"
 #include "ros2_medkit_gateway/discovery/manifest/validation_error.hpp"
 
 #include <rclcpp/rclcpp.hpp>
 
+#include <cstdint>
+#include <memory>
 #include <mutex>
 #include <nlohmann/json.hpp>
 #include <optional>
@@ -49,6 +52,17 @@ class ManifestManager {
 
   // === Manifest Loading ===
 
+  /**
+   * @brief Enable the compiled manifest cache
+   *
+   * Manifests loaded from a file afterwards are looked up by content hash in
+   * @p cache_dir; an unchanged manifest skips parsing and validation. Manifests
+   * that pass validation are written back to the cache.
+   *
+   * @param cache_dir Cache directory (empty disables the cache)
+   */
+  void set_cache_dir(const std::string & cache_dir);
+
   /**
    * @brief Load manifest from file
    * @param file_path Path to manifest YAML file
@@ -109,6 +123,15 @@ class ManifestManager {
    */
   ManifestConfig get_config() const;
 
+  /**
+   * @brief Get manifest revision
+   *
+   * Incremented every time a manifest is loaded, reloaded or unloaded, so
+   * consumers can cache results derived from the manifest and recompute them
+   * only when the revision changes.
+   */
+  uint64_t get_revision() const;
+
   // === Entity Access ===
 
   /**
@@ -196,6 +219,16 @@ class ManifestManager {
   /// Build lookup maps after loading manifest
   void build_lookup_maps();
 
+  /**
+   * @brief Install a parsed manifest given its validation result
+   *
+   * Stores @p validation as validation_result_. Errors always reject the
+   * manifest; warnings reject it in strict mode and are logged otherwise.
+   *
+   * @return true if the manifest was installed
+   */
+  bool install(Manifest loaded, ValidationResult validation, bool strict);
+
   /// Log info message (handles null node)
   void log_info(const std::string & msg) const;
   /// Log warning message
@@ -210,6 +243,8 @@ class ManifestManager {
   std::string manifest_path_;
   ValidationResult validation_result_;
   bool strict_mode_{true};
+  uint64_t revision_{0};
+  std::unique_ptr<ManifestCache> cache_;  ///< Compiled manifest cache (null = disabled)
 
   ManifestParser parser_;
   ManifestValidator validator_;
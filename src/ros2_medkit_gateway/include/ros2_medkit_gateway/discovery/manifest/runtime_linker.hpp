@@ -20,8 +20,8 @@
 
 #include <rclcpp/rclcpp.hpp>
 
+#include <map>
 #include <optional>
-#include <set>
 #include <string>
 #include <unordered_map>
 #include <vector>
@@ -76,6 +76,11 @@ struct LinkingResult {
  * 1. Exact match: node_name + namespace both match
  * 2. Wildcard namespace: node_name matches, namespace is "*"
  * 3. Topic namespace: topic_namespace prefix matches node's topics
+ *
+ * An app binds to the first runtime node (in discovery order) that matches.
+ * Candidates come from indexes over the runtime graph (node name, FQN segments,
+ * topic names) rather than a scan of every node per app; the indexes are
+ * rebuilt only when the graph passed to link() differs from the previous one.
  */
 class RuntimeLinker {
  public:
@@ -96,6 +101,17 @@ class RuntimeLinker {
   LinkingResult link(const std::vector<App> & apps, const std::vector<Component> & runtime_components,
                      const ManifestConfig & config);
 
+  /**
+   * @brief Check whether the runtime graph differs from the one last linked
+   *
+   * Compares everything linking reads (node FQN, name, namespace, topics,
+   * services, actions), so callers can skip relinking an unchanged graph.
+   *
+   * @param runtime_components Components discovered from ROS graph
+   * @return true if nodes were added, removed, reordered or changed
+   */
+  bool graph_changed(const std::vector<Component> & runtime_components) const;
+
   /**
    * @brief Check if a specific app is linked to a runtime node
    * @param app_id App identifier
@@ -125,24 +141,32 @@ class RuntimeLinker {
   }
 
  private:
+  /// Runtime node matched to a binding
+  struct NodeMatch {
+    size_t position;  ///< Index into nodes_
+    bool by_topic;    ///< Matched via topic_namespace rather than node name
+  };
+
   /**
-   * @brief Try to match a ROS node to an app's binding
+   * @brief Replace the graph snapshot and rebuild the node indexes
+   * @param runtime_components Components discovered from ROS graph
+   */
+  void rebuild_node_index(const std::vector<Component> & runtime_components);
+
+  /**
+   * @brief Find the first runtime node matching a binding
    * @param binding The app's ROS binding configuration
-   * @param node_fqn Fully qualified node name
-   * @param node_name Node name (without namespace)
-   * @param node_namespace Node namespace
-   * @return true if binding matches
+   * @return Matched node, or nullopt if no node matches
    */
-  bool matches_binding(const App::RosBinding & binding, const std::string & node_fqn, const std::string & node_name,
-                       const std::string & node_namespace) const;
+  std::optional<NodeMatch> find_match(const App::RosBinding & binding) const;
 
   /**
-   * @brief Try to match by topic namespace
-   * @param topic_namespace Topic namespace pattern from binding
-   * @param component Component with topic info
-   * @return true if any topic matches the prefix
+   * @brief Check a node namespace against the binding's namespace pattern
+   * @param binding The app's ROS binding configuration
+   * @param node_namespace Node namespace
+   * @return true if the namespace matches ("*", exact or prefix)
    */
-  bool matches_topic_namespace(const std::string & topic_namespace, const Component & component) const;
+  bool matches_namespace(const App::RosBinding & binding, const std::string & node_namespace) const;
 
   /**
    * @brief Enrich app with runtime data from matched component
@@ -173,6 +197,16 @@ class RuntimeLinker {
 
   rclcpp::Node * node_;
   LinkingResult last_result_;
+
+  // Graph snapshot of the last link() call and indexes into it (positions into nodes_, ascending)
+  std::vector<Component> nodes_;
+  std::unordered_map<std::string, size_t> node_by_fqn_;
+  std::unordered_map<std::string, std::vector<size_t>> nodes_by_name_;
+  /// FQN text after each '/' (e.g. "nav/controller" and "controller" for "/nav/controller"),
+  /// ordered so a binding's node_name is found with a prefix range scan
+  std::map<std::string, std::vector<size_t>> nodes_by_fqn_suffix_;
+  /// Published and subscribed topic names, ordered for topic_namespace prefix range scans
+  std::map<std::string, std::vector<size_t>> nodes_by_topic_;
 };
 
 }  // namespace discovery
@@ -15,6 +15,7 @@
 #pragma once
 
 #include "ros2_medkit_gateway/discovery/models/common.hpp"
+#include "ros2_medkit_gateway/discovery/models/interned_string.hpp"
 
 #include <nlohmann/json.hpp>
 #include <optional>
@@ -37,8 +38,8 @@ using json = nlohmann::json;
  */
 struct App {
   // === Required fields ===
-  std::string id;    ///< Unique identifier
-  std::string name;  ///< Human-readable name
+  InternedString id;  ///< Unique identifier
+  std::string name;   ///< Human-readable name
 
   // === Optional SOVD fields ===
   std::string translation_id;     ///< For i18n support
@@ -46,7 +47,7 @@ struct App {
   std::vector<std::string> tags;  ///< Tags for filtering
 
   // === Relationships ===
-  std::string component_id;             ///< is-located-on relationship
+  InternedString component_id;          ///< is-located-on relationship
   std::vector<std::string> depends_on;  ///< depends-on relationship (App IDs)
 
   // === ROS binding (for manifest) ===
@@ -91,7 +92,7 @@ struct App {
   std::vector<ActionInfo> actions;
 
   // === Discovery metadata ===
-  std::string source = "manifest";  ///< "manifest" or "runtime"
+  InternedString source = "manifest";  ///< "manifest" or "runtime"
 
   // === Serialization methods ===
 
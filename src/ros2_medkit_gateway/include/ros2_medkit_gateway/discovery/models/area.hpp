@@ -14,6 +14,8 @@
 
 #pragma once
 
+#include "ros2_medkit_gateway/discovery/models/interned_string.hpp"
+
 #include <nlohmann/json.hpp>
 #include <string>
 #include <vector>
@@ -29,14 +31,14 @@ using json = nlohmann::json;
  * They provide a hierarchical organization of components.
  */
 struct Area {
-  std::string id;                 ///< Unique identifier (e.g., "powertrain")
+  InternedString id;              ///< Unique identifier (e.g., "powertrain")
   std::string name;               ///< Human-readable name (e.g., "Powertrain System")
-  std::string namespace_path;     ///< ROS 2 namespace path (e.g., "/powertrain")
-  std::string type = "Area";      ///< Entity type (always "Area")
+  InternedString namespace_path;  ///< ROS 2 namespace path (e.g., "/powertrain")
+  InternedString type = "Area";   ///< Entity type (always "Area")
   std::string translation_id;     ///< Internationalization key
   std::string description;        ///< Human-readable description
   std::vector<std::string> tags;  ///< Tags for filtering
-  std::string parent_area_id;     ///< Parent area ID for sub-areas
+  InternedString parent_area_id;  ///< Parent area ID for sub-areas
 
   /**
    * @brief Convert to JSON representation
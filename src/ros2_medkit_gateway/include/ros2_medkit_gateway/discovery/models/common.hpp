@@ -14,6 +14,8 @@
 
 #pragma once
 
+#include "ros2_medkit_gateway/discovery/models/interned_string.hpp"
+
 #include <nlohmann/json.hpp>
 #include <optional>
 #include <string>
@@ -48,7 +50,7 @@ struct QosProfile {
 struct TopicEndpoint {
   std::string node_name;       ///< Name of the node (e.g., "controller_server")
   std::string node_namespace;  ///< Namespace of the node (e.g., "/navigation")
-  std::string topic_type;      ///< Message type (e.g., "geometry_msgs/msg/Twist")
+  InternedString topic_type;   ///< Message type (e.g., "geometry_msgs/msg/Twist")
   QosProfile qos;              ///< QoS profile of this endpoint
 
   /// Get fully qualified node name
@@ -68,8 +70,8 @@ struct TopicEndpoint {
  * @brief Topic with its publishers and subscribers
  */
 struct TopicConnection {
-  std::string topic_name;  ///< Full topic path (e.g., "/cmd_vel")
-  std::string topic_type;  ///< Message type
+  std::string topic_name;     ///< Full topic path (e.g., "/cmd_vel")
+  InternedString topic_type;  ///< Message type
   std::vector<TopicEndpoint> publishers;
   std::vector<TopicEndpoint> subscribers;
 
@@ -104,7 +106,7 @@ struct ComponentTopics {
 struct ServiceInfo {
   std::string name;               ///< Service name (e.g., "calibrate")
   std::string full_path;          ///< Full service path (e.g., "/powertrain/engine/calibrate")
-  std::string type;               ///< Service type (e.g., "std_srvs/srv/Trigger")
+  InternedString type;            ///< Service type (e.g., "std_srvs/srv/Trigger")
   std::optional<json> type_info;  ///< Schema info with request/response schemas
 
   json to_json() const {
@@ -122,7 +124,7 @@ struct ServiceInfo {
 struct ActionInfo {
   std::string name;               ///< Action name (e.g., "navigate_to_pose")
   std::string full_path;          ///< Full action path (e.g., "/navigation/navigate_to_pose")
-  std::string type;               ///< Action type (e.g., "nav2_msgs/action/NavigateToPose")
+  InternedString type;            ///< Action type (e.g., "nav2_msgs/action/NavigateToPose")
   std::optional<json> type_info;  ///< Schema info with goal/result/feedback schemas
 
   json to_json() const {
@@ -15,6 +15,7 @@
 #pragma once
 
 #include "ros2_medkit_gateway/discovery/models/common.hpp"
+#include "ros2_medkit_gateway/discovery/models/interned_string.hpp"
 
 #include <nlohmann/json.hpp>
 #include <string>
@@ -31,18 +32,18 @@ using json = nlohmann::json;
  * They expose operations (services/actions), data (topics), and configurations (parameters).
  */
 struct Component {
-  std::string id;                       ///< Unique identifier (node name)
+  InternedString id;                    ///< Unique identifier (node name)
   std::string name;                     ///< Human-readable name
-  std::string namespace_path;           ///< ROS 2 namespace path
+  InternedString namespace_path;        ///< ROS 2 namespace path
   std::string fqn;                      ///< Fully qualified name (namespace + id)
-  std::string type = "Component";       ///< Entity type (always "Component")
-  std::string area;                     ///< Parent area ID
-  std::string source = "node";          ///< Discovery source: "node", "topic", or "manifest"
+  InternedString type = "Component";    ///< Entity type (always "Component")
+  InternedString area;                  ///< Parent area ID
+  InternedString source = "node";       ///< Discovery source: "node", "topic", or "manifest"
   std::string translation_id;           ///< Internationalization key
   std::string description;              ///< Human-readable description
   std::string variant;                  ///< Hardware variant identifier
   std::vector<std::string> tags;        ///< Tags for filtering
-  std::string parent_component_id;      ///< Parent component ID for sub-components
+  InternedString parent_component_id;   ///< Parent component ID for sub-components
   std::vector<std::string> depends_on;  ///< Component IDs this component depends on
   std::vector<ServiceInfo> services;    ///< Services exposed by this component
   std::vector<ActionInfo> actions;      ///< Actions exposed by this component
@@ -14,6 +14,8 @@
 
 #pragma once
 
+#include "ros2_medkit_gateway/discovery/models/interned_string.hpp"
+
 #include <nlohmann/json.hpp>
 #include <string>
 #include <vector>
@@ -33,8 +35,8 @@ using json = nlohmann::json;
  */
 struct Function {
   // === Required fields ===
-  std::string id;    ///< Unique identifier
-  std::string name;  ///< Human-readable name
+  InternedString id;  ///< Unique identifier
+  std::string name;   ///< Human-readable name
 
   // === Optional SOVD fields ===
   std::string translation_id;     ///< For i18n support
@@ -46,7 +48,7 @@ struct Function {
   std::vector<std::string> depends_on;  ///< depends-on relationship (Function IDs)
 
   // === Discovery metadata ===
-  std::string source = "manifest";  ///< Always "manifest" (functions don't exist at runtime)
+  InternedString source = "manifest";  ///< Always "manifest" (functions don't exist at runtime)
 
   // === Serialization methods ===
 
@@ -0,0 +1,260 @@
+// Copyright 2026 bburda
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+#pragma once
+
+#include <cstddef>
+#include <functional>
+#include <nlohmann/json.hpp>
+#include <optional>
+#include <ostream>
+#include <string>
+#include <type_traits>
+#include <utility>
+
+namespace ros2_medkit_gateway {
+
+/**
+ * @brief Handle to a string stored once in a process-wide pool
+ *
+ * Entity IDs, namespaces, source tags and type strings repeat across the
+ * discovery models (every App names its Component, every Component its Area,
+ * many services share a type). An InternedString is the 8-byte address of the
+ * pooled copy, so equal values share one allocation, copying a model copies
+ * pointers, and equality and hashing between handles compare the address.
+ *
+ * It reads like a const std::string (implicit conversion, comparison with
+ * strings, JSON serialization) and is assigned from strings, so models keep
+ * their field syntax. Pooled strings are never freed: the pool holds each
+ * distinct value ever interned, which discovery bounds to the names in the
+ * ROS graph and manifest.
+ *
+ * @example
+ * InternedString area = "powertrain";
+ * area == InternedString("powertrain");   // true, address comparison
+ * InternedString::lookup("unknown");      // std::nullopt, nothing added
+ */
+class InternedString {
+ public:
+  /// Empty string
+  InternedString() = default;
+
+  // Implicit so that models are assigned and initialized from strings as before
+  InternedString(const std::string & value);  // NOLINT(runtime/explicit)
+  InternedString(const char * value);         // NOLINT(runtime/explicit)
+
+  /**
+   * @brief Handle of an already interned value, without adding it to the pool
+   *
+   * Lets lookups by a request-supplied string skip values no entity uses.
+   */
+  static std::optional<InternedString> lookup(const std::string & value);
+
+  /// Number of distinct non-empty values in the pool
+  static size_t pool_size();
+
+  const std::string & str() const {
+    return *value_;
+  }
+
+  operator const std::string &() const {  // NOLINT(runtime/explicit)
+    return *value_;
+  }
+
+  // Read-only std::string interface
+  bool empty() const {
+    return value_->empty();
+  }
+  size_t size() const {
+    return value_->size();
+  }
+  size_t length() const {
+    return value_->length();
+  }
+  const char * c_str() const {
+    return value_->c_str();
+  }
+  const char * data() const {
+    return value_->data();
+  }
+  std::string::const_iterator begin() const {
+    return value_->begin();
+  }
+  std::string::const_iterator end() const {
+    return value_->end();
+  }
+  char front() const {
+    return value_->front();
+  }
+  char back() const {
+    return value_->back();
+  }
+  char operator[](size_t pos) const {
+    return (*value_)[pos];
+  }
+  char at(size_t pos) const {
+    return value_->at(pos);
+  }
+  template <typename... Args>
+  size_t find(Args &&... args) const {
+    return value_->find(std::forward<Args>(args)...);
+  }
+  template <typename... Args>
+  size_t rfind(Args &&... args) const {
+    return value_->rfind(std::forward<Args>(args)...);
+  }
+  template <typename... Args>
+  size_t find_first_of(Args &&... args) const {
+    return value_->find_first_of(std::forward<Args>(args)...);
+  }
+  template <typename... Args>
+  size_t find_last_of(Args &&... args) const {
+    return value_->find_last_of(std::forward<Args>(args)...);
+  }
+  template <typename... Args>
+  size_t find_first_not_of(Args &&... args) const {
+    return value_->find_first_not_of(std::forward<Args>(args)...);
+  }
+  template <typename... Args>
+  int compare(Args &&... args) const {
+    return value_->compare(std::forward<Args>(args)...);
+  }
+  std::string substr(size_t pos = 0, size_t count = std::string::npos) const {
+    return value_->substr(pos, count);
+  }
+
+  // Handles of equal values are the same address
+  friend bool operator==(const InternedString & lhs, const InternedString & rhs) {
+    return lhs.value_ == rhs.value_;
+  }
+  friend bool operator!=(const InternedString & lhs, const InternedString & rhs) {
+    return lhs.value_ != rhs.value_;
+  }
+  friend bool operator==(const InternedString & lhs, const std::string & rhs) {
+    return *lhs.value_ == rhs;
+  }
+  friend bool operator==(const std::string & lhs, const InternedString & rhs) {
+    return lhs == *rhs.value_;
+  }
+  friend bool operator!=(const InternedString & lhs, const std::string & rhs) {
+    return *lhs.value_ != rhs;
+  }
+  friend bool operator!=(const std::string & lhs, const InternedString & rhs) {
+    return lhs != *rhs.value_;
+  }
+  friend bool operator==(const InternedString & lhs, const char * rhs) {
+    return *lhs.value_ == rhs;
+  }
+  friend bool operator==(const char * lhs, const InternedString & rhs) {
+    return lhs == *rhs.value_;
+  }
+  friend bool operator!=(const InternedString & lhs, const char * rhs) {
+    return *lhs.value_ != rhs;
+  }
+  friend bool operator!=(const char * lhs, const InternedString & rhs) {
+    return lhs != *rhs.value_;
+  }
+  // Ordered by value, as std::string (mixed overloads so a compared std::string is never interned)
+  friend bool operator<(const InternedString & lhs, const InternedString & rhs) {
+    return *lhs.value_ < *rhs.value_;
+  }
+  friend bool operator<(const InternedString & lhs, const std::string & rhs) {
+    return *lhs.value_ < rhs;
+  }
+  friend bool operator<(const std::string & lhs, const InternedString & rhs) {
+    return lhs < *rhs.value_;
+  }
+
+  friend std::string operator+(const InternedString & lhs, const std::string & rhs) {
+    return *lhs.value_ + rhs;
+  }
+  friend std::string operator+(const std::string & lhs, const InternedString & rhs) {
+    return lhs + *rhs.value_;
+  }
+  friend std::string operator+(const InternedString & lhs, const char * rhs) {
+    return *lhs.value_ + rhs;
+  }
+  friend std::string operator+(const char * lhs, const InternedString & rhs) {
+    return lhs + *rhs.value_;
+  }
+  friend std::string operator+(const InternedString & lhs, char rhs) {
+    return *lhs.value_ + rhs;
+  }
+  friend std::string operator+(std::string && lhs, const InternedString & rhs) {
+    return std::move(lhs) + *rhs.value_;
+  }
+
+  friend std::ostream & operator<<(std::ostream & os, const InternedString & value) {
+    return os << *value.value_;
+  }
+
+  /// Hash of the handle (the address), not of the characters
+  size_t hash() const {
+    return std::hash<const std::string *>{}(value_);
+  }
+
+ private:
+  explicit InternedString(const std::string * value) : value_(value) {
+  }
+
+  static const std::string * intern(const std::string & value);
+
+  static const std::string kEmpty;
+
+  const std::string * value_{&kEmpty};
+};
+
+inline void to_json(nlohmann::json & j, const InternedString & value) {
+  j = value.str();
+}
+
+inline void from_json(const nlohmann::json & j, InternedString & value) {
+  value = j.get<std::string>();
+}
+
+// JSON values and InternedString convert both ways, so spell out the comparison. Templates, so that
+// neither operand is converted: comparing JSON with a std::string must still pick nlohmann's operator.
+template <typename Json, typename Interned,
+          std::enable_if_t<std::is_same_v<Json, nlohmann::json> && std::is_same_v<Interned, InternedString>, int> = 0>
+bool operator==(const Json & lhs, const Interned & rhs) {
+  return lhs.is_string() && lhs.template get_ref<const std::string &>() == rhs.str();
+}
+template <typename Interned, typename Json,
+          std::enable_if_t<std::is_same_v<Json, nlohmann::json> && std::is_same_v<Interned, InternedString>, int> = 0>
+bool operator==(const Interned & lhs, const Json & rhs) {
+  return rhs == lhs;
+}
+template <typename Json, typename Interned,
+          std::enable_if_t<std::is_same_v<Json, nlohmann::json> && std::is_same_v<Interned, InternedString>, int> = 0>
+bool operator!=(const Json & lhs, const Interned & rhs) {
+  return !(lhs == rhs);
+}
+template <typename Interned, typename Json,
+          std::enable_if_t<std::is_same_v<Json, nlohmann::json> && std::is_same_v<Interned, InternedString>, int> = 0>
+bool operator!=(const Interned & lhs, const Json & rhs) {
+  return !(rhs == lhs);
+}
+
+}  // namespace ros2_medkit_gateway
+
+namespace std {
+
+template <>
+struct hash<ros2_medkit_gateway::InternedString> {
+  size_t operator()(const ros2_medkit_gateway::InternedString & value) const noexcept {
+    return value.hash();
+  }
+};
+
+}  // namespace std
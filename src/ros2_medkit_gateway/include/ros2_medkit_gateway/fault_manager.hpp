@@ -14,6 +14,8 @@
 
 #pragma once
 
+#include <chrono>
+#include <cstdint>
 #include <memory>
 #include <mutex>
 #include <nlohmann/json.hpp>
@@ -21,8 +23,12 @@
 #include <string>
 #include <vector>
 
+#include "ros2_medkit_gateway/fault_mirror.hpp"
+#include "ros2_medkit_gateway/service_availability.hpp"
+#include "ros2_medkit_gateway/single_flight.hpp"
 #include "ros2_medkit_msgs/msg/environment_data.hpp"
 #include "ros2_medkit_msgs/msg/fault.hpp"
+#include "ros2_medkit_msgs/msg/fault_event.hpp"
 #include "ros2_medkit_msgs/srv/clear_fault.hpp"
 #include "ros2_medkit_msgs/srv/get_fault.hpp"
 #include "ros2_medkit_msgs/srv/get_rosbag.hpp"
@@ -51,7 +57,9 @@ struct FaultWithEnvResult {
 };
 
 /// Manager for fault management operations
-/// Provides interface to the ros2_medkit_fault_manager services
+/// Provides interface to the ros2_medkit_fault_manager services.
+/// Fault listings are served from a local FaultMirror fed by /fault_manager/events
+/// when it is in sync; the ListFaults service is the fallback.
 class FaultManager {
  public:
   explicit FaultManager(rclcpp::Node * node);
@@ -66,6 +74,7 @@ class FaultManager {
                            const std::string & source_id);
 
   /// Get all faults, optionally filtered by component
+  /// Served from the fault mirror (no service call) when it is in sync and no correlation details are requested.
   /// @param source_id Optional component identifier to filter by (empty = all)
   /// @param include_prefailed Include PREFAILED status faults (debounce not yet confirmed)
   /// @param include_confirmed Include CONFIRMED status faults
@@ -87,8 +96,8 @@ class FaultManager {
   /// @param fault_code Fault identifier
   /// @param source_id Optional component identifier to verify fault belongs to component
   /// @return FaultResult with fault data or error if not found
-  /// @note Thread-safe: delegates to get_fault_with_env() which acquires get_mutex_.
-  ///       Do NOT call this method while holding get_mutex_.
+  /// @note Served from the fault mirror when it holds the fault; otherwise delegates to
+  ///       get_fault_with_env() which acquires get_mutex_. Do NOT call this method while holding get_mutex_.
   FaultResult get_fault(const std::string & fault_code, const std::string & source_id = "");
 
   /// Clear a fault
@@ -112,6 +121,9 @@ class FaultManager {
   /// @return FaultResult with arrays of rosbag metadata
   FaultResult list_rosbags(const std::string & entity_fqn);
 
+  /// Answer "service available?" from @p availability instead of waiting before each call (nullptr: wait)
+  void set_service_availability(ServiceAvailability * availability);
+
   /// Check if fault manager service is available
   /// @return true if services are available
   bool is_available() const;
@@ -120,9 +132,26 @@ class FaultManager {
   static json fault_to_json(const ros2_medkit_msgs::msg::Fault & fault);
 
  private:
+  /// Service round trips behind list_faults() / get_fault_with_env(), shared by concurrent identical calls
+  FaultResult call_list_faults(const std::string & source_id, bool include_prefailed, bool include_confirmed,
+                               bool include_cleared, bool include_muted, bool include_clusters);
+  FaultWithEnvResult call_get_fault(const std::string & fault_code, const std::string & source_id);
+
   /// Wait for services to become available
   bool wait_for_services(std::chrono::duration<double> timeout);
 
+  /// Statuses to request from ListFaults for the given include flags
+  static std::vector<std::string> status_filter(bool include_prefailed, bool include_confirmed, bool include_cleared);
+
+  /// Feed a fault event into the mirror; resyncs on a sequence gap
+  void on_fault_event(const ros2_medkit_msgs::msg::FaultEvent::ConstSharedPtr & msg);
+
+  /// Timer callback: bootstrap the mirror, retry failed syncs and run periodic resyncs
+  void maintain_mirror();
+
+  /// Send an asynchronous ListFaults (all statuses) and load the response into the mirror
+  void request_mirror_sync();
+
   rclcpp::Node * node_;
 
   /// Service clients
@@ -137,6 +166,9 @@ class FaultManager {
   /// Service timeout
   double service_timeout_sec_{5.0};
 
+  /// Service availability tracker (owned by GatewayNode, may be null)
+  ServiceAvailability * availability_{nullptr};
+
   /// Per-client mutexes for thread-safe service calls.
   /// Split by service client so that read operations (list, get) are not blocked
   /// by slow write operations (report_fault with snapshot capture).
@@ -147,6 +179,22 @@ class FaultManager {
   mutable std::mutex snapshots_mutex_;
   mutable std::mutex rosbag_mutex_;
   mutable std::mutex list_rosbags_mutex_;
+
+  /// In-flight list/get calls, keyed by their arguments
+  SingleFlight<FaultResult> list_flights_;
+  SingleFlight<FaultWithEnvResult> get_flights_;
+
+  /// Local fault state fed by /fault_manager/events
+  FaultMirror mirror_;
+  bool mirror_enabled_{true};
+  std::chrono::duration<double> mirror_resync_interval_{5.0};
+  rclcpp::Subscription<ros2_medkit_msgs::msg::FaultEvent>::SharedPtr event_subscription_;
+  rclcpp::TimerBase::SharedPtr mirror_timer_;
+
+  /// Sync bookkeeping, only touched from executor callbacks (timer, event, service response)
+  uint64_t mirror_sync_generation_{0};
+  std::chrono::steady_clock::time_point mirror_sync_started_;
+  std::chrono::steady_clock::time_point mirror_last_sync_;
 };
 
 }  // namespace ros2_medkit_gateway
@@ -0,0 +1,141 @@
+// Copyright 2026 bburda
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+#pragma once
+
+#include <cstdint>
+#include <map>
+#include <optional>
+#include <set>
+#include <shared_mutex>
+#include <string>
+#include <unordered_map>
+#include <vector>
+
+#include "ros2_medkit_msgs/msg/fault.hpp"
+#include "ros2_medkit_msgs/msg/fault_event.hpp"
+
+namespace ros2_medkit_gateway {
+
+/**
+ * @brief Local copy of the FaultManager's fault list, fed by /fault_manager/events
+ *
+ * Lifecycle:
+ * 1. begin_sync() before sending ListFaults (all statuses). Events arriving while
+ *    the request is in flight are buffered.
+ * 2. complete_sync() with the response replaces the contents and replays the
+ *    buffered events on top, so changes racing the snapshot are not lost.
+ * 3. apply() keeps the mirror current from FaultEvent messages. Each event carries
+ *    the full fault state, so applying one is an upsert by fault code.
+ *
+ * A sequence number that does not follow the previous one (lost events or a
+ * restarted FaultManager) marks the mirror unsynced until the next sync completes.
+ * While unsynced, queries return std::nullopt and callers use the service instead.
+ *
+ * Faults are indexed by status and by reporting source; source lookups use
+ * prefix matching like the ListFaults-based filtering (a namespace matches every
+ * source below it). Readers share a lock; only events and syncs take it exclusively.
+ */
+class FaultMirror {
+ public:
+  using Fault = ros2_medkit_msgs::msg::Fault;
+  using FaultEvent = ros2_medkit_msgs::msg::FaultEvent;
+
+  /// Start a resync: buffer incoming events until complete_sync() or abort_sync()
+  void begin_sync();
+
+  /**
+   * @brief Replace the mirror with a ListFaults snapshot and replay buffered events
+   * @param faults Faults of every status
+   * @param muted_count Muted fault count reported with the snapshot
+   * @param cluster_count Cluster count reported with the snapshot
+   */
+  void complete_sync(const std::vector<Fault> & faults, uint32_t muted_count, uint32_t cluster_count);
+
+  /// Give up on the current resync (service unavailable or timed out)
+  void abort_sync();
+
+  /**
+   * @brief Apply a fault event
+   * @return false if a sequence gap was detected and the mirror needs a resync
+   */
+  bool apply(const FaultEvent & event);
+
+  /**
+   * @brief Mark faults CLEARED right after a successful ClearFault
+   *
+   * Gives the clearing client read-your-writes behaviour without waiting for the
+   * fault_cleared event, which later overwrites the entry with the full state.
+   */
+  void mark_cleared(const std::vector<std::string> & fault_codes);
+
+  /// True once a snapshot has been loaded and no gap has been seen since
+  bool is_synced() const;
+
+  /// True while a resync started by begin_sync() is outstanding
+  bool is_syncing() const;
+
+  /**
+   * @brief Faults with one of @p statuses reported by a source under @p source_prefix
+   * @param source_prefix Reporting source prefix (empty = all sources)
+   * @param statuses Statuses to include (empty = CONFIRMED only, as ListFaults)
+   * @return Faults ordered by fault code, or std::nullopt while unsynced
+   */
+  std::optional<std::vector<Fault>> list(const std::string & source_prefix,
+                                         const std::vector<std::string> & statuses) const;
+
+  /// Look up a single fault; std::nullopt while unsynced or when not mirrored
+  std::optional<Fault> find(const std::string & fault_code) const;
+
+  /// Muted fault count from the last snapshot
+  uint32_t muted_count() const;
+
+  /// Cluster count from the last snapshot
+  uint32_t cluster_count() const;
+
+  /// Number of mirrored faults
+  size_t size() const;
+
+ private:
+  /// Record @p sequence; false if it does not follow the previous one. Caller holds the exclusive lock
+  bool check_sequence(uint64_t sequence);
+
+  /// Insert or replace a fault and update the indexes; caller holds the exclusive lock
+  void upsert(const Fault & fault);
+
+  /// Drop a fault from the indexes; caller holds the exclusive lock
+  void unindex(const Fault & fault);
+
+  mutable std::shared_mutex mutex_;
+
+  /// Faults by code (ordered, matching the FaultManager's listing order)
+  std::map<std::string, Fault> faults_;
+
+  /// Fault codes by status
+  std::unordered_map<std::string, std::set<std::string>> by_status_;
+
+  /// Fault codes by reporting source (ordered for prefix range scans)
+  std::map<std::string, std::set<std::string>> by_source_;
+
+  bool synced_{false};
+  bool syncing_{false};
+  /// A gap was seen while the current sync was in flight; its snapshot cannot be trusted
+  bool sync_dirty_{false};
+  std::vector<FaultEvent> pending_events_;
+  uint64_t last_sequence_{0};
+  uint32_t muted_count_{0};
+  uint32_t cluster_count_{0};
+};
+
+}  // namespace ros2_medkit_gateway
@@ -15,6 +15,7 @@
 #pragma once
 
 #include <atomic>
+#include <chrono>
 #include <condition_variable>
 #include <memory>
 #include <mutex>
@@ -30,8 +31,10 @@
 #include "ros2_medkit_gateway/discovery/discovery_manager.hpp"
 #include "ros2_medkit_gateway/fault_manager.hpp"
 #include "ros2_medkit_gateway/http/rest_server.hpp"
+#include "ros2_medkit_gateway/metrics_registry.hpp"
 #include "ros2_medkit_gateway/models/thread_safe_entity_cache.hpp"
 #include "ros2_medkit_gateway/operation_manager.hpp"
+#include "ros2_medkit_gateway/service_availability.hpp"
 
 namespace ros2_medkit_gateway {
 
@@ -78,8 +81,17 @@ class GatewayNode : public rclcpp::Node {
    */
   FaultManager * get_fault_manager() const;
 
+  /**
+   * @brief Get the gateway metrics registry
+   * @return Raw pointer to MetricsRegistry, or nullptr if metrics.enabled is false
+   */
+  MetricsRegistry * get_metrics_registry() const;
+
  private:
   void refresh_cache();
+  void register_cache_metrics();
+  /// Observe the time since @p start for a refresh_cache() stage and restart the clock
+  void record_refresh_stage(const char * stage, std::chrono::steady_clock::time_point & start);
   void start_rest_server();
   void stop_rest_server();
 
@@ -90,6 +102,14 @@ class GatewayNode : public rclcpp::Node {
   CorsConfig cors_config_;
   AuthConfig auth_config_;
   TlsConfig tls_config_;
+  CompressionConfig compression_config_;
+  ServerLimitsConfig server_limits_;
+
+  // Metrics (declared before managers so it outlives everything that records into it)
+  std::unique_ptr<MetricsRegistry> metrics_;
+
+  // Service availability (declared before managers, which consult it on each call)
+  std::unique_ptr<ServiceAvailability> service_availability_;
 
   // Managers
   std::unique_ptr<DiscoveryManager> discovery_mgr_;
@@ -0,0 +1,71 @@
+// Copyright 2026 bburda
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+#pragma once
+
+#include <nlohmann/json.hpp>
+#include <string>
+
+namespace ros2_medkit_gateway {
+
+/// Media type for JSON responses (default)
+constexpr const char * MEDIA_TYPE_JSON = "application/json";
+/// Media type for CBOR responses (RFC 8949)
+constexpr const char * MEDIA_TYPE_CBOR = "application/cbor";
+/// Media type for MessagePack responses
+constexpr const char * MEDIA_TYPE_MSGPACK = "application/msgpack";
+
+/**
+ * @brief Wire format of a response body
+ *
+ * All formats are produced from the same nlohmann::json document, so the
+ * structure of a response is identical regardless of the encoding.
+ */
+enum class ResponseFormat { JSON, CBOR, MSGPACK };
+
+/**
+ * @brief Pick a response format from an HTTP Accept header
+ *
+ * Honors quality values (q=) and falls back to JSON when the header is
+ * empty or lists no supported type. Wildcard media ranges are satisfied by
+ * JSON. On equal quality, the type listed first wins.
+ *
+ * Recognized media types:
+ * - application/json
+ * - application/cbor
+ * - application/msgpack, application/x-msgpack, application/vnd.msgpack
+ *
+ * @param accept_header Value of the Accept request header
+ * @return Negotiated response format
+ */
+ResponseFormat negotiate_response_format(const std::string & accept_header);
+
+/**
+ * @brief Get the Content-Type for a response format
+ */
+const char * content_type_for(ResponseFormat format);
+
+/**
+ * @brief Encode a JSON document in the given format
+ *
+ * JSON output is pretty-printed with 2-space indentation (the REST API default);
+ * CBOR and MessagePack are binary.
+ *
+ * @param data Document to encode
+ * @param format Target format
+ * @return Encoded response body
+ */
+std::string encode_response_body(const nlohmann::json & data, ResponseFormat format);
+
+}  // namespace ros2_medkit_gateway
@@ -25,6 +25,7 @@ namespace handlers {
  * Provides handlers for:
  * - GET /components/{component_id}/configurations - List all parameters
  * - GET /components/{component_id}/configurations/{param_name} - Get parameter
+ * - PUT /components/{component_id}/configurations - Set several parameters
  * - PUT /components/{component_id}/configurations/{param_name} - Set parameter
  * - DELETE /components/{component_id}/configurations/{param_name} - Reset parameter
  * - DELETE /components/{component_id}/configurations - Reset all parameters
@@ -48,6 +49,14 @@ class ConfigHandlers {
    */
   void handle_get_configuration(const httplib::Request & req, httplib::Response & res);
 
+  /**
+   * @brief Handle PUT /components/{component_id}/configurations - set several parameters.
+   *
+   * Values are grouped by node and each group is written with one set_parameters
+   * call; nodes are written concurrently.
+   */
+  void handle_set_all_configurations(const httplib::Request & req, httplib::Response & res);
+
   /**
    * @brief Handle PUT /components/{component_id}/configurations/{param_name}.
    */
@@ -16,6 +16,7 @@
 
 #include <httplib.h>
 
+#include <atomic>
 #include <iomanip>
 #include <memory>
 #include <nlohmann/json.hpp>
@@ -134,6 +135,11 @@ class HandlerContext {
     return auth_manager_;
   }
 
+  /// SSE connections open across all streams, limited by sse.max_clients
+  std::atomic<size_t> & sse_connections() {
+    return sse_connections_;
+  }
+
   /**
    * @brief Validate entity ID (component_id, area_id, etc.)
    * @param entity_id The ID to validate
@@ -240,6 +246,20 @@ class HandlerContext {
    */
   static void send_json(httplib::Response & res, const nlohmann::json & data);
 
+  /**
+   * @brief Send success response encoded according to the request's Accept header
+   *
+   * Produces JSON, CBOR or MessagePack from the same document (see
+   * negotiate_response_format()) and sets "Vary: Accept" so caches keep the
+   * encodings apart. Clients that do not ask for a binary format get the
+   * same JSON as send_json(res, data).
+   *
+   * @param req HTTP request (Accept header is read from here)
+   * @param res HTTP response
+   * @param data Response document
+   */
+  static void send_json(const httplib::Request & req, httplib::Response & res, const nlohmann::json & data);
+
   /**
    * @brief Get logger for handlers
    */
@@ -253,6 +273,7 @@ class HandlerContext {
   AuthConfig auth_config_;
   TlsConfig tls_config_;
   AuthManager * auth_manager_;
+  std::atomic<size_t> sse_connections_{0};
 };
 
 }  // namespace handlers
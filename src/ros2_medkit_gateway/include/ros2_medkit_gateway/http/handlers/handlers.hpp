@@ -35,4 +35,5 @@
 #include "ros2_medkit_gateway/http/handlers/handler_context.hpp"
 #include "ros2_medkit_gateway/http/handlers/health_handlers.hpp"
 #include "ros2_medkit_gateway/http/handlers/operation_handlers.hpp"
+#include "ros2_medkit_gateway/http/handlers/sse_execution_handler.hpp"
 #include "ros2_medkit_gateway/http/handlers/sse_fault_handler.hpp"
@@ -17,6 +17,7 @@
 #include <httplib.h>
 
 #include "ros2_medkit_gateway/http/handlers/handler_context.hpp"
+#include "ros2_medkit_gateway/http/route_dispatcher.hpp"
 
 namespace ros2_medkit_gateway {
 namespace handlers {
@@ -28,10 +29,15 @@ namespace handlers {
  * - GET /health - Health check
  * - GET / - Root endpoint with capabilities
  * - GET /version-info - Version information
+ * - GET /metrics - Prometheus metrics (outside the API prefix)
  */
 class HealthHandlers {
  public:
-  explicit HealthHandlers(HandlerContext & ctx) : ctx_(ctx) {
+  /**
+   * @param ctx Shared handler context
+   * @param routes Route table the root endpoint lists; must outlive the handlers
+   */
+  HealthHandlers(HandlerContext & ctx, const RouteDispatcher & routes) : ctx_(ctx), routes_(routes) {
   }
 
   /// GET /health - Health check endpoint
@@ -43,8 +49,12 @@ class HealthHandlers {
   /// GET /version-info - Version information
   void handle_version_info(const httplib::Request & req, httplib::Response & res);
 
+  /// GET /metrics - Gateway metrics in Prometheus text format
+  void handle_metrics(const httplib::Request & req, httplib::Response & res);
+
  private:
   HandlerContext & ctx_;
+  const RouteDispatcher & routes_;
 };
 
 }  // namespace handlers
@@ -14,11 +14,17 @@
 
 #pragma once
 
+#include <string>
+
 #include "ros2_medkit_gateway/http/handlers/handler_context.hpp"
+#include "ros2_medkit_gateway/operation_manager.hpp"
 
 namespace ros2_medkit_gateway {
 namespace handlers {
 
+/// Convert a ROS 2 goal status to a SOVD ExecutionStatus ("running", "completed", "failed")
+std::string sovd_status_from_ros2(ActionGoalStatus status);
+
 /**
  * @brief Handlers for operation-related REST API endpoints (services and actions).
  *
@@ -0,0 +1,154 @@
+// Copyright 2026 bburda
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+#pragma once
+
+#include <atomic>
+#include <condition_variable>
+#include <deque>
+#include <functional>
+#include <mutex>
+#include <optional>
+#include <string>
+
+#include "ros2_medkit_gateway/http/handlers/handler_context.hpp"
+#include "ros2_medkit_gateway/operation_manager.hpp"
+
+namespace ros2_medkit_gateway {
+namespace handlers {
+
+/**
+ * @brief Handler for Server-Sent Events (SSE) streams of action executions.
+ *
+ * Pushes goal progress as it arrives from the action status and feedback
+ * topics, so clients no longer poll the execution resource:
+ * - GET /{entity}/operations/{op-id}/executions/stream - all goals of the operation
+ * - GET /{entity}/operations/{op-id}/executions/{exec-id}/stream - one goal
+ *
+ * Events streamed:
+ * - status: goal status changed (same status/x-medkit fields as GET execution)
+ * - feedback: feedback message received (in "parameters")
+ *
+ * Events are formatted once when they arrive and kept in a replay buffer of
+ * the most recent kMaxBufferedEvents, so reconnecting clients resume from
+ * their Last-Event-ID. A single-execution stream starts with the current
+ * status (when not resuming) and ends after the goal's final status, or
+ * once the goal is no longer tracked.
+ *
+ * Connections count against sse.max_clients together with the fault stream.
+ */
+class SSEExecutionHandler {
+ public:
+  /**
+   * @brief Construct SSE execution handler and register for goal events.
+   * @param ctx The shared handler context
+   */
+  explicit SSEExecutionHandler(HandlerContext & ctx);
+
+  /// Destructor - stop receiving goal events and end open streams
+  ~SSEExecutionHandler();
+
+  // Disable copy/move
+  SSEExecutionHandler(const SSEExecutionHandler &) = delete;
+  SSEExecutionHandler & operator=(const SSEExecutionHandler &) = delete;
+  SSEExecutionHandler(SSEExecutionHandler &&) = delete;
+  SSEExecutionHandler & operator=(SSEExecutionHandler &&) = delete;
+
+  /**
+   * @brief Handle GET /{entity}/operations/{op-id}/executions/stream.
+   *
+   * @code
+   * event: status
+   * data: {"execution_id":"...","status":"running","x-medkit":{"ros2_status":"executing",...}}
+   *
+   * event: feedback
+   * data: {"execution_id":"...","status":"running","parameters":{"partial_sequence":[0,1,1]}}
+   * @endcode
+   */
+  void handle_operation_stream(const httplib::Request & req, httplib::Response & res);
+
+  /**
+   * @brief Handle GET /{entity}/operations/{op-id}/executions/{exec-id}/stream.
+   */
+  void handle_execution_stream(const httplib::Request & req, httplib::Response & res);
+
+  /**
+   * @brief Get the number of currently connected SSE clients.
+   */
+  size_t connected_clients() const;
+
+ private:
+  /// Formatted event kept for replay
+  struct BufferedEvent {
+    uint64_t id;
+    std::string goal_id;
+    std::string action_path;
+    bool final;  ///< Goal reached a terminal status
+    std::string sse;
+  };
+
+  /// Goal event callback registered with the OperationManager
+  void on_goal_event(const ActionGoalEvent & event);
+
+  /// Format an event as SSE message (without id line when @p event_id is 0)
+  static std::string format_sse_event(const ActionGoalEvent & event, uint64_t event_id);
+
+  /// Resolve an entity's operation to its ROS 2 path, if the entity exists
+  std::optional<std::string> resolve_operation_path(const std::string & entity_id,
+                                                    const std::string & operation_id) const;
+
+  /// Reject with 503 if the SSE client limit is reached, else set SSE headers and count the client
+  bool accept_client(const httplib::Request & req, httplib::Response & res);
+
+  /// Last event a client has seen: its Last-Event-ID, or the newest event for new clients
+  uint64_t resume_point(const httplib::Request & req) const;
+
+  /**
+   * @brief Stream buffered and future events selected by @p matches
+   * @param last_event_id Events up to this id are skipped
+   * @param initial Sent before anything else (may be empty)
+   * @param end_on_final End the stream after an event with final set
+   * @param ended Polled at each keepalive (may be empty): a value ends the stream after sending it (if not empty)
+   */
+  void stream(httplib::Response & res, uint64_t last_event_id, std::function<bool(const BufferedEvent &)> matches,
+              std::string initial, bool end_on_final, std::function<std::optional<std::string>()> ended);
+
+  HandlerContext & ctx_;
+
+  /// Event buffer for broadcasting to clients
+  mutable std::mutex queue_mutex_;
+  std::condition_variable queue_cv_;
+  std::deque<BufferedEvent> event_queue_;
+
+  /// Monotonically increasing event ID for Last-Event-ID support
+  uint64_t next_event_id_{1};
+
+  /// Number of connected clients (for monitoring)
+  std::atomic<size_t> client_count_{0};
+
+  /// Maximum allowed concurrent SSE clients (from sse.max_clients parameter)
+  size_t max_sse_clients_{10};
+
+  /// Shutdown flag for clean termination
+  std::atomic<bool> shutdown_flag_{false};
+
+  /// Maximum events to buffer (for reconnecting clients)
+  static constexpr size_t kMaxBufferedEvents = 500;
+
+  /// Keepalive interval in seconds
+  static constexpr int kKeepaliveIntervalSec = 30;
+};
+
+}  // namespace handlers
+}  // namespace ros2_medkit_gateway
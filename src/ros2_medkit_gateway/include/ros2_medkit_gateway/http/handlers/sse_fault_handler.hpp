@@ -19,15 +19,73 @@
 #include <deque>
 #include <memory>
 #include <mutex>
+#include <optional>
 #include <string>
+#include <tl/expected.hpp>
+#include <unordered_set>
 
 #include "rclcpp/rclcpp.hpp"
 #include "ros2_medkit_gateway/http/handlers/handler_context.hpp"
+#include "ros2_medkit_gateway/models/thread_safe_entity_cache.hpp"
 #include "ros2_medkit_msgs/msg/fault_event.hpp"
 
 namespace ros2_medkit_gateway {
 namespace handlers {
 
+/**
+ * @brief Server-side filter for a fault stream, compiled once per connection.
+ *
+ * Built from the query parameters of GET /faults/stream; a default-constructed
+ * filter lets every event through. Statuses and event types are kept as bit
+ * masks, so checking an event costs a few comparisons per client.
+ */
+struct FaultEventFilter {
+  /// Node FQNs of the requested entity; unset = any source
+  std::optional<std::unordered_set<std::string>> source_fqns;
+
+  /// Lowest fault severity let through (Fault::SEVERITY_* value)
+  uint8_t min_severity{0};
+
+  /// Allowed fault statuses (bits from status_bit(), 0 = any)
+  uint8_t status_mask{0};
+
+  /// Allowed event types (bits from event_type_bit(), 0 = any)
+  uint8_t event_type_mask{0};
+
+  /**
+   * @brief Parse status, min_severity and event_type query parameters.
+   *
+   * - status: comma-separated pending, confirmed, cleared or all (as for fault listings)
+   * - min_severity: info, warn, error, critical or 0-3
+   * - event_type: comma-separated fault_confirmed, fault_cleared, fault_updated
+   *
+   * The entity_id parameter is resolved by the handler through set_entity().
+   *
+   * @return Filter, or the name of the first invalid parameter
+   */
+  static tl::expected<FaultEventFilter, std::string> from_query(const httplib::Request & req);
+
+  /**
+   * @brief Let through only faults reported by the nodes of an entity.
+   *
+   * The ID is resolved with find_entity(), and source_fqns is taken from the
+   * FQN index of the resolved type only, so an entity of another type with
+   * the same ID never adds its nodes.
+   *
+   * @return false if no entity has this ID
+   */
+  bool set_entity(const ThreadSafeEntityCache & cache, const std::string & entity_id);
+
+  /// Check whether an event passes the filter
+  bool matches(const ros2_medkit_msgs::msg::FaultEvent & event) const;
+
+  /// Bit of a fault status in status_mask (0 for unknown statuses)
+  static uint8_t status_bit(const std::string & status);
+
+  /// Bit of an event type in event_type_mask (0 for unknown types)
+  static uint8_t event_type_bit(const std::string & event_type);
+};
+
 /**
  * @brief Handler for Server-Sent Events (SSE) fault streaming.
  *
@@ -46,6 +104,10 @@ namespace handlers {
  * - Replay buffer of up to 100 most recent events for reconnecting clients;
  *   when the buffer is full, older events are discarded (FIFO), so clients
  *   that are disconnected for long periods may miss some events
+ * - Each event is formatted once when it arrives; all clients write the same
+ *   shared bytes, so the cost per event does not grow with the client count
+ * - Server-side filtering by entity, minimum severity, status and event type
+ *   via query parameters (see FaultEventFilter)
  */
 class SSEFaultHandler {
  public:
@@ -75,6 +137,9 @@ class SSEFaultHandler {
    * event: fault_cleared
    * data: {"event_type":"fault_cleared","fault":{...},"timestamp":1234567890.456}
    * @endcode
+   *
+   * Query parameters (all optional): entity_id, min_severity, status, event_type.
+   * Returns 400 for invalid values and 404 when entity_id is not a known entity.
    */
   void handle_stream(const httplib::Request & req, httplib::Response & res);
 
@@ -87,21 +152,28 @@ class SSEFaultHandler {
   /// Callback for fault events from ROS 2 topic
   void on_fault_event(const ros2_medkit_msgs::msg::FaultEvent::ConstSharedPtr & msg);
 
-  /// Format a fault event as SSE message
-  static std::string format_sse_event(const ros2_medkit_msgs::msg::FaultEvent & event, uint64_t event_id);
+  /// Formatted event kept for replay, shared read-only by all client threads
+  struct BufferedEvent {
+    uint64_t id;
+    std::shared_ptr<const std::string> sse;
+    ros2_medkit_msgs::msg::FaultEvent::ConstSharedPtr event;  ///< Source message, for filtering
+  };
+
+  /// Format a fault event as SSE message (without the id line)
+  static std::string format_sse_event(const ros2_medkit_msgs::msg::FaultEvent & event);
 
   HandlerContext & ctx_;
 
   /// Subscription to fault events topic
   rclcpp::Subscription<ros2_medkit_msgs::msg::FaultEvent>::SharedPtr subscription_;
 
-  /// Event queue for broadcasting to clients
+  /// Event buffer for broadcasting to clients (ids are increasing, so it can be binary searched)
   mutable std::mutex queue_mutex_;
   std::condition_variable queue_cv_;
-  std::deque<std::pair<uint64_t, ros2_medkit_msgs::msg::FaultEvent>> event_queue_;
+  std::deque<BufferedEvent> event_queue_;
 
-  /// Monotonically increasing event ID for Last-Event-ID support
-  std::atomic<uint64_t> next_event_id_{1};
+  /// Monotonically increasing event ID for Last-Event-ID support (guarded by queue_mutex_)
+  uint64_t next_event_id_{1};
 
   /// Number of connected clients (for monitoring)
   std::atomic<size_t> client_count_{0};
@@ -30,15 +30,19 @@ namespace ros2_medkit_gateway {
  * This class abstracts the creation and management of cpp-httplib Server
  * or SSLServer instances based on TLS configuration. It provides a unified
  * interface to get the active server pointer, eliminating code duplication.
+ *
+ * Connections are served by a bounded WorkerPool sized from ServerLimitsConfig,
+ * which also sets the keep-alive limits.
  */
 class HttpServerManager {
  public:
   /**
    * @brief Construct HTTP server manager
    * @param tls_config TLS configuration (if enabled, creates SSLServer)
+   * @param limits Worker pool and keep-alive settings
    * @throws std::runtime_error if TLS is requested but SSL server creation fails
    */
-  explicit HttpServerManager(const TlsConfig & tls_config);
+  explicit HttpServerManager(const TlsConfig & tls_config, const ServerLimitsConfig & limits = ServerLimitsConfig{});
 
   ~HttpServerManager() = default;
 
@@ -87,7 +91,13 @@ class HttpServerManager {
    */
   void configure_tls();
 
+  /**
+   * @brief Install the worker pool and keep-alive settings on the active server
+   */
+  void configure_limits();
+
   TlsConfig tls_config_;
+  ServerLimitsConfig limits_;
 
   // HTTP server (used when TLS is disabled)
   std::unique_ptr<httplib::Server> server_;
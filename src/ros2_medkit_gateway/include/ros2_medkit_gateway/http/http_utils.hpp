@@ -20,6 +20,7 @@
 #include <cstdio>
 #include <ctime>
 #include <string>
+#include <unordered_set>
 
 #include "ros2_medkit_gateway/models/entity_types.hpp"
 
@@ -126,6 +127,30 @@ inline FaultStatusFilter parse_fault_status_param(const httplib::Request & req)
   return filter;
 }
 
+/**
+ * @brief Check whether a fault reporting source is one of @p fqns or lies below one of them
+ *
+ * E.g. "/perception/lidar/driver/sensor" matches "/perception/lidar/driver".
+ * Hash lookups per path segment instead of comparing against every FQN.
+ *
+ * @param source Reporting source of a fault
+ * @param fqns Node FQNs of an entity (from the entity cache FQN index)
+ */
+inline bool source_matches_fqns(const std::string & source, const std::unordered_set<std::string> & fqns) {
+  std::string candidate = source;
+  while (!candidate.empty()) {
+    if (fqns.count(candidate) > 0) {
+      return true;
+    }
+    auto pos = candidate.rfind('/');
+    if (pos == 0 || pos == std::string::npos) {
+      break;
+    }
+    candidate.resize(pos);
+  }
+  return false;
+}
+
 /**
  * @brief Convert nanoseconds since epoch to ISO 8601 string with milliseconds.
  *
@@ -0,0 +1,89 @@
+// Copyright 2026 bburda
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+#pragma once
+
+#include <httplib.h>
+
+#include <optional>
+#include <string>
+
+#include "ros2_medkit_gateway/config.hpp"
+
+namespace ros2_medkit_gateway {
+
+/**
+ * @brief Content coding applied to a response body
+ */
+enum class ContentEncoding { IDENTITY, GZIP, ZSTD };
+
+/**
+ * @brief Pick a content coding from an HTTP Accept-Encoding header
+ *
+ * Honors quality values (q=). zstd is preferred over gzip when both are
+ * acceptable with the same quality, since it compresses faster at a similar
+ * ratio. A wildcard (*) is satisfied by gzip. Returns IDENTITY when the
+ * header is empty or lists no supported coding.
+ *
+ * @param accept_encoding Value of the Accept-Encoding request header
+ * @return Negotiated content coding
+ */
+ContentEncoding negotiate_content_encoding(const std::string & accept_encoding);
+
+/**
+ * @brief Get the Content-Encoding token for a coding (empty for IDENTITY)
+ */
+const char * content_encoding_token(ContentEncoding encoding);
+
+/**
+ * @brief Check whether a Content-Type benefits from compression
+ *
+ * Text and structured formats (JSON, CBOR, MessagePack, XML, YAML, any text type)
+ * are compressible. Event streams and binary payloads (images, archives,
+ * octet-stream) are not.
+ */
+bool is_compressible_content_type(const std::string & content_type);
+
+/**
+ * @brief Compress a buffer with the given coding
+ *
+ * @param body Data to compress
+ * @param encoding GZIP or ZSTD
+ * @param level Codec-specific compression level
+ * @return Compressed data, or std::nullopt for IDENTITY or on codec failure
+ */
+std::optional<std::string> compress_body(const std::string & body, ContentEncoding encoding, int level);
+
+/**
+ * @brief Compress a response in place when the request allows it
+ *
+ * Intended to run as the server's post-routing handler. The response is left
+ * untouched when compression is disabled, the body is streamed through a
+ * content provider (SSE, file downloads) or smaller than the threshold, the
+ * content type is not compressible, the path is excluded, a Content-Encoding
+ * is already set, or compression does not reduce the size.
+ *
+ * On success the body is replaced and Content-Encoding is set. Vary:
+ * Accept-Encoding is added to every eligible response so caches keep the
+ * variants apart.
+ *
+ * @param req HTTP request (Accept-Encoding and path are read)
+ * @param res HTTP response to compress
+ * @param config Compression settings
+ * @return true if the body was compressed
+ */
+bool apply_response_compression(const httplib::Request & req, httplib::Response & res,
+                                const CompressionConfig & config);
+
+}  // namespace ros2_medkit_gateway
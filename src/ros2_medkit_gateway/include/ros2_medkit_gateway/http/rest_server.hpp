@@ -28,6 +28,8 @@
 #include "ros2_medkit_gateway/config.hpp"
 #include "ros2_medkit_gateway/http/handlers/handlers.hpp"
 #include "ros2_medkit_gateway/http/http_server.hpp"
+#include "ros2_medkit_gateway/http/route_dispatcher.hpp"
+#include "ros2_medkit_gateway/http/worker_pool.hpp"
 
 namespace ros2_medkit_gateway {
 
@@ -50,7 +52,9 @@ class GatewayNode;
 class RESTServer {
  public:
   RESTServer(GatewayNode * node, const std::string & host, int port, const CorsConfig & cors_config,
-             const AuthConfig & auth_config, const TlsConfig & tls_config = TlsConfig{});
+             const AuthConfig & auth_config, const TlsConfig & tls_config = TlsConfig{},
+             const CompressionConfig & compression_config = CompressionConfig{},
+             const ServerLimitsConfig & server_limits = ServerLimitsConfig{});
   ~RESTServer();
 
   void start();
@@ -65,6 +69,12 @@ class RESTServer {
   void setup_routes();
   void setup_pre_routing_handler();
   void setup_global_error_handlers();
+  void setup_post_routing_handler();
+
+  /// Wrap a handler that blocks on ROS round-trips so it runs under slow_routes_
+  RouteDispatcher::Handler limit_slow(RouteDispatcher::Handler handler);
+  /// Answer 503 with Retry-After and count the rejection
+  void send_overloaded(httplib::Response & res, const char * reason) const;
 
   // CORS helper methods
   void set_cors_headers(httplib::Response & res, const std::string & origin) const;
@@ -76,9 +86,17 @@ class RESTServer {
   CorsConfig cors_config_;
   AuthConfig auth_config_;
   TlsConfig tls_config_;
+  CompressionConfig compression_config_;
+  ServerLimitsConfig server_limits_;
   std::unique_ptr<AuthManager> auth_manager_;
   std::unique_ptr<AuthMiddleware> auth_middleware_;
 
+  // Compiled route table; declared before http_server_ so it outlives the server
+  RouteDispatcher routes_;
+
+  // Admission control for slow (ROS round-trip) routes; outlives the server as well
+  ConcurrencyLimiter slow_routes_;
+
   // HTTP/HTTPS server manager
   std::unique_ptr<HttpServerManager> http_server_;
 
@@ -92,7 +110,11 @@ class RESTServer {
   std::unique_ptr<handlers::FaultHandlers> fault_handlers_;
   std::unique_ptr<handlers::AuthHandlers> auth_handlers_;
   std::unique_ptr<handlers::SSEFaultHandler> sse_fault_handler_;
+  std::unique_ptr<handlers::SSEExecutionHandler> sse_execution_handler_;
   std::unique_ptr<handlers::BulkDataHandlers> bulkdata_handlers_;
+
+  // Collector publishing SSE client counts (0 when metrics are disabled)
+  size_t sse_metrics_collector_{0};
 };
 
 }  // namespace ros2_medkit_gateway
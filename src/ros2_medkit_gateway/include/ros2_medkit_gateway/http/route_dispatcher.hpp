@@ -0,0 +1,166 @@
+// Copyright 2026 bburda
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+#pragma once
+
+#include <httplib.h>
+
+#include <functional>
+#include <map>
+#include <memory>
+#include <string>
+#include <string_view>
+#include <vector>
+
+#include "ros2_medkit_gateway/metrics_registry.hpp"
+
+namespace ros2_medkit_gateway {
+
+/**
+ * @brief Compiled path router built from a single route table
+ *
+ * Routes are registered as path templates made of '/'-separated segments:
+ * - literal segments match exactly (e.g. "data", "operations")
+ * - {name} captures exactly one non-empty segment
+ * - {name+} captures the non-empty remainder of the path, slashes included
+ *   (used for topic and parameter names decoded from %2F). Only allowed as
+ *   the last segment.
+ *
+ * Templates are compiled into one segment trie per HTTP method, so matching
+ * costs O(path length) regardless of how many routes are registered. At each
+ * segment, literals take precedence over {name}, which takes precedence over
+ * {name+}; the matcher backtracks if a more specific branch dead-ends.
+ *
+ * Handlers read captures with path_capture()/path_capture_count(), indexed like
+ * req.matches of httplib's regex routes (0 is the whole path, captures follow
+ * in template order). No regex is evaluated per request.
+ *
+ * @example
+ * RouteDispatcher routes;
+ * routes.add("GET", "/api/v1/apps/{app_id}/data/{data_id+}", handler);
+ * routes.install(*srv, "/api/v1");
+ */
+class RouteDispatcher {
+ public:
+  using Handler = std::function<void(const httplib::Request &, httplib::Response &)>;
+
+  /// A registered route
+  struct Route {
+    std::string method;
+    std::string pattern;                ///< Path template as registered
+    std::vector<std::string> captures;  ///< Capture names in template order
+    Handler handler;
+  };
+
+  RouteDispatcher();
+  ~RouteDispatcher();
+
+  RouteDispatcher(const RouteDispatcher &) = delete;
+  RouteDispatcher & operator=(const RouteDispatcher &) = delete;
+
+  /**
+   * @brief Register a route
+   *
+   * @param method HTTP method (GET, PUT, POST, DELETE)
+   * @param pattern Path template (see class description)
+   * @param handler Request handler
+   * @throws std::invalid_argument if the template is malformed or the
+   *         method/template pair is already registered
+   */
+  void add(const std::string & method, const std::string & pattern, Handler handler);
+
+  /**
+   * @brief Find the route for a request path
+   *
+   * @param method HTTP method
+   * @param path Decoded request path (httplib::Request::path)
+   * @return Matched route, or nullptr if no route matches
+   */
+  const Route * match(const std::string & method, std::string_view path) const;
+
+  /**
+   * @brief Route a request to its handler
+   *
+   * Invokes the matched route's handler with the captured path segments
+   * published for path_capture(). HEAD requests are served by GET routes.
+   *
+   * @return The route that handled the request, or nullptr if no route
+   *         matches (response is left untouched)
+   */
+  const Route * dispatch(const httplib::Request & req, httplib::Response & res) const;
+
+  /**
+   * @brief Record per-route request metrics in @p metrics
+   *
+   * Requests dispatched through install() are counted and timed per route
+   * template (unmatched paths are labelled "unmatched"). Pass nullptr to
+   * disable. Must be called before install().
+   */
+  void set_metrics(MetricsRegistry * metrics);
+
+  /**
+   * @brief Install the dispatcher on an httplib server
+   *
+   * Registers a single catch-all route under @p prefix for each HTTP method
+   * that has routes. Unmatched paths under the prefix get 404, which the
+   * server's error handler turns into a SOVD GenericError.
+   *
+   * The dispatcher must outlive the server.
+   */
+  void install(httplib::Server & srv, const std::string & prefix) const;
+
+  /**
+   * @brief List registered endpoints as "METHOD /path/{capture}" strings
+   *
+   * Returned in registration order; tail captures are shown as {name}.
+   */
+  std::vector<std::string> endpoints() const;
+
+  /// Number of registered routes
+  size_t size() const {
+    return routes_.size();
+  }
+
+ private:
+  struct Node;
+
+  const Route * find(const std::string & method, std::string_view path, std::vector<std::string_view> * captures) const;
+  const Route * match_node(const Node & node, std::string_view path, size_t pos,
+                           std::vector<std::string_view> * captures) const;
+
+  std::vector<std::unique_ptr<Route>> routes_;
+  std::map<std::string, std::unique_ptr<Node>> roots_;  ///< One trie per HTTP method
+  MetricsRegistry * metrics_{nullptr};
+};
+
+/**
+ * @brief Number of path captures of a routed request, like req.matches.size()
+ *
+ * std::smatch can only be filled by running a regex, so RouteDispatcher
+ * publishes the segments captured by its trie for the duration of the
+ * handler call instead. Requests not dispatched by RouteDispatcher fall back
+ * to req.matches.
+ */
+size_t path_capture_count(const httplib::Request & req);
+
+/**
+ * @brief Path capture of a routed request, like req.matches[index]
+ *
+ * @param req Request being handled
+ * @param index 0 for the whole path, 1.. for captures in template order
+ * @return Captured text, or an empty string if @p index is out of range
+ */
+std::string path_capture(const httplib::Request & req, size_t index);
+
+}  // namespace ros2_medkit_gateway
@@ -0,0 +1,159 @@
+// Copyright 2026 bburda
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+#pragma once
+
+#include <httplib.h>
+
+#include <condition_variable>
+#include <cstddef>
+#include <deque>
+#include <functional>
+#include <mutex>
+#include <thread>
+#include <type_traits>
+#include <utility>
+#include <vector>
+
+namespace ros2_medkit_gateway {
+
+/**
+ * @brief Bounded connection pool for httplib::Server
+ *
+ * Replaces httplib's default thread pool (installed through
+ * Server::new_task_queue). Each task serves one accepted connection.
+ *
+ * At most @p max_queued connections wait for one of the @p worker_threads.
+ * Connections beyond that are handed to a small set of overflow threads
+ * instead of being queued behind slow requests. While an overflow thread
+ * serves a connection, is_overflow_task() returns true and the pre-routing
+ * handler answers 503 with Retry-After (health checks are still served), so
+ * saturation is reported to clients immediately instead of as a timeout.
+ *
+ * The overflow queue is bounded by @p max_overflow_queued as well. Beyond it,
+ * connections are rejected: with cpp-httplib versions whose enqueue() returns
+ * bool, httplib closes the socket right away; older versions cannot take the
+ * connection back, so it is answered on the accepting thread, which stops
+ * accepting (leaving new connections in the kernel backlog) until it is done.
+ */
+class WorkerPool : public httplib::TaskQueue {
+ public:
+  /// Return type of TaskQueue::enqueue (void in older cpp-httplib, bool in newer)
+  using EnqueueResult = decltype(std::declval<httplib::TaskQueue &>().enqueue(std::function<void()>()));
+
+  /**
+   * @param worker_threads Threads serving connections
+   * @param max_queued Connections allowed to wait for a worker
+   * @param overflow_threads Threads answering connections that overflowed the queue
+   * @param max_overflow_queued Connections allowed to wait for an overflow thread
+   */
+  WorkerPool(size_t worker_threads, size_t max_queued, size_t overflow_threads = 2, size_t max_overflow_queued = 32);
+  ~WorkerPool() override;
+
+  WorkerPool(const WorkerPool &) = delete;
+  WorkerPool & operator=(const WorkerPool &) = delete;
+
+  /// Queue a connection; overflowing connections get a 503, rejected ones are closed (see class description)
+  EnqueueResult enqueue(std::function<void()> fn) override;
+
+  /// Finish queued connections and join all threads
+  void shutdown() override;
+
+  /// True while the calling thread serves a connection that overflowed the queue
+  static bool is_overflow_task();
+
+  /// Connections waiting for a worker
+  size_t queued() const;
+
+  /// Connections waiting for an overflow thread
+  size_t overflow_queued() const;
+
+ private:
+  struct Queue {
+    std::deque<std::function<void()>> tasks;
+    std::condition_variable cv;
+    std::vector<std::thread> threads;
+  };
+
+  void run(Queue & queue, bool overflow);
+
+  size_t max_queued_;
+  size_t max_overflow_queued_;
+  bool shutdown_{false};
+  mutable std::mutex mutex_;
+  Queue workers_;
+  Queue overflow_;
+};
+
+/**
+ * @brief Bounds how many requests of one class run concurrently
+ *
+ * Used to reserve workers for cache-served routes: handlers that block on
+ * ROS round-trips acquire a Permit first. Up to @p max_active permits are
+ * held at once and up to @p max_waiting callers block waiting for one; any
+ * further caller gets an empty Permit and should be answered with 503.
+ */
+class ConcurrencyLimiter {
+ public:
+  /// RAII slot; releases on destruction. Empty (false) when the limiter was saturated.
+  class Permit {
+   public:
+    Permit() = default;
+    ~Permit();
+
+    Permit(Permit && other) noexcept : limiter_(std::exchange(other.limiter_, nullptr)) {
+    }
+    Permit & operator=(Permit && other) noexcept;
+
+    Permit(const Permit &) = delete;
+    Permit & operator=(const Permit &) = delete;
+
+    explicit operator bool() const {
+      return limiter_ != nullptr;
+    }
+
+   private:
+    friend class ConcurrencyLimiter;
+    explicit Permit(ConcurrencyLimiter * limiter) : limiter_(limiter) {
+    }
+
+    ConcurrencyLimiter * limiter_{nullptr};
+  };
+
+  ConcurrencyLimiter(size_t max_active, size_t max_waiting);
+
+  ConcurrencyLimiter(const ConcurrencyLimiter &) = delete;
+  ConcurrencyLimiter & operator=(const ConcurrencyLimiter &) = delete;
+
+  /// Take a slot, waiting if a waiter slot is free; empty Permit if saturated
+  Permit acquire();
+
+  /// Requests currently holding a slot
+  size_t active() const;
+
+  /// Requests currently waiting for a slot
+  size_t waiting() const;
+
+ private:
+  void release();
+
+  size_t max_active_;
+  size_t max_waiting_;
+  size_t active_{0};
+  size_t waiting_{0};
+  mutable std::mutex mutex_;
+  std::condition_variable cv_;
+};
+
+}  // namespace ros2_medkit_gateway
@@ -0,0 +1,66 @@
+// Copyright 2026 bburda
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+#pragma once
+
+#include <condition_variable>
+#include <cstddef>
+#include <deque>
+#include <functional>
+#include <mutex>
+#include <thread>
+#include <vector>
+
+namespace ros2_medkit_gateway {
+
+/**
+ * @brief Fixed set of worker threads running jobs from a bounded queue
+ *
+ * Used for work that must not block an HTTP worker, such as service calls
+ * executed asynchronously. submit() never blocks: when @p max_queued jobs are
+ * already waiting it rejects the job so the caller can answer 503.
+ */
+class JobQueue {
+ public:
+  /**
+   * @param worker_threads Threads running jobs
+   * @param max_queued Jobs allowed to wait for a worker
+   */
+  JobQueue(size_t worker_threads, size_t max_queued);
+  ~JobQueue();
+
+  JobQueue(const JobQueue &) = delete;
+  JobQueue & operator=(const JobQueue &) = delete;
+
+  /// Queue a job; false if the queue is full or shut down
+  bool submit(std::function<void()> job);
+
+  /// Drop jobs that have not started and join the workers (running jobs finish first)
+  void shutdown();
+
+  /// Jobs waiting for a worker
+  size_t queued() const;
+
+ private:
+  void run();
+
+  size_t max_queued_;
+  bool shutdown_{false};
+  mutable std::mutex mutex_;
+  std::condition_variable cv_;
+  std::deque<std::function<void()>> jobs_;
+  std::vector<std::thread> threads_;
+};
+
+}  // namespace ros2_medkit_gateway
@@ -0,0 +1,136 @@
+// Copyright 2026 bburda
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+#pragma once
+
+#include <atomic>
+#include <chrono>
+#include <functional>
+#include <map>
+#include <memory>
+#include <mutex>
+#include <shared_mutex>
+#include <string>
+#include <utility>
+#include <vector>
+
+namespace ros2_medkit_gateway {
+
+/// Label name/value pairs identifying one series of a metric
+using MetricLabels = std::vector<std::pair<std::string, std::string>>;
+
+/**
+ * @brief Thread-safe registry of gateway metrics in Prometheus data model
+ *
+ * Metrics are declared once with describe_*() and then updated from any
+ * thread. Each distinct label set creates a series on first use; updates to
+ * an existing series are lock-free (atomics under a shared lock).
+ *
+ * Values owned by other components (cache statistics, client counts) are
+ * pulled at scrape time by collectors registered with add_collector().
+ *
+ * render() produces the Prometheus text exposition format (version 0.0.4)
+ * served at GET /metrics.
+ *
+ * Updates to metric names that were never described are ignored, so
+ * instrumentation never throws on the request path.
+ */
+class MetricsRegistry {
+ public:
+  /// Collector invoked before rendering to refresh pulled values
+  using Collector = std::function<void(MetricsRegistry &)>;
+
+  /// Content-Type of render() output
+  static constexpr const char * CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8";
+
+  /// Default histogram buckets for latencies in seconds (1 ms .. 30 s)
+  static const std::vector<double> & default_latency_buckets();
+
+  MetricsRegistry();
+  ~MetricsRegistry();
+
+  MetricsRegistry(const MetricsRegistry &) = delete;
+  MetricsRegistry & operator=(const MetricsRegistry &) = delete;
+
+  /// Declare a monotonically increasing counter (no-op if already declared)
+  void describe_counter(const std::string & name, const std::string & help);
+
+  /// Declare a gauge (no-op if already declared)
+  void describe_gauge(const std::string & name, const std::string & help);
+
+  /// Declare a histogram with upper bucket bounds in ascending order (no-op if already declared)
+  void describe_histogram(const std::string & name, const std::string & help,
+                          const std::vector<double> & buckets = default_latency_buckets());
+
+  /// Add to a counter or gauge series
+  void increment(const std::string & name, const MetricLabels & labels = {}, double value = 1.0);
+
+  /// Set a gauge series, or mirror a counter maintained elsewhere
+  void set(const std::string & name, const MetricLabels & labels, double value);
+
+  /// Record an observation in a histogram series
+  void observe(const std::string & name, const MetricLabels & labels, double value);
+
+  /**
+   * @brief Register a collector run at the start of every render()
+   * @return Handle for remove_collector()
+   */
+  size_t add_collector(Collector collector);
+
+  /// Unregister a collector (its owner is going away)
+  void remove_collector(size_t handle);
+
+  /// Render all metrics in Prometheus text format
+  std::string render();
+
+ private:
+  enum class MetricType { COUNTER, GAUGE, HISTOGRAM };
+  struct Family;
+  struct Series;
+
+  /// Find or create a series; returns {nullptr, nullptr} for unknown names or a type mismatch
+  std::pair<const Family *, Series *> get_series(const std::string & name, const MetricLabels & labels, bool histogram);
+  void describe(const std::string & name, const std::string & help, MetricType type,
+                const std::vector<double> & buckets);
+
+  mutable std::shared_mutex families_mutex_;
+  std::map<std::string, std::unique_ptr<Family>> families_;
+
+  std::mutex collectors_mutex_;
+  std::map<size_t, Collector> collectors_;
+  size_t next_collector_handle_{1};
+};
+
+/**
+ * @brief Observe the lifetime of a scope in a latency histogram
+ *
+ * Does nothing when the registry is null, so instrumented code does not need
+ * to check whether metrics are enabled.
+ */
+class ScopedLatency {
+ public:
+  ScopedLatency(MetricsRegistry * registry, std::string name, MetricLabels labels);
+  ~ScopedLatency();
+
+  ScopedLatency(const ScopedLatency &) = delete;
+  ScopedLatency & operator=(const ScopedLatency &) = delete;
+
+ private:
+  MetricsRegistry * registry_;
+  std::string name_;
+  MetricLabels labels_;
+  std::chrono::steady_clock::time_point start_;
+};
+
+}  // namespace ros2_medkit_gateway
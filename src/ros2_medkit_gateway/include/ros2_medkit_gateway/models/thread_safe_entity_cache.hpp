@@ -20,7 +20,9 @@
 #include "ros2_medkit_gateway/discovery/models/function.hpp"
 #include "ros2_medkit_gateway/models/entity_types.hpp"
 
+#include <atomic>
 #include <chrono>
+#include <cstdint>
 #include <optional>
 #include <shared_mutex>
 #include <string>
@@ -113,6 +115,15 @@ struct AggregatedConfigurations {
   }
 };
 
+/**
+ * @brief Aggregated resources of a Component, Area or Function, precomputed on cache updates
+ */
+struct PrecomputedAggregations {
+  AggregatedData data;
+  AggregatedOperations operations;
+  AggregatedConfigurations configurations;
+};
+
 /**
  * @brief Cache statistics
  */
@@ -123,6 +134,10 @@ struct EntityCacheStats {
   size_t function_count{0};
   size_t total_operations{0};
   std::chrono::system_clock::time_point last_update;
+  uint64_t entity_lookup_hits{0};    ///< Entity lookups by ID that found an entity
+  uint64_t entity_lookup_misses{0};  ///< Entity lookups by ID that found nothing
+  uint64_t topic_type_hits{0};       ///< Topic type lookups served from the cache
+  uint64_t topic_type_misses{0};     ///< Topic type lookups for unknown topics
 };
 
 /**
@@ -130,10 +145,11 @@ struct EntityCacheStats {
  *
  * Design principles:
  * 1. Primary storage in vectors (cache-friendly, predictable memory)
- * 2. Hash indexes for O(1) lookup by ID
+ * 2. Hash indexes for O(1) lookup by ID, keyed by interned ID handles
  * 3. Relationship indexes for O(1) aggregation queries
- * 4. Reader-writer lock for concurrent access
- * 5. Batch updates to minimize lock contention
+ * 4. Component/Area/Function aggregations precomputed on update, so aggregated reads are a lookup
+ * 5. Reader-writer lock for concurrent access
+ * 6. Batch updates to minimize lock contention
  *
  * Thread Safety:
  * - Multiple readers can access concurrently (shared lock)
@@ -253,7 +269,26 @@ class ThreadSafeEntityCache {
   std::vector<std::string> get_subareas(const std::string & area_id) const;
 
   // =========================================================================
-  // Aggregation methods (uses relationship indexes)
+  // Node FQN indexes (precomputed on every update)
+  // =========================================================================
+
+  /**
+   * @brief Get bound node FQNs of an entity
+   *
+   * App: its own bound FQN. Component: FQNs of hosted Apps. Area: FQNs of Apps
+   * hosted by the Area's Components. Function: FQNs of host Apps.
+   *
+   * The type is required because entities of different types may share an ID
+   * (runtime discovery names an Area and a Component after the same namespace).
+   *
+   * @param type Entity type, as resolved by find_entity() or the route
+   * @param entity_id Entity ID
+   * @return Set of node FQNs (empty if entity not found or nothing is bound)
+   */
+  std::unordered_set<std::string> get_entity_fqns(SovdEntityType type, const std::string & entity_id) const;
+
+  // =========================================================================
+  // Aggregation methods (precomputed on every update)
   // =========================================================================
 
   /**
@@ -288,7 +323,7 @@ class ThreadSafeEntityCache {
   AggregatedOperations get_function_operations(const std::string & function_id) const;
 
   // =========================================================================
-  // Data aggregation methods (uses relationship indexes)
+  // Data aggregation methods (precomputed on every update)
   // =========================================================================
 
   /**
@@ -419,24 +454,44 @@ class ThreadSafeEntityCache {
   // Timestamp
   std::chrono::system_clock::time_point last_update_;
 
+  // Indexes keyed by entity ID hash and compare the interned handle. A requested ID is resolved with
+  // InternedString::lookup() first: an ID that was never interned belongs to no entity.
+
   // Primary indexes (ID → vector index)
-  std::unordered_map<std::string, size_t> area_index_;
-  std::unordered_map<std::string, size_t> component_index_;
-  std::unordered_map<std::string, size_t> app_index_;
-  std::unordered_map<std::string, size_t> function_index_;
+  std::unordered_map<InternedString, size_t> area_index_;
+  std::unordered_map<InternedString, size_t> component_index_;
+  std::unordered_map<InternedString, size_t> app_index_;
+  std::unordered_map<InternedString, size_t> function_index_;
 
   // Relationship indexes (parent ID → child vector indexes)
-  std::unordered_map<std::string, std::vector<size_t>> component_to_apps_;
-  std::unordered_map<std::string, std::vector<size_t>> area_to_components_;
-  std::unordered_map<std::string, std::vector<size_t>> area_to_subareas_;
-  std::unordered_map<std::string, std::vector<size_t>> function_to_apps_;
+  std::unordered_map<InternedString, std::vector<size_t>> component_to_apps_;
+  std::unordered_map<InternedString, std::vector<size_t>> area_to_components_;
+  std::unordered_map<InternedString, std::vector<size_t>> area_to_subareas_;
+  std::unordered_map<InternedString, std::vector<size_t>> function_to_apps_;
 
   // Operation index (operation full_path → owning entity)
   std::unordered_map<std::string, EntityRef> operation_index_;
 
+  // Node FQN indexes per entity type (entity ID → bound node FQNs)
+  std::unordered_map<InternedString, std::unordered_set<std::string>> app_fqns_;
+  std::unordered_map<InternedString, std::unordered_set<std::string>> component_fqns_;
+  std::unordered_map<InternedString, std::unordered_set<std::string>> area_fqns_;
+  std::unordered_map<InternedString, std::unordered_set<std::string>> function_fqns_;
+
+  // Aggregated data/operations/configurations (entity ID → precomputed result)
+  std::unordered_map<InternedString, PrecomputedAggregations> component_aggregations_;
+  std::unordered_map<InternedString, PrecomputedAggregations> area_aggregations_;
+  std::unordered_map<InternedString, PrecomputedAggregations> function_aggregations_;
+
   // Topic type cache (topic name → message type) - refreshed periodically
   std::unordered_map<std::string, std::string> topic_type_cache_;
 
+  // Lookup statistics (updated under shared lock, hence atomic)
+  mutable std::atomic<uint64_t> entity_lookup_hits_{0};
+  mutable std::atomic<uint64_t> entity_lookup_misses_{0};
+  mutable std::atomic<uint64_t> topic_type_hits_{0};
+  mutable std::atomic<uint64_t> topic_type_misses_{0};
+
   // Internal helpers (called under lock)
   void rebuild_all_indexes();
   void rebuild_area_index();
@@ -445,6 +500,19 @@ class ThreadSafeEntityCache {
   void rebuild_function_index();
   void rebuild_relationship_indexes();
   void rebuild_operation_index();
+  void rebuild_fqn_indexes();
+  void rebuild_aggregations();
+
+  // Aggregation walks over the hierarchy (called under lock, at update time by rebuild_aggregations())
+  AggregatedOperations compute_component_operations(const InternedString & component_id) const;
+  AggregatedOperations compute_area_operations(const InternedString & area_id) const;
+  AggregatedOperations compute_function_operations(const InternedString & function_id) const;
+  AggregatedData compute_component_data(const InternedString & component_id) const;
+  AggregatedData compute_area_data(const InternedString & area_id) const;
+  AggregatedData compute_function_data(const InternedString & function_id) const;
+  AggregatedConfigurations compute_component_configurations(const InternedString & component_id) const;
+  AggregatedConfigurations compute_area_configurations(const InternedString & area_id) const;
+  AggregatedConfigurations compute_function_configurations(const InternedString & function_id) const;
 
   // Aggregation helpers (called under shared lock)
   void collect_operations_from_apps(const std::vector<size_t> & app_indexes,
@@ -137,9 +137,12 @@ class NativeTopicSampler {
    *
    * @param topic_name Full topic path
    * @param timeout_sec Maximum time to wait for a message
+   * @param projection Field selection and array decimation applied during conversion
    * @return TopicSampleResult with data (if received) or metadata only
+   * @throws ros2_medkit_serialization::FieldProjectionError if projection names a field the message type lacks
    */
-  TopicSampleResult sample_topic(const std::string & topic_name, double timeout_sec = 1.0);
+  TopicSampleResult sample_topic(const std::string & topic_name, double timeout_sec = 1.0,
+                                 const ros2_medkit_serialization::ProjectionOptions & projection = {});
 
   /**
    * @brief Sample multiple topics in parallel with metadata fallback
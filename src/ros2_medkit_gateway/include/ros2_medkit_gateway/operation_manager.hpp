@@ -17,6 +17,7 @@
 #include <action_msgs/msg/goal_status_array.hpp>
 #include <array>
 #include <chrono>
+#include <functional>
 #include <map>
 #include <memory>
 #include <mutex>
@@ -24,13 +25,20 @@
 #include <optional>
 #include <random>
 #include <rclcpp/generic_client.hpp>
+#include <rclcpp/generic_subscription.hpp>
 #include <rclcpp/rclcpp.hpp>
+#include <set>
 #include <shared_mutex>
 #include <string>
+#include <string_view>
+#include <utility>
 #include <vector>
 
 #include "ros2_medkit_gateway/discovery/discovery_manager.hpp"
 #include "ros2_medkit_gateway/discovery/models/common.hpp"
+#include "ros2_medkit_gateway/job_queue.hpp"
+#include "ros2_medkit_gateway/metrics_registry.hpp"
+#include "ros2_medkit_gateway/service_availability.hpp"
 #include "ros2_medkit_serialization/json_serializer.hpp"
 #include "ros2_medkit_serialization/service_action_types.hpp"
 
@@ -43,6 +51,7 @@ struct ServiceCallResult {
   bool success;
   json response;
   std::string error_message;
+  bool service_unavailable{false};  ///< Failed because the service has no server
 };
 
 /// Action goal status (matches ROS2 action_msgs/msg/GoalStatus)
@@ -65,6 +74,7 @@ struct ActionSendGoalResult {
   std::string goal_id;  // UUID hex string
   bool goal_accepted;
   std::string error_message;
+  bool goal_limit_reached{false};  // Not sent: max_tracked_goals goals are tracked and all still running
 };
 
 /// Result of canceling an action goal
@@ -93,11 +103,43 @@ struct ActionGoalInfo {
   std::chrono::system_clock::time_point last_update;
 };
 
+/// Change to a tracked action goal, reported through the goal event callback
+struct ActionGoalEvent {
+  std::string goal_id;
+  std::string action_path;
+  ActionGoalStatus status;  // Goal status after the change
+  json feedback;            // Feedback message content; null for status changes
+};
+
+/// Result of queueing an asynchronous service call
+struct ServiceSubmitResult {
+  bool success;
+  std::string execution_id;  // UUID hex string
+  std::string error_message;
+};
+
+/// Tracked asynchronous service execution (stored locally)
+struct ServiceExecutionInfo {
+  std::string execution_id;
+  std::string service_path;  // e.g., /powertrain/engine/calibrate
+  std::string service_type;  // e.g., std_srvs/srv/Trigger
+  /// ACCEPTED while queued, EXECUTING during the call, then SUCCEEDED, ABORTED (call failed)
+  /// or CANCELED (canceled before it started)
+  ActionGoalStatus status;
+  ServiceCallResult result;
+  std::chrono::system_clock::time_point created_at;
+  std::chrono::system_clock::time_point last_update;
+};
+
 /// Manager for ROS2 operations (services and actions)
-/// Handles service calls synchronously and action calls asynchronously
+/// Handles service calls synchronously or through a job queue, and action calls asynchronously
 class OperationManager {
  public:
   explicit OperationManager(rclcpp::Node * node, DiscoveryManager * discovery_manager);
+  ~OperationManager();
+
+  OperationManager(const OperationManager &) = delete;
+  OperationManager & operator=(const OperationManager &) = delete;
 
   /// Call a ROS2 service synchronously
   /// @param service_path Full service path (e.g., "/powertrain/engine/calibrate")
@@ -117,6 +159,27 @@ class OperationManager {
   ServiceCallResult call_component_service(const std::string & component_ns, const std::string & operation_name,
                                            const std::optional<std::string> & service_type, const json & request);
 
+  // ==================== ASYNCHRONOUS SERVICE EXECUTIONS ====================
+
+  /// Queue a service call for a worker thread instead of blocking the caller
+  /// The result is kept until cleanup_old_goals() removes it
+  /// @param service_path Full service path
+  /// @param service_type Service type
+  /// @param request JSON request body
+  /// @return ServiceSubmitResult with execution_id, or an error if the queue is full
+  ServiceSubmitResult submit_service_call(const std::string & service_path, const std::string & service_type,
+                                          const json & request);
+
+  /// Get a tracked service execution by execution_id
+  std::optional<ServiceExecutionInfo> get_service_execution(const std::string & execution_id) const;
+
+  /// Get all executions of a service, sorted by created_at (newest first)
+  std::vector<ServiceExecutionInfo> get_service_executions(const std::string & service_path) const;
+
+  /// Cancel a service execution that has not started yet
+  /// @return true if the execution was still queued and is now CANCELED
+  bool cancel_service_execution(const std::string & execution_id);
+
   /// Validate message type format (package/srv/Type or package/action/Type)
   static bool is_valid_message_type(const std::string & type);
 
@@ -193,27 +256,45 @@ class OperationManager {
   /// @param feedback New feedback JSON
   void update_goal_feedback(const std::string & goal_id, const json & feedback);
 
-  /// Remove completed goals older than specified duration
+  /// Remove completed goals and finished service executions older than specified duration,
+  /// and drop action clients left idle for action_client_idle_timeout_sec
+  /// Goals are visited oldest first, so only the removed goals are examined
   /// @param max_age Maximum age of completed goals to keep
   void cleanup_old_goals(std::chrono::seconds max_age = std::chrono::seconds(300));
 
   /// Subscribe to action status topic for real-time updates
   /// Called automatically when a goal is sent
   /// @param action_path Full action path (e.g., "/powertrain/engine/long_calibration")
-  void subscribe_to_action_status(const std::string & action_path);
+  /// @param action_type Action type; when given, the feedback topic is subscribed as well
+  void subscribe_to_action_status(const std::string & action_path, const std::string & action_type = "");
 
-  /// Unsubscribe from action status topic
+  /// Unsubscribe from action status (and feedback) topics
   /// Called when no more active goals exist for this action
   /// @param action_path Full action path
   void unsubscribe_from_action_status(const std::string & action_path);
 
+  /// Report goal status changes and feedback of tracked goals to @p callback (empty disables)
+  /// The callback runs on ROS callback and HTTP worker threads and must not block
+  void set_goal_event_callback(std::function<void(const ActionGoalEvent &)> callback);
+
+  /// Record service call latency per target service in @p metrics (nullptr disables)
+  void set_metrics_registry(MetricsRegistry * metrics);
+
+  /// Answer "service available?" from @p availability instead of waiting before each call (nullptr: wait)
+  void set_service_availability(ServiceAvailability * availability);
+
+  /// Number of actions with cached clients (dropped by cleanup_old_goals() once idle)
+  size_t action_client_count() const;
+
  private:
   /// Set of clients for an action (internal services)
+  /// Shared by all calls to the action; callers hold a reference, so eviction never cuts a call short
   struct ActionClientSet {
     rclcpp::GenericClient::SharedPtr send_goal_client;
     rclcpp::GenericClient::SharedPtr get_result_client;
     rclcpp::GenericClient::SharedPtr cancel_goal_client;
-    std::string action_type;  // Store type for later use
+    std::string action_type;                          // Store type for later use
+    std::chrono::steady_clock::time_point last_used;  // Guarded by clients_mutex_
   };
 
   /// Convert UUID hex string to JSON array of byte values
@@ -225,7 +306,8 @@ class OperationManager {
   /// Convert UUID bytes to JSON array
   json uuid_bytes_to_json_array(const std::array<uint8_t, 16> & uuid);
 
-  /// Track a new goal
+  /// Track a new goal, evicting the oldest finished goal when max_tracked_goals is reached
+  /// Running goals are never evicted; if all of them are running the limit is exceeded with a warning
   void track_goal(const std::string & goal_id, const std::string & action_path, const std::string & action_type);
 
   /// Get or create a cached GenericClient for a service
@@ -233,7 +315,14 @@ class OperationManager {
                                                                 const std::string & service_type);
 
   /// Get or create cached action clients for an action
-  ActionClientSet & get_or_create_action_clients(const std::string & action_path, const std::string & action_type);
+  std::shared_ptr<ActionClientSet> get_or_create_action_clients(const std::string & action_path,
+                                                                const std::string & action_type);
+
+  /// True if a new goal can be tracked without exceeding max_tracked_goals (a finished goal can make room)
+  bool can_track_new_goal() const;
+
+  /// Drop cached action clients without tracked goals that were not used for action_client_idle_timeout_sec
+  void evict_idle_action_clients();
 
   /// Make cache key from service path and type
   static std::string make_client_key(const std::string & service_path, const std::string & service_type);
@@ -252,25 +341,77 @@ class OperationManager {
   mutable std::shared_mutex clients_mutex_;
   std::map<std::string, rclcpp::GenericClient::SharedPtr> generic_clients_;
 
-  /// Cache for action client sets (key = action_path)
-  std::map<std::string, ActionClientSet> action_clients_;
+  /// Cache for action client sets (key = action_path, guarded by clients_mutex_)
+  std::map<std::string, std::shared_ptr<ActionClientSet>> action_clients_;
+
+  /// Idle time after which unused action clients are dropped (action_client_idle_timeout_sec param)
+  std::chrono::seconds action_client_idle_timeout_;
 
   /// Timeout for service calls in seconds (configurable via service_call_timeout_sec param)
   int service_call_timeout_sec_;
 
+  /// Gateway metrics (owned by GatewayNode, may be null)
+  MetricsRegistry * metrics_{nullptr};
+
+  /// Service availability tracker (owned by GatewayNode, may be null)
+  ServiceAvailability * availability_{nullptr};
+
+  /// Index key ordering goals by a timestamp, ties broken by goal_id
+  using GoalKey = std::pair<std::chrono::system_clock::time_point, std::string>;
+  /// Transparent comparator: status messages look goals up by std::string_view without allocating
+  using GoalMap = std::map<std::string, ActionGoalInfo, std::less<>>;
+
   /// Map of goal_id -> ActionGoalInfo for tracking active goals
   mutable std::mutex goals_mutex_;
-  std::map<std::string, ActionGoalInfo> tracked_goals_;
+  GoalMap tracked_goals_;
+
+  /// action_path -> goals of that action by created_at, newest first
+  std::map<std::string, std::set<GoalKey, std::greater<GoalKey>>> goals_by_action_;
+
+  /// Finished goals by last_update, oldest first (removed first by cleanup and eviction)
+  std::set<GoalKey> finished_goals_;
+
+  /// Maximum number of tracked goals (configurable via max_tracked_goals param)
+  size_t max_tracked_goals_;
+
+  /// Set status and last_update of a tracked goal, keeping finished_goals_ in order (goals_mutex_ held)
+  void set_goal_status_locked(ActionGoalInfo & info, ActionGoalStatus status,
+                              std::chrono::system_clock::time_point now);
+
+  /// Remove a tracked goal from the map and all indexes (goals_mutex_ held)
+  /// @param emptied_actions Receives the goal's action path if no goal of that action is left
+  void erase_goal_locked(GoalMap::iterator it, std::vector<std::string> & emptied_actions);
 
   /// Callback for action status topic updates
   void on_action_status(const std::string & action_path, const action_msgs::msg::GoalStatusArray::ConstSharedPtr & msg);
 
+  /// Callback for action feedback topic messages (<action>/_action/feedback)
+  void on_action_feedback(const std::string & action_path, const std::string & feedback_type,
+                          const rclcpp::SerializedMessage & msg);
+
+  /// Pass @p event to the goal event callback, if set
+  void emit_goal_event(const ActionGoalEvent & event);
+
   /// Convert goal UUID bytes to hex string
   std::string uuid_bytes_to_hex(const std::array<uint8_t, 16> & uuid) const;
 
   /// Map of action_path -> status subscription
   mutable std::mutex subscriptions_mutex_;
   std::map<std::string, rclcpp::Subscription<action_msgs::msg::GoalStatusArray>::SharedPtr> status_subscriptions_;
+
+  /// Map of action_path -> feedback subscription (guarded by subscriptions_mutex_)
+  std::map<std::string, rclcpp::GenericSubscription::SharedPtr> feedback_subscriptions_;
+
+  /// Receiver of goal status changes and feedback; held while it runs so it can be cleared safely
+  std::mutex goal_event_mutex_;
+  std::function<void(const ActionGoalEvent &)> goal_event_callback_;
+
+  /// Map of execution_id -> ServiceExecutionInfo for asynchronous service calls
+  mutable std::mutex service_executions_mutex_;
+  std::map<std::string, ServiceExecutionInfo> service_executions_;
+
+  /// Workers running asynchronous service calls (declared last: its jobs use the members above)
+  std::unique_ptr<JobQueue> service_jobs_;
 };
 
 }  // namespace ros2_medkit_gateway
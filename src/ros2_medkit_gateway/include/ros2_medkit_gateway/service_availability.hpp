@@ -0,0 +1,95 @@
+// Copyright 2026 bburda
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+#pragma once
+
+#include <atomic>
+#include <chrono>
+#include <memory>
+#include <rclcpp/rclcpp.hpp>
+#include <shared_mutex>
+#include <string>
+#include <thread>
+#include <unordered_map>
+#include <vector>
+
+namespace ros2_medkit_gateway {
+
+/**
+ * @brief Tracks which services have a server, driven by ROS graph events
+ *
+ * Replaces wait_for_service() before each request. A service seen up answers
+ * from memory; a service not seen up is checked against the graph without
+ * waiting, so requests to a missing server fail immediately instead of after
+ * the full timeout. A background thread re-checks every tracked service when
+ * the graph changes, so servers that go away are noticed without polling.
+ *
+ * The first lookup of a client that is not tracked yet still waits for its
+ * server, up to a short bound, since a just created client may not see a
+ * running server until discovery has caught up.
+ *
+ * Clients are tracked on first use and dropped once destroyed.
+ */
+class ServiceAvailability {
+ public:
+  /// Start watching the graph of @p node
+  /// @param first_use_wait Longest wait for the server on the first lookup of a client
+  explicit ServiceAvailability(rclcpp::Node * node,
+                               std::chrono::milliseconds first_use_wait = std::chrono::milliseconds(500));
+  ~ServiceAvailability();
+
+  ServiceAvailability(const ServiceAvailability &) = delete;
+  ServiceAvailability & operator=(const ServiceAvailability &) = delete;
+
+  /// True if the client's service has a server
+  ///
+  /// Blocks only on the first lookup of @p client, for at most min(@p timeout, first_use_wait).
+  bool is_available(const rclcpp::ClientBase::SharedPtr & client,
+                    std::chrono::nanoseconds timeout = std::chrono::nanoseconds::max());
+
+  /// Number of tracked services
+  size_t tracked_count() const;
+
+ private:
+  struct Entry {
+    std::vector<std::weak_ptr<rclcpp::ClientBase>> clients;  ///< clients already looked up once
+    bool available{false};
+  };
+
+  /// Wait for graph changes and refresh() after each
+  void watch_graph();
+
+  /// Re-check every tracked service against the graph
+  void refresh();
+
+  rclcpp::Node * node_;
+  std::chrono::milliseconds first_use_wait_;
+
+  mutable std::shared_mutex mutex_;
+  std::unordered_map<std::string, Entry> entries_;  ///< keyed by service name
+
+  std::atomic<bool> running_{true};
+  std::thread watch_thread_;
+};
+
+/**
+ * @brief Wait for a client's server, answering from @p availability when set
+ *
+ * With a tracker the answer is immediate after the client's first lookup;
+ * without one (nullptr) this falls back to client->wait_for_service(timeout).
+ */
+bool wait_for_server(ServiceAvailability * availability, const rclcpp::ClientBase::SharedPtr & client,
+                     std::chrono::duration<double> timeout);
+
+}  // namespace ros2_medkit_gateway
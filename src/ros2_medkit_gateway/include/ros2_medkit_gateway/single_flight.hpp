@@ -0,0 +1,112 @@
+// Copyright 2026 bburda
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+#pragma once
+
+#include <atomic>
+#include <cstdint>
+#include <exception>
+#include <future>
+#include <mutex>
+#include <string>
+#include <unordered_map>
+#include <utility>
+
+namespace ros2_medkit_gateway {
+
+/**
+ * @brief Coalesces concurrent identical operations into one execution
+ *
+ * The first caller for a key runs the operation; callers arriving with the
+ * same key while it is in flight wait for it and receive a copy of the same
+ * result (or the same exception). Once the operation completes the key is
+ * forgotten, so nothing is cached: the next call starts a fresh operation.
+ *
+ * Used to keep load on the ROS graph proportional to distinct requests when
+ * many clients poll the same topic, parameter list or fault list.
+ *
+ * @tparam Result Operation result type (must be copyable)
+ *
+ * @example
+ * SingleFlight<json> flights;
+ * json sample = flights.run(topic_name, [&] { return sample_topic(topic_name); });
+ */
+template <typename Result>
+class SingleFlight {
+ public:
+  SingleFlight() = default;
+
+  SingleFlight(const SingleFlight &) = delete;
+  SingleFlight & operator=(const SingleFlight &) = delete;
+
+  /**
+   * @brief Run @p operation for @p key, or join the identical call in flight
+   *
+   * @param key Identifies identical operations (must cover every input that affects the result)
+   * @param operation Callable returning Result; may throw
+   * @return Result of the shared operation
+   * @throws Whatever the shared operation threw
+   */
+  template <typename Operation>
+  Result run(const std::string & key, Operation && operation) {
+    std::promise<Result> promise;
+    {
+      std::unique_lock<std::mutex> lock(mutex_);
+      auto it = in_flight_.find(key);
+      if (it != in_flight_.end()) {
+        std::shared_future<Result> shared = it->second;
+        lock.unlock();
+        shared_calls_.fetch_add(1, std::memory_order_relaxed);
+        return shared.get();
+      }
+      in_flight_.emplace(key, promise.get_future().share());
+    }
+
+    // Remove the key before publishing the result, so callers arriving after
+    // completion start a new operation instead of reusing a stale result
+    try {
+      Result result = operation();
+      forget(key);
+      promise.set_value(result);
+      return result;
+    } catch (...) {
+      forget(key);
+      promise.set_exception(std::current_exception());
+      throw;
+    }
+  }
+
+  /// Number of operations currently in flight
+  size_t in_flight() const {
+    std::lock_guard<std::mutex> lock(mutex_);
+    return in_flight_.size();
+  }
+
+  /// Total number of calls that joined an operation instead of starting one
+  uint64_t shared_calls() const {
+    return shared_calls_.load(std::memory_order_relaxed);
+  }
+
+ private:
+  void forget(const std::string & key) {
+    std::lock_guard<std::mutex> lock(mutex_);
+    in_flight_.erase(key);
+  }
+
+  mutable std::mutex mutex_;
+  std::unordered_map<std::string, std::shared_future<Result>> in_flight_;
+  std::atomic<uint64_t> shared_calls_{0};
+};
+
+}  // namespace ros2_medkit_gateway
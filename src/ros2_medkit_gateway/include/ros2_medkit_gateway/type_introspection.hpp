@@ -14,11 +14,17 @@
 
 #pragma once
 
+#include <atomic>
+#include <cstddef>
+#include <cstdint>
 #include <memory>
 #include <mutex>
 #include <nlohmann/json.hpp>
+#include <shared_mutex>
 #include <string>
 #include <unordered_map>
+#include <utility>
+#include <vector>
 
 #include "ros2_medkit_serialization/json_serializer.hpp"
 
@@ -33,6 +39,9 @@ struct TopicTypeInfo {
   nlohmann::json default_value;  ///< Template with default values
 };
 
+/// Shared, immutable type info handed out by the cache (avoids deep-copying schema JSON per request)
+using TopicTypeInfoPtr = std::shared_ptr<const TopicTypeInfo>;
+
 /**
  * @brief Provides type introspection capabilities for ROS 2 message types
  *
@@ -40,16 +49,25 @@ struct TopicTypeInfo {
  * without requiring actual message data. It uses the native JsonSerializer
  * to gather type information via dynmsg.
  *
- * Type information is cached to avoid repeated introspection calls for the same types.
+ * Fully built TopicTypeInfo is memoized per type name in a bounded cache shared by
+ * the HTTP handlers and runtime discovery. Reads take a shared lock, so concurrent
+ * requests for cached types never serialize on each other. When the cache is full,
+ * the least recently used entry is evicted.
  */
 class TypeIntrospection {
  public:
+  /// Default maximum number of cached message types
+  static constexpr size_t kDefaultMaxCacheSize = 1024;
+
   /**
    * @brief Construct a new TypeIntrospection object
    *
    * The scripts_path parameter is deprecated and ignored - native serialization is used.
+   *
+   * @param scripts_path Deprecated, ignored
+   * @param max_cache_size Maximum number of cached types (0 = unbounded)
    */
-  explicit TypeIntrospection(const std::string & scripts_path = "");
+  explicit TypeIntrospection(const std::string & scripts_path = "", size_t max_cache_size = kDefaultMaxCacheSize);
 
   ~TypeIntrospection() = default;
 
@@ -70,6 +88,50 @@ class TypeIntrospection {
    */
   TopicTypeInfo get_type_info(const std::string & type_name);
 
+  /**
+   * @brief Get cached type information without copying the schema JSON
+   *
+   * Same semantics as get_type_info(), but returns a shared pointer to the cached
+   * entry. Prefer this in hot paths (listing data/operations for large entities).
+   *
+   * @param type_name Full type name (e.g., "sensor_msgs/msg/Temperature")
+   * @return Shared pointer to immutable TopicTypeInfo (never nullptr)
+   */
+  TopicTypeInfoPtr get_type_info_ptr(const std::string & type_name);
+
+  /**
+   * @brief Build and cache type information for the given types ahead of time
+   *
+   * Types already in the cache are skipped. Prewarming never evicts: it stops once
+   * the cache is full. Used at startup and on discovery refresh so the first request
+   * for a topic does not pay the schema build cost.
+   *
+   * @param type_names Full type names to prewarm
+   * @return Number of types that were newly built
+   */
+  size_t prewarm(const std::vector<std::string> & type_names);
+
+  /// Number of types currently cached
+  size_t cache_size() const;
+
+  /// Maximum number of cached types (0 = unbounded)
+  size_t max_cache_size() const {
+    return max_cache_size_;
+  }
+
+  /// Number of get_type_info lookups served from cache
+  uint64_t cache_hits() const {
+    return cache_hits_.load(std::memory_order_relaxed);
+  }
+
+  /// Number of get_type_info lookups that had to build type info
+  uint64_t cache_misses() const {
+    return cache_misses_.load(std::memory_order_relaxed);
+  }
+
+  /// Drop all cached type info
+  void clear_cache();
+
   /**
    * @brief Get the default value template for a message type
    *
@@ -93,11 +155,30 @@ class TypeIntrospection {
   nlohmann::json get_type_schema(const std::string & type_name);
 
  private:
+  struct CacheEntry {
+    TopicTypeInfoPtr info;
+    mutable std::atomic<uint64_t> last_used{0};  ///< Access tick for LRU eviction (updated under shared lock)
+
+    explicit CacheEntry(TopicTypeInfoPtr i, uint64_t tick) : info(std::move(i)), last_used(tick) {
+    }
+  };
+
+  /// Build type info via the serializer (no caching)
+  TopicTypeInfoPtr build_type_info(const std::string & type_name);
+
+  /// Evict least recently used entries until there is room for one more (caller holds unique lock)
+  void evict_if_full();
+
   /// Native JSON serializer for type introspection
   std::shared_ptr<ros2_medkit_serialization::JsonSerializer> serializer_;
 
-  std::unordered_map<std::string, TopicTypeInfo> type_cache_;  ///< Cache for type info
-  mutable std::mutex cache_mutex_;                             ///< Mutex for thread-safe cache access
+  size_t max_cache_size_;
+  std::unordered_map<std::string, std::unique_ptr<CacheEntry>> type_cache_;  ///< Cache for type info
+  mutable std::shared_mutex cache_mutex_;  ///< Shared for lookups, exclusive for insert/evict
+
+  std::atomic<uint64_t> access_tick_{0};
+  std::atomic<uint64_t> cache_hits_{0};
+  std::atomic<uint64_t> cache_misses_{0};
 };
 
 }  // namespace ros2_medkit_gateway
@@ -178,4 +178,43 @@ CorsConfig CorsConfigBuilder::build() {
   return config_;
 }
 
+// CompressionConfig implementation
+
+std::string CompressionConfig::validate() const {
+  if (gzip_level < 1 || gzip_level > 9) {
+    return "Compression: gzip_level must be between 1 and 9, got: " + std::to_string(gzip_level);
+  }
+  if (zstd_level < 1 || zstd_level > 19) {
+    return "Compression: zstd_level must be between 1 and 19, got: " + std::to_string(zstd_level);
+  }
+  return "";  // Valid
+}
+
+// ServerLimitsConfig implementation
+
+std::string ServerLimitsConfig::validate() const {
+  if (worker_threads == 0) {
+    return "Server limits: worker_threads must be > 0";
+  }
+  if (slow_route_concurrency == 0) {
+    return "Server limits: slow_route_concurrency must be > 0";
+  }
+  // Slow requests (running or waiting) must never occupy every worker
+  if (slow_route_concurrency + slow_route_queue >= worker_threads) {
+    return "Server limits: slow_route_concurrency + slow_route_queue (" +
+           std::to_string(slow_route_concurrency + slow_route_queue) + ") must be less than worker_threads (" +
+           std::to_string(worker_threads) + ")";
+  }
+  if (keep_alive_max_count == 0) {
+    return "Server limits: keep_alive_max_count must be > 0";
+  }
+  if (keep_alive_timeout_sec < 1) {
+    return "Server limits: keep_alive_timeout_sec must be >= 1, got: " + std::to_string(keep_alive_timeout_sec);
+  }
+  if (retry_after_sec < 1) {
+    return "Server limits: retry_after_sec must be >= 1, got: " + std::to_string(retry_after_sec);
+  }
+  return "";  // Valid
+}
+
 }  // namespace ros2_medkit_gateway
@@ -15,15 +15,48 @@
 #include "ros2_medkit_gateway/configuration_manager.hpp"
 
 #include <chrono>
+#include <future>
+#include <stdexcept>
 
 using namespace std::chrono_literals;
 
 namespace ros2_medkit_gateway {
 
+namespace {
+
+/// A parameter service accepted a request but did not answer within the service timeout
+class ParameterServiceTimeout : public std::runtime_error {
+ public:
+  using std::runtime_error::runtime_error;
+};
+
+/// Wait for a parameter client response
+/// @throws ParameterServiceTimeout if it does not arrive within @p timeout
+template <typename T>
+T await_response(const std::shared_future<T> & future, std::chrono::duration<double> timeout, const char * call) {
+  if (future.wait_for(timeout) != std::future_status::ready) {
+    throw ParameterServiceTimeout(std::string(call) + " request timed out");
+  }
+  return future.get();
+}
+
+/// Classify the reason a node gave for rejecting a parameter value
+ParameterErrorCode classify_set_failure(const std::string & reason) {
+  if (reason.find("read-only") != std::string::npos || reason.find("read only") != std::string::npos ||
+      reason.find("is read_only") != std::string::npos) {
+    return ParameterErrorCode::READ_ONLY;
+  }
+  if (reason.find("type") != std::string::npos) {
+    return ParameterErrorCode::TYPE_MISMATCH;
+  }
+  return ParameterErrorCode::INVALID_VALUE;
+}
+
+}  // namespace
+
 ConfigurationManager::ConfigurationManager(rclcpp::Node * node) : node_(node) {
   // Create an internal node for parameter client operations
-  // SyncParametersClient needs a node that is NOT added to any executor
-  // so it can spin internally when waiting for service responses
+  // It gets its own executor thread so parameter calls never spin on HTTP threads
   rclcpp::NodeOptions options;
   options.start_parameter_services(false);
   options.start_parameter_event_publisher(false);
@@ -35,7 +68,60 @@ ConfigurationManager::ConfigurationManager(rclcpp::Node * node) : node_(node) {
   // Get configurable timeout for parameter services (default 2.0 seconds)
   service_timeout_sec_ = node_->declare_parameter("parameter_service_timeout_sec", 2.0);
 
-  RCLCPP_INFO(node_->get_logger(), "ConfigurationManager initialized");
+  // Validate parameter_max_concurrent_requests against allowed range [1, 256]
+  auto max_concurrent = node_->declare_parameter<int64_t>("parameter_max_concurrent_requests", 32);
+  if (max_concurrent < 1 || max_concurrent > 256) {
+    RCLCPP_WARN(node_->get_logger(),
+                "parameter_max_concurrent_requests (%ld) out of valid range (1-256), using default: 32",
+                static_cast<long>(max_concurrent));
+    max_concurrent = 32;
+  }
+  max_concurrent_requests_ = static_cast<size_t>(max_concurrent);
+
+  cache_enabled_ = node_->declare_parameter("parameter_cache.enabled", true);
+  cache_max_age_sec_ = node_->declare_parameter("parameter_cache.max_age_sec", 60.0);
+  if (cache_max_age_sec_ < 0.0) {
+    RCLCPP_WARN(node_->get_logger(), "parameter_cache.max_age_sec (%.1f) must be >= 0, using default: 60.0",
+                cache_max_age_sec_);
+    cache_max_age_sec_ = 60.0;
+  }
+  if (cache_enabled_) {
+    // Received on param_executor_ like the parameter client responses
+    parameter_events_sub_ = param_node_->create_subscription<rcl_interfaces::msg::ParameterEvent>(
+        "/parameter_events", rclcpp::ParameterEventsQoS(),
+        [this](const rcl_interfaces::msg::ParameterEvent::SharedPtr event) {
+          on_parameter_event(*event);
+        });
+  }
+
+  // Parameter client responses are delivered here; callers only wait on futures
+  param_executor_ = std::make_shared<rclcpp::executors::SingleThreadedExecutor>();
+  param_executor_->add_node(param_node_);
+  param_spin_thread_ = std::thread([this]() {
+    while (param_spinning_.load() && rclcpp::ok()) {
+      param_executor_->spin_once(std::chrono::milliseconds(100));
+    }
+  });
+
+  RCLCPP_INFO(node_->get_logger(), "ConfigurationManager initialized (max_concurrent_requests=%zu, parameter_cache=%s)",
+              max_concurrent_requests_, cache_enabled_ ? "enabled" : "disabled");
+}
+
+ConfigurationManager::~ConfigurationManager() {
+  param_spinning_.store(false);
+  param_executor_->cancel();
+  if (param_spin_thread_.joinable()) {
+    param_spin_thread_.join();
+  }
+  param_executor_->remove_node(param_node_);
+}
+
+void ConfigurationManager::set_metrics_registry(MetricsRegistry * metrics) {
+  metrics_ = metrics;
+  if (metrics_) {
+    metrics_->describe_histogram("medkit_ros_service_call_duration_seconds",
+                                 "ROS 2 service call latency by target service");
+  }
 }
 
 /// Helper to get the service timeout as a chrono duration
@@ -43,7 +129,11 @@ std::chrono::duration<double> ConfigurationManager::get_service_timeout() const
   return std::chrono::duration<double>(service_timeout_sec_);
 }
 
-std::shared_ptr<rclcpp::SyncParametersClient> ConfigurationManager::get_param_client(const std::string & node_name) {
+std::chrono::duration<double> ConfigurationManager::get_max_age() const {
+  return std::chrono::duration<double>(cache_max_age_sec_);
+}
+
+std::shared_ptr<rclcpp::AsyncParametersClient> ConfigurationManager::get_param_client(const std::string & node_name) {
   std::lock_guard<std::mutex> lock(clients_mutex_);
 
   auto it = param_clients_.find(node_name);
@@ -52,26 +142,98 @@ std::shared_ptr<rclcpp::SyncParametersClient> ConfigurationManager::get_param_cl
   }
 
   // Create new client for this node using the internal param_node_
-  // (not the main gateway node, which is already in an executor)
-  auto client = std::make_shared<rclcpp::SyncParametersClient>(param_node_, node_name);
+  // (its responses are delivered by param_executor_)
+  auto client = std::make_shared<rclcpp::AsyncParametersClient>(param_node_, node_name);
   param_clients_[node_name] = client;
   return client;
 }
 
-ParameterResult ConfigurationManager::list_parameters(const std::string & node_name) {
-  std::lock_guard<std::mutex> op_lock(param_operations_mutex_);
+std::shared_ptr<std::mutex> ConfigurationManager::get_node_mutex(const std::string & node_name) {
+  std::lock_guard<std::mutex> lock(node_mutexes_mutex_);
+  auto & node_mutex = node_mutexes_[node_name];
+  if (!node_mutex) {
+    node_mutex = std::make_shared<std::mutex>();
+  }
+  return node_mutex;
+}
+
+ConfigurationManager::RequestSlot::RequestSlot(ConfigurationManager & manager) : manager_(manager) {
+  std::unique_lock<std::mutex> lock(manager_.slots_mutex_);
+  manager_.slots_cv_.wait(lock, [this]() {
+    return manager_.requests_in_flight_ < manager_.max_concurrent_requests_;
+  });
+  ++manager_.requests_in_flight_;
+}
+
+ConfigurationManager::RequestSlot::~RequestSlot() {
+  {
+    std::lock_guard<std::mutex> lock(manager_.slots_mutex_);
+    --manager_.requests_in_flight_;
+  }
+  manager_.slots_cv_.notify_one();
+}
+
+ParameterResult ConfigurationManager::list_parameters(const std::string & node_name, bool fresh) {
+  if (!fresh) {
+    if (auto cached = cached_list_parameters(node_name)) {
+      return *cached;
+    }
+  }
+  return list_flights_.run(node_name, [&]() {
+    return call_list_parameters(node_name);
+  });
+}
+
+std::vector<rclcpp::Parameter>
+ConfigurationManager::fetch_all_parameters(const std::shared_ptr<rclcpp::AsyncParametersClient> & client,
+                                           const std::string & node_name) {
+  auto param_names = await_response(client->list_parameters({}, 0), get_service_timeout(), "list_parameters");
+
+  RCLCPP_DEBUG(node_->get_logger(), "Got %zu parameter names for node: '%s'", param_names.names.size(),
+               node_name.c_str());
+
+  // First try getting all at once
+  auto parameters = await_response(client->get_parameters(param_names.names), get_service_timeout(), "get_parameters");
+
+  if (parameters.empty() && !param_names.names.empty()) {
+    RCLCPP_WARN(node_->get_logger(), "get_parameters returned empty, trying one by one for node: '%s'",
+                node_name.c_str());
+    // Issue all single gets at once and collect them, instead of one round trip after another
+    std::vector<std::shared_future<std::vector<rclcpp::Parameter>>> pending;
+    pending.reserve(param_names.names.size());
+    for (const auto & name : param_names.names) {
+      pending.push_back(client->get_parameters({name}));
+    }
+    for (size_t i = 0; i < pending.size(); ++i) {
+      try {
+        auto single_params = await_response(pending[i], get_service_timeout(), "get_parameters");
+        if (!single_params.empty()) {
+          parameters.push_back(single_params[0]);
+        }
+      } catch (const std::exception & e) {
+        RCLCPP_DEBUG(node_->get_logger(), "Failed to get param '%s': %s", param_names.names[i].c_str(), e.what());
+      }
+    }
+  }
+
+  return parameters;
+}
+
+ParameterResult ConfigurationManager::call_list_parameters(const std::string & node_name) {
+  // Node lock first: callers queued behind the same node do not hold request slots
+  auto node_mutex = get_node_mutex(node_name);
+  std::lock_guard<std::mutex> node_lock(*node_mutex);
+  RequestSlot slot(*this);
   ParameterResult result;
+  ScopedLatency latency(metrics_, "medkit_ros_service_call_duration_seconds",
+                        {{"service", node_name + "/list_parameters"}});
 
   RCLCPP_DEBUG(node_->get_logger(), "list_parameters called for node: '%s'", node_name.c_str());
 
-  // Cache default values on first access to this node
-  cache_default_values(node_name);
-
+  uint64_t version = cache_version(node_name);
   try {
     auto client = get_param_client(node_name);
 
-    RCLCPP_DEBUG(node_->get_logger(), "Got param client for node: '%s'", node_name.c_str());
-
     if (!client->wait_for_service(get_service_timeout())) {
       result.success = false;
       result.error_message = "Parameter service not available for node: " + node_name;
@@ -80,43 +242,14 @@ ParameterResult ConfigurationManager::list_parameters(const std::string & node_n
       return result;
     }
 
-    RCLCPP_DEBUG(node_->get_logger(), "Service ready for node: '%s'", node_name.c_str());
-
-    // List all parameter names
-    auto param_names = client->list_parameters({}, 0);
-
-    RCLCPP_DEBUG(node_->get_logger(), "Got %zu parameter names for node: '%s'", param_names.names.size(),
-                 node_name.c_str());
-
-    // Log first few parameter names for debugging
-    for (size_t i = 0; i < std::min(param_names.names.size(), static_cast<size_t>(5)); ++i) {
-      RCLCPP_DEBUG(node_->get_logger(), "  param[%zu]: '%s'", i, param_names.names[i].c_str());
-    }
-
-    // Get all parameter values - try in smaller batches if needed
-    std::vector<rclcpp::Parameter> parameters;
-
-    // First try getting all at once
-    parameters = client->get_parameters(param_names.names);
-
-    if (parameters.empty() && !param_names.names.empty()) {
-      RCLCPP_WARN(node_->get_logger(), "get_parameters returned empty, trying one by one for node: '%s'",
-                  node_name.c_str());
-      // Try getting parameters one by one
-      for (const auto & name : param_names.names) {
-        try {
-          auto single_params = client->get_parameters({name});
-          if (!single_params.empty()) {
-            parameters.push_back(single_params[0]);
-          }
-        } catch (const std::exception & e) {
-          RCLCPP_DEBUG(node_->get_logger(), "Failed to get param '%s': %s", name.c_str(), e.what());
-        }
-      }
-    }
+    auto parameters = fetch_all_parameters(client, node_name);
 
     RCLCPP_DEBUG(node_->get_logger(), "Got %zu parameter values for node: '%s'", parameters.size(), node_name.c_str());
 
+    // The first listing of a node doubles as its defaults snapshot (no second round trip)
+    store_default_values(node_name, parameters);
+    cache_listing(node_name, version, parameters);
+
     json params_array = json::array();
     for (const auto & param : parameters) {
       json param_obj;
@@ -128,6 +261,11 @@ ParameterResult ConfigurationManager::list_parameters(const std::string & node_n
 
     result.success = true;
     result.data = params_array;
+  } catch (const ParameterServiceTimeout & e) {
+    result.success = false;
+    result.error_message = std::string("Failed to list parameters: ") + e.what();
+    result.error_code = ParameterErrorCode::TIMEOUT;
+    RCLCPP_WARN(node_->get_logger(), "Timeout in list_parameters for node '%s': %s", node_name.c_str(), e.what());
   } catch (const std::exception & e) {
     result.success = false;
     result.error_message = std::string("Failed to list parameters: ") + e.what();
@@ -138,10 +276,28 @@ ParameterResult ConfigurationManager::list_parameters(const std::string & node_n
   return result;
 }
 
-ParameterResult ConfigurationManager::get_parameter(const std::string & node_name, const std::string & param_name) {
-  std::lock_guard<std::mutex> op_lock(param_operations_mutex_);
+ParameterResult ConfigurationManager::get_parameter(const std::string & node_name, const std::string & param_name,
+                                                    bool fresh) {
+  if (!fresh) {
+    if (auto cached = cached_get_parameter(node_name, param_name)) {
+      return *cached;
+    }
+  }
+  return get_flights_.run(node_name + "\n" + param_name, [&]() {
+    return call_get_parameter(node_name, param_name);
+  });
+}
+
+ParameterResult ConfigurationManager::call_get_parameter(const std::string & node_name,
+                                                         const std::string & param_name) {
+  auto node_mutex = get_node_mutex(node_name);
+  std::lock_guard<std::mutex> node_lock(*node_mutex);
+  RequestSlot slot(*this);
   ParameterResult result;
+  ScopedLatency latency(metrics_, "medkit_ros_service_call_duration_seconds",
+                        {{"service", node_name + "/get_parameters"}});
 
+  uint64_t version = cache_version(node_name);
   try {
     auto client = get_param_client(node_name);
 
@@ -152,8 +308,13 @@ ParameterResult ConfigurationManager::get_parameter(const std::string & node_nam
       return result;
     }
 
+    // Existence check, value and descriptor are independent: send all three before waiting
+    auto names_future = client->list_parameters({param_name}, 1);
+    auto values_future = client->get_parameters({param_name});
+    auto descriptors_future = client->describe_parameters({param_name});
+
     // Check if parameter exists
-    auto param_names = client->list_parameters({param_name}, 1);
+    auto param_names = await_response(names_future, get_service_timeout(), "list_parameters");
     if (param_names.names.empty()) {
       result.success = false;
       result.error_message = "Parameter not found: " + param_name;
@@ -162,7 +323,7 @@ ParameterResult ConfigurationManager::get_parameter(const std::string & node_nam
     }
 
     // Get parameter value
-    auto parameters = client->get_parameters({param_name});
+    auto parameters = await_response(values_future, get_service_timeout(), "get_parameters");
     if (parameters.empty()) {
       result.success = false;
       result.error_message = "Failed to get parameter: " + param_name;
@@ -173,7 +334,7 @@ ParameterResult ConfigurationManager::get_parameter(const std::string & node_nam
     const auto & param = parameters[0];
 
     // Get parameter descriptor for additional metadata
-    auto descriptors = client->describe_parameters({param_name});
+    auto descriptors = await_response(descriptors_future, get_service_timeout(), "describe_parameters");
 
     json param_obj;
     param_obj["name"] = param.get_name();
@@ -183,10 +344,17 @@ ParameterResult ConfigurationManager::get_parameter(const std::string & node_nam
     if (!descriptors.empty()) {
       param_obj["description"] = descriptors[0].description;
       param_obj["read_only"] = descriptors[0].read_only;
+      cache_parameter(node_name, version, param, descriptors[0]);
+    } else {
+      cache_parameter(node_name, version, param, std::nullopt);
     }
 
     result.success = true;
     result.data = param_obj;
+  } catch (const ParameterServiceTimeout & e) {
+    result.success = false;
+    result.error_message = std::string("Failed to get parameter: ") + e.what();
+    result.error_code = ParameterErrorCode::TIMEOUT;
   } catch (const std::exception & e) {
     result.success = false;
     result.error_message = std::string("Failed to get parameter: ") + e.what();
@@ -198,8 +366,12 @@ ParameterResult ConfigurationManager::get_parameter(const std::string & node_nam
 
 ParameterResult ConfigurationManager::set_parameter(const std::string & node_name, const std::string & param_name,
                                                     const json & value) {
-  std::lock_guard<std::mutex> op_lock(param_operations_mutex_);
+  auto node_mutex = get_node_mutex(node_name);
+  std::lock_guard<std::mutex> node_lock(*node_mutex);
+  RequestSlot slot(*this);
   ParameterResult result;
+  ScopedLatency latency(metrics_, "medkit_ros_service_call_duration_seconds",
+                        {{"service", node_name + "/set_parameters"}});
 
   try {
     auto client = get_param_client(node_name);
@@ -212,7 +384,7 @@ ParameterResult ConfigurationManager::set_parameter(const std::string & node_nam
     }
 
     // Get current parameter to determine type hint
-    auto current_params = client->get_parameters({param_name});
+    auto current_params = await_response(client->get_parameters({param_name}), get_service_timeout(), "get_parameters");
     rclcpp::ParameterType hint_type = rclcpp::ParameterType::PARAMETER_NOT_SET;
     if (!current_params.empty()) {
       hint_type = current_params[0].get_type();
@@ -223,27 +395,17 @@ ParameterResult ConfigurationManager::set_parameter(const std::string & node_nam
     rclcpp::Parameter param(param_name, param_value);
 
     // Set parameter
-    auto results = client->set_parameters({param});
+    auto results = await_response(client->set_parameters({param}), get_service_timeout(), "set_parameters");
     if (results.empty() || !results[0].successful) {
       result.success = false;
       result.error_message = results.empty() ? "Failed to set parameter" : results[0].reason;
-      // Classify error based on reason
-      if (!results.empty()) {
-        const auto & reason = results[0].reason;
-        if (reason.find("read-only") != std::string::npos || reason.find("read only") != std::string::npos ||
-            reason.find("is read_only") != std::string::npos) {
-          result.error_code = ParameterErrorCode::READ_ONLY;
-        } else if (reason.find("type") != std::string::npos) {
-          result.error_code = ParameterErrorCode::TYPE_MISMATCH;
-        } else {
-          result.error_code = ParameterErrorCode::INVALID_VALUE;
-        }
-      } else {
-        result.error_code = ParameterErrorCode::INTERNAL_ERROR;
-      }
+      result.error_code =
+          results.empty() ? ParameterErrorCode::INTERNAL_ERROR : classify_set_failure(results[0].reason);
       return result;
     }
 
+    cache_written(node_name, {param});
+
     // Return the new value
     json param_obj;
     param_obj["name"] = param_name;
@@ -252,6 +414,10 @@ ParameterResult ConfigurationManager::set_parameter(const std::string & node_nam
 
     result.success = true;
     result.data = param_obj;
+  } catch (const ParameterServiceTimeout & e) {
+    result.success = false;
+    result.error_message = std::string("Failed to set parameter: ") + e.what();
+    result.error_code = ParameterErrorCode::TIMEOUT;
   } catch (const std::exception & e) {
     result.success = false;
     result.error_message = std::string("Failed to set parameter: ") + e.what();
@@ -261,6 +427,316 @@ ParameterResult ConfigurationManager::set_parameter(const std::string & node_nam
   return result;
 }
 
+ConfigurationManager::CachedNodeParameters * ConfigurationManager::find_cached_node(const std::string & node_name) {
+  auto it = parameter_cache_.find(node_name);
+  if (it == parameter_cache_.end()) {
+    return nullptr;
+  }
+  bool expired = cache_max_age_sec_ > 0.0 && std::chrono::steady_clock::now() - it->second.loaded_at > get_max_age();
+  // A node that went away still has its last parameters cached; only serve them while it is up
+  if (expired || !get_param_client(node_name)->service_is_ready()) {
+    parameter_cache_.erase(it);
+    return nullptr;
+  }
+  return &it->second;
+}
+
+std::optional<ParameterResult> ConfigurationManager::cached_list_parameters(const std::string & node_name) {
+  if (!cache_enabled_) {
+    return std::nullopt;
+  }
+  std::lock_guard<std::mutex> lock(cache_mutex_);
+  auto * cached = find_cached_node(node_name);
+  if (!cached || !cached->complete) {
+    return std::nullopt;
+  }
+
+  json params_array = json::array();
+  for (const auto & [name, param] : cached->values) {
+    json param_obj;
+    param_obj["name"] = name;
+    param_obj["value"] = parameter_value_to_json(param.get_parameter_value());
+    param_obj["type"] = parameter_type_to_string(param.get_type());
+    params_array.push_back(param_obj);
+  }
+
+  ParameterResult result;
+  result.success = true;
+  result.data = params_array;
+  return result;
+}
+
+std::optional<ParameterResult> ConfigurationManager::cached_get_parameter(const std::string & node_name,
+                                                                          const std::string & param_name) {
+  if (!cache_enabled_) {
+    return std::nullopt;
+  }
+  std::lock_guard<std::mutex> lock(cache_mutex_);
+  auto * cached = find_cached_node(node_name);
+  if (!cached) {
+    return std::nullopt;
+  }
+
+  ParameterResult result;
+  auto value_it = cached->values.find(param_name);
+  if (value_it == cached->values.end()) {
+    if (!cached->complete) {
+      return std::nullopt;
+    }
+    // A full listing without the name: the node does not have it
+    result.success = false;
+    result.error_message = "Parameter not found: " + param_name;
+    result.error_code = ParameterErrorCode::NOT_FOUND;
+    return result;
+  }
+  auto descriptor_it = cached->descriptors.find(param_name);
+  if (descriptor_it == cached->descriptors.end()) {
+    return std::nullopt;
+  }
+
+  const auto & param = value_it->second;
+  json param_obj;
+  param_obj["name"] = param_name;
+  param_obj["value"] = parameter_value_to_json(param.get_parameter_value());
+  param_obj["type"] = parameter_type_to_string(param.get_type());
+  param_obj["description"] = descriptor_it->second.description;
+  param_obj["read_only"] = descriptor_it->second.read_only;
+
+  result.success = true;
+  result.data = param_obj;
+  return result;
+}
+
+uint64_t ConfigurationManager::cache_version(const std::string & node_name) {
+  std::lock_guard<std::mutex> lock(cache_mutex_);
+  auto it = cache_versions_.find(node_name);
+  return it != cache_versions_.end() ? it->second : 0;
+}
+
+void ConfigurationManager::cache_listing(const std::string & node_name, uint64_t version,
+                                         const std::vector<rclcpp::Parameter> & params) {
+  if (!cache_enabled_) {
+    return;
+  }
+  std::lock_guard<std::mutex> lock(cache_mutex_);
+  if (cache_versions_[node_name] != version) {
+    return;  // Parameters changed while the listing was in flight; it may be stale
+  }
+  auto & cached = parameter_cache_[node_name];
+  cached.values.clear();
+  for (const auto & param : params) {
+    cached.values[param.get_name()] = param;
+  }
+  // Descriptors of parameters that are still present stay valid
+  for (auto it = cached.descriptors.begin(); it != cached.descriptors.end();) {
+    it = cached.values.count(it->first) > 0 ? std::next(it) : cached.descriptors.erase(it);
+  }
+  cached.complete = true;
+  cached.loaded_at = std::chrono::steady_clock::now();
+}
+
+void ConfigurationManager::cache_parameter(const std::string & node_name, uint64_t version,
+                                           const rclcpp::Parameter & param,
+                                           const std::optional<rcl_interfaces::msg::ParameterDescriptor> & descriptor) {
+  if (!cache_enabled_) {
+    return;
+  }
+  std::lock_guard<std::mutex> lock(cache_mutex_);
+  if (cache_versions_[node_name] != version) {
+    return;
+  }
+  auto [it, inserted] = parameter_cache_.try_emplace(node_name);
+  auto & cached = it->second;
+  if (inserted) {
+    cached.loaded_at = std::chrono::steady_clock::now();
+  }
+  cached.values[param.get_name()] = param;
+  if (descriptor) {
+    cached.descriptors[param.get_name()] = *descriptor;
+  }
+}
+
+void ConfigurationManager::cache_written(const std::string & node_name, const std::vector<rclcpp::Parameter> & params) {
+  if (!cache_enabled_) {
+    return;
+  }
+  std::lock_guard<std::mutex> lock(cache_mutex_);
+  ++cache_versions_[node_name];
+  auto it = parameter_cache_.find(node_name);
+  if (it == parameter_cache_.end()) {
+    return;
+  }
+  for (const auto & param : params) {
+    it->second.values[param.get_name()] = param;
+  }
+}
+
+void ConfigurationManager::on_parameter_event(const rcl_interfaces::msg::ParameterEvent & event) {
+  std::lock_guard<std::mutex> lock(cache_mutex_);
+  ++cache_versions_[event.node];
+  auto it = parameter_cache_.find(event.node);
+  if (it == parameter_cache_.end()) {
+    return;
+  }
+  auto & cached = it->second;
+  for (const auto & param : event.new_parameters) {
+    cached.values[param.name] = rclcpp::Parameter::from_parameter_msg(param);
+    cached.descriptors.erase(param.name);  // Declared again, possibly with a different descriptor
+  }
+  for (const auto & param : event.changed_parameters) {
+    cached.values[param.name] = rclcpp::Parameter::from_parameter_msg(param);
+  }
+  for (const auto & param : event.deleted_parameters) {
+    cached.values.erase(param.name);
+    cached.descriptors.erase(param.name);
+  }
+}
+
+std::map<std::string, rclcpp::ParameterType>
+ConfigurationManager::fetch_parameter_types(const std::shared_ptr<rclcpp::AsyncParametersClient> & client,
+                                            const std::string & node_name, const std::vector<std::string> & names) {
+  std::map<std::string, rclcpp::ParameterType> types;
+  std::vector<std::string> missing;
+  {
+    // Types of cached parameters are kept current by parameter events
+    std::lock_guard<std::mutex> lock(cache_mutex_);
+    auto it = cache_enabled_ ? parameter_cache_.find(node_name) : parameter_cache_.end();
+    for (const auto & name : names) {
+      if (it != parameter_cache_.end() && it->second.values.count(name) > 0) {
+        types[name] = it->second.values.at(name).get_type();
+      } else {
+        missing.push_back(name);
+      }
+    }
+  }
+  if (missing.empty()) {
+    return types;
+  }
+
+  auto parameters = await_response(client->get_parameters(missing), get_service_timeout(), "get_parameters");
+  if (parameters.size() != missing.size()) {
+    // One undeclared name makes the node reject the whole batch; ask for each name instead
+    parameters.clear();
+    std::vector<std::shared_future<std::vector<rclcpp::Parameter>>> pending;
+    pending.reserve(missing.size());
+    for (const auto & name : missing) {
+      pending.push_back(client->get_parameters({name}));
+    }
+    for (auto & future : pending) {
+      auto single_params = await_response(future, get_service_timeout(), "get_parameters");
+      parameters.insert(parameters.end(), single_params.begin(), single_params.end());
+    }
+  }
+  for (const auto & param : parameters) {
+    types[param.get_name()] = param.get_type();
+  }
+  return types;
+}
+
+std::vector<ParameterResult>
+ConfigurationManager::set_parameters(const std::string & node_name,
+                                     const std::vector<std::pair<std::string, json>> & values, bool atomic) {
+  std::vector<ParameterResult> results(values.size());
+  if (values.empty()) {
+    return results;
+  }
+
+  auto node_mutex = get_node_mutex(node_name);
+  std::lock_guard<std::mutex> node_lock(*node_mutex);
+  RequestSlot slot(*this);
+  ScopedLatency latency(metrics_, "medkit_ros_service_call_duration_seconds",
+                        {{"service", node_name + (atomic ? "/set_parameters_atomically" : "/set_parameters")}});
+
+  auto fail_pending = [&](const std::string & message, ParameterErrorCode code) {
+    for (auto & result : results) {
+      if (result.error_code == ParameterErrorCode::NONE && !result.success) {
+        result.success = false;
+        result.error_message = message;
+        result.error_code = code;
+      }
+    }
+    return results;
+  };
+
+  try {
+    auto client = get_param_client(node_name);
+
+    if (!client->wait_for_service(get_service_timeout())) {
+      return fail_pending("Parameter service not available for node: " + node_name,
+                          ParameterErrorCode::SERVICE_UNAVAILABLE);
+    }
+
+    // Current types decide how JSON values are converted, as in set_parameter()
+    std::vector<std::string> names;
+    names.reserve(values.size());
+    for (const auto & [name, value] : values) {
+      names.push_back(name);
+    }
+    auto hint_types = fetch_parameter_types(client, node_name, names);
+
+    std::vector<rclcpp::Parameter> params;
+    std::vector<size_t> param_index;  // params[i] answers values[param_index[i]]
+    for (size_t i = 0; i < values.size(); ++i) {
+      const auto & [name, value] = values[i];
+      auto type_it = hint_types.find(name);
+      try {
+        params.emplace_back(name, json_to_parameter_value(value, type_it != hint_types.end()
+                                                                     ? type_it->second
+                                                                     : rclcpp::ParameterType::PARAMETER_NOT_SET));
+        param_index.push_back(i);
+      } catch (const std::exception & e) {
+        results[i].success = false;
+        results[i].error_message = std::string("Invalid value: ") + e.what();
+        results[i].error_code = ParameterErrorCode::INVALID_VALUE;
+      }
+    }
+    if (params.empty()) {
+      return results;
+    }
+    if (atomic && params.size() != values.size()) {
+      // All or nothing: a value that cannot be converted keeps the rest of the group from being sent
+      return fail_pending("Not applied: another value in the atomic batch is invalid",
+                          ParameterErrorCode::INVALID_VALUE);
+    }
+
+    // One call for the whole group: set_parameters reports each parameter, the atomic
+    // variant applies all of them or none and reports a single outcome
+    std::vector<rcl_interfaces::msg::SetParametersResult> set_results;
+    if (atomic) {
+      auto outcome =
+          await_response(client->set_parameters_atomically(params), get_service_timeout(), "set_parameters_atomically");
+      set_results.assign(params.size(), outcome);
+    } else {
+      set_results = await_response(client->set_parameters(params), get_service_timeout(), "set_parameters");
+    }
+
+    std::vector<rclcpp::Parameter> written;
+    for (size_t i = 0; i < params.size(); ++i) {
+      auto & result = results[param_index[i]];
+      const auto & param = params[i];
+      if (i >= set_results.size() || !set_results[i].successful) {
+        result.success = false;
+        result.error_message = i < set_results.size() ? set_results[i].reason : "Failed to set parameter";
+        result.error_code =
+            i < set_results.size() ? classify_set_failure(set_results[i].reason) : ParameterErrorCode::INTERNAL_ERROR;
+        continue;
+      }
+      written.push_back(param);
+      result.success = true;
+      result.data = {{"name", param.get_name()},
+                     {"value", parameter_value_to_json(param.get_parameter_value())},
+                     {"type", parameter_type_to_string(param.get_type())}};
+    }
+    cache_written(node_name, written);
+  } catch (const ParameterServiceTimeout & e) {
+    return fail_pending(std::string("Failed to set parameters: ") + e.what(), ParameterErrorCode::TIMEOUT);
+  } catch (const std::exception & e) {
+    return fail_pending(std::string("Failed to set parameters: ") + e.what(), ParameterErrorCode::INTERNAL_ERROR);
+  }
+
+  return results;
+}
+
 std::string ConfigurationManager::parameter_type_to_string(rclcpp::ParameterType type) {
   switch (type) {
     case rclcpp::ParameterType::PARAMETER_BOOL:
@@ -441,48 +917,32 @@ void ConfigurationManager::cache_default_values(const std::string & node_name) {
       return;
     }
 
-    // List all parameter names
-    auto param_names = client->list_parameters({}, 0);
-
-    // Get all parameter values
-    std::vector<rclcpp::Parameter> parameters;
-    parameters = client->get_parameters(param_names.names);
-
-    // Fallback to one-by-one if batch fails
-    if (parameters.empty() && !param_names.names.empty()) {
-      for (const auto & name : param_names.names) {
-        try {
-          auto single_params = client->get_parameters({name});
-          if (!single_params.empty()) {
-            parameters.push_back(single_params[0]);
-          }
-        } catch (const std::exception &) {
-          // Skip failed parameters
-        }
-      }
-    }
-
-    // Store as defaults (re-acquire lock, double-check to avoid overwriting concurrent cacher)
-    std::map<std::string, rclcpp::Parameter> node_defaults;
-    for (const auto & param : parameters) {
-      node_defaults[param.get_name()] = param;
-    }
-
-    {
-      std::lock_guard<std::mutex> lock(defaults_mutex_);
-      if (default_values_.find(node_name) == default_values_.end()) {
-        default_values_[node_name] = std::move(node_defaults);
-        RCLCPP_DEBUG(node_->get_logger(), "Cached %zu default values for node: '%s'", default_values_[node_name].size(),
-                     node_name.c_str());
-      }
-    }
+    store_default_values(node_name, fetch_all_parameters(client, node_name));
   } catch (const std::exception & e) {
     RCLCPP_ERROR(node_->get_logger(), "Failed to cache defaults for node '%s': %s", node_name.c_str(), e.what());
   }
 }
 
+void ConfigurationManager::store_default_values(const std::string & node_name,
+                                                const std::vector<rclcpp::Parameter> & parameters) {
+  std::map<std::string, rclcpp::Parameter> node_defaults;
+  for (const auto & param : parameters) {
+    node_defaults[param.get_name()] = param;
+  }
+
+  // Double-check under lock to avoid overwriting the first snapshot
+  std::lock_guard<std::mutex> lock(defaults_mutex_);
+  if (default_values_.find(node_name) == default_values_.end()) {
+    default_values_[node_name] = std::move(node_defaults);
+    RCLCPP_DEBUG(node_->get_logger(), "Cached %zu default values for node: '%s'", default_values_[node_name].size(),
+                 node_name.c_str());
+  }
+}
+
 ParameterResult ConfigurationManager::reset_parameter(const std::string & node_name, const std::string & param_name) {
-  std::lock_guard<std::mutex> op_lock(param_operations_mutex_);
+  auto node_mutex = get_node_mutex(node_name);
+  std::lock_guard<std::mutex> node_lock(*node_mutex);
+  RequestSlot slot(*this);
   ParameterResult result;
 
   try {
@@ -521,7 +981,7 @@ ParameterResult ConfigurationManager::reset_parameter(const std::string & node_n
       return result;
     }
 
-    auto results = client->set_parameters({default_param});
+    auto results = await_response(client->set_parameters({default_param}), get_service_timeout(), "set_parameters");
     if (results.empty() || !results[0].successful) {
       result.success = false;
       result.error_message = results.empty() ? "Failed to reset parameter" : results[0].reason;
@@ -529,6 +989,8 @@ ParameterResult ConfigurationManager::reset_parameter(const std::string & node_n
       return result;
     }
 
+    cache_written(node_name, {default_param});
+
     // Return the reset value
     json param_obj;
     param_obj["name"] = param_name;
@@ -541,6 +1003,10 @@ ParameterResult ConfigurationManager::reset_parameter(const std::string & node_n
 
     RCLCPP_INFO(node_->get_logger(), "Reset parameter '%s' on node '%s' to default value", param_name.c_str(),
                 node_name.c_str());
+  } catch (const ParameterServiceTimeout & e) {
+    result.success = false;
+    result.error_message = std::string("Failed to reset parameter: ") + e.what();
+    result.error_code = ParameterErrorCode::TIMEOUT;
   } catch (const std::exception & e) {
     result.success = false;
     result.error_message = std::string("Failed to reset parameter: ") + e.what();
@@ -551,7 +1017,9 @@ ParameterResult ConfigurationManager::reset_parameter(const std::string & node_n
 }
 
 ParameterResult ConfigurationManager::reset_all_parameters(const std::string & node_name) {
-  std::lock_guard<std::mutex> op_lock(param_operations_mutex_);
+  auto node_mutex = get_node_mutex(node_name);
+  std::lock_guard<std::mutex> node_lock(*node_mutex);
+  RequestSlot slot(*this);
   ParameterResult result;
 
   try {
@@ -590,22 +1058,28 @@ ParameterResult ConfigurationManager::reset_all_parameters(const std::string & n
     size_t failed_count = 0;
     json failed_params = json::array();
 
-    // Set parameters one by one to handle partial failures
-    for (const auto & param : params_to_reset) {
-      try {
-        auto results = client->set_parameters({param});
-        if (!results.empty() && results[0].successful) {
-          reset_count++;
-        } else {
-          failed_count++;
-          failed_params.push_back(param.get_name());
-        }
-      } catch (const std::exception &) {
+    // One set_parameters call; the node applies and reports each parameter separately,
+    // so partial failures are still visible per parameter
+    std::vector<rcl_interfaces::msg::SetParametersResult> results;
+    try {
+      results = await_response(client->set_parameters(params_to_reset), get_service_timeout(), "set_parameters");
+    } catch (const std::exception & e) {
+      RCLCPP_WARN(node_->get_logger(), "Failed to reset parameters on node '%s': %s", node_name.c_str(), e.what());
+    }
+
+    std::vector<rclcpp::Parameter> reset_params;
+    for (size_t i = 0; i < params_to_reset.size(); ++i) {
+      if (i < results.size() && results[i].successful) {
+        reset_count++;
+        reset_params.push_back(params_to_reset[i]);
+      } else {
         failed_count++;
-        failed_params.push_back(param.get_name());
+        failed_params.push_back(params_to_reset[i].get_name());
       }
     }
 
+    cache_written(node_name, reset_params);
+
     json response;
     response["node_name"] = node_name;
     response["reset_count"] = reset_count;
@@ -25,16 +25,43 @@
 
 namespace ros2_medkit_gateway {
 
+namespace {
+
+/// Canonical text of a field mask ("" selects everything); children are visited in sorted order
+void append_field_mask_key(const ros2_medkit_serialization::FieldMask & mask, std::string & key) {
+  if (mask.selects_all()) {
+    return;
+  }
+  key += '{';
+  for (const auto & name : mask.child_names()) {
+    key += name;
+    append_field_mask_key(*mask.child(name), key);
+    key += ',';
+  }
+  key += '}';
+}
+
+}  // namespace
+
 DataAccessManager::DataAccessManager(rclcpp::Node * node)
   : node_(node)
   , serializer_(std::make_shared<ros2_medkit_serialization::JsonSerializer>())
-  , type_introspection_(
-        std::make_unique<TypeIntrospection>(ament_index_cpp::get_package_share_directory("ros2_medkit_gateway") + "/scr"
-                                                                                                                  "ipt"
-                                                                                                                  "s"))
   , native_sampler_(std::make_unique<NativeTopicSampler>(node))
   , max_parallel_samples_(static_cast<int>(node->declare_parameter<int64_t>("max_parallel_topic_samples", 10)))
-  , topic_sample_timeout_sec_(node->declare_parameter<double>("topic_sample_timeout_sec", 1.0)) {
+  , topic_sample_timeout_sec_(node->declare_parameter<double>("topic_sample_timeout_sec", 1.0))
+  , type_cache_prewarm_(node->declare_parameter<bool>("type_cache.prewarm", true)) {
+  // Validate type_cache.max_entries against allowed range [0, 100000] (0 = unbounded)
+  auto type_cache_max_entries = node->declare_parameter<int64_t>(
+      "type_cache.max_entries", static_cast<int64_t>(TypeIntrospection::kDefaultMaxCacheSize));
+  if (type_cache_max_entries < 0 || type_cache_max_entries > 100000) {
+    RCLCPP_WARN(node_->get_logger(), "type_cache.max_entries (%ld) out of valid range (0-100000), using default: %zu",
+                static_cast<long>(type_cache_max_entries), TypeIntrospection::kDefaultMaxCacheSize);
+    type_cache_max_entries = static_cast<int64_t>(TypeIntrospection::kDefaultMaxCacheSize);
+  }
+  type_introspection_ = std::make_unique<TypeIntrospection>(
+      ament_index_cpp::get_package_share_directory("ros2_medkit_gateway") + "/scripts",
+      static_cast<size_t>(type_cache_max_entries));
+
   // Validate max_parallel_samples_ against allowed range [1, 50]
   if (max_parallel_samples_ < 1 || max_parallel_samples_ > 50) {
     RCLCPP_WARN(node_->get_logger(), "max_parallel_topic_samples (%d) out of valid range (1-50), using default: 10",
@@ -52,8 +79,8 @@ DataAccessManager::DataAccessManager(rclcpp::Node * node)
 
   RCLCPP_INFO(node_->get_logger(),
               "DataAccessManager initialized (native_sampling=enabled, native_publishing=enabled, "
-              "max_parallel_samples=%d, topic_sample_timeout=%.2fs)",
-              max_parallel_samples_, topic_sample_timeout_sec_);
+              "max_parallel_samples=%d, topic_sample_timeout=%.2fs, type_cache_max_entries=%zu)",
+              max_parallel_samples_, topic_sample_timeout_sec_, type_introspection_->max_cache_size());
 }
 
 rclcpp::GenericPublisher::SharedPtr DataAccessManager::get_or_create_publisher(const std::string & topic_path,
@@ -165,8 +192,8 @@ json DataAccessManager::sample_result_to_json(const TopicSampleResult & sample)
 
     // Try to add schema/default value info
     try {
-      TopicTypeInfo type_info = type_introspection_->get_type_info(sample.message_type);
-      result["type_info"] = {{"schema", type_info.schema}, {"default_value", type_info.default_value}};
+      auto type_info = type_introspection_->get_type_info_ptr(sample.message_type);
+      result["type_info"] = {{"schema", type_info->schema}, {"default_value", type_info->default_value}};
     } catch (const std::exception & e) {
       RCLCPP_DEBUG(node_->get_logger(), "Could not get type info for '%s': %s", sample.message_type.c_str(), e.what());
     }
@@ -178,7 +205,8 @@ json DataAccessManager::sample_result_to_json(const TopicSampleResult & sample)
 json DataAccessManager::get_topic_sample_native(const std::string & topic_name, double timeout_sec) {
   RCLCPP_DEBUG(node_->get_logger(), "get_topic_sample_native: topic='%s', timeout=%.2f", topic_name.c_str(),
                timeout_sec);
-  auto sample = native_sampler_->sample_topic(topic_name, timeout_sec);
+
+  auto sample = sample_topic(topic_name, ros2_medkit_serialization::ProjectionOptions{}, timeout_sec);
   RCLCPP_DEBUG(node_->get_logger(), "get_topic_sample_native: sample returned, has_data=%d, type='%s'", sample.has_data,
                sample.message_type.c_str());
 
@@ -191,4 +219,26 @@ json DataAccessManager::get_topic_sample_native(const std::string & topic_name,
   throw TopicNotAvailableException(topic_name);
 }
 
+TopicSampleResult DataAccessManager::sample_topic(const std::string & topic_name,
+                                                  const ros2_medkit_serialization::ProjectionOptions & projection,
+                                                  double timeout_sec) {
+  double effective_timeout = (timeout_sec < 0) ? topic_sample_timeout_sec_ : timeout_sec;
+
+  // Requests that arrive while an identical sample is in flight share it; the key covers
+  // every input that changes the result
+  std::string key = topic_name;
+  key += '|';
+  key += std::to_string(effective_timeout);
+  key += '|';
+  key += std::to_string(projection.arrays.max_length);
+  key += '|';
+  key += std::to_string(projection.arrays.stride);
+  key += '|';
+  append_field_mask_key(projection.fields, key);
+
+  return sample_flights_.run(key, [&]() {
+    return native_sampler_->sample_topic(topic_name, effective_timeout, projection);
+  });
+}
+
 }  // namespace ros2_medkit_gateway
@@ -33,6 +33,9 @@ bool DiscoveryManager::initialize(const DiscoveryConfig & config) {
   // Create manifest manager if needed
   if (config.mode == DiscoveryMode::MANIFEST_ONLY || config.mode == DiscoveryMode::HYBRID) {
     manifest_manager_ = std::make_unique<discovery::ManifestManager>(node_);
+    if (!config.manifest_cache_dir.empty()) {
+      manifest_manager_->set_cache_dir(config.manifest_cache_dir);
+    }
 
     if (!config.manifest_path.empty()) {
       if (!manifest_manager_->load_manifest(config.manifest_path, config.manifest_strict_validation)) {
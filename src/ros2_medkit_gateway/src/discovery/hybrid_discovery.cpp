@@ -14,6 +14,8 @@
 
 #include "ros2_medkit_gateway/discovery/hybrid_discovery.hpp"
 
+#include <set>
+
 namespace ros2_medkit_gateway {
 namespace discovery {
 
@@ -122,18 +124,28 @@ void HybridDiscoveryStrategy::perform_linking() {
     return;
   }
 
-  // Get manifest apps
-  auto apps = manifest_manager_->get_apps();
+  // Read the revision before the apps: a manifest swapped in between is relinked next time
+  uint64_t manifest_revision = manifest_manager_->get_revision();
 
   // Get runtime node components (raw nodes, not synthetic groupings)
   // Runtime linking needs individual node FQNs to match against manifest bindings
   auto runtime_components = runtime_strategy_->discover_node_components();
 
+  // The previous result stays valid until the manifest or the graph changes
+  if (has_linked_ && manifest_revision == linked_revision_ && !linker_.graph_changed(runtime_components)) {
+    return;
+  }
+
+  // Get manifest apps
+  auto apps = manifest_manager_->get_apps();
+
   // Get config for orphan policy
   auto config = manifest_manager_->get_config();
 
   // Perform linking
   linking_result_ = linker_.link(apps, runtime_components, config);
+  linked_revision_ = manifest_revision;
+  has_linked_ = true;
 
   log_info("Hybrid linking complete: " + linking_result_.summary());
 }
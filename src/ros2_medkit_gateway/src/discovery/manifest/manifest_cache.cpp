@@ -0,0 +1,404 @@
+// Copyright 2026 bburda
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+#include "ros2_medkit_gateway/discovery/manifest/manifest_cache.hpp"
+
+#include <fcntl.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include <unistd.h>
+
+#include <cstdint>
+#include <cstdio>
+#include <cstring>
+#include <filesystem>
+#include <fstream>
+#include <utility>
+#include <vector>
+
+namespace ros2_medkit_gateway {
+namespace discovery {
+
+namespace {
+
+/// File header; bump the trailing version whenever the encoding below changes
+constexpr char kMagic[] = "MKMANIF1";
+constexpr size_t kMagicSize = sizeof(kMagic) - 1;
+
+constexpr char kFilePrefix[] = "manifest-";
+constexpr char kFileSuffix[] = ".bin";
+
+/// Read-only memory mapping of a whole file (empty on any error)
+class MappedFile {
+ public:
+  explicit MappedFile(const std::string & path) {
+    fd_ = ::open(path.c_str(), O_RDONLY);
+    if (fd_ < 0) {
+      return;
+    }
+    struct stat st {};
+    if (::fstat(fd_, &st) != 0 || st.st_size <= 0) {
+      return;
+    }
+    void * mapped = ::mmap(nullptr, static_cast<size_t>(st.st_size), PROT_READ, MAP_PRIVATE, fd_, 0);
+    if (mapped == MAP_FAILED) {
+      return;
+    }
+    data_ = static_cast<const uint8_t *>(mapped);
+    size_ = static_cast<size_t>(st.st_size);
+  }
+
+  ~MappedFile() {
+    if (data_) {
+      ::munmap(const_cast<uint8_t *>(data_), size_);
+    }
+    if (fd_ >= 0) {
+      ::close(fd_);
+    }
+  }
+
+  MappedFile(const MappedFile &) = delete;
+  MappedFile & operator=(const MappedFile &) = delete;
+
+  const uint8_t * data() const {
+    return data_;
+  }
+  size_t size() const {
+    return size_;
+  }
+
+ private:
+  int fd_{-1};
+  const uint8_t * data_{nullptr};
+  size_t size_{0};
+};
+
+json encode_validation_errors(const std::vector<ValidationError> & entries) {
+  json result = json::array();
+  for (const auto & entry : entries) {
+    result.push_back({{"rule_id", entry.rule_id},
+                      {"error", entry.severity == ValidationSeverity::ERROR},
+                      {"message", entry.message},
+                      {"path", entry.path}});
+  }
+  return result;
+}
+
+std::vector<ValidationError> decode_validation_errors(const json & entries) {
+  std::vector<ValidationError> result;
+  for (const auto & entry : entries) {
+    ValidationError error;
+    error.rule_id = entry.at("rule_id").get<std::string>();
+    error.severity = entry.at("error").get<bool>() ? ValidationSeverity::ERROR : ValidationSeverity::WARNING;
+    error.message = entry.at("message").get<std::string>();
+    error.path = entry.at("path").get<std::string>();
+    result.push_back(std::move(error));
+  }
+  return result;
+}
+
+// Entity encodings cover every field ManifestParser sets
+
+json encode_area(const Area & area) {
+  return {{"id", area.id},
+          {"name", area.name},
+          {"namespace", area.namespace_path},
+          {"type", area.type},
+          {"translation_id", area.translation_id},
+          {"description", area.description},
+          {"tags", area.tags},
+          {"parent_area_id", area.parent_area_id}};
+}
+
+Area decode_area(const json & j) {
+  Area area;
+  area.id = j.at("id").get<std::string>();
+  area.name = j.at("name").get<std::string>();
+  area.namespace_path = j.at("namespace").get<std::string>();
+  area.type = j.at("type").get<std::string>();
+  area.translation_id = j.at("translation_id").get<std::string>();
+  area.description = j.at("description").get<std::string>();
+  area.tags = j.at("tags").get<std::vector<std::string>>();
+  area.parent_area_id = j.at("parent_area_id").get<std::string>();
+  return area;
+}
+
+json encode_component(const Component & comp) {
+  return {{"id", comp.id},
+          {"name", comp.name},
+          {"namespace", comp.namespace_path},
+          {"fqn", comp.fqn},
+          {"type", comp.type},
+          {"area", comp.area},
+          {"source", comp.source},
+          {"translation_id", comp.translation_id},
+          {"description", comp.description},
+          {"variant", comp.variant},
+          {"tags", comp.tags},
+          {"parent_component_id", comp.parent_component_id},
+          {"depends_on", comp.depends_on}};
+}
+
+Component decode_component(const json & j) {
+  Component comp;
+  comp.id = j.at("id").get<std::string>();
+  comp.name = j.at("name").get<std::string>();
+  comp.namespace_path = j.at("namespace").get<std::string>();
+  comp.fqn = j.at("fqn").get<std::string>();
+  comp.type = j.at("type").get<std::string>();
+  comp.area = j.at("area").get<std::string>();
+  comp.source = j.at("source").get<std::string>();
+  comp.translation_id = j.at("translation_id").get<std::string>();
+  comp.description = j.at("description").get<std::string>();
+  comp.variant = j.at("variant").get<std::string>();
+  comp.tags = j.at("tags").get<std::vector<std::string>>();
+  comp.parent_component_id = j.at("parent_component_id").get<std::string>();
+  comp.depends_on = j.at("depends_on").get<std::vector<std::string>>();
+  return comp;
+}
+
+json encode_app(const App & app) {
+  json j = {{"id", app.id},
+            {"name", app.name},
+            {"translation_id", app.translation_id},
+            {"description", app.description},
+            {"tags", app.tags},
+            {"component_id", app.component_id},
+            {"depends_on", app.depends_on},
+            {"external", app.external},
+            {"source", app.source}};
+  if (app.ros_binding) {
+    j["ros_binding"] = {{"node_name", app.ros_binding->node_name},
+                        {"namespace", app.ros_binding->namespace_pattern},
+                        {"topic_namespace", app.ros_binding->topic_namespace}};
+  }
+  return j;
+}
+
+App decode_app(const json & j) {
+  App app;
+  app.id = j.at("id").get<std::string>();
+  app.name = j.at("name").get<std::string>();
+  app.translation_id = j.at("translation_id").get<std::string>();
+  app.description = j.at("description").get<std::string>();
+  app.tags = j.at("tags").get<std::vector<std::string>>();
+  app.component_id = j.at("component_id").get<std::string>();
+  app.depends_on = j.at("depends_on").get<std::vector<std::string>>();
+  app.external = j.at("external").get<bool>();
+  app.source = j.at("source").get<std::string>();
+  if (j.contains("ros_binding")) {
+    const auto & binding_json = j.at("ros_binding");
+    App::RosBinding binding;
+    binding.node_name = binding_json.at("node_name").get<std::string>();
+    binding.namespace_pattern = binding_json.at("namespace").get<std::string>();
+    binding.topic_namespace = binding_json.at("topic_namespace").get<std::string>();
+    app.ros_binding = binding;
+  }
+  return app;
+}
+
+json encode_function(const Function & func) {
+  return {{"id", func.id},
+          {"name", func.name},
+          {"translation_id", func.translation_id},
+          {"description", func.description},
+          {"tags", func.tags},
+          {"hosts", func.hosts},
+          {"depends_on", func.depends_on},
+          {"source", func.source}};
+}
+
+Function decode_function(const json & j) {
+  Function func;
+  func.id = j.at("id").get<std::string>();
+  func.name = j.at("name").get<std::string>();
+  func.translation_id = j.at("translation_id").get<std::string>();
+  func.description = j.at("description").get<std::string>();
+  func.tags = j.at("tags").get<std::vector<std::string>>();
+  func.hosts = j.at("hosts").get<std::vector<std::string>>();
+  func.depends_on = j.at("depends_on").get<std::vector<std::string>>();
+  func.source = j.at("source").get<std::string>();
+  return func;
+}
+
+template <typename Entity, typename Encoder>
+json encode_all(const std::vector<Entity> & entities, Encoder encode) {
+  json result = json::array();
+  for (const auto & entity : entities) {
+    result.push_back(encode(entity));
+  }
+  return result;
+}
+
+template <typename Entity, typename Decoder>
+std::vector<Entity> decode_all(const json & entities, Decoder decode) {
+  std::vector<Entity> result;
+  result.reserve(entities.size());
+  for (const auto & entity : entities) {
+    result.push_back(decode(entity));
+  }
+  return result;
+}
+
+json encode(const std::string & hash, const CompiledManifest & compiled) {
+  const auto & manifest = compiled.manifest;
+  json capabilities = json::object();
+  for (const auto & [entity_id, override_json] : manifest.capabilities) {
+    capabilities[entity_id] = override_json;
+  }
+
+  return {{"hash", hash},
+          {"manifest_version", manifest.manifest_version},
+          {"metadata",
+           {{"name", manifest.metadata.name},
+            {"description", manifest.metadata.description},
+            {"version", manifest.metadata.version},
+            {"created_at", manifest.metadata.created_at}}},
+          {"config",
+           {{"unmanifested_nodes", ManifestConfig::policy_to_string(manifest.config.unmanifested_nodes)},
+            {"inherit_runtime_resources", manifest.config.inherit_runtime_resources},
+            {"allow_manifest_override", manifest.config.allow_manifest_override}}},
+          {"areas", encode_all(manifest.areas, encode_area)},
+          {"components", encode_all(manifest.components, encode_component)},
+          {"apps", encode_all(manifest.apps, encode_app)},
+          {"functions", encode_all(manifest.functions, encode_function)},
+          {"capabilities", capabilities},
+          {"validation",
+           {{"is_valid", compiled.validation.is_valid},
+            {"errors", encode_validation_errors(compiled.validation.errors)},
+            {"warnings", encode_validation_errors(compiled.validation.warnings)}}}};
+}
+
+CompiledManifest decode(const json & j) {
+  CompiledManifest compiled;
+  auto & manifest = compiled.manifest;
+
+  manifest.manifest_version = j.at("manifest_version").get<std::string>();
+
+  const auto & metadata = j.at("metadata");
+  manifest.metadata.name = metadata.at("name").get<std::string>();
+  manifest.metadata.description = metadata.at("description").get<std::string>();
+  manifest.metadata.version = metadata.at("version").get<std::string>();
+  manifest.metadata.created_at = metadata.at("created_at").get<std::string>();
+
+  const auto & config = j.at("config");
+  manifest.config.unmanifested_nodes = ManifestConfig::parse_policy(config.at("unmanifested_nodes").get<std::string>());
+  manifest.config.inherit_runtime_resources = config.at("inherit_runtime_resources").get<bool>();
+  manifest.config.allow_manifest_override = config.at("allow_manifest_override").get<bool>();
+
+  manifest.areas = decode_all<Area>(j.at("areas"), decode_area);
+  manifest.components = decode_all<Component>(j.at("components"), decode_component);
+  manifest.apps = decode_all<App>(j.at("apps"), decode_app);
+  manifest.functions = decode_all<Function>(j.at("functions"), decode_function);
+
+  for (const auto & [entity_id, override_json] : j.at("capabilities").items()) {
+    manifest.capabilities[entity_id] = override_json;
+  }
+
+  const auto & validation = j.at("validation");
+  compiled.validation.is_valid = validation.at("is_valid").get<bool>();
+  compiled.validation.errors = decode_validation_errors(validation.at("errors"));
+  compiled.validation.warnings = decode_validation_errors(validation.at("warnings"));
+  return compiled;
+}
+
+}  // namespace
+
+ManifestCache::ManifestCache(std::string cache_dir) : cache_dir_(std::move(cache_dir)) {
+}
+
+std::string ManifestCache::content_hash(const std::string & content) {
+  // FNV-1a: stable across builds and platforms, unlike std::hash
+  uint64_t hash = 14695981039346656037ULL;
+  for (unsigned char c : content) {
+    hash ^= c;
+    hash *= 1099511628211ULL;
+  }
+  char hex[17];
+  std::snprintf(hex, sizeof(hex), "%016llx", static_cast<unsigned long long>(hash));
+  return hex;
+}
+
+std::string ManifestCache::cache_path(const std::string & hash) const {
+  return (std::filesystem::path(cache_dir_) / (kFilePrefix + hash + kFileSuffix)).string();
+}
+
+std::optional<CompiledManifest> ManifestCache::load(const std::string & hash) const {
+  MappedFile file(cache_path(hash));
+  if (!file.data() || file.size() <= kMagicSize || std::memcmp(file.data(), kMagic, kMagicSize) != 0) {
+    return std::nullopt;
+  }
+
+  try {
+    json j = json::from_msgpack(file.data() + kMagicSize, file.data() + file.size());
+    // Guards against a file renamed by hand or a hash collision in the name only
+    if (j.at("hash").get<std::string>() != hash) {
+      return std::nullopt;
+    }
+    return decode(j);
+  } catch (const json::exception &) {
+    return std::nullopt;
+  }
+}
+
+bool ManifestCache::store(const std::string & hash, const CompiledManifest & compiled) const {
+  std::error_code ec;
+  std::filesystem::create_directories(cache_dir_, ec);
+  if (ec) {
+    return false;
+  }
+
+  std::vector<uint8_t> payload = json::to_msgpack(encode(hash, compiled));
+  std::string final_path = cache_path(hash);
+  std::string tmp_path = final_path + ".tmp." + std::to_string(::getpid());
+  {
+    std::ofstream out(tmp_path, std::ios::binary | std::ios::trunc);
+    if (!out) {
+      return false;
+    }
+    out.write(kMagic, kMagicSize);
+    out.write(reinterpret_cast<const char *>(payload.data()), static_cast<std::streamsize>(payload.size()));
+    if (!out.good()) {
+      out.close();
+      std::filesystem::remove(tmp_path, ec);
+      return false;
+    }
+  }
+
+  // Atomic replace: concurrent readers see either the old file or the complete new one
+  std::filesystem::rename(tmp_path, final_path, ec);
+  if (ec) {
+    std::filesystem::remove(tmp_path, ec);
+    return false;
+  }
+
+  // Only the current manifest is kept (best effort)
+  try {
+    std::string current_name = std::filesystem::path(final_path).filename().string();
+    for (const auto & entry : std::filesystem::directory_iterator(cache_dir_)) {
+      std::string name = entry.path().filename().string();
+      bool is_cache_file = name.rfind(kFilePrefix, 0) == 0 && name.size() > sizeof(kFileSuffix) - 1 &&
+                           name.compare(name.size() - (sizeof(kFileSuffix) - 1), std::string::npos, kFileSuffix) == 0;
+      if (is_cache_file && name != current_name) {
+        std::filesystem::remove(entry.path(), ec);
+      }
+    }
+  } catch (const std::filesystem::filesystem_error &) {
+    // Stale files only cost disk space
+  }
+  return true;
+}
+
+}  // namespace discovery
+}  // namespace ros2_medkit_gateway
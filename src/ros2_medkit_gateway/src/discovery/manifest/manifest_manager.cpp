@@ -14,12 +14,24 @@
 
 #include "ros2_medkit_gateway/discovery/manifest/manifest_manager.hpp"
 
+#include <fstream>
+#include <sstream>
+
 namespace ros2_medkit_gateway {
 namespace discovery {
 
 ManifestManager::ManifestManager(rclcpp::Node * node) : node_(node) {
 }
 
+void ManifestManager::set_cache_dir(const std::string & cache_dir) {
+  std::lock_guard<std::mutex> lock(mutex_);
+  if (cache_dir.empty()) {
+    cache_.reset();
+  } else {
+    cache_ = std::make_unique<ManifestCache>(cache_dir);
+  }
+}
+
 bool ManifestManager::load_manifest(const std::string & file_path, bool strict) {
   std::lock_guard<std::mutex> lock(mutex_);
 
@@ -28,33 +40,41 @@ bool ManifestManager::load_manifest(const std::string & file_path, bool strict)
 
   try {
     log_info("Loading manifest from: " + file_path);
-    Manifest loaded = parser_.parse_file(file_path);
-
-    // Validate
-    validation_result_ = validator_.validate(loaded);
-
-    // Always fail on ERRORs (broken references, circular deps, duplicate bindings)
-    // These indicate a fundamentally broken manifest that would cause runtime issues
-    if (validation_result_.has_errors()) {
-      for (const auto & err : validation_result_.errors) {
-        log_error("Manifest error: " + err.to_string());
+    if (!cache_) {
+      Manifest loaded = parser_.parse_file(file_path);
+      ValidationResult validation = validator_.validate(loaded);
+      if (!install(std::move(loaded), std::move(validation), strict)) {
+        return false;
+      }
+    } else {
+      std::ifstream file(file_path);
+      if (!file.is_open()) {
+        throw std::runtime_error("Cannot open manifest file: " + file_path);
+      }
+      std::stringstream buffer;
+      buffer << file.rdbuf();
+      const std::string content = buffer.str();
+      const std::string hash = ManifestCache::content_hash(content);
+
+      // Unchanged manifest: reuse the compiled form and skip parsing and validation
+      if (auto compiled = cache_->load(hash)) {
+        log_info("Using compiled manifest from cache: " + cache_->cache_path(hash));
+        if (!install(std::move(compiled->manifest), std::move(compiled->validation), strict)) {
+          return false;
+        }
+      } else {
+        Manifest loaded = parser_.parse_string(content);
+        ValidationResult validation = validator_.validate(loaded);
+        // Manifests with errors are never cached, so they are re-validated and reported each time
+        if (!validation.has_errors() && !cache_->store(hash, CompiledManifest{loaded, validation})) {
+          log_warn("Failed to write manifest cache: " + cache_->cache_path(hash));
+        }
+        if (!install(std::move(loaded), std::move(validation), strict)) {
+          return false;
+        }
       }
-      log_error("Manifest validation failed: " + std::to_string(validation_result_.errors.size()) + " errors found");
-      return false;
-    }
-
-    // In strict mode, also fail on warnings; otherwise just log them
-    for (const auto & warn : validation_result_.warnings) {
-      log_warn("Manifest warning: " + warn.to_string());
-    }
-    if (strict && validation_result_.has_warnings()) {
-      log_error("Manifest validation failed (strict mode): warnings treated as errors");
-      return false;
     }
 
-    manifest_ = std::move(loaded);
-    build_lookup_maps();
-
     log_info("Manifest loaded successfully: " + std::to_string(manifest_->areas.size()) + " areas, " +
              std::to_string(manifest_->components.size()) + " components, " + std::to_string(manifest_->apps.size()) +
              " apps, " + std::to_string(manifest_->functions.size()) + " functions");
@@ -75,29 +95,8 @@ bool ManifestManager::load_manifest_from_string(const std::string & yaml_content
 
   try {
     Manifest loaded = parser_.parse_string(yaml_content);
-    validation_result_ = validator_.validate(loaded);
-
-    // Always fail on ERRORs (broken references, circular deps, duplicate bindings)
-    if (validation_result_.has_errors()) {
-      for (const auto & err : validation_result_.errors) {
-        log_error("Manifest error: " + err.to_string());
-      }
-      log_error("Manifest validation failed: " + std::to_string(validation_result_.errors.size()) + " errors found");
-      return false;
-    }
-
-    // In strict mode, also fail on warnings; otherwise just log them
-    for (const auto & warn : validation_result_.warnings) {
-      log_warn("Manifest warning: " + warn.to_string());
-    }
-    if (strict && validation_result_.has_warnings()) {
-      log_error("Manifest validation failed (strict mode): warnings treated as errors");
-      return false;
-    }
-
-    manifest_ = std::move(loaded);
-    build_lookup_maps();
-    return true;
+    ValidationResult validation = validator_.validate(loaded);
+    return install(std::move(loaded), std::move(validation), strict);
 
   } catch (const std::exception & e) {
     log_error("Failed to parse manifest: " + std::string(e.what()));
@@ -106,6 +105,33 @@ bool ManifestManager::load_manifest_from_string(const std::string & yaml_content
   }
 }
 
+bool ManifestManager::install(Manifest loaded, ValidationResult validation, bool strict) {
+  validation_result_ = std::move(validation);
+
+  // Always fail on ERRORs (broken references, circular deps, duplicate bindings)
+  // These indicate a fundamentally broken manifest that would cause runtime issues
+  if (validation_result_.has_errors()) {
+    for (const auto & err : validation_result_.errors) {
+      log_error("Manifest error: " + err.to_string());
+    }
+    log_error("Manifest validation failed: " + std::to_string(validation_result_.errors.size()) + " errors found");
+    return false;
+  }
+
+  // In strict mode, also fail on warnings; otherwise just log them
+  for (const auto & warn : validation_result_.warnings) {
+    log_warn("Manifest warning: " + warn.to_string());
+  }
+  if (strict && validation_result_.has_warnings()) {
+    log_error("Manifest validation failed (strict mode): warnings treated as errors");
+    return false;
+  }
+
+  manifest_ = std::move(loaded);
+  build_lookup_maps();
+  return true;
+}
+
 bool ManifestManager::reload_manifest() {
   // Note: This method acquires lock internally via load_manifest
   if (manifest_path_.empty() || manifest_path_ == "<string>") {
@@ -147,6 +173,7 @@ void ManifestManager::unload_manifest() {
   component_index_.clear();
   app_index_.clear();
   function_index_.clear();
+  ++revision_;
 
   log_info("Manifest unloaded");
 }
@@ -182,6 +209,11 @@ ManifestConfig ManifestManager::get_config() const {
   return ManifestConfig{};
 }
 
+uint64_t ManifestManager::get_revision() const {
+  std::lock_guard<std::mutex> lock(mutex_);
+  return revision_;
+}
+
 std::vector<Area> ManifestManager::get_areas() const {
   std::lock_guard<std::mutex> lock(mutex_);
   if (manifest_) {
@@ -400,6 +432,8 @@ json ManifestManager::get_status_json() const {
 }
 
 void ManifestManager::build_lookup_maps() {
+  // Called whenever a new manifest is installed
+  ++revision_;
   area_index_.clear();
   component_index_.clear();
   app_index_.clear();
@@ -15,10 +15,47 @@
 #include "ros2_medkit_gateway/discovery/manifest/runtime_linker.hpp"
 
 #include <algorithm>
+#include <limits>
+#include <unordered_set>
 
 namespace ros2_medkit_gateway {
 namespace discovery {
 
+namespace {
+
+bool same_operations(const std::vector<ServiceInfo> & a, const std::vector<ServiceInfo> & b) {
+  return std::equal(a.begin(), a.end(), b.begin(), b.end(), [](const ServiceInfo & x, const ServiceInfo & y) {
+    return x.name == y.name && x.full_path == y.full_path && x.type == y.type && x.type_info == y.type_info;
+  });
+}
+
+bool same_operations(const std::vector<ActionInfo> & a, const std::vector<ActionInfo> & b) {
+  return std::equal(a.begin(), a.end(), b.begin(), b.end(), [](const ActionInfo & x, const ActionInfo & y) {
+    return x.name == y.name && x.full_path == y.full_path && x.type == y.type && x.type_info == y.type_info;
+  });
+}
+
+/// Compare the node fields linking reads (matching and enrichment)
+bool same_runtime_node(const Component & a, const Component & b) {
+  return a.fqn == b.fqn && a.id == b.id && a.namespace_path == b.namespace_path &&
+         a.topics.publishes == b.topics.publishes && a.topics.subscribes == b.topics.subscribes &&
+         same_operations(a.services, b.services) && same_operations(a.actions, b.actions);
+}
+
+/// Visit the entries of an ordered index whose key starts with @p prefix
+template <typename Visitor>
+void for_each_with_prefix(const std::map<std::string, std::vector<size_t>> & index, const std::string & prefix,
+                          Visitor && visit) {
+  for (auto it = index.lower_bound(prefix); it != index.end() && it->first.compare(0, prefix.size(), prefix) == 0;
+       ++it) {
+    for (size_t position : it->second) {
+      visit(position);
+    }
+  }
+}
+
+}  // namespace
+
 RuntimeLinker::RuntimeLinker(rclcpp::Node * node) : node_(node) {
 }
 
@@ -26,14 +63,13 @@ LinkingResult RuntimeLinker::link(const std::vector<App> & apps, const std::vect
                                   const ManifestConfig & config) {
   LinkingResult result;
 
-  // Build a map of node FQN -> Component for quick lookup
-  std::unordered_map<std::string, const Component *> fqn_to_component;
-  for (const auto & comp : runtime_components) {
-    fqn_to_component[comp.fqn] = &comp;
+  // Index the runtime graph once; unchanged graphs reuse the previous indexes
+  if (graph_changed(runtime_components)) {
+    rebuild_node_index(runtime_components);
   }
 
   // Track which runtime nodes have been matched
-  std::set<std::string> matched_nodes;
+  std::unordered_set<std::string> matched_nodes;
 
   // Process each manifest app
   for (const auto & manifest_app : apps) {
@@ -53,47 +89,21 @@ LinkingResult RuntimeLinker::link(const std::vector<App> & apps, const std::vect
       continue;
     }
 
-    const auto & binding = manifest_app.ros_binding.value();
-    bool found = false;
-
     // Try to find matching runtime node
-    for (const auto & comp : runtime_components) {
-      // Extract node name and namespace from component
-      std::string node_name = comp.id;
-      std::string node_ns = comp.namespace_path;
-
-      if (matches_binding(binding, comp.fqn, node_name, node_ns)) {
-        // Match found!
-        linked_app.bound_fqn = comp.fqn;
-        linked_app.is_online = true;
-        enrich_app(linked_app, comp);
-
-        result.app_to_node[manifest_app.id] = comp.fqn;
-        result.node_to_app[comp.fqn] = manifest_app.id;
-        matched_nodes.insert(comp.fqn);
-        found = true;
-
-        log_debug("Linked app '" + manifest_app.id + "' to node '" + comp.fqn + "'");
-        break;
-      }
-
-      // Try topic namespace matching
-      if (!binding.topic_namespace.empty() && matches_topic_namespace(binding.topic_namespace, comp)) {
-        linked_app.bound_fqn = comp.fqn;
-        linked_app.is_online = true;
-        enrich_app(linked_app, comp);
-
-        result.app_to_node[manifest_app.id] = comp.fqn;
-        result.node_to_app[comp.fqn] = manifest_app.id;
-        matched_nodes.insert(comp.fqn);
-        found = true;
-
-        log_debug("Linked app '" + manifest_app.id + "' to node '" + comp.fqn + "' (topic namespace)");
-        break;
-      }
-    }
-
-    if (!found) {
+    auto match = find_match(manifest_app.ros_binding.value());
+    if (match) {
+      const auto & comp = nodes_[match->position];
+      linked_app.bound_fqn = comp.fqn;
+      linked_app.is_online = true;
+      enrich_app(linked_app, comp);
+
+      result.app_to_node[manifest_app.id] = comp.fqn;
+      result.node_to_app[comp.fqn] = manifest_app.id;
+      matched_nodes.insert(comp.fqn);
+
+      log_debug("Linked app '" + manifest_app.id + "' to node '" + comp.fqn + "'" +
+                (match->by_topic ? " (topic namespace)" : ""));
+    } else {
       result.unlinked_app_ids.push_back(manifest_app.id);
       log_debug("App '" + manifest_app.id + "' not linked (no matching node)");
     }
@@ -103,7 +113,7 @@ LinkingResult RuntimeLinker::link(const std::vector<App> & apps, const std::vect
 
   // Find orphan nodes (runtime nodes not matching any manifest app)
   for (const auto & comp : runtime_components) {
-    if (matched_nodes.find(comp.fqn) == matched_nodes.end()) {
+    if (matched_nodes.count(comp.fqn) == 0) {
       result.orphan_nodes.push_back(comp.fqn);
     }
   }
@@ -138,22 +148,104 @@ LinkingResult RuntimeLinker::link(const std::vector<App> & apps, const std::vect
   return result;
 }
 
-bool RuntimeLinker::matches_binding(const App::RosBinding & binding, const std::string & node_fqn,
-                                    const std::string & node_name, const std::string & node_namespace) const {
-  // Check node name match
-  if (binding.node_name.empty()) {
-    return false;
+bool RuntimeLinker::graph_changed(const std::vector<Component> & runtime_components) const {
+  return !std::equal(nodes_.begin(), nodes_.end(), runtime_components.begin(), runtime_components.end(),
+                     same_runtime_node);
+}
+
+void RuntimeLinker::rebuild_node_index(const std::vector<Component> & runtime_components) {
+  std::unordered_map<std::string, size_t> by_fqn;
+  for (size_t i = 0; i < runtime_components.size(); ++i) {
+    by_fqn.emplace(runtime_components[i].fqn, i);
+  }
+
+  // Graph delta against the previous snapshot (for diagnostics)
+  size_t added = 0;
+  size_t changed = 0;
+  for (const auto & [fqn, position] : by_fqn) {
+    auto it = node_by_fqn_.find(fqn);
+    if (it == node_by_fqn_.end()) {
+      ++added;
+    } else if (!same_runtime_node(nodes_[it->second], runtime_components[position])) {
+      ++changed;
+    }
+  }
+  size_t removed = 0;
+  for (const auto & entry : node_by_fqn_) {
+    removed += by_fqn.count(entry.first) == 0 ? 1 : 0;
+  }
+
+  nodes_ = runtime_components;
+  node_by_fqn_ = std::move(by_fqn);
+  nodes_by_name_.clear();
+  nodes_by_fqn_suffix_.clear();
+  nodes_by_topic_.clear();
+
+  for (size_t i = 0; i < nodes_.size(); ++i) {
+    const auto & comp = nodes_[i];
+    nodes_by_name_[comp.id].push_back(i);
+
+    // A binding's node_name matches wherever it follows a '/' in the FQN
+    for (size_t slash = comp.fqn.find('/'); slash != std::string::npos; slash = comp.fqn.find('/', slash + 1)) {
+      auto & positions = nodes_by_fqn_suffix_[comp.fqn.substr(slash + 1)];
+      if (positions.empty() || positions.back() != i) {
+        positions.push_back(i);
+      }
+    }
+
+    for (const auto * topics : {&comp.topics.publishes, &comp.topics.subscribes}) {
+      for (const auto & topic : *topics) {
+        auto & positions = nodes_by_topic_[topic];
+        if (positions.empty() || positions.back() != i) {
+          positions.push_back(i);
+        }
+      }
+    }
+  }
+
+  log_debug("Runtime graph changed: " + std::to_string(added) + " added, " + std::to_string(removed) + " removed, " +
+            std::to_string(changed) + " changed nodes; indexes rebuilt");
+}
+
+std::optional<RuntimeLinker::NodeMatch> RuntimeLinker::find_match(const App::RosBinding & binding) const {
+  constexpr size_t none = std::numeric_limits<size_t>::max();
+
+  // Node name: equals the node's name or follows a '/' in its FQN (e.g. "local_costmap/local_costmap")
+  size_t by_name = none;
+  if (!binding.node_name.empty()) {
+    auto consider = [&](size_t position) {
+      if (position < by_name && matches_namespace(binding, nodes_[position].namespace_path)) {
+        by_name = position;
+      }
+    };
+    auto name_it = nodes_by_name_.find(binding.node_name);
+    if (name_it != nodes_by_name_.end()) {
+      for (size_t position : name_it->second) {
+        consider(position);
+      }
+    }
+    for_each_with_prefix(nodes_by_fqn_suffix_, binding.node_name, consider);
   }
 
-  // Node name can be simple or with subpath (e.g., "local_costmap/local_costmap")
-  // Check if binding.node_name matches node_name or is contained in fqn
-  bool name_matches = (node_name == binding.node_name) || (node_fqn.find("/" + binding.node_name) != std::string::npos);
+  // Topic namespace: any published or subscribed topic starts with it
+  size_t by_topic = none;
+  if (!binding.topic_namespace.empty()) {
+    for_each_with_prefix(nodes_by_topic_, binding.topic_namespace, [&](size_t position) {
+      by_topic = std::min(by_topic, position);
+    });
+  }
 
-  if (!name_matches) {
-    return false;
+  // First node in discovery order wins; a name match beats a topic match on the same node
+  if (by_name == none && by_topic == none) {
+    return std::nullopt;
+  }
+  if (by_name <= by_topic) {
+    return NodeMatch{by_name, false};
   }
+  return NodeMatch{by_topic, true};
+}
 
-  // Check namespace match
+bool RuntimeLinker::matches_namespace(const App::RosBinding & binding, const std::string & node_namespace) const {
   if (binding.namespace_pattern == "*") {
     // Wildcard matches any namespace
     return true;
@@ -174,21 +266,6 @@ bool RuntimeLinker::matches_binding(const App::RosBinding & binding, const std::
   return actual_ns == expected_ns || actual_ns.find(expected_ns) == 0;  // Prefix match
 }
 
-bool RuntimeLinker::matches_topic_namespace(const std::string & topic_namespace, const Component & component) const {
-  // Check if any topic starts with the given namespace
-  for (const auto & topic : component.topics.publishes) {
-    if (topic.find(topic_namespace) == 0) {
-      return true;
-    }
-  }
-  for (const auto & topic : component.topics.subscribes) {
-    if (topic.find(topic_namespace) == 0) {
-      return true;
-    }
-  }
-  return false;
-}
-
 void RuntimeLinker::enrich_app(App & app, const Component & component) {
   // Copy topics
   app.topics = component.topics;
@@ -0,0 +1,81 @@
+// Copyright 2026 bburda
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+#include "ros2_medkit_gateway/discovery/models/interned_string.hpp"
+
+#include <mutex>
+#include <shared_mutex>
+#include <unordered_set>
+
+namespace ros2_medkit_gateway {
+
+namespace {
+
+struct StringPool {
+  std::shared_mutex mutex;
+  std::unordered_set<std::string> values;  // Node-based: element addresses are stable
+};
+
+StringPool & pool() {
+  // Never destroyed, so handles held by static objects stay valid during shutdown
+  static auto * instance = new StringPool();
+  return *instance;
+}
+
+}  // namespace
+
+const std::string InternedString::kEmpty;
+
+InternedString::InternedString(const std::string & value) : value_(intern(value)) {
+}
+
+InternedString::InternedString(const char * value) : value_(intern(value)) {
+}
+
+const std::string * InternedString::intern(const std::string & value) {
+  if (value.empty()) {
+    return &kEmpty;
+  }
+  auto & p = pool();
+  {
+    std::shared_lock lock(p.mutex);
+    auto it = p.values.find(value);
+    if (it != p.values.end()) {
+      return &*it;
+    }
+  }
+  std::unique_lock lock(p.mutex);
+  return &*p.values.insert(value).first;
+}
+
+std::optional<InternedString> InternedString::lookup(const std::string & value) {
+  if (value.empty()) {
+    return InternedString();
+  }
+  auto & p = pool();
+  std::shared_lock lock(p.mutex);
+  auto it = p.values.find(value);
+  if (it == p.values.end()) {
+    return std::nullopt;
+  }
+  return InternedString(&*it);
+}
+
+size_t InternedString::pool_size() {
+  auto & p = pool();
+  std::shared_lock lock(p.mutex);
+  return p.values.size();
+}
+
+}  // namespace ros2_medkit_gateway
@@ -281,10 +281,10 @@ std::vector<ServiceInfo> RuntimeDiscoveryStrategy::discover_services() {
     if (type_introspection_ && !info.type.empty()) {
       try {
         json type_info_json;
-        auto request_info = type_introspection_->get_type_info(info.type + "_Request");
-        auto response_info = type_introspection_->get_type_info(info.type + "_Response");
-        type_info_json["request"] = request_info.schema;
-        type_info_json["response"] = response_info.schema;
+        auto request_info = type_introspection_->get_type_info_ptr(info.type + "_Request");
+        auto response_info = type_introspection_->get_type_info_ptr(info.type + "_Response");
+        type_info_json["request"] = request_info->schema;
+        type_info_json["response"] = response_info->schema;
         info.type_info = type_info_json;
       } catch (const std::exception & e) {
         RCLCPP_DEBUG(node_->get_logger(), "Could not get schema for service '%s': %s", info.type.c_str(), e.what());
@@ -346,12 +346,12 @@ std::vector<ActionInfo> RuntimeDiscoveryStrategy::discover_actions() {
         if (type_introspection_ && !info.type.empty()) {
           try {
             json type_info_json;
-            auto goal_info = type_introspection_->get_type_info(info.type + "_Goal");
-            auto result_info = type_introspection_->get_type_info(info.type + "_Result");
-            auto feedback_info = type_introspection_->get_type_info(info.type + "_Feedback");
-            type_info_json["goal"] = goal_info.schema;
-            type_info_json["result"] = result_info.schema;
-            type_info_json["feedback"] = feedback_info.schema;
+            auto goal_info = type_introspection_->get_type_info_ptr(info.type + "_Goal");
+            auto result_info = type_introspection_->get_type_info_ptr(info.type + "_Result");
+            auto feedback_info = type_introspection_->get_type_info_ptr(info.type + "_Feedback");
+            type_info_json["goal"] = goal_info->schema;
+            type_info_json["result"] = result_info->schema;
+            type_info_json["feedback"] = feedback_info->schema;
             info.type_info = type_info_json;
           } catch (const std::exception & e) {
             RCLCPP_DEBUG(node_->get_logger(), "Could not get schema for action '%s': %s", info.type.c_str(), e.what());
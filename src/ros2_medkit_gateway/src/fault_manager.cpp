@@ -17,6 +17,7 @@
 #include <algorithm>
 #include <builtin_interfaces/msg/time.hpp>
 #include <chrono>
+#include <cinttypes>
 
 using namespace std::chrono_literals;
 
@@ -35,7 +36,29 @@ FaultManager::FaultManager(rclcpp::Node * node) : node_(node) {
   // Get configurable timeout
   service_timeout_sec_ = node_->declare_parameter("fault_service_timeout_sec", 5.0);
 
-  RCLCPP_INFO(node_->get_logger(), "FaultManager initialized");
+  // Local fault mirror: bootstrapped with ListFaults, kept current from fault events
+  mirror_enabled_ = node_->declare_parameter("fault_mirror.enabled", true);
+  double resync_interval_sec = node_->declare_parameter("fault_mirror.resync_interval_sec", 5.0);
+  if (resync_interval_sec < 0.0) {
+    RCLCPP_WARN(node_->get_logger(), "fault_mirror.resync_interval_sec must be >= 0, got %.2f. Using default 5.0",
+                resync_interval_sec);
+    resync_interval_sec = 5.0;
+  }
+  mirror_resync_interval_ = std::chrono::duration<double>(resync_interval_sec);
+
+  if (mirror_enabled_) {
+    event_subscription_ = node_->create_subscription<ros2_medkit_msgs::msg::FaultEvent>(
+        "/fault_manager/events", rclcpp::QoS(100).reliable(),
+        [this](const ros2_medkit_msgs::msg::FaultEvent::ConstSharedPtr & msg) {
+          on_fault_event(msg);
+        });
+    mirror_timer_ = node_->create_wall_timer(1s, [this]() {
+      maintain_mirror();
+    });
+  }
+
+  RCLCPP_INFO(node_->get_logger(), "FaultManager initialized (fault mirror %s)",
+              mirror_enabled_ ? "enabled" : "disabled");
 }
 
 bool FaultManager::wait_for_services(std::chrono::duration<double> timeout) {
@@ -43,11 +66,83 @@ bool FaultManager::wait_for_services(std::chrono::duration<double> timeout) {
          list_faults_client_->wait_for_service(timeout) && clear_fault_client_->wait_for_service(timeout);
 }
 
+void FaultManager::set_service_availability(ServiceAvailability * availability) {
+  availability_ = availability;
+}
+
 bool FaultManager::is_available() const {
   return report_fault_client_->service_is_ready() && get_fault_client_->service_is_ready() &&
          list_faults_client_->service_is_ready() && clear_fault_client_->service_is_ready();
 }
 
+std::vector<std::string> FaultManager::status_filter(bool include_prefailed, bool include_confirmed,
+                                                     bool include_cleared) {
+  std::vector<std::string> statuses;
+  if (include_prefailed) {
+    statuses.push_back(ros2_medkit_msgs::msg::Fault::STATUS_PREFAILED);
+  }
+  if (include_confirmed) {
+    statuses.push_back(ros2_medkit_msgs::msg::Fault::STATUS_CONFIRMED);
+  }
+  if (include_cleared) {
+    statuses.push_back(ros2_medkit_msgs::msg::Fault::STATUS_CLEARED);
+  }
+  return statuses;
+}
+
+void FaultManager::on_fault_event(const ros2_medkit_msgs::msg::FaultEvent::ConstSharedPtr & msg) {
+  if (!mirror_.apply(*msg)) {
+    RCLCPP_WARN(node_->get_logger(), "Fault event sequence gap at %" PRIu64 ", resyncing fault mirror", msg->sequence);
+    if (!mirror_.is_syncing()) {
+      request_mirror_sync();
+    }
+  }
+}
+
+void FaultManager::maintain_mirror() {
+  auto now = std::chrono::steady_clock::now();
+  if (mirror_.is_syncing()) {
+    // Response lost (e.g. FaultManager restarted mid-request): give up and retry
+    if (now - mirror_sync_started_ < std::chrono::duration<double>(service_timeout_sec_)) {
+      return;
+    }
+    mirror_.abort_sync();
+  } else if (mirror_.is_synced()) {
+    // Periodic resync picks up changes the FaultManager does not publish events for
+    // (debounce transitions, muted symptoms, time-based confirmation)
+    if (mirror_resync_interval_.count() <= 0.0 || now - mirror_last_sync_ < mirror_resync_interval_) {
+      return;
+    }
+  }
+  request_mirror_sync();
+}
+
+void FaultManager::request_mirror_sync() {
+  if (!list_faults_client_->service_is_ready()) {
+    return;  // Retried by maintain_mirror() once the FaultManager is up
+  }
+
+  auto request = std::make_shared<ros2_medkit_msgs::srv::ListFaults::Request>();
+  request->statuses = {ros2_medkit_msgs::msg::Fault::STATUS_PREFAILED, ros2_medkit_msgs::msg::Fault::STATUS_PREPASSED,
+                       ros2_medkit_msgs::msg::Fault::STATUS_CONFIRMED, ros2_medkit_msgs::msg::Fault::STATUS_HEALED,
+                       ros2_medkit_msgs::msg::Fault::STATUS_CLEARED};
+
+  mirror_.begin_sync();
+  mirror_sync_started_ = std::chrono::steady_clock::now();
+  uint64_t generation = ++mirror_sync_generation_;
+
+  list_faults_client_->async_send_request(
+      request, [this, generation](rclcpp::Client<ros2_medkit_msgs::srv::ListFaults>::SharedFuture future) {
+        if (generation != mirror_sync_generation_) {
+          return;  // Superseded by a newer sync
+        }
+        auto response = future.get();
+        mirror_.complete_sync(response->faults, response->muted_count, response->cluster_count);
+        mirror_last_sync_ = std::chrono::steady_clock::now();
+        RCLCPP_DEBUG(node_->get_logger(), "Fault mirror synced: %zu faults", mirror_.size());
+      });
+}
+
 /// Convert a ROS 2 Fault message to JSON for REST API responses.
 /// Timestamps are converted from builtin_interfaces::msg::Time (sec + nanosec) to seconds as double.
 /// A human-readable severity_label is added based on the severity level.
@@ -95,7 +190,7 @@ FaultResult FaultManager::report_fault(const std::string & fault_code, uint8_t s
   FaultResult result;
 
   auto timeout = std::chrono::duration<double>(service_timeout_sec_);
-  if (!report_fault_client_->wait_for_service(timeout)) {
+  if (!wait_for_server(availability_, report_fault_client_, timeout)) {
     result.success = false;
     result.error_message = "ReportFault service not available";
     return result;
@@ -128,11 +223,42 @@ FaultResult FaultManager::report_fault(const std::string & fault_code, uint8_t s
 
 FaultResult FaultManager::list_faults(const std::string & source_id, bool include_prefailed, bool include_confirmed,
                                       bool include_cleared, bool include_muted, bool include_clusters) {
+  // Correlation details are only available from the service
+  if (!include_muted && !include_clusters) {
+    auto faults = mirror_.list(source_id, status_filter(include_prefailed, include_confirmed, include_cleared));
+    if (faults) {
+      json faults_array = json::array();
+      for (const auto & fault : *faults) {
+        faults_array.push_back(fault_to_json(fault));
+      }
+      FaultResult result;
+      result.success = true;
+      result.data = {{"faults", faults_array},
+                     {"count", faults_array.size()},
+                     {"muted_count", mirror_.muted_count()},
+                     {"cluster_count", mirror_.cluster_count()}};
+      return result;
+    }
+  }
+
+  std::string key = source_id + "|";
+  for (bool flag : {include_prefailed, include_confirmed, include_cleared, include_muted, include_clusters}) {
+    key += flag ? '1' : '0';
+  }
+  return list_flights_.run(key, [&]() {
+    return call_list_faults(source_id, include_prefailed, include_confirmed, include_cleared, include_muted,
+                            include_clusters);
+  });
+}
+
+FaultResult FaultManager::call_list_faults(const std::string & source_id, bool include_prefailed,
+                                           bool include_confirmed, bool include_cleared, bool include_muted,
+                                           bool include_clusters) {
   std::lock_guard<std::mutex> lock(list_mutex_);
   FaultResult result;
 
   auto timeout = std::chrono::duration<double>(service_timeout_sec_);
-  if (!list_faults_client_->wait_for_service(timeout)) {
+  if (!wait_for_server(availability_, list_faults_client_, timeout)) {
     result.success = false;
     result.error_message = "ListFaults service not available";
     return result;
@@ -141,17 +267,7 @@ FaultResult FaultManager::list_faults(const std::string & source_id, bool includ
   auto request = std::make_shared<ros2_medkit_msgs::srv::ListFaults::Request>();
   request->filter_by_severity = false;
   request->severity = 0;
-
-  // Build status filter
-  if (include_prefailed) {
-    request->statuses.push_back(ros2_medkit_msgs::msg::Fault::STATUS_PREFAILED);
-  }
-  if (include_confirmed) {
-    request->statuses.push_back(ros2_medkit_msgs::msg::Fault::STATUS_CONFIRMED);
-  }
-  if (include_cleared) {
-    request->statuses.push_back(ros2_medkit_msgs::msg::Fault::STATUS_CLEARED);
-  }
+  request->statuses = status_filter(include_prefailed, include_confirmed, include_cleared);
 
   // Correlation options
   request->include_muted = include_muted;
@@ -232,11 +348,17 @@ FaultResult FaultManager::list_faults(const std::string & source_id, bool includ
 }
 
 FaultWithEnvResult FaultManager::get_fault_with_env(const std::string & fault_code, const std::string & source_id) {
+  return get_flights_.run(fault_code + "|" + source_id, [&]() {
+    return call_get_fault(fault_code, source_id);
+  });
+}
+
+FaultWithEnvResult FaultManager::call_get_fault(const std::string & fault_code, const std::string & source_id) {
   std::lock_guard<std::mutex> lock(get_mutex_);
   FaultWithEnvResult result;
 
   auto timeout = std::chrono::duration<double>(service_timeout_sec_);
-  if (!get_fault_client_->wait_for_service(timeout)) {
+  if (!wait_for_server(availability_, get_fault_client_, timeout)) {
     result.success = false;
     result.error_message = "GetFault service not available";
     return result;
@@ -284,6 +406,26 @@ FaultWithEnvResult FaultManager::get_fault_with_env(const std::string & fault_co
 }
 
 FaultResult FaultManager::get_fault(const std::string & fault_code, const std::string & source_id) {
+  // Environment data is not needed here, so a mirrored fault answers without a service call
+  auto mirrored = mirror_.find(fault_code);
+  if (mirrored) {
+    bool matches = source_id.empty();
+    for (const auto & src : mirrored->reporting_sources) {
+      if (src.rfind(source_id, 0) == 0) {
+        matches = true;
+        break;
+      }
+    }
+    FaultResult result;
+    result.success = matches;
+    if (matches) {
+      result.data = fault_to_json(*mirrored);
+    } else {
+      result.error_message = "Fault not found for source: " + source_id;
+    }
+    return result;
+  }
+
   // Use get_fault_with_env and convert to JSON
   auto env_result = get_fault_with_env(fault_code, source_id);
 
@@ -303,7 +445,7 @@ FaultResult FaultManager::clear_fault(const std::string & fault_code) {
   FaultResult result;
 
   auto timeout = std::chrono::duration<double>(service_timeout_sec_);
-  if (!clear_fault_client_->wait_for_service(timeout)) {
+  if (!wait_for_server(availability_, clear_fault_client_, timeout)) {
     result.success = false;
     result.error_message = "ClearFault service not available";
     return result;
@@ -332,6 +474,12 @@ FaultResult FaultManager::clear_fault(const std::string & fault_code) {
     result.data["auto_cleared_codes"] = response->auto_cleared_codes;
   }
 
+  if (response->success) {
+    std::vector<std::string> cleared_codes = response->auto_cleared_codes;
+    cleared_codes.push_back(fault_code);
+    mirror_.mark_cleared(cleared_codes);
+  }
+
   return result;
 }
 
@@ -340,7 +488,7 @@ FaultResult FaultManager::get_snapshots(const std::string & fault_code, const st
   FaultResult result;
 
   auto timeout = std::chrono::duration<double>(service_timeout_sec_);
-  if (!get_snapshots_client_->wait_for_service(timeout)) {
+  if (!wait_for_server(availability_, get_snapshots_client_, timeout)) {
     result.success = false;
     result.error_message = "GetSnapshots service not available";
     return result;
@@ -380,7 +528,7 @@ FaultResult FaultManager::get_rosbag(const std::string & fault_code) {
   FaultResult result;
 
   auto timeout = std::chrono::duration<double>(service_timeout_sec_);
-  if (!get_rosbag_client_->wait_for_service(timeout)) {
+  if (!wait_for_server(availability_, get_rosbag_client_, timeout)) {
     result.success = false;
     result.error_message = "GetRosbag service not available";
     return result;
@@ -417,7 +565,7 @@ FaultResult FaultManager::list_rosbags(const std::string & entity_fqn) {
   FaultResult result;
 
   auto timeout = std::chrono::duration<double>(service_timeout_sec_);
-  if (!list_rosbags_client_->wait_for_service(timeout)) {
+  if (!wait_for_server(availability_, list_rosbags_client_, timeout)) {
     result.success = false;
     result.error_message = "ListRosbags service not available";
     return result;
@@ -0,0 +1,205 @@
+// Copyright 2026 bburda
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+#include "ros2_medkit_gateway/fault_mirror.hpp"
+
+#include <mutex>
+
+namespace ros2_medkit_gateway {
+
+void FaultMirror::begin_sync() {
+  std::unique_lock<std::shared_mutex> lock(mutex_);
+  syncing_ = true;
+  sync_dirty_ = false;
+  pending_events_.clear();
+}
+
+void FaultMirror::complete_sync(const std::vector<Fault> & faults, uint32_t muted_count, uint32_t cluster_count) {
+  std::unique_lock<std::shared_mutex> lock(mutex_);
+  faults_.clear();
+  by_status_.clear();
+  by_source_.clear();
+  for (const auto & fault : faults) {
+    upsert(fault);
+  }
+  for (const auto & event : pending_events_) {
+    upsert(event.fault);
+  }
+  pending_events_.clear();
+  muted_count_ = muted_count;
+  cluster_count_ = cluster_count;
+  syncing_ = false;
+  // A gap seen while the snapshot was in flight may not be covered by it
+  synced_ = !sync_dirty_;
+}
+
+void FaultMirror::abort_sync() {
+  std::unique_lock<std::shared_mutex> lock(mutex_);
+  syncing_ = false;
+  pending_events_.clear();
+}
+
+bool FaultMirror::apply(const FaultEvent & event) {
+  std::unique_lock<std::shared_mutex> lock(mutex_);
+  if (!check_sequence(event.sequence)) {
+    synced_ = false;
+    if (syncing_) {
+      sync_dirty_ = true;
+    }
+    return false;
+  }
+  if (syncing_) {
+    pending_events_.push_back(event);
+  } else if (synced_) {
+    upsert(event.fault);
+  }
+  return true;
+}
+
+void FaultMirror::mark_cleared(const std::vector<std::string> & fault_codes) {
+  std::unique_lock<std::shared_mutex> lock(mutex_);
+  for (const auto & code : fault_codes) {
+    auto it = faults_.find(code);
+    if (it != faults_.end()) {
+      Fault cleared = it->second;
+      cleared.status = Fault::STATUS_CLEARED;
+      upsert(cleared);
+    }
+  }
+}
+
+bool FaultMirror::is_synced() const {
+  std::shared_lock<std::shared_mutex> lock(mutex_);
+  return synced_;
+}
+
+bool FaultMirror::is_syncing() const {
+  std::shared_lock<std::shared_mutex> lock(mutex_);
+  return syncing_;
+}
+
+std::optional<std::vector<FaultMirror::Fault>> FaultMirror::list(const std::string & source_prefix,
+                                                                 const std::vector<std::string> & statuses) const {
+  std::shared_lock<std::shared_mutex> lock(mutex_);
+  if (!synced_) {
+    return std::nullopt;
+  }
+
+  // Same default as ListFaults: no statuses means CONFIRMED only
+  std::vector<std::string> wanted = statuses;
+  if (wanted.empty()) {
+    wanted.push_back(Fault::STATUS_CONFIRMED);
+  }
+
+  std::set<std::string> codes;
+  for (const auto & status : wanted) {
+    auto it = by_status_.find(status);
+    if (it != by_status_.end()) {
+      codes.insert(it->second.begin(), it->second.end());
+    }
+  }
+
+  if (!source_prefix.empty()) {
+    // Sources sharing the prefix are contiguous in the ordered index
+    std::set<std::string> from_source;
+    for (auto it = by_source_.lower_bound(source_prefix);
+         it != by_source_.end() && it->first.compare(0, source_prefix.size(), source_prefix) == 0; ++it) {
+      for (const auto & code : it->second) {
+        if (codes.count(code) > 0) {
+          from_source.insert(code);
+        }
+      }
+    }
+    codes = std::move(from_source);
+  }
+
+  std::vector<Fault> result;
+  result.reserve(codes.size());
+  for (const auto & code : codes) {
+    result.push_back(faults_.at(code));
+  }
+  return result;
+}
+
+std::optional<FaultMirror::Fault> FaultMirror::find(const std::string & fault_code) const {
+  std::shared_lock<std::shared_mutex> lock(mutex_);
+  if (!synced_) {
+    return std::nullopt;
+  }
+  auto it = faults_.find(fault_code);
+  if (it == faults_.end()) {
+    return std::nullopt;
+  }
+  return it->second;
+}
+
+uint32_t FaultMirror::muted_count() const {
+  std::shared_lock<std::shared_mutex> lock(mutex_);
+  return muted_count_;
+}
+
+uint32_t FaultMirror::cluster_count() const {
+  std::shared_lock<std::shared_mutex> lock(mutex_);
+  return cluster_count_;
+}
+
+size_t FaultMirror::size() const {
+  std::shared_lock<std::shared_mutex> lock(mutex_);
+  return faults_.size();
+}
+
+bool FaultMirror::check_sequence(uint64_t sequence) {
+  if (sequence == 0) {
+    // Publisher does not number its events; nothing to check
+    return true;
+  }
+  bool in_order = last_sequence_ == 0 || sequence == last_sequence_ + 1;
+  last_sequence_ = sequence;
+  return in_order;
+}
+
+void FaultMirror::upsert(const Fault & fault) {
+  auto it = faults_.find(fault.fault_code);
+  if (it != faults_.end()) {
+    unindex(it->second);
+    it->second = fault;
+  } else {
+    faults_.emplace(fault.fault_code, fault);
+  }
+  by_status_[fault.status].insert(fault.fault_code);
+  for (const auto & source : fault.reporting_sources) {
+    by_source_[source].insert(fault.fault_code);
+  }
+}
+
+void FaultMirror::unindex(const Fault & fault) {
+  auto status_it = by_status_.find(fault.status);
+  if (status_it != by_status_.end()) {
+    status_it->second.erase(fault.fault_code);
+    if (status_it->second.empty()) {
+      by_status_.erase(status_it);
+    }
+  }
+  for (const auto & source : fault.reporting_sources) {
+    auto source_it = by_source_.find(source);
+    if (source_it != by_source_.end()) {
+      source_it->second.erase(fault.fault_code);
+      if (source_it->second.empty()) {
+        by_source_.erase(source_it);
+      }
+    }
+  }
+}
+
+}  // namespace ros2_medkit_gateway
@@ -15,6 +15,7 @@
 #include "ros2_medkit_gateway/gateway_node.hpp"
 
 #include <chrono>
+#include <unordered_set>
 
 using namespace std::chrono_literals;
 
@@ -27,6 +28,16 @@ GatewayNode::GatewayNode() : Node("ros2_medkit_gateway") {
   declare_parameter("server.host", "127.0.0.1");
   declare_parameter("server.port", 8080);
   declare_parameter("refresh_interval_ms", 10000);
+
+  // HTTP worker pool, keep-alive and backpressure parameters
+  declare_parameter("server.worker_threads", 32);
+  declare_parameter("server.max_queued_connections", 128);
+  declare_parameter("server.slow_route_concurrency", 8);
+  declare_parameter("server.slow_route_queue", 8);
+  declare_parameter("server.keep_alive_max_count", 100);
+  declare_parameter("server.keep_alive_timeout_sec", 5);
+  declare_parameter("server.retry_after_sec", 1);
+
   declare_parameter("cors.allowed_origins", std::vector<std::string>{});
   declare_parameter("cors.allowed_methods", std::vector<std::string>{"GET", "PUT", "POST", "DELETE", "OPTIONS"});
   declare_parameter("cors.allowed_headers", std::vector<std::string>{"Content-Type", "Accept"});
@@ -36,6 +47,16 @@ GatewayNode::GatewayNode() : Node("ros2_medkit_gateway") {
   // SSE (Server-Sent Events) parameters
   declare_parameter("sse.max_clients", 10);  // Limit concurrent SSE connections to prevent resource exhaustion
 
+  // Response compression parameters
+  declare_parameter("compression.enabled", true);
+  declare_parameter("compression.min_size_bytes", 1024);
+  declare_parameter("compression.gzip_level", 6);
+  declare_parameter("compression.zstd_level", 3);
+  declare_parameter("compression.excluded_paths", std::vector<std::string>{});
+
+  // Prometheus metrics endpoint (GET /metrics)
+  declare_parameter("metrics.enabled", true);
+
   // TLS/HTTPS parameters
   declare_parameter("server.tls.enabled", false);
   declare_parameter("server.tls.cert_file", "");
@@ -60,6 +81,7 @@ GatewayNode::GatewayNode() : Node("ros2_medkit_gateway") {
   declare_parameter("discovery_mode", "runtime_only");  // runtime_only, manifest_only, hybrid
   declare_parameter("manifest_path", "");
   declare_parameter("manifest_strict_validation", true);
+  declare_parameter("manifest_cache_dir", "");  // empty = no compiled manifest cache
 
   // Runtime (heuristic) discovery options
   // These control how nodes are mapped to SOVD entities in runtime mode
@@ -108,9 +130,40 @@ GatewayNode::GatewayNode() : Node("ros2_medkit_gateway") {
     refresh_interval_ms_ = 10000;
   }
 
+  // Build worker pool and backpressure configuration (negative values are rejected by validate())
+  auto read_count = [this](const std::string & name) {
+    int64_t value = get_parameter(name).as_int();
+    return value < 0 ? size_t{0} : static_cast<size_t>(value);
+  };
+  server_limits_.worker_threads = read_count("server.worker_threads");
+  server_limits_.max_queued_connections = read_count("server.max_queued_connections");
+  server_limits_.slow_route_concurrency = read_count("server.slow_route_concurrency");
+  server_limits_.slow_route_queue = read_count("server.slow_route_queue");
+  server_limits_.keep_alive_max_count = read_count("server.keep_alive_max_count");
+  server_limits_.keep_alive_timeout_sec = static_cast<int>(get_parameter("server.keep_alive_timeout_sec").as_int());
+  server_limits_.retry_after_sec = static_cast<int>(get_parameter("server.retry_after_sec").as_int());
+  std::string limits_error = server_limits_.validate();
+  if (!limits_error.empty()) {
+    RCLCPP_WARN(get_logger(), "%s. Using default worker pool settings.", limits_error.c_str());
+    server_limits_ = ServerLimitsConfig{};
+  }
+
+  // Each SSE stream holds a worker for its whole lifetime
+  int64_t sse_max_clients = get_parameter("sse.max_clients").as_int();
+  size_t slow_workers = server_limits_.slow_route_concurrency + server_limits_.slow_route_queue;
+  if (sse_max_clients > 0 && static_cast<size_t>(sse_max_clients) + slow_workers >= server_limits_.worker_threads) {
+    RCLCPP_WARN(get_logger(),
+                "sse.max_clients (%ld) plus slow route limits leave no worker for other requests. "
+                "Increase server.worker_threads.",
+                static_cast<long>(sse_max_clients));
+  }
+
   // Log configuration
   RCLCPP_INFO(get_logger(), "Configuration: REST API at %s:%d, refresh interval: %dms", server_host_.c_str(),
               server_port_, refresh_interval_ms_);
+  RCLCPP_INFO(get_logger(), "HTTP workers: %zu (slow routes: %zu running, %zu queued), connection queue: %zu",
+              server_limits_.worker_threads, server_limits_.slow_route_concurrency, server_limits_.slow_route_queue,
+              server_limits_.max_queued_connections);
 
   if (cors_config_.enabled) {
     std::string origins_str;
@@ -158,6 +211,33 @@ GatewayNode::GatewayNode() : Node("ros2_medkit_gateway") {
     tls_config_ = TlsConfig{};
   }
 
+  // Build response compression configuration
+  compression_config_.enabled = get_parameter("compression.enabled").as_bool();
+  int64_t compression_min_size = get_parameter("compression.min_size_bytes").as_int();
+  if (compression_min_size < 0) {
+    RCLCPP_WARN(get_logger(), "Invalid compression.min_size_bytes %ld. Must be >= 0. Using default 1024.",
+                static_cast<long>(compression_min_size));
+    compression_min_size = 1024;
+  }
+  compression_config_.min_size_bytes = static_cast<size_t>(compression_min_size);
+  compression_config_.gzip_level = static_cast<int>(get_parameter("compression.gzip_level").as_int());
+  compression_config_.zstd_level = static_cast<int>(get_parameter("compression.zstd_level").as_int());
+  for (const auto & path : get_parameter("compression.excluded_paths").as_string_array()) {
+    // Skip empty strings (used as placeholder for empty list in YAML)
+    if (!path.empty()) {
+      compression_config_.excluded_paths.push_back(path);
+    }
+  }
+  std::string compression_error = compression_config_.validate();
+  if (!compression_error.empty()) {
+    RCLCPP_WARN(get_logger(), "%s. Using default compression levels.", compression_error.c_str());
+    compression_config_.gzip_level = CompressionConfig{}.gzip_level;
+    compression_config_.zstd_level = CompressionConfig{}.zstd_level;
+  }
+  if (!compression_config_.enabled) {
+    RCLCPP_INFO(get_logger(), "Response compression: disabled");
+  }
+
   // Build Authentication configuration (REQ_INTEROP_086, REQ_INTEROP_087)
   bool auth_enabled = get_parameter("auth.enabled").as_bool();
   if (auth_enabled) {
@@ -213,6 +293,12 @@ GatewayNode::GatewayNode() : Node("ros2_medkit_gateway") {
     auth_config_ = AuthConfig{};
   }
 
+  if (get_parameter("metrics.enabled").as_bool()) {
+    metrics_ = std::make_unique<MetricsRegistry>();
+  } else {
+    RCLCPP_INFO(get_logger(), "Metrics endpoint: disabled");
+  }
+
   // Initialize managers
   discovery_mgr_ = std::make_unique<DiscoveryManager>(this);
 
@@ -221,6 +307,7 @@ GatewayNode::GatewayNode() : Node("ros2_medkit_gateway") {
   discovery_config.mode = parse_discovery_mode(get_parameter("discovery_mode").as_string());
   discovery_config.manifest_path = get_parameter("manifest_path").as_string();
   discovery_config.manifest_strict_validation = get_parameter("manifest_strict_validation").as_bool();
+  discovery_config.manifest_cache_dir = get_parameter("manifest_cache_dir").as_string();
 
   // Runtime discovery options
   discovery_config.runtime.create_synthetic_components =
@@ -244,12 +331,23 @@ GatewayNode::GatewayNode() : Node("ros2_medkit_gateway") {
   config_mgr_ = std::make_unique<ConfigurationManager>(this);
   fault_mgr_ = std::make_unique<FaultManager>(this);
 
+  // Operations and faults check servers against the graph-driven tracker instead of waiting per call
+  service_availability_ = std::make_unique<ServiceAvailability>(this);
+  operation_mgr_->set_service_availability(service_availability_.get());
+  fault_mgr_->set_service_availability(service_availability_.get());
+
   // Connect topic sampler to discovery manager for component-topic mapping
   discovery_mgr_->set_topic_sampler(data_access_mgr_->get_native_sampler());
 
   // Connect type introspection for operation schema enrichment
   discovery_mgr_->set_type_introspection(data_access_mgr_->get_type_introspection());
 
+  if (metrics_) {
+    operation_mgr_->set_metrics_registry(metrics_.get());
+    config_mgr_->set_metrics_registry(metrics_.get());
+    register_cache_metrics();
+  }
+
   // Initial discovery
   refresh_cache();
 
@@ -263,9 +361,9 @@ GatewayNode::GatewayNode() : Node("ros2_medkit_gateway") {
     operation_mgr_->cleanup_old_goals(std::chrono::seconds(300));
   });
 
-  // Start REST server with configured host, port, CORS, auth, and TLS
-  rest_server_ =
-      std::make_unique<RESTServer>(this, server_host_, server_port_, cors_config_, auth_config_, tls_config_);
+  // Start REST server with configured host, port, CORS, auth, TLS, compression and worker limits
+  rest_server_ = std::make_unique<RESTServer>(this, server_host_, server_port_, cors_config_, auth_config_, tls_config_,
+                                              compression_config_, server_limits_);
   start_rest_server();
 
   std::string protocol = tls_config_.enabled ? "HTTPS" : "HTTP";
@@ -302,28 +400,75 @@ FaultManager * GatewayNode::get_fault_manager() const {
   return fault_mgr_.get();
 }
 
+MetricsRegistry * GatewayNode::get_metrics_registry() const {
+  return metrics_.get();
+}
+
+void GatewayNode::register_cache_metrics() {
+  metrics_->describe_counter("medkit_cache_hits_total", "Cache lookups served from the cache");
+  metrics_->describe_counter("medkit_cache_misses_total", "Cache lookups that found no entry");
+  metrics_->describe_gauge("medkit_cache_entries", "Entries currently held by the cache");
+  metrics_->describe_histogram("medkit_discovery_refresh_duration_seconds",
+                               "Duration of each discovery cache refresh stage");
+
+  // Cache statistics are owned by the caches; mirror them at scrape time
+  metrics_->add_collector([this](MetricsRegistry & metrics) {
+    auto stats = thread_safe_cache_.get_stats();
+    metrics.set("medkit_cache_hits_total", {{"cache", "entity"}}, static_cast<double>(stats.entity_lookup_hits));
+    metrics.set("medkit_cache_misses_total", {{"cache", "entity"}}, static_cast<double>(stats.entity_lookup_misses));
+    metrics.set("medkit_cache_entries", {{"cache", "entity"}},
+                static_cast<double>(stats.area_count + stats.component_count + stats.app_count + stats.function_count));
+    metrics.set("medkit_cache_hits_total", {{"cache", "topic"}}, static_cast<double>(stats.topic_type_hits));
+    metrics.set("medkit_cache_misses_total", {{"cache", "topic"}}, static_cast<double>(stats.topic_type_misses));
+
+    auto type_introspection = data_access_mgr_->get_type_introspection();
+    metrics.set("medkit_cache_hits_total", {{"cache", "type"}}, static_cast<double>(type_introspection->cache_hits()));
+    metrics.set("medkit_cache_misses_total", {{"cache", "type"}},
+                static_cast<double>(type_introspection->cache_misses()));
+    metrics.set("medkit_cache_entries", {{"cache", "type"}}, static_cast<double>(type_introspection->cache_size()));
+  });
+}
+
+void GatewayNode::record_refresh_stage(const char * stage, std::chrono::steady_clock::time_point & start) {
+  auto now = std::chrono::steady_clock::now();
+  if (metrics_) {
+    std::chrono::duration<double> elapsed = now - start;
+    metrics_->observe("medkit_discovery_refresh_duration_seconds", {{"stage", stage}}, elapsed.count());
+  }
+  start = now;
+}
+
 void GatewayNode::refresh_cache() {
   RCLCPP_DEBUG(get_logger(), "Refreshing entity cache...");
 
+  const auto refresh_start = std::chrono::steady_clock::now();
+  auto stage_start = refresh_start;
+
   try {
     // Refresh topic map first (rebuilds the cached map)
     discovery_mgr_->refresh_topic_map();
+    record_refresh_stage("topic_map", stage_start);
 
     // Discover data outside the lock to minimize lock time
     auto areas = discovery_mgr_->discover_areas();
+    record_refresh_stage("areas", stage_start);
 
     // Discover node-based components (standard ROS 2 nodes)
     auto node_components = discovery_mgr_->discover_components();
+    record_refresh_stage("components", stage_start);
 
     // Discover topic-based components (for systems like Isaac Sim that
     // publish topics without creating proper ROS 2 nodes)
     auto topic_components = discovery_mgr_->discover_topic_components();
+    record_refresh_stage("topic_components", stage_start);
 
     // Discover apps (nodes as Apps when heuristic discovery is enabled)
     auto apps = discovery_mgr_->discover_apps();
+    record_refresh_stage("apps", stage_start);
 
     // Discover functions (from manifest in manifest_only/hybrid mode)
     auto functions = discovery_mgr_->discover_functions();
+    record_refresh_stage("functions", stage_start);
 
     // Merge both component lists
     std::vector<Component> all_components;
@@ -345,6 +490,7 @@ void GatewayNode::refresh_cache() {
                                   apps,            // copy
                                   functions        // copy
     );
+    record_refresh_stage("entity_cache", stage_start);
 
     // Update topic type cache (avoids expensive ROS graph queries on /data requests)
     if (data_access_mgr_) {
@@ -352,14 +498,30 @@ void GatewayNode::refresh_cache() {
       auto all_topics = native_sampler->discover_all_topics();
       std::unordered_map<std::string, std::string> topic_types;
       topic_types.reserve(all_topics.size());
+      std::unordered_set<std::string> unique_types;
       for (const auto & topic : all_topics) {
         if (!topic.type.empty()) {
           topic_types[topic.name] = topic.type;
+          unique_types.insert(topic.type);
         }
       }
       thread_safe_cache_.update_topic_types(std::move(topic_types));
+      record_refresh_stage("topic_types", stage_start);
+
+      // Prebuild schema/default_value for newly seen topic types so /data listings are served from cache
+      if (data_access_mgr_->is_type_cache_prewarm_enabled()) {
+        size_t built = data_access_mgr_->get_type_introspection()->prewarm(
+            std::vector<std::string>(unique_types.begin(), unique_types.end()));
+        if (built > 0) {
+          RCLCPP_DEBUG(get_logger(), "Prewarmed type cache with %zu new message types", built);
+        }
+        record_refresh_stage("type_prewarm", stage_start);
+      }
     }
 
+    auto total_start = refresh_start;
+    record_refresh_stage("total", total_start);
+
     RCLCPP_DEBUG(
         get_logger(),
         "Cache refreshed: %zu areas, %zu components (%zu node-based, %zu topic-based), %zu apps, %zu functions",
@@ -0,0 +1,134 @@
+// Copyright 2026 bburda
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+#include "ros2_medkit_gateway/http/content_negotiation.hpp"
+
+#include <algorithm>
+#include <cctype>
+#include <cstdlib>
+#include <optional>
+#include <vector>
+
+namespace ros2_medkit_gateway {
+
+namespace {
+
+std::string trim_lower(const std::string & s) {
+  size_t start = s.find_first_not_of(" \t");
+  if (start == std::string::npos) {
+    return "";
+  }
+  size_t end = s.find_last_not_of(" \t");
+  std::string out = s.substr(start, end - start + 1);
+  std::transform(out.begin(), out.end(), out.begin(), [](unsigned char c) {
+    return static_cast<char>(std::tolower(c));
+  });
+  return out;
+}
+
+std::optional<ResponseFormat> format_for_media_type(const std::string & media_type) {
+  // Wildcards are satisfied by the JSON default
+  if (media_type == MEDIA_TYPE_JSON || media_type == "*/*" || media_type == "application/*") {
+    return ResponseFormat::JSON;
+  }
+  if (media_type == MEDIA_TYPE_CBOR) {
+    return ResponseFormat::CBOR;
+  }
+  if (media_type == MEDIA_TYPE_MSGPACK || media_type == "application/x-msgpack" ||
+      media_type == "application/vnd.msgpack") {
+    return ResponseFormat::MSGPACK;
+  }
+  return std::nullopt;
+}
+
+/// Parse the q parameter of a media range (defaults to 1.0)
+double parse_quality(const std::string & params) {
+  size_t pos = 0;
+  while (pos < params.size()) {
+    size_t next = params.find(';', pos);
+    std::string param = trim_lower(params.substr(pos, next == std::string::npos ? std::string::npos : next - pos));
+    if (param.rfind("q=", 0) == 0) {
+      char * end = nullptr;
+      double q = std::strtod(param.c_str() + 2, &end);
+      if (end == param.c_str() + 2) {
+        return 1.0;
+      }
+      return std::clamp(q, 0.0, 1.0);
+    }
+    if (next == std::string::npos) {
+      break;
+    }
+    pos = next + 1;
+  }
+  return 1.0;
+}
+
+}  // namespace
+
+ResponseFormat negotiate_response_format(const std::string & accept_header) {
+  ResponseFormat best = ResponseFormat::JSON;
+  double best_q = 0.0;
+
+  size_t pos = 0;
+  while (pos <= accept_header.size()) {
+    size_t next = accept_header.find(',', pos);
+    std::string range = accept_header.substr(pos, next == std::string::npos ? std::string::npos : next - pos);
+    pos = next == std::string::npos ? accept_header.size() + 1 : next + 1;
+
+    size_t semicolon = range.find(';');
+    std::string media_type = trim_lower(range.substr(0, semicolon));
+    auto format = format_for_media_type(media_type);
+    if (!format) {
+      continue;  // Unsupported types keep the JSON default
+    }
+    double q = semicolon == std::string::npos ? 1.0 : parse_quality(range.substr(semicolon + 1));
+    if (q > best_q) {
+      best = *format;
+      best_q = q;
+    }
+  }
+  return best;
+}
+
+const char * content_type_for(ResponseFormat format) {
+  switch (format) {
+    case ResponseFormat::CBOR:
+      return MEDIA_TYPE_CBOR;
+    case ResponseFormat::MSGPACK:
+      return MEDIA_TYPE_MSGPACK;
+    case ResponseFormat::JSON:
+    default:
+      return MEDIA_TYPE_JSON;
+  }
+}
+
+std::string encode_response_body(const nlohmann::json & data, ResponseFormat format) {
+  switch (format) {
+    case ResponseFormat::CBOR: {
+      std::string body;
+      nlohmann::json::to_cbor(data, nlohmann::detail::output_adapter<char>(body));
+      return body;
+    }
+    case ResponseFormat::MSGPACK: {
+      std::string body;
+      nlohmann::json::to_msgpack(data, nlohmann::detail::output_adapter<char>(body));
+      return body;
+    }
+    case ResponseFormat::JSON:
+    default:
+      return data.dump(2);
+  }
+}
+
+}  // namespace ros2_medkit_gateway
@@ -47,7 +47,7 @@ void BulkDataHandlers::handle_list_categories(const httplib::Request & req, http
   // Currently only "rosbags" category is supported
   nlohmann::json response = {{"items", nlohmann::json::array({"rosbags"})}};
 
-  HandlerContext::send_json(res, response);
+  HandlerContext::send_json(req, res, response);
 }
 
 void BulkDataHandlers::handle_list_descriptors(const httplib::Request & req, httplib::Response & res) {
@@ -132,7 +132,7 @@ void BulkDataHandlers::handle_list_descriptors(const httplib::Request & req, htt
   }
 
   nlohmann::json response = {{"items", items}};
-  HandlerContext::send_json(res, response);
+  HandlerContext::send_json(req, res, response);
 }
 
 void BulkDataHandlers::handle_download(const httplib::Request & req, httplib::Response & res) {
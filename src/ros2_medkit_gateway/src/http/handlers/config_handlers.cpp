@@ -15,11 +15,14 @@
 #include "ros2_medkit_gateway/http/handlers/config_handlers.hpp"
 
 #include <future>
+#include <map>
+#include <utility>
 #include <vector>
 
 #include "ros2_medkit_gateway/gateway_node.hpp"
 #include "ros2_medkit_gateway/http/error_codes.hpp"
 #include "ros2_medkit_gateway/http/http_utils.hpp"
+#include "ros2_medkit_gateway/http/route_dispatcher.hpp"
 #include "ros2_medkit_gateway/http/x_medkit.hpp"
 
 using json = nlohmann::json;
@@ -214,12 +217,12 @@ static void send_parameter_error(httplib::Response & res, const ParameterResult
 void ConfigHandlers::handle_list_configurations(const httplib::Request & req, httplib::Response & res) {
   std::string entity_id;
   try {
-    if (req.matches.size() < 2) {
+    if (path_capture_count(req) < 2) {
       HandlerContext::send_error(res, StatusCode::BadRequest_400, ERR_INVALID_REQUEST, "Invalid request");
       return;
     }
 
-    entity_id = req.matches[1];
+    entity_id = path_capture(req, 1);
 
     // Validate entity ID and type for this route
     auto entity_opt = ctx_.validate_entity_for_route(req, res, entity_id);
@@ -247,6 +250,8 @@ void ConfigHandlers::handle_list_configurations(const httplib::Request & req, ht
     }
 
     auto config_mgr = ctx_.node()->get_configuration_manager();
+    // ?fresh=true reads from the nodes instead of the parameter cache
+    bool fresh = req.get_param_value("fresh") == "true";
     json items = json::array();
     json all_parameters = json::array();
     std::vector<std::string> queried_nodes;
@@ -266,10 +271,10 @@ void ConfigHandlers::handle_list_configurations(const httplib::Request & req, ht
 
     // Launch parallel queries
     for (const auto & node_info : agg_configs.nodes) {
-      futures.push_back(std::async(std::launch::async, [config_mgr, node_info]() {
+      futures.push_back(std::async(std::launch::async, [config_mgr, node_info, fresh]() {
         NodeQueryResult query_result;
         query_result.node_info = node_info;
-        query_result.result = config_mgr->list_parameters(node_info.node_fqn);
+        query_result.result = config_mgr->list_parameters(node_info.node_fqn, fresh);
         return query_result;
       }));
     }
@@ -355,13 +360,13 @@ void ConfigHandlers::handle_get_configuration(const httplib::Request & req, http
   std::string entity_id;
   std::string param_id;
   try {
-    if (req.matches.size() < 3) {
+    if (path_capture_count(req) < 3) {
       HandlerContext::send_error(res, StatusCode::BadRequest_400, ERR_INVALID_REQUEST, "Invalid request");
       return;
     }
 
-    entity_id = req.matches[1];
-    param_id = req.matches[2];
+    entity_id = path_capture(req, 1);
+    param_id = path_capture(req, 2);
 
     // Validate entity ID and type for this route
     auto entity_opt = ctx_.validate_entity_for_route(req, res, entity_id);
@@ -387,6 +392,7 @@ void ConfigHandlers::handle_get_configuration(const httplib::Request & req, http
     }
 
     auto config_mgr = ctx_.node()->get_configuration_manager();
+    bool fresh = req.get_param_value("fresh") == "true";
 
     // Parse param_id for app_id prefix
     auto parsed = parse_aggregated_param_id(param_id, agg_configs.is_aggregated);
@@ -401,7 +407,7 @@ void ConfigHandlers::handle_get_configuration(const httplib::Request & req, http
         return;
       }
 
-      auto result = config_mgr->get_parameter(node_info->node_fqn, parsed.param_name);
+      auto result = config_mgr->get_parameter(node_info->node_fqn, parsed.param_name, fresh);
 
       if (result.success) {
         json response;
@@ -431,7 +437,7 @@ void ConfigHandlers::handle_get_configuration(const httplib::Request & req, http
     bool all_not_found = true;    // Track if all failures are "not found" vs other errors
 
     for (const auto & node_info : agg_configs.nodes) {
-      auto result = config_mgr->get_parameter(node_info.node_fqn, parsed.param_name);
+      auto result = config_mgr->get_parameter(node_info.node_fqn, parsed.param_name, fresh);
 
       if (result.success) {
         json response;
@@ -483,13 +489,13 @@ void ConfigHandlers::handle_set_configuration(const httplib::Request & req, http
   std::string entity_id;
   std::string param_id;
   try {
-    if (req.matches.size() < 3) {
+    if (path_capture_count(req) < 3) {
       HandlerContext::send_error(res, StatusCode::BadRequest_400, ERR_INVALID_REQUEST, "Invalid request");
       return;
     }
 
-    entity_id = req.matches[1];
-    param_id = req.matches[2];
+    entity_id = path_capture(req, 1);
+    param_id = path_capture(req, 2);
 
     // Validate entity_id format first
     auto entity_validation = ctx_.validate_entity_id(entity_id);
@@ -610,18 +616,178 @@ void ConfigHandlers::handle_set_configuration(const httplib::Request & req, http
   }
 }
 
+void ConfigHandlers::handle_set_all_configurations(const httplib::Request & req, httplib::Response & res) {
+  std::string entity_id;
+  try {
+    if (path_capture_count(req) < 2) {
+      HandlerContext::send_error(res, StatusCode::BadRequest_400, ERR_INVALID_REQUEST, "Invalid request");
+      return;
+    }
+
+    entity_id = path_capture(req, 1);
+
+    auto entity_validation = ctx_.validate_entity_id(entity_id);
+    if (!entity_validation) {
+      HandlerContext::send_error(res, StatusCode::BadRequest_400, ERR_INVALID_PARAMETER, "Invalid entity ID",
+                                 {{"details", entity_validation.error()}, {"entity_id", entity_id}});
+      return;
+    }
+
+    // Parse request body before checking entity existence
+    json body;
+    try {
+      body = json::parse(req.body);
+    } catch (const json::parse_error & e) {
+      HandlerContext::send_error(res, StatusCode::BadRequest_400, ERR_INVALID_REQUEST, "Invalid JSON in request body",
+                                 {{"details", e.what()}});
+      return;
+    }
+
+    if (!body.is_object() || !body.contains("data") || !body["data"].is_object() || body["data"].empty()) {
+      HandlerContext::send_error(
+          res, StatusCode::BadRequest_400, ERR_INVALID_REQUEST, "Missing 'data' field",
+          {{"details", "Request body must contain a non-empty 'data' object of id: value pairs"}});
+      return;
+    }
+    if (body.contains("atomic") && !body["atomic"].is_boolean()) {
+      HandlerContext::send_error(res, StatusCode::BadRequest_400, ERR_INVALID_REQUEST, "Invalid 'atomic' field",
+                                 {{"details", "'atomic' must be a boolean"}});
+      return;
+    }
+    bool atomic = body.value("atomic", false);
+
+    auto entity_opt = ctx_.validate_entity_for_route(req, res, entity_id);
+    if (!entity_opt) {
+      return;  // Error response already sent
+    }
+
+    const auto & cache = ctx_.node()->get_thread_safe_cache();
+    auto agg_configs = cache.get_entity_configurations(entity_id);
+
+    if (agg_configs.nodes.empty()) {
+      HandlerContext::send_error(res, StatusCode::NotFound_404, ERR_RESOURCE_NOT_FOUND, "No nodes available",
+                                 json{{"entity_id", entity_id}});
+      return;
+    }
+
+    auto config_mgr = ctx_.node()->get_configuration_manager();
+
+    // Resolve every id to its node; ids that cannot be resolved are answered directly
+    struct NodeWrite {
+      NodeConfigInfo node_info;
+      std::vector<std::string> ids;
+      std::vector<std::pair<std::string, json>> values;
+    };
+    std::map<std::string, NodeWrite> writes;  // keyed by node FQN
+    json results = json::array();
+    bool all_success = true;
+
+    for (const auto & [param_id, value] : body["data"].items()) {
+      if (param_id.empty() || param_id.length() > MAX_AGGREGATED_PARAM_ID_LENGTH) {
+        all_success = false;
+        results.push_back({{"id", param_id},
+                           {"success", false},
+                           {"error_code", ERR_INVALID_PARAMETER},
+                           {"error", "Parameter ID is empty or too long"}});
+        continue;
+      }
+
+      auto parsed = parse_aggregated_param_id(param_id, agg_configs.is_aggregated);
+      const NodeConfigInfo * node_info = nullptr;
+      if (parsed.has_prefix) {
+        node_info = find_node_for_app(agg_configs.nodes, parsed.app_id);
+        if (!node_info) {
+          all_success = false;
+          results.push_back({{"id", param_id},
+                             {"success", false},
+                             {"error_code", ERR_RESOURCE_NOT_FOUND},
+                             {"error", "Source app not found in entity"}});
+          continue;
+        }
+      } else if (!agg_configs.is_aggregated) {
+        node_info = &agg_configs.nodes[0];
+      } else {
+        all_success = false;
+        results.push_back({{"id", param_id},
+                           {"success", false},
+                           {"error_code", ERR_INVALID_REQUEST},
+                           {"error", "Aggregated configuration requires app_id prefix"}});
+        continue;
+      }
+
+      auto & write = writes[node_info->node_fqn];
+      write.node_info = *node_info;
+      write.ids.push_back(param_id);
+      write.values.emplace_back(parsed.param_name, value);
+    }
+
+    // One set_parameters call per node, nodes written in parallel
+    struct NodeWriteResult {
+      const NodeWrite * write;
+      std::vector<ParameterResult> results;
+    };
+
+    std::vector<std::future<NodeWriteResult>> futures;
+    futures.reserve(writes.size());
+    for (const auto & node_write : writes) {
+      const NodeWrite * write = &node_write.second;
+      futures.push_back(std::async(std::launch::async, [config_mgr, write, atomic]() {
+        return NodeWriteResult{write, config_mgr->set_parameters(write->node_info.node_fqn, write->values, atomic)};
+      }));
+    }
+
+    for (auto & future : futures) {
+      auto node_result = future.get();
+      const auto & write = *node_result.write;
+      for (size_t i = 0; i < write.ids.size(); ++i) {
+        const auto & result = node_result.results[i];
+        json entry;
+        entry["id"] = write.ids[i];
+        entry["node"] = write.node_info.node_fqn;
+        if (agg_configs.is_aggregated) {
+          entry["app_id"] = write.node_info.app_id;
+        }
+        entry["success"] = result.success;
+        if (result.success) {
+          entry["data"] = result.data.contains("value") ? result.data["value"] : result.data;
+        } else {
+          all_success = false;
+          entry["error_code"] = classify_parameter_error(result).error_code;
+          entry["error"] = result.error_message;
+        }
+        results.push_back(std::move(entry));
+      }
+    }
+
+    json response;
+    response["entity_id"] = entity_id;
+    response["results"] = std::move(results);
+    HandlerContext::send_json(res, response);
+    if (!all_success) {
+      // Partial success - return 207 Multi-Status, as DELETE of all configurations does
+      res.status = StatusCode::MultiStatus_207;
+    }
+
+  } catch (const std::exception & e) {
+    HandlerContext::send_error(res, StatusCode::InternalServerError_500, ERR_INTERNAL_ERROR,
+                               "Failed to set configurations", {{"details", e.what()}, {"entity_id", entity_id}});
+    RCLCPP_ERROR(HandlerContext::logger(), "Error in handle_set_all_configurations for entity '%s': %s",
+                 entity_id.c_str(), e.what());
+  }
+}
+
 void ConfigHandlers::handle_delete_configuration(const httplib::Request & req, httplib::Response & res) {
   std::string entity_id;
   std::string param_id;
 
   try {
-    if (req.matches.size() < 3) {
+    if (path_capture_count(req) < 3) {
       HandlerContext::send_error(res, StatusCode::BadRequest_400, ERR_INVALID_REQUEST, "Invalid request");
       return;
     }
 
-    entity_id = req.matches[1];
-    param_id = req.matches[2];
+    entity_id = path_capture(req, 1);
+    param_id = path_capture(req, 2);
 
     // Validate entity ID and type for this route
     auto entity_opt = ctx_.validate_entity_for_route(req, res, entity_id);
@@ -696,12 +862,12 @@ void ConfigHandlers::handle_delete_all_configurations(const httplib::Request & r
   std::string entity_id;
 
   try {
-    if (req.matches.size() < 2) {
+    if (path_capture_count(req) < 2) {
       HandlerContext::send_error(res, StatusCode::BadRequest_400, ERR_INVALID_REQUEST, "Invalid request");
       return;
     }
 
-    entity_id = req.matches[1];
+    entity_id = path_capture(req, 1);
 
     // Validate entity ID and type for this route
     auto entity_opt = ctx_.validate_entity_for_route(req, res, entity_id);
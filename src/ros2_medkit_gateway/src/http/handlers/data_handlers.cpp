@@ -15,11 +15,13 @@
 #include "ros2_medkit_gateway/http/handlers/data_handlers.hpp"
 
 #include <algorithm>
+#include <charconv>
 
 #include "ros2_medkit_gateway/exceptions.hpp"
 #include "ros2_medkit_gateway/gateway_node.hpp"
 #include "ros2_medkit_gateway/http/error_codes.hpp"
 #include "ros2_medkit_gateway/http/http_utils.hpp"
+#include "ros2_medkit_gateway/http/route_dispatcher.hpp"
 #include "ros2_medkit_gateway/http/x_medkit.hpp"
 
 using json = nlohmann::json;
@@ -28,15 +30,40 @@ using httplib::StatusCode;
 namespace ros2_medkit_gateway {
 namespace handlers {
 
+namespace {
+
+/**
+ * @brief Parse an optional non-negative integer query parameter
+ * @param req HTTP request
+ * @param name Query parameter name
+ * @param value Output, left unchanged when the parameter is absent
+ * @return false if the parameter is present but not a valid non-negative integer
+ */
+bool parse_size_param(const httplib::Request & req, const std::string & name, size_t & value) {
+  if (!req.has_param(name)) {
+    return true;
+  }
+  const std::string raw = req.get_param_value(name);
+  size_t parsed = 0;
+  auto [ptr, ec] = std::from_chars(raw.data(), raw.data() + raw.size(), parsed);
+  if (ec != std::errc() || ptr != raw.data() + raw.size() || raw.empty()) {
+    return false;
+  }
+  value = parsed;
+  return true;
+}
+
+}  // namespace
+
 void DataHandlers::handle_list_data(const httplib::Request & req, httplib::Response & res) {
   std::string entity_id;
   try {
-    if (req.matches.size() < 2) {
+    if (path_capture_count(req) < 2) {
       HandlerContext::send_error(res, StatusCode::BadRequest_400, ERR_INVALID_REQUEST, "Invalid request");
       return;
     }
 
-    entity_id = req.matches[1];
+    entity_id = path_capture(req, 1);
 
     // Validate entity ID and type for this route
     auto entity_opt = ctx_.validate_entity_for_route(req, res, entity_id);
@@ -72,10 +99,10 @@ void DataHandlers::handle_list_data(const httplib::Request & req, httplib::Respo
       if (!topic_type.empty()) {
         ext.ros2_type(topic_type);
         try {
-          auto type_info = type_introspection->get_type_info(topic_type);
+          auto type_info = type_introspection->get_type_info_ptr(topic_type);
           json type_info_obj;
-          type_info_obj["schema"] = type_info.schema;
-          type_info_obj["default_value"] = type_info.default_value;
+          type_info_obj["schema"] = type_info->schema;
+          type_info_obj["default_value"] = type_info->default_value;
           ext.type_info(type_info_obj);
         } catch (const std::exception & e) {
           RCLCPP_DEBUG(HandlerContext::logger(), "Could not get type info for topic '%s': %s", topic.name.c_str(),
@@ -99,7 +126,7 @@ void DataHandlers::handle_list_data(const httplib::Request & req, httplib::Respo
     }
     response["x-medkit"] = resp_ext.build();
 
-    HandlerContext::send_json(res, response);
+    HandlerContext::send_json(req, res, response);
   } catch (const std::exception & e) {
     HandlerContext::send_error(res, StatusCode::InternalServerError_500, ERR_INTERNAL_ERROR,
                                "Failed to retrieve entity data", {{"details", e.what()}, {"entity_id", entity_id}});
@@ -112,14 +139,14 @@ void DataHandlers::handle_get_data_item(const httplib::Request & req, httplib::R
   std::string entity_id;
   std::string topic_name;
   try {
-    if (req.matches.size() < 3) {
+    if (path_capture_count(req) < 3) {
       HandlerContext::send_error(res, StatusCode::BadRequest_400, ERR_INVALID_REQUEST, "Invalid request");
       return;
     }
 
-    entity_id = req.matches[1];
+    entity_id = path_capture(req, 1);
     // cpp-httplib automatically decodes percent-encoded characters in URL path
-    topic_name = req.matches[2];
+    topic_name = path_capture(req, 2);
 
     // Validate entity ID and type for this route
     auto entity_opt = ctx_.validate_entity_for_route(req, res, entity_id);
@@ -135,10 +162,44 @@ void DataHandlers::handle_get_data_item(const httplib::Request & req, httplib::R
       full_topic_path = "/" + topic_name;
     }
 
+    // Optional projection: ?fields=a.b,c&max_array_length=N&array_stride=K
+    ros2_medkit_serialization::ProjectionOptions projection;
+    if (!parse_size_param(req, "max_array_length", projection.arrays.max_length)) {
+      HandlerContext::send_error(
+          res, StatusCode::BadRequest_400, ERR_INVALID_PARAMETER, "Invalid max_array_length parameter value",
+          {{"parameter", "max_array_length"}, {"value", req.get_param_value("max_array_length")}});
+      return;
+    }
+    if (!parse_size_param(req, "array_stride", projection.arrays.stride) || projection.arrays.stride == 0) {
+      HandlerContext::send_error(res, StatusCode::BadRequest_400, ERR_INVALID_PARAMETER,
+                                 "Invalid array_stride parameter value",
+                                 {{"parameter", "array_stride"}, {"value", req.get_param_value("array_stride")}});
+      return;
+    }
+    try {
+      projection.fields = ros2_medkit_serialization::FieldMask::parse(req.get_param_value("fields"));
+    } catch (const ros2_medkit_serialization::FieldProjectionError & e) {
+      HandlerContext::send_error(
+          res, StatusCode::BadRequest_400, ERR_INVALID_PARAMETER, "Invalid fields parameter value",
+          {{"details", e.what()}, {"parameter", "fields"}, {"value", req.get_param_value("fields")}});
+      return;
+    }
+
     // Get topic data from DataAccessManager
+    // (concurrent GETs with the same projection share one sample)
     auto data_access_mgr = ctx_.node()->get_data_access_manager();
-    auto native_sampler = data_access_mgr->get_native_sampler();
-    auto sample = native_sampler->sample_topic(full_topic_path, data_access_mgr->get_topic_sample_timeout());
+    TopicSampleResult sample;
+    try {
+      sample = data_access_mgr->sample_topic(full_topic_path, projection);
+    } catch (const ros2_medkit_serialization::FieldProjectionError & e) {
+      HandlerContext::send_error(res, StatusCode::BadRequest_400, ERR_INVALID_PARAMETER,
+                                 "Invalid fields parameter value",
+                                 {{"details", e.what()},
+                                  {"field", e.field_path()},
+                                  {"parameter", "fields"},
+                                  {"value", req.get_param_value("fields")}});
+      return;
+    }
 
     // Build SOVD ReadValue response (id must match what list returns for round-trip)
     json response;
@@ -160,10 +221,10 @@ void DataHandlers::handle_get_data_item(const httplib::Request & req, httplib::R
       // Add type_info schema for the message type
       auto type_introspection = data_access_mgr->get_type_introspection();
       try {
-        auto type_info = type_introspection->get_type_info(sample.message_type);
+        auto type_info = type_introspection->get_type_info_ptr(sample.message_type);
         json type_info_obj;
-        type_info_obj["schema"] = type_info.schema;
-        type_info_obj["default_value"] = type_info.default_value;
+        type_info_obj["schema"] = type_info->schema;
+        type_info_obj["default_value"] = type_info->default_value;
         ext.type_info(type_info_obj);
       } catch (const std::exception & e) {
         RCLCPP_DEBUG(HandlerContext::logger(), "Could not get type info for topic '%s': %s", full_topic_path.c_str(),
@@ -174,9 +235,22 @@ void DataHandlers::handle_get_data_item(const httplib::Request & req, httplib::R
     ext.add("publisher_count", sample.publisher_count);
     ext.add("subscriber_count", sample.subscriber_count);
     ext.add("status", sample.has_data ? "data" : "metadata_only");
+    if (!projection.is_identity()) {
+      json projection_obj;
+      if (!projection.fields.selects_all()) {
+        projection_obj["fields"] = req.get_param_value("fields");
+      }
+      if (projection.arrays.max_length > 0) {
+        projection_obj["max_array_length"] = projection.arrays.max_length;
+      }
+      if (projection.arrays.stride > 1) {
+        projection_obj["array_stride"] = projection.arrays.stride;
+      }
+      ext.add("projection", projection_obj);
+    }
     response["x-medkit"] = ext.build();
 
-    HandlerContext::send_json(res, response);
+    HandlerContext::send_json(req, res, response);
   } catch (const TopicNotAvailableException & e) {
     HandlerContext::send_error(res, StatusCode::NotFound_404, ERR_X_MEDKIT_ROS2_TOPIC_UNAVAILABLE, "Topic not found",
                                {{"entity_id", entity_id}, {"topic_name", topic_name}});
@@ -195,13 +269,13 @@ void DataHandlers::handle_put_data_item(const httplib::Request & req, httplib::R
   std::string entity_id;
   std::string topic_name;
   try {
-    if (req.matches.size() < 3) {
+    if (path_capture_count(req) < 3) {
       HandlerContext::send_error(res, StatusCode::BadRequest_400, ERR_INVALID_REQUEST, "Invalid request");
       return;
     }
 
-    entity_id = req.matches[1];
-    topic_name = req.matches[2];
+    entity_id = path_capture(req, 1);
+    topic_name = path_capture(req, 2);
 
     // Validate entity ID and type for this route
     auto entity_opt = ctx_.validate_entity_for_route(req, res, entity_id);
@@ -274,7 +348,7 @@ void DataHandlers::handle_put_data_item(const httplib::Request & req, httplib::R
     }
     response["x-medkit"] = ext.build();
 
-    HandlerContext::send_json(res, response);
+    HandlerContext::send_json(req, res, response);
   } catch (const std::exception & e) {
     HandlerContext::send_error(res, StatusCode::InternalServerError_500, ERR_INTERNAL_ERROR,
                                "Failed to publish to topic",
@@ -21,6 +21,7 @@
 #include "ros2_medkit_gateway/http/error_codes.hpp"
 #include "ros2_medkit_gateway/http/handlers/capability_builder.hpp"
 #include "ros2_medkit_gateway/http/http_utils.hpp"
+#include "ros2_medkit_gateway/http/route_dispatcher.hpp"
 #include "ros2_medkit_gateway/http/x_medkit.hpp"
 
 using json = nlohmann::json;
@@ -44,7 +45,7 @@ void DiscoveryHandlers::handle_list_areas(const httplib::Request & req, httplib:
     for (const auto & area : areas) {
       json area_item;
       area_item["id"] = area.id;
-      area_item["name"] = area.name.empty() ? area.id : area.name;
+      area_item["name"] = area.name.empty() ? area.id.str() : area.name;
       area_item["href"] = "/api/v1/areas/" + area.id;
 
       if (!area.description.empty()) {
@@ -71,7 +72,7 @@ void DiscoveryHandlers::handle_list_areas(const httplib::Request & req, httplib:
     resp_ext.add("total_count", items.size());
     response["x-medkit"] = resp_ext.build();
 
-    HandlerContext::send_json(res, response);
+    HandlerContext::send_json(req, res, response);
   } catch (const std::exception & e) {
     HandlerContext::send_error(res, StatusCode::InternalServerError_500, ERR_INTERNAL_ERROR, "Internal server error");
     RCLCPP_ERROR(HandlerContext::logger(), "Error in handle_list_areas: %s", e.what());
@@ -80,12 +81,12 @@ void DiscoveryHandlers::handle_list_areas(const httplib::Request & req, httplib:
 
 void DiscoveryHandlers::handle_get_area(const httplib::Request & req, httplib::Response & res) {
   try {
-    if (req.matches.size() < 2) {
+    if (path_capture_count(req) < 2) {
       HandlerContext::send_error(res, StatusCode::BadRequest_400, ERR_INVALID_REQUEST, "Invalid request");
       return;
     }
 
-    std::string area_id = req.matches[1];
+    std::string area_id = path_capture(req, 1);
 
     auto validation_result = ctx_.validate_entity_id(area_id);
     if (!validation_result) {
@@ -107,7 +108,7 @@ void DiscoveryHandlers::handle_get_area(const httplib::Request & req, httplib::R
 
     json response;
     response["id"] = area.id;
-    response["name"] = area.name.empty() ? area.id : area.name;
+    response["name"] = area.name.empty() ? area.id.str() : area.name;
 
     if (!area.description.empty()) {
       response["description"] = area.description;
@@ -144,7 +145,7 @@ void DiscoveryHandlers::handle_get_area(const httplib::Request & req, httplib::R
     }
     response["x-medkit"] = ext.build();
 
-    HandlerContext::send_json(res, response);
+    HandlerContext::send_json(req, res, response);
   } catch (const std::exception & e) {
     HandlerContext::send_error(res, StatusCode::InternalServerError_500, ERR_INTERNAL_ERROR, "Internal server error",
                                {{"details", e.what()}});
@@ -154,12 +155,12 @@ void DiscoveryHandlers::handle_get_area(const httplib::Request & req, httplib::R
 
 void DiscoveryHandlers::handle_area_components(const httplib::Request & req, httplib::Response & res) {
   try {
-    if (req.matches.size() < 2) {
+    if (path_capture_count(req) < 2) {
       HandlerContext::send_error(res, StatusCode::BadRequest_400, ERR_INVALID_REQUEST, "Invalid request");
       return;
     }
 
-    std::string area_id = req.matches[1];
+    std::string area_id = path_capture(req, 1);
 
     auto validation_result = ctx_.validate_entity_id(area_id);
     if (!validation_result) {
@@ -182,7 +183,7 @@ void DiscoveryHandlers::handle_area_components(const httplib::Request & req, htt
       if (component.area == area_id) {
         json comp_item;
         comp_item["id"] = component.id;
-        comp_item["name"] = component.name.empty() ? component.id : component.name;
+        comp_item["name"] = component.name.empty() ? component.id.str() : component.name;
         comp_item["href"] = "/api/v1/components/" + component.id;
 
         if (!component.description.empty()) {
@@ -207,7 +208,7 @@ void DiscoveryHandlers::handle_area_components(const httplib::Request & req, htt
     resp_ext.add("total_count", items.size());
     response["x-medkit"] = resp_ext.build();
 
-    HandlerContext::send_json(res, response);
+    HandlerContext::send_json(req, res, response);
   } catch (const std::exception & e) {
     HandlerContext::send_error(res, StatusCode::InternalServerError_500, ERR_INTERNAL_ERROR, "Internal server error");
     RCLCPP_ERROR(HandlerContext::logger(), "Error in handle_area_components: %s", e.what());
@@ -216,12 +217,12 @@ void DiscoveryHandlers::handle_area_components(const httplib::Request & req, htt
 
 void DiscoveryHandlers::handle_get_subareas(const httplib::Request & req, httplib::Response & res) {
   try {
-    if (req.matches.size() < 2) {
+    if (path_capture_count(req) < 2) {
       HandlerContext::send_error(res, StatusCode::BadRequest_400, ERR_INVALID_REQUEST, "Invalid request");
       return;
     }
 
-    std::string area_id = req.matches[1];
+    std::string area_id = path_capture(req, 1);
 
     auto validation_result = ctx_.validate_entity_id(area_id);
     if (!validation_result) {
@@ -245,7 +246,7 @@ void DiscoveryHandlers::handle_get_subareas(const httplib::Request & req, httpli
     for (const auto & subarea : subareas) {
       json item;
       item["id"] = subarea.id;
-      item["name"] = subarea.name.empty() ? subarea.id : subarea.name;
+      item["name"] = subarea.name.empty() ? subarea.id.str() : subarea.name;
       item["href"] = "/api/v1/areas/" + subarea.id;
 
       XMedkit ext;
@@ -267,7 +268,7 @@ void DiscoveryHandlers::handle_get_subareas(const httplib::Request & req, httpli
     links["parent"] = "/api/v1/areas/" + area_id;
     response["_links"] = links;
 
-    HandlerContext::send_json(res, response);
+    HandlerContext::send_json(req, res, response);
   } catch (const std::exception & e) {
     HandlerContext::send_error(res, StatusCode::InternalServerError_500, ERR_INTERNAL_ERROR, "Internal server error",
                                {{"details", e.what()}});
@@ -278,12 +279,12 @@ void DiscoveryHandlers::handle_get_subareas(const httplib::Request & req, httpli
 void DiscoveryHandlers::handle_get_contains(const httplib::Request & req, httplib::Response & res) {
   // @verifies REQ_INTEROP_006
   try {
-    if (req.matches.size() < 2) {
+    if (path_capture_count(req) < 2) {
       HandlerContext::send_error(res, StatusCode::BadRequest_400, ERR_INVALID_REQUEST, "Invalid request");
       return;
     }
 
-    std::string area_id = req.matches[1];
+    std::string area_id = path_capture(req, 1);
 
     auto validation_result = ctx_.validate_entity_id(area_id);
     if (!validation_result) {
@@ -307,7 +308,7 @@ void DiscoveryHandlers::handle_get_contains(const httplib::Request & req, httpli
     for (const auto & comp : components) {
       json item;
       item["id"] = comp.id;
-      item["name"] = comp.name.empty() ? comp.id : comp.name;
+      item["name"] = comp.name.empty() ? comp.id.str() : comp.name;
       item["href"] = "/api/v1/components/" + comp.id;
 
       XMedkit ext;
@@ -332,7 +333,7 @@ void DiscoveryHandlers::handle_get_contains(const httplib::Request & req, httpli
     links["area"] = "/api/v1/areas/" + area_id;
     response["_links"] = links;
 
-    HandlerContext::send_json(res, response);
+    HandlerContext::send_json(req, res, response);
   } catch (const std::exception & e) {
     HandlerContext::send_error(res, StatusCode::InternalServerError_500, ERR_INTERNAL_ERROR, "Internal server error",
                                {{"details", e.what()}});
@@ -355,7 +356,7 @@ void DiscoveryHandlers::handle_list_components(const httplib::Request & req, htt
     for (const auto & component : components) {
       json item;
       item["id"] = component.id;
-      item["name"] = component.name.empty() ? component.id : component.name;
+      item["name"] = component.name.empty() ? component.id.str() : component.name;
       item["href"] = "/api/v1/components/" + component.id;
 
       if (!component.description.empty()) {
@@ -385,7 +386,7 @@ void DiscoveryHandlers::handle_list_components(const httplib::Request & req, htt
     resp_ext.add("total_count", items.size());
     response["x-medkit"] = resp_ext.build();
 
-    HandlerContext::send_json(res, response);
+    HandlerContext::send_json(req, res, response);
   } catch (const std::exception & e) {
     HandlerContext::send_error(res, StatusCode::InternalServerError_500, ERR_INTERNAL_ERROR, "Internal server error");
     RCLCPP_ERROR(HandlerContext::logger(), "Error in handle_list_components: %s", e.what());
@@ -394,12 +395,12 @@ void DiscoveryHandlers::handle_list_components(const httplib::Request & req, htt
 
 void DiscoveryHandlers::handle_get_component(const httplib::Request & req, httplib::Response & res) {
   try {
-    if (req.matches.size() < 2) {
+    if (path_capture_count(req) < 2) {
       HandlerContext::send_error(res, StatusCode::BadRequest_400, ERR_INVALID_REQUEST, "Invalid request");
       return;
     }
 
-    std::string component_id = req.matches[1];
+    std::string component_id = path_capture(req, 1);
 
     auto validation_result = ctx_.validate_entity_id(component_id);
     if (!validation_result) {
@@ -421,7 +422,7 @@ void DiscoveryHandlers::handle_get_component(const httplib::Request & req, httpl
 
     json response;
     response["id"] = comp.id;
-    response["name"] = comp.name.empty() ? comp.id : comp.name;
+    response["name"] = comp.name.empty() ? comp.id.str() : comp.name;
 
     if (!comp.description.empty()) {
       response["description"] = comp.description;
@@ -477,7 +478,7 @@ void DiscoveryHandlers::handle_get_component(const httplib::Request & req, httpl
     ext.add("capabilities", CapabilityBuilder::build_capabilities("components", comp.id, caps));
     response["x-medkit"] = ext.build();
 
-    HandlerContext::send_json(res, response);
+    HandlerContext::send_json(req, res, response);
   } catch (const std::exception & e) {
     HandlerContext::send_error(res, StatusCode::InternalServerError_500, ERR_INTERNAL_ERROR, "Internal server error",
                                {{"details", e.what()}});
@@ -487,12 +488,12 @@ void DiscoveryHandlers::handle_get_component(const httplib::Request & req, httpl
 
 void DiscoveryHandlers::handle_get_subcomponents(const httplib::Request & req, httplib::Response & res) {
   try {
-    if (req.matches.size() < 2) {
+    if (path_capture_count(req) < 2) {
       HandlerContext::send_error(res, StatusCode::BadRequest_400, ERR_INVALID_REQUEST, "Invalid request");
       return;
     }
 
-    std::string component_id = req.matches[1];
+    std::string component_id = path_capture(req, 1);
 
     auto validation_result = ctx_.validate_entity_id(component_id);
     if (!validation_result) {
@@ -516,7 +517,7 @@ void DiscoveryHandlers::handle_get_subcomponents(const httplib::Request & req, h
     for (const auto & sub : subcomponents) {
       json item;
       item["id"] = sub.id;
-      item["name"] = sub.name.empty() ? sub.id : sub.name;
+      item["name"] = sub.name.empty() ? sub.id.str() : sub.name;
       item["href"] = "/api/v1/components/" + sub.id;
 
       XMedkit ext;
@@ -541,7 +542,7 @@ void DiscoveryHandlers::handle_get_subcomponents(const httplib::Request & req, h
     links["parent"] = "/api/v1/components/" + component_id;
     response["_links"] = links;
 
-    HandlerContext::send_json(res, response);
+    HandlerContext::send_json(req, res, response);
   } catch (const std::exception & e) {
     HandlerContext::send_error(res, StatusCode::InternalServerError_500, ERR_INTERNAL_ERROR, "Internal server error",
                                {{"details", e.what()}});
@@ -552,12 +553,12 @@ void DiscoveryHandlers::handle_get_subcomponents(const httplib::Request & req, h
 void DiscoveryHandlers::handle_get_hosts(const httplib::Request & req, httplib::Response & res) {
   // @verifies REQ_INTEROP_007
   try {
-    if (req.matches.size() < 2) {
+    if (path_capture_count(req) < 2) {
       HandlerContext::send_error(res, StatusCode::BadRequest_400, ERR_INVALID_REQUEST, "Invalid request");
       return;
     }
 
-    std::string component_id = req.matches[1];
+    std::string component_id = path_capture(req, 1);
 
     auto validation_result = ctx_.validate_entity_id(component_id);
     if (!validation_result) {
@@ -581,7 +582,7 @@ void DiscoveryHandlers::handle_get_hosts(const httplib::Request & req, httplib::
     for (const auto & app : apps) {
       json item;
       item["id"] = app.id;
-      item["name"] = app.name.empty() ? app.id : app.name;
+      item["name"] = app.name.empty() ? app.id.str() : app.name;
       item["href"] = "/api/v1/apps/" + app.id;
 
       XMedkit ext;
@@ -606,7 +607,7 @@ void DiscoveryHandlers::handle_get_hosts(const httplib::Request & req, httplib::
     links["component"] = "/api/v1/components/" + component_id;
     response["_links"] = links;
 
-    HandlerContext::send_json(res, response);
+    HandlerContext::send_json(req, res, response);
   } catch (const std::exception & e) {
     HandlerContext::send_error(res, StatusCode::InternalServerError_500, ERR_INTERNAL_ERROR, "Internal server error",
                                {{"details", e.what()}});
@@ -616,12 +617,12 @@ void DiscoveryHandlers::handle_get_hosts(const httplib::Request & req, httplib::
 
 void DiscoveryHandlers::handle_component_depends_on(const httplib::Request & req, httplib::Response & res) {
   try {
-    if (req.matches.size() < 2) {
+    if (path_capture_count(req) < 2) {
       HandlerContext::send_error(res, StatusCode::BadRequest_400, ERR_INVALID_REQUEST, "Invalid request");
       return;
     }
 
-    std::string component_id = req.matches[1];
+    std::string component_id = path_capture(req, 1);
 
     auto validation_result = ctx_.validate_entity_id(component_id);
     if (!validation_result) {
@@ -678,7 +679,7 @@ void DiscoveryHandlers::handle_component_depends_on(const httplib::Request & req
     links["component"] = "/api/v1/components/" + component_id;
     response["_links"] = links;
 
-    HandlerContext::send_json(res, response);
+    HandlerContext::send_json(req, res, response);
   } catch (const std::exception & e) {
     HandlerContext::send_error(res, StatusCode::InternalServerError_500, ERR_INTERNAL_ERROR, "Internal server error",
                                {{"details", e.what()}});
@@ -702,7 +703,7 @@ void DiscoveryHandlers::handle_list_apps(const httplib::Request & req, httplib::
     for (const auto & app : apps) {
       json app_item;
       app_item["id"] = app.id;
-      app_item["name"] = app.name.empty() ? app.id : app.name;
+      app_item["name"] = app.name.empty() ? app.id.str() : app.name;
       app_item["href"] = "/api/v1/apps/" + app.id;
 
       if (!app.description.empty()) {
@@ -732,7 +733,7 @@ void DiscoveryHandlers::handle_list_apps(const httplib::Request & req, httplib::
     resp_ext.add("total_count", items.size());
     response["x-medkit"] = resp_ext.build();
 
-    HandlerContext::send_json(res, response);
+    HandlerContext::send_json(req, res, response);
   } catch (const std::exception & e) {
     HandlerContext::send_error(res, StatusCode::InternalServerError_500, ERR_INTERNAL_ERROR, "Internal server error",
                                {{"details", e.what()}});
@@ -742,12 +743,12 @@ void DiscoveryHandlers::handle_list_apps(const httplib::Request & req, httplib::
 
 void DiscoveryHandlers::handle_get_app(const httplib::Request & req, httplib::Response & res) {
   try {
-    if (req.matches.size() < 2) {
+    if (path_capture_count(req) < 2) {
       HandlerContext::send_error(res, StatusCode::BadRequest_400, ERR_INVALID_REQUEST, "Invalid request");
       return;
     }
 
-    std::string app_id = req.matches[1];
+    std::string app_id = path_capture(req, 1);
 
     auto validation_result = ctx_.validate_entity_id(app_id);
     if (!validation_result) {
@@ -824,7 +825,7 @@ void DiscoveryHandlers::handle_get_app(const httplib::Request & req, httplib::Re
     }
     response["x-medkit"] = ext.build();
 
-    HandlerContext::send_json(res, response);
+    HandlerContext::send_json(req, res, response);
   } catch (const std::exception & e) {
     HandlerContext::send_error(res, StatusCode::InternalServerError_500, ERR_INTERNAL_ERROR, "Internal server error",
                                {{"details", e.what()}});
@@ -834,12 +835,12 @@ void DiscoveryHandlers::handle_get_app(const httplib::Request & req, httplib::Re
 
 void DiscoveryHandlers::handle_app_depends_on(const httplib::Request & req, httplib::Response & res) {
   try {
-    if (req.matches.size() < 2) {
+    if (path_capture_count(req) < 2) {
       HandlerContext::send_error(res, StatusCode::BadRequest_400, ERR_INVALID_REQUEST, "Invalid request");
       return;
     }
 
-    std::string app_id = req.matches[1];
+    std::string app_id = path_capture(req, 1);
 
     auto validation_result = ctx_.validate_entity_id(app_id);
     if (!validation_result) {
@@ -896,7 +897,7 @@ void DiscoveryHandlers::handle_app_depends_on(const httplib::Request & req, http
     links["app"] = "/api/v1/apps/" + app_id;
     response["_links"] = links;
 
-    HandlerContext::send_json(res, response);
+    HandlerContext::send_json(req, res, response);
   } catch (const std::exception & e) {
     HandlerContext::send_error(res, StatusCode::InternalServerError_500, ERR_INTERNAL_ERROR, "Internal server error",
                                {{"details", e.what()}});
@@ -920,7 +921,7 @@ void DiscoveryHandlers::handle_list_functions(const httplib::Request & req, http
     for (const auto & func : functions) {
       json func_item;
       func_item["id"] = func.id;
-      func_item["name"] = func.name.empty() ? func.id : func.name;
+      func_item["name"] = func.name.empty() ? func.id.str() : func.name;
       func_item["href"] = "/api/v1/functions/" + func.id;
 
       if (!func.description.empty()) {
@@ -944,7 +945,7 @@ void DiscoveryHandlers::handle_list_functions(const httplib::Request & req, http
     resp_ext.add("total_count", functions.size());
     response["x-medkit"] = resp_ext.build();
 
-    HandlerContext::send_json(res, response);
+    HandlerContext::send_json(req, res, response);
   } catch (const std::exception & e) {
     HandlerContext::send_error(res, StatusCode::InternalServerError_500, ERR_INTERNAL_ERROR, "Internal server error",
                                {{"details", e.what()}});
@@ -954,12 +955,12 @@ void DiscoveryHandlers::handle_list_functions(const httplib::Request & req, http
 
 void DiscoveryHandlers::handle_get_function(const httplib::Request & req, httplib::Response & res) {
   try {
-    if (req.matches.size() < 2) {
+    if (path_capture_count(req) < 2) {
       HandlerContext::send_error(res, StatusCode::BadRequest_400, ERR_INVALID_REQUEST, "Invalid request");
       return;
     }
 
-    std::string function_id = req.matches[1];
+    std::string function_id = path_capture(req, 1);
 
     auto validation_result = ctx_.validate_entity_id(function_id);
     if (!validation_result) {
@@ -981,7 +982,7 @@ void DiscoveryHandlers::handle_get_function(const httplib::Request & req, httpli
 
     json response;
     response["id"] = func.id;
-    response["name"] = func.name.empty() ? func.id : func.name;
+    response["name"] = func.name.empty() ? func.id.str() : func.name;
 
     if (!func.description.empty()) {
       response["description"] = func.description;
@@ -1020,7 +1021,7 @@ void DiscoveryHandlers::handle_get_function(const httplib::Request & req, httpli
     ext.source(func.source);
     response["x-medkit"] = ext.build();
 
-    HandlerContext::send_json(res, response);
+    HandlerContext::send_json(req, res, response);
   } catch (const std::exception & e) {
     HandlerContext::send_error(res, StatusCode::InternalServerError_500, ERR_INTERNAL_ERROR, "Internal server error",
                                {{"details", e.what()}});
@@ -1030,12 +1031,12 @@ void DiscoveryHandlers::handle_get_function(const httplib::Request & req, httpli
 
 void DiscoveryHandlers::handle_function_hosts(const httplib::Request & req, httplib::Response & res) {
   try {
-    if (req.matches.size() < 2) {
+    if (path_capture_count(req) < 2) {
       HandlerContext::send_error(res, StatusCode::BadRequest_400, ERR_INVALID_REQUEST, "Invalid request");
       return;
     }
 
-    std::string function_id = req.matches[1];
+    std::string function_id = path_capture(req, 1);
 
     auto validation_result = ctx_.validate_entity_id(function_id);
     if (!validation_result) {
@@ -1061,7 +1062,7 @@ void DiscoveryHandlers::handle_function_hosts(const httplib::Request & req, http
       if (app_opt) {
         json item;
         item["id"] = app_opt->id;
-        item["name"] = app_opt->name.empty() ? app_opt->id : app_opt->name;
+        item["name"] = app_opt->name.empty() ? app_opt->id.str() : app_opt->name;
         item["href"] = "/api/v1/apps/" + app_opt->id;
 
         XMedkit ext;
@@ -1087,7 +1088,7 @@ void DiscoveryHandlers::handle_function_hosts(const httplib::Request & req, http
     links["function"] = "/api/v1/functions/" + function_id;
     response["_links"] = links;
 
-    HandlerContext::send_json(res, response);
+    HandlerContext::send_json(req, res, response);
   } catch (const std::exception & e) {
     HandlerContext::send_error(res, StatusCode::InternalServerError_500, ERR_INTERNAL_ERROR, "Internal server error",
                                {{"details", e.what()}});
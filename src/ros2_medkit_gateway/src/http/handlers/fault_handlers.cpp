@@ -18,15 +18,16 @@
 #include <cctype>
 #include <chrono>
 #include <ctime>
-#include <set>
 #include <sstream>
 #include <unordered_map>
+#include <unordered_set>
 #include <vector>
 
 #include "ros2_medkit_gateway/gateway_node.hpp"
 #include "ros2_medkit_gateway/http/entity_path_utils.hpp"
 #include "ros2_medkit_gateway/http/error_codes.hpp"
 #include "ros2_medkit_gateway/http/http_utils.hpp"
+#include "ros2_medkit_gateway/http/route_dispatcher.hpp"
 #include "ros2_medkit_gateway/http/x_medkit.hpp"
 
 using json = nlohmann::json;
@@ -37,31 +38,23 @@ namespace handlers {
 
 namespace {
 
-/// Helper to filter faults JSON array by a set of namespace prefixes
-/// Keeps faults where any reporting_source starts with any of the given prefixes
-json filter_faults_by_sources(const json & faults_array, const std::set<std::string> & source_prefixes) {
+/// Helper to filter faults JSON array by a set of node FQNs (from the entity cache FQN index)
+/// Keeps faults where any reporting_source matches one of the FQNs
+json filter_faults_by_fqns(const json & faults_array, const std::unordered_set<std::string> & fqns) {
   json filtered = json::array();
+  if (fqns.empty()) {
+    return filtered;
+  }
   for (const auto & fault : faults_array) {
     if (!fault.contains("reporting_sources")) {
       continue;
     }
-    const auto & sources = fault["reporting_sources"];
-    bool matches = false;
-    for (const auto & src : sources) {
-      const std::string src_str = src.get<std::string>();
-      for (const auto & prefix : source_prefixes) {
-        if (src_str.rfind(prefix, 0) == 0) {
-          matches = true;
-          break;
-        }
-      }
-      if (matches) {
+    for (const auto & src : fault["reporting_sources"]) {
+      if (source_matches_fqns(src.get<std::string>(), fqns)) {
+        filtered.push_back(fault);
         break;
       }
     }
-    if (matches) {
-      filtered.push_back(fault);
-    }
   }
   return filtered;
 }
@@ -271,7 +264,7 @@ void FaultHandlers::handle_list_all_faults(const httplib::Request & req, httplib
       }
 
       res.status = StatusCode::OK_200;
-      HandlerContext::send_json(res, response);
+      HandlerContext::send_json(req, res, response);
     } else {
       HandlerContext::send_error(res, StatusCode::ServiceUnavailable_503, ERR_SERVICE_UNAVAILABLE,
                                  "Failed to get faults", {{"details", result.error_message}});
@@ -286,12 +279,12 @@ void FaultHandlers::handle_list_all_faults(const httplib::Request & req, httplib
 void FaultHandlers::handle_list_faults(const httplib::Request & req, httplib::Response & res) {
   std::string entity_id;
   try {
-    if (req.matches.size() < 2) {
+    if (path_capture_count(req) < 2) {
       HandlerContext::send_error(res, StatusCode::BadRequest_400, ERR_INVALID_REQUEST, "Invalid request");
       return;
     }
 
-    entity_id = req.matches[1];
+    entity_id = path_capture(req, 1);
 
     // Validate entity ID and type for this route
     auto entity_opt = ctx_.validate_entity_for_route(req, res, entity_id);
@@ -331,18 +324,11 @@ void FaultHandlers::handle_list_faults(const httplib::Request & req, httplib::Re
         return;
       }
 
-      // Collect host app FQNs for filtering
-      const auto & cache = ctx_.node()->get_thread_safe_cache();
-      auto agg_configs = cache.get_entity_configurations(entity_id);
-      std::set<std::string> host_fqns;
-      for (const auto & node : agg_configs.nodes) {
-        if (!node.node_fqn.empty()) {
-          host_fqns.insert(node.node_fqn);
-        }
-      }
+      // Host app FQNs are precomputed by the entity cache
+      auto host_fqns = ctx_.node()->get_thread_safe_cache().get_entity_fqns(SovdEntityType::FUNCTION, entity_id);
 
       // Filter faults to only those from function's host apps
-      json filtered_faults = filter_faults_by_sources(result.data["faults"], host_fqns);
+      json filtered_faults = filter_faults_by_fqns(result.data["faults"], host_fqns);
 
       // Build response
       json response = {{"items", filtered_faults}};
@@ -354,7 +340,7 @@ void FaultHandlers::handle_list_faults(const httplib::Request & req, httplib::Re
       ext.add("host_count", host_fqns.size());
 
       response["x-medkit"] = ext.build();
-      HandlerContext::send_json(res, response);
+      HandlerContext::send_json(req, res, response);
       return;
     }
 
@@ -372,19 +358,11 @@ void FaultHandlers::handle_list_faults(const httplib::Request & req, httplib::Re
         return;
       }
 
-      // Collect hosted app FQNs for filtering
-      const auto & cache = ctx_.node()->get_thread_safe_cache();
-      auto app_ids = cache.get_apps_for_component(entity_id);
-      std::set<std::string> app_fqns;
-      for (const auto & app_id : app_ids) {
-        auto app = cache.get_app(app_id);
-        if (app && app->bound_fqn.has_value() && !app->bound_fqn->empty()) {
-          app_fqns.insert(app->bound_fqn.value());
-        }
-      }
+      // Hosted app FQNs are precomputed by the entity cache
+      auto app_fqns = ctx_.node()->get_thread_safe_cache().get_entity_fqns(SovdEntityType::COMPONENT, entity_id);
 
       // Filter faults to only those from component's hosted apps
-      json filtered_faults = filter_faults_by_sources(result.data["faults"], app_fqns);
+      json filtered_faults = filter_faults_by_fqns(result.data["faults"], app_fqns);
 
       // Build response
       json response = {{"items", filtered_faults}};
@@ -396,7 +374,7 @@ void FaultHandlers::handle_list_faults(const httplib::Request & req, httplib::Re
       ext.add("app_count", app_fqns.size());
 
       response["x-medkit"] = ext.build();
-      HandlerContext::send_json(res, response);
+      HandlerContext::send_json(req, res, response);
       return;
     }
 
@@ -426,7 +404,7 @@ void FaultHandlers::handle_list_faults(const httplib::Request & req, httplib::Re
       }
 
       response["x-medkit"] = ext.build();
-      HandlerContext::send_json(res, response);
+      HandlerContext::send_json(req, res, response);
     } else {
       HandlerContext::send_error(res, StatusCode::ServiceUnavailable_503, ERR_SERVICE_UNAVAILABLE,
                                  "Failed to get faults",
@@ -444,13 +422,13 @@ void FaultHandlers::handle_get_fault(const httplib::Request & req, httplib::Resp
   std::string entity_id;
   std::string fault_code;
   try {
-    if (req.matches.size() < 3) {
+    if (path_capture_count(req) < 3) {
       HandlerContext::send_error(res, StatusCode::BadRequest_400, ERR_INVALID_REQUEST, "Invalid request");
       return;
     }
 
-    entity_id = req.matches[1];
-    fault_code = req.matches[2];
+    entity_id = path_capture(req, 1);
+    fault_code = path_capture(req, 2);
 
     // Parse entity path from URL to get entity_path for bulk_data_uri
     auto entity_path_info = parse_entity_path(req.path);
@@ -484,7 +462,7 @@ void FaultHandlers::handle_get_fault(const httplib::Request & req, httplib::Resp
       // Build SOVD-compliant response with environment data
       auto response = build_sovd_fault_response(result.fault, result.environment_data, entity_path_info->entity_path);
 
-      HandlerContext::send_json(res, response);
+      HandlerContext::send_json(req, res, response);
     } else {
       // Check if it's a "not found" error
       if (result.error_message.find("not found") != std::string::npos ||
@@ -510,13 +488,13 @@ void FaultHandlers::handle_clear_fault(const httplib::Request & req, httplib::Re
   std::string entity_id;
   std::string fault_code;
   try {
-    if (req.matches.size() < 3) {
+    if (path_capture_count(req) < 3) {
       HandlerContext::send_error(res, StatusCode::BadRequest_400, ERR_INVALID_REQUEST, "Invalid request");
       return;
     }
 
-    entity_id = req.matches[1];
-    fault_code = req.matches[2];
+    entity_id = path_capture(req, 1);
+    fault_code = path_capture(req, 2);
 
     // Validate entity ID and type for this route
     auto entity_opt = ctx_.validate_entity_for_route(req, res, entity_id);
@@ -562,12 +540,12 @@ void FaultHandlers::handle_clear_fault(const httplib::Request & req, httplib::Re
 void FaultHandlers::handle_clear_all_faults(const httplib::Request & req, httplib::Response & res) {
   std::string entity_id;
   try {
-    if (req.matches.size() < 2) {
+    if (path_capture_count(req) < 2) {
       HandlerContext::send_error(res, StatusCode::BadRequest_400, ERR_INVALID_REQUEST, "Invalid request");
       return;
     }
 
-    entity_id = req.matches[1];
+    entity_id = path_capture(req, 1);
 
     // Validate entity ID and type for this route
     auto entity_opt = ctx_.validate_entity_for_route(req, res, entity_id);
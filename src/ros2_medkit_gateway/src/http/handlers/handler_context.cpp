@@ -15,6 +15,7 @@
 #include "ros2_medkit_gateway/http/handlers/handler_context.hpp"
 
 #include "ros2_medkit_gateway/gateway_node.hpp"
+#include "ros2_medkit_gateway/http/content_negotiation.hpp"
 #include "ros2_medkit_gateway/models/entity_capabilities.hpp"
 #include "ros2_medkit_gateway/models/entity_types.hpp"
 
@@ -290,5 +291,11 @@ void HandlerContext::send_json(httplib::Response & res, const json & data) {
   res.set_content(data.dump(2), "application/json");
 }
 
+void HandlerContext::send_json(const httplib::Request & req, httplib::Response & res, const json & data) {
+  ResponseFormat format = negotiate_response_format(req.get_header_value("Accept"));
+  res.set_header("Vary", "Accept");
+  res.set_content(encode_response_body(data, format), content_type_for(format));
+}
+
 }  // namespace handlers
 }  // namespace ros2_medkit_gateway
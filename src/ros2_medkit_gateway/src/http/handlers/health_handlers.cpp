@@ -17,6 +17,7 @@
 #include <chrono>
 
 #include "ros2_medkit_gateway/auth/auth_models.hpp"
+#include "ros2_medkit_gateway/gateway_node.hpp"
 #include "ros2_medkit_gateway/http/error_codes.hpp"
 #include "ros2_medkit_gateway/http/http_utils.hpp"
 
@@ -43,127 +44,18 @@ void HealthHandlers::handle_root(const httplib::Request & req, httplib::Response
   (void)req;  // Unused parameter
 
   try {
-    json endpoints = json::array({
-        // Health & Discovery
-        "GET /api/v1/health",
-        "GET /api/v1/version-info",
-        // Areas
-        "GET /api/v1/areas",
-        "GET /api/v1/areas/{area_id}",
-        "GET /api/v1/areas/{area_id}/subareas",
-        "GET /api/v1/areas/{area_id}/components",
-        "GET /api/v1/areas/{area_id}/contains",
-        "GET /api/v1/areas/{area_id}/data",
-        "GET /api/v1/areas/{area_id}/data/{data_id}",
-        "PUT /api/v1/areas/{area_id}/data/{data_id}",
-        "GET /api/v1/areas/{area_id}/operations",
-        "GET /api/v1/areas/{area_id}/operations/{operation_id}",
-        "POST /api/v1/areas/{area_id}/operations/{operation_id}/executions",
-        "GET /api/v1/areas/{area_id}/operations/{operation_id}/executions",
-        "GET /api/v1/areas/{area_id}/operations/{operation_id}/executions/{execution_id}",
-        "PUT /api/v1/areas/{area_id}/operations/{operation_id}/executions/{execution_id}",
-        "DELETE /api/v1/areas/{area_id}/operations/{operation_id}/executions/{execution_id}",
-        "GET /api/v1/areas/{area_id}/configurations",
-        "GET /api/v1/areas/{area_id}/configurations/{param_name}",
-        "PUT /api/v1/areas/{area_id}/configurations/{param_name}",
-        "DELETE /api/v1/areas/{area_id}/configurations/{param_name}",
-        "DELETE /api/v1/areas/{area_id}/configurations",
-        "GET /api/v1/areas/{area_id}/faults",
-        "GET /api/v1/areas/{area_id}/faults/{fault_code}",
-        "DELETE /api/v1/areas/{area_id}/faults/{fault_code}",
-        "DELETE /api/v1/areas/{area_id}/faults",
-        "GET /api/v1/areas/{area_id}/faults/{fault_code}/snapshots",
-        // Components
-        "GET /api/v1/components",
-        "GET /api/v1/components/{component_id}",
-        "GET /api/v1/components/{component_id}/subcomponents",
-        "GET /api/v1/components/{component_id}/hosts",
-        "GET /api/v1/components/{component_id}/depends-on",
-        "GET /api/v1/components/{component_id}/data",
-        "GET /api/v1/components/{component_id}/data/{data_id}",
-        "PUT /api/v1/components/{component_id}/data/{data_id}",
-        "GET /api/v1/components/{component_id}/operations",
-        "GET /api/v1/components/{component_id}/operations/{operation_id}",
-        "POST /api/v1/components/{component_id}/operations/{operation_id}/executions",
-        "GET /api/v1/components/{component_id}/operations/{operation_id}/executions",
-        "GET /api/v1/components/{component_id}/operations/{operation_id}/executions/{execution_id}",
-        "PUT /api/v1/components/{component_id}/operations/{operation_id}/executions/{execution_id}",
-        "DELETE /api/v1/components/{component_id}/operations/{operation_id}/executions/{execution_id}",
-        "GET /api/v1/components/{component_id}/configurations",
-        "GET /api/v1/components/{component_id}/configurations/{param_name}",
-        "PUT /api/v1/components/{component_id}/configurations/{param_name}",
-        "DELETE /api/v1/components/{component_id}/configurations/{param_name}",
-        "DELETE /api/v1/components/{component_id}/configurations",
-        "GET /api/v1/components/{component_id}/faults",
-        "GET /api/v1/components/{component_id}/faults/{fault_code}",
-        "DELETE /api/v1/components/{component_id}/faults/{fault_code}",
-        "DELETE /api/v1/components/{component_id}/faults",
-        "GET /api/v1/components/{component_id}/faults/{fault_code}/snapshots",
-        // Apps
-        "GET /api/v1/apps",
-        "GET /api/v1/apps/{app_id}",
-        "GET /api/v1/apps/{app_id}/depends-on",
-        "GET /api/v1/apps/{app_id}/data",
-        "GET /api/v1/apps/{app_id}/data/{data_id}",
-        "PUT /api/v1/apps/{app_id}/data/{data_id}",
-        "GET /api/v1/apps/{app_id}/data-categories",
-        "GET /api/v1/apps/{app_id}/data-groups",
-        "GET /api/v1/apps/{app_id}/operations",
-        "GET /api/v1/apps/{app_id}/operations/{operation_id}",
-        "POST /api/v1/apps/{app_id}/operations/{operation_id}/executions",
-        "GET /api/v1/apps/{app_id}/operations/{operation_id}/executions",
-        "GET /api/v1/apps/{app_id}/operations/{operation_id}/executions/{execution_id}",
-        "PUT /api/v1/apps/{app_id}/operations/{operation_id}/executions/{execution_id}",
-        "DELETE /api/v1/apps/{app_id}/operations/{operation_id}/executions/{execution_id}",
-        "GET /api/v1/apps/{app_id}/configurations",
-        "GET /api/v1/apps/{app_id}/configurations/{param_name}",
-        "PUT /api/v1/apps/{app_id}/configurations/{param_name}",
-        "DELETE /api/v1/apps/{app_id}/configurations/{param_name}",
-        "DELETE /api/v1/apps/{app_id}/configurations",
-        "GET /api/v1/apps/{app_id}/faults",
-        "GET /api/v1/apps/{app_id}/faults/{fault_code}",
-        "DELETE /api/v1/apps/{app_id}/faults/{fault_code}",
-        "DELETE /api/v1/apps/{app_id}/faults",
-        "GET /api/v1/apps/{app_id}/faults/{fault_code}/snapshots",
-        // Functions
-        "GET /api/v1/functions",
-        "GET /api/v1/functions/{function_id}",
-        "GET /api/v1/functions/{function_id}/hosts",
-        "GET /api/v1/functions/{function_id}/data",
-        "GET /api/v1/functions/{function_id}/data/{data_id}",
-        "PUT /api/v1/functions/{function_id}/data/{data_id}",
-        "GET /api/v1/functions/{function_id}/operations",
-        "GET /api/v1/functions/{function_id}/operations/{operation_id}",
-        "POST /api/v1/functions/{function_id}/operations/{operation_id}/executions",
-        "GET /api/v1/functions/{function_id}/operations/{operation_id}/executions",
-        "GET /api/v1/functions/{function_id}/operations/{operation_id}/executions/{execution_id}",
-        "PUT /api/v1/functions/{function_id}/operations/{operation_id}/executions/{execution_id}",
-        "DELETE /api/v1/functions/{function_id}/operations/{operation_id}/executions/{execution_id}",
-        "GET /api/v1/functions/{function_id}/configurations",
-        "GET /api/v1/functions/{function_id}/configurations/{param_name}",
-        "PUT /api/v1/functions/{function_id}/configurations/{param_name}",
-        "DELETE /api/v1/functions/{function_id}/configurations/{param_name}",
-        "DELETE /api/v1/functions/{function_id}/configurations",
-        "GET /api/v1/functions/{function_id}/faults",
-        "GET /api/v1/functions/{function_id}/faults/{fault_code}",
-        "DELETE /api/v1/functions/{function_id}/faults/{fault_code}",
-        "DELETE /api/v1/functions/{function_id}/faults",
-        "GET /api/v1/functions/{function_id}/faults/{fault_code}/snapshots",
-        // Global Faults
-        "GET /api/v1/faults",
-        "GET /api/v1/faults/stream",
-        "GET /api/v1/faults/{fault_code}/snapshots",
-        "GET /api/v1/faults/{fault_code}/snapshots/bag",
-    });
-
     const auto & auth_config = ctx_.auth_config();
     const auto & tls_config = ctx_.tls_config();
 
-    // Add auth endpoints if auth is enabled
-    if (auth_config.enabled) {
-      endpoints.push_back("POST /api/v1/auth/authorize");
-      endpoints.push_back("POST /api/v1/auth/token");
-      endpoints.push_back("POST /api/v1/auth/revoke");
+    // Listed from the route table so the root never drifts from what is actually served;
+    // auth endpoints are only advertised when authentication is enabled
+    const std::string auth_prefix = api_path("/auth/");
+    json endpoints = json::array();
+    for (auto & endpoint : routes_.endpoints()) {
+      if (!auth_config.enabled && endpoint.find(auth_prefix) != std::string::npos) {
+        continue;
+      }
+      endpoints.push_back(std::move(endpoint));
     }
 
     json capabilities = {
@@ -228,5 +120,21 @@ void HealthHandlers::handle_version_info(const httplib::Request & req, httplib::
   }
 }
 
+void HealthHandlers::handle_metrics(const httplib::Request & req, httplib::Response & res) {
+  (void)req;  // Unused parameter
+
+  try {
+    MetricsRegistry * metrics = ctx_.node()->get_metrics_registry();
+    if (!metrics) {
+      HandlerContext::send_error(res, StatusCode::NotFound_404, ERR_RESOURCE_NOT_FOUND, "Metrics are disabled");
+      return;
+    }
+    res.set_content(metrics->render(), MetricsRegistry::CONTENT_TYPE);
+  } catch (const std::exception & e) {
+    HandlerContext::send_error(res, StatusCode::InternalServerError_500, ERR_INTERNAL_ERROR, "Internal server error");
+    RCLCPP_ERROR(HandlerContext::logger(), "Error in handle_metrics: %s", e.what());
+  }
+}
+
 }  // namespace handlers
 }  // namespace ros2_medkit_gateway
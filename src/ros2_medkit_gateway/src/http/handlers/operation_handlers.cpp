@@ -14,11 +14,16 @@
 
 #include "ros2_medkit_gateway/http/handlers/operation_handlers.hpp"
 
+#include <algorithm>
+#include <chrono>
 #include <unordered_set>
+#include <utility>
+#include <vector>
 
 #include "ros2_medkit_gateway/gateway_node.hpp"
 #include "ros2_medkit_gateway/http/error_codes.hpp"
 #include "ros2_medkit_gateway/http/http_utils.hpp"
+#include "ros2_medkit_gateway/http/route_dispatcher.hpp"
 #include "ros2_medkit_gateway/http/x_medkit.hpp"
 #include "ros2_medkit_gateway/operation_manager.hpp"
 
@@ -31,12 +36,12 @@ namespace handlers {
 void OperationHandlers::handle_list_operations(const httplib::Request & req, httplib::Response & res) {
   std::string entity_id;
   try {
-    if (req.matches.size() < 2) {
+    if (path_capture_count(req) < 2) {
       HandlerContext::send_error(res, StatusCode::BadRequest_400, ERR_INVALID_REQUEST, "Invalid request");
       return;
     }
 
-    entity_id = req.matches[1];
+    entity_id = path_capture(req, 1);
 
     // Validate entity ID and type for this route
     auto entity_opt = ctx_.validate_entity_for_route(req, res, entity_id);
@@ -102,10 +107,10 @@ void OperationHandlers::handle_list_operations(const httplib::Request & req, htt
       try {
         json type_info_json;
         // Service types: pkg/srv/Type -> Request: pkg/srv/Type_Request, Response: pkg/srv/Type_Response
-        auto request_info = type_introspection->get_type_info(svc.type + "_Request");
-        auto response_info = type_introspection->get_type_info(svc.type + "_Response");
-        type_info_json["request"] = request_info.schema;
-        type_info_json["response"] = response_info.schema;
+        auto request_info = type_introspection->get_type_info_ptr(svc.type + "_Request");
+        auto response_info = type_introspection->get_type_info_ptr(svc.type + "_Response");
+        type_info_json["request"] = request_info->schema;
+        type_info_json["response"] = response_info->schema;
         x_medkit.add("type_info", type_info_json);
       } catch (const std::exception & e) {
         RCLCPP_DEBUG(HandlerContext::logger(), "Could not get type info for service '%s': %s", svc.type.c_str(),
@@ -133,12 +138,12 @@ void OperationHandlers::handle_list_operations(const httplib::Request & req, htt
       try {
         json type_info_json;
         // Action types: pkg/action/Type -> Goal: pkg/action/Type_Goal, etc.
-        auto goal_info = type_introspection->get_type_info(act.type + "_Goal");
-        auto result_info = type_introspection->get_type_info(act.type + "_Result");
-        auto feedback_info = type_introspection->get_type_info(act.type + "_Feedback");
-        type_info_json["goal"] = goal_info.schema;
-        type_info_json["result"] = result_info.schema;
-        type_info_json["feedback"] = feedback_info.schema;
+        auto goal_info = type_introspection->get_type_info_ptr(act.type + "_Goal");
+        auto result_info = type_introspection->get_type_info_ptr(act.type + "_Result");
+        auto feedback_info = type_introspection->get_type_info_ptr(act.type + "_Feedback");
+        type_info_json["goal"] = goal_info->schema;
+        type_info_json["result"] = result_info->schema;
+        type_info_json["feedback"] = feedback_info->schema;
         x_medkit.add("type_info", type_info_json);
       } catch (const std::exception & e) {
         RCLCPP_DEBUG(HandlerContext::logger(), "Could not get type info for action '%s': %s", act.type.c_str(),
@@ -165,13 +170,13 @@ void OperationHandlers::handle_get_operation(const httplib::Request & req, httpl
   std::string entity_id;
   std::string operation_id;
   try {
-    if (req.matches.size() < 3) {
+    if (path_capture_count(req) < 3) {
       HandlerContext::send_error(res, StatusCode::BadRequest_400, ERR_INVALID_REQUEST, "Invalid request");
       return;
     }
 
-    entity_id = req.matches[1];
-    operation_id = req.matches[2];
+    entity_id = path_capture(req, 1);
+    operation_id = path_capture(req, 2);
 
     // Validate entity ID and type for this route
     auto entity_opt = ctx_.validate_entity_for_route(req, res, entity_id);
@@ -257,10 +262,10 @@ void OperationHandlers::handle_get_operation(const httplib::Request & req, httpl
 
       try {
         json type_info_json;
-        auto request_info = type_introspection->get_type_info(service_info->type + "_Request");
-        auto response_info = type_introspection->get_type_info(service_info->type + "_Response");
-        type_info_json["request"] = request_info.schema;
-        type_info_json["response"] = response_info.schema;
+        auto request_info = type_introspection->get_type_info_ptr(service_info->type + "_Request");
+        auto response_info = type_introspection->get_type_info_ptr(service_info->type + "_Response");
+        type_info_json["request"] = request_info->schema;
+        type_info_json["response"] = response_info->schema;
         x_medkit.add("type_info", type_info_json);
       } catch (const std::exception & e) {
         RCLCPP_DEBUG(HandlerContext::logger(), "Could not get type info for service '%s': %s",
@@ -283,12 +288,12 @@ void OperationHandlers::handle_get_operation(const httplib::Request & req, httpl
 
       try {
         json type_info_json;
-        auto goal_info = type_introspection->get_type_info(action_info->type + "_Goal");
-        auto result_info = type_introspection->get_type_info(action_info->type + "_Result");
-        auto feedback_info = type_introspection->get_type_info(action_info->type + "_Feedback");
-        type_info_json["goal"] = goal_info.schema;
-        type_info_json["result"] = result_info.schema;
-        type_info_json["feedback"] = feedback_info.schema;
+        auto goal_info = type_introspection->get_type_info_ptr(action_info->type + "_Goal");
+        auto result_info = type_introspection->get_type_info_ptr(action_info->type + "_Result");
+        auto feedback_info = type_introspection->get_type_info_ptr(action_info->type + "_Feedback");
+        type_info_json["goal"] = goal_info->schema;
+        type_info_json["result"] = result_info->schema;
+        type_info_json["feedback"] = feedback_info->schema;
         x_medkit.add("type_info", type_info_json);
       } catch (const std::exception & e) {
         RCLCPP_DEBUG(HandlerContext::logger(), "Could not get type info for action '%s': %s", action_info->type.c_str(),
@@ -311,8 +316,7 @@ void OperationHandlers::handle_get_operation(const httplib::Request & req, httpl
   }
 }
 
-// Helper function to convert ROS2 action status to SOVD ExecutionStatus
-static std::string sovd_status_from_ros2(ActionGoalStatus status) {
+std::string sovd_status_from_ros2(ActionGoalStatus status) {
   switch (status) {
     case ActionGoalStatus::ACCEPTED:
     case ActionGoalStatus::EXECUTING:
@@ -328,17 +332,22 @@ static std::string sovd_status_from_ros2(ActionGoalStatus status) {
   }
 }
 
+/// True if the client asked for an asynchronous response (RFC 7240 "Prefer: respond-async")
+static bool prefers_async(const httplib::Request & req) {
+  return req.get_header_value("Prefer").find("respond-async") != std::string::npos;
+}
+
 void OperationHandlers::handle_create_execution(const httplib::Request & req, httplib::Response & res) {
   std::string entity_id;
   std::string operation_id;
   try {
-    if (req.matches.size() < 3) {
+    if (path_capture_count(req) < 3) {
       HandlerContext::send_error(res, StatusCode::BadRequest_400, ERR_INVALID_REQUEST, "Invalid request");
       return;
     }
 
-    entity_id = req.matches[1];
-    operation_id = req.matches[2];
+    entity_id = path_capture(req, 1);
+    operation_id = path_capture(req, 2);
 
     // Validate entity ID and type for this route
     auto entity_opt = ctx_.validate_entity_for_route(req, res, entity_id);
@@ -452,6 +461,11 @@ void OperationHandlers::handle_create_execution(const httplib::Request & req, ht
             {{id_field, entity_id},
              {"operation_id", operation_id},
              {"details", action_result.error_message.empty() ? "Goal rejected" : action_result.error_message}});
+      } else if (action_result.goal_limit_reached) {
+        HandlerContext::send_error(
+            res, StatusCode::ServiceUnavailable_503, ERR_SERVICE_UNAVAILABLE, "Too many running goals",
+            {{id_field, entity_id}, {"operation_id", operation_id}, {"details", action_result.error_message}});
+        res.set_header("Retry-After", "1");
       } else {
         HandlerContext::send_error(
             res, StatusCode::InternalServerError_500, ERR_X_MEDKIT_ROS2_ACTION_UNAVAILABLE, "Action execution failed",
@@ -460,7 +474,7 @@ void OperationHandlers::handle_create_execution(const httplib::Request & req, ht
       return;
     }
 
-    // Handle services (synchronous execution)
+    // Handle services (synchronous execution, or queued with "Prefer: respond-async")
     if (service_info.has_value()) {
       json request_data = json::object();
       if (body.contains("parameters")) {
@@ -474,12 +488,38 @@ void OperationHandlers::handle_create_execution(const httplib::Request & req, ht
         service_type = body["type"].get<std::string>();
       }
 
+      if (prefers_async(req)) {
+        auto submit_result = operation_mgr->submit_service_call(service_info->full_path, service_type, request_data);
+        if (!submit_result.success) {
+          HandlerContext::send_error(
+              res, StatusCode::ServiceUnavailable_503, ERR_SERVICE_UNAVAILABLE, "Service execution queue is full",
+              {{id_field, entity_id}, {"operation_id", operation_id}, {"details", submit_result.error_message}});
+          res.set_header("Retry-After", "1");
+          return;
+        }
+
+        json response = {{"id", submit_result.execution_id}, {"status", "running"}};
+        std::string base_path = (entity_type == "app") ? "/api/v1/apps/" : "/api/v1/components/";
+        std::string location =
+            base_path + entity_id + "/operations/" + operation_id + "/executions/" + submit_result.execution_id;
+        res.set_header("Location", location);
+        res.set_header("Preference-Applied", "respond-async");
+
+        res.status = StatusCode::Accepted_202;
+        res.set_content(response.dump(), "application/json");
+        return;
+      }
+
       auto result = operation_mgr->call_service(service_info->full_path, service_type, request_data);
 
       if (result.success) {
         // Synchronous response
         json response = {{"parameters", result.response}};
         HandlerContext::send_json(res, response);
+      } else if (result.service_unavailable) {
+        HandlerContext::send_error(
+            res, StatusCode::ServiceUnavailable_503, ERR_X_MEDKIT_ROS2_SERVICE_UNAVAILABLE, "Service not available",
+            {{id_field, entity_id}, {"operation_id", operation_id}, {"details", result.error_message}});
       } else {
         json error_response = {{"error",
                                 {{"code", ERR_X_MEDKIT_ROS2_SERVICE_UNAVAILABLE},
@@ -503,13 +543,13 @@ void OperationHandlers::handle_list_executions(const httplib::Request & req, htt
   std::string entity_id;
   std::string operation_id;
   try {
-    if (req.matches.size() < 3) {
+    if (path_capture_count(req) < 3) {
       HandlerContext::send_error(res, StatusCode::BadRequest_400, ERR_INVALID_REQUEST, "Invalid request");
       return;
     }
 
-    entity_id = req.matches[1];
-    operation_id = req.matches[2];
+    entity_id = path_capture(req, 1);
+    operation_id = path_capture(req, 2);
 
     auto entity_validation = ctx_.validate_entity_id(entity_id);
     if (!entity_validation) {
@@ -537,6 +577,12 @@ void OperationHandlers::handle_list_executions(const httplib::Request & req, htt
             break;
           }
         }
+        for (const auto & svc : app->services) {
+          if (!entity_found && svc.name == operation_id) {
+            namespace_path = svc.full_path.substr(0, svc.full_path.rfind('/'));
+            entity_found = true;
+          }
+        }
       }
     }
 
@@ -546,15 +592,28 @@ void OperationHandlers::handle_list_executions(const httplib::Request & req, htt
       return;
     }
 
-    // Build action path and get all goals for this action
-    std::string action_path = namespace_path + "/" + operation_id;
+    // Build operation path and get all action goals and service executions for it
+    std::string operation_path = namespace_path + "/" + operation_id;
     auto operation_mgr = ctx_.node()->get_operation_manager();
-    auto goals = operation_mgr->get_goals_for_action(action_path);
+    auto goals = operation_mgr->get_goals_for_action(operation_path);
+    auto service_executions = operation_mgr->get_service_executions(operation_path);
 
-    // Return list of execution objects with id field (Table 172)
-    json items = json::array();
+    // Return list of execution objects with id field (Table 172), newest first
+    std::vector<std::pair<std::chrono::system_clock::time_point, std::string>> executions;
+    executions.reserve(goals.size() + service_executions.size());
     for (const auto & goal : goals) {
-      items.push_back({{"id", goal.goal_id}});
+      executions.emplace_back(goal.created_at, goal.goal_id);
+    }
+    for (const auto & execution : service_executions) {
+      executions.emplace_back(execution.created_at, execution.execution_id);
+    }
+    std::stable_sort(executions.begin(), executions.end(), [](const auto & a, const auto & b) {
+      return a.first > b.first;
+    });
+
+    json items = json::array();
+    for (const auto & [created_at, id] : executions) {
+      items.push_back({{"id", id}});
     }
 
     json response = {{"items", items}};
@@ -573,14 +632,14 @@ void OperationHandlers::handle_get_execution(const httplib::Request & req, httpl
   std::string operation_id;
   std::string execution_id;
   try {
-    if (req.matches.size() < 4) {
+    if (path_capture_count(req) < 4) {
       HandlerContext::send_error(res, StatusCode::BadRequest_400, ERR_INVALID_REQUEST, "Invalid request");
       return;
     }
 
-    entity_id = req.matches[1];
-    operation_id = req.matches[2];
-    execution_id = req.matches[3];
+    entity_id = path_capture(req, 1);
+    operation_id = path_capture(req, 2);
+    execution_id = path_capture(req, 3);
 
     auto entity_validation = ctx_.validate_entity_id(entity_id);
     if (!entity_validation) {
@@ -593,9 +652,30 @@ void OperationHandlers::handle_get_execution(const httplib::Request & req, httpl
     auto goal_info = operation_mgr->get_tracked_goal(execution_id);
 
     if (!goal_info.has_value()) {
-      HandlerContext::send_error(
-          res, StatusCode::NotFound_404, ERR_RESOURCE_NOT_FOUND, "Execution not found",
-          {{"entity_id", entity_id}, {"operation_id", operation_id}, {"execution_id", execution_id}});
+      auto service_execution = operation_mgr->get_service_execution(execution_id);
+      if (!service_execution.has_value()) {
+        HandlerContext::send_error(
+            res, StatusCode::NotFound_404, ERR_RESOURCE_NOT_FOUND, "Execution not found",
+            {{"entity_id", entity_id}, {"operation_id", operation_id}, {"execution_id", execution_id}});
+        return;
+      }
+
+      json response = {{"status", sovd_status_from_ros2(service_execution->status)}, {"capability", "execute"}};
+      if (service_execution->status == ActionGoalStatus::SUCCEEDED) {
+        response["parameters"] = service_execution->result.response;
+      } else if (service_execution->status == ActionGoalStatus::ABORTED) {
+        response["error"] = {{"code", ERR_X_MEDKIT_ROS2_SERVICE_UNAVAILABLE},
+                             {"message", "Service call failed"},
+                             {"details", service_execution->result.error_message}};
+      }
+
+      auto x_medkit = XMedkit()
+                          .add("ros2_status", action_status_to_string(service_execution->status))
+                          .ros2_service(service_execution->service_path)
+                          .ros2_type(service_execution->service_type);
+      response["x-medkit"] = x_medkit.build();
+
+      HandlerContext::send_json(res, response);
       return;
     }
 
@@ -633,14 +713,14 @@ void OperationHandlers::handle_cancel_execution(const httplib::Request & req, ht
   std::string operation_id;
   std::string execution_id;
   try {
-    if (req.matches.size() < 4) {
+    if (path_capture_count(req) < 4) {
       HandlerContext::send_error(res, StatusCode::BadRequest_400, ERR_INVALID_REQUEST, "Invalid request");
       return;
     }
 
-    entity_id = req.matches[1];
-    operation_id = req.matches[2];
-    execution_id = req.matches[3];
+    entity_id = path_capture(req, 1);
+    operation_id = path_capture(req, 2);
+    execution_id = path_capture(req, 3);
 
     auto entity_validation = ctx_.validate_entity_id(entity_id);
     if (!entity_validation) {
@@ -653,9 +733,21 @@ void OperationHandlers::handle_cancel_execution(const httplib::Request & req, ht
     auto goal_info = operation_mgr->get_tracked_goal(execution_id);
 
     if (!goal_info.has_value()) {
-      HandlerContext::send_error(
-          res, StatusCode::NotFound_404, ERR_RESOURCE_NOT_FOUND, "Execution not found",
-          {{"entity_id", entity_id}, {"operation_id", operation_id}, {"execution_id", execution_id}});
+      if (!operation_mgr->get_service_execution(execution_id).has_value()) {
+        HandlerContext::send_error(
+            res, StatusCode::NotFound_404, ERR_RESOURCE_NOT_FOUND, "Execution not found",
+            {{"entity_id", entity_id}, {"operation_id", operation_id}, {"execution_id", execution_id}});
+        return;
+      }
+
+      // A service call cannot be interrupted once sent; only queued executions can be canceled
+      if (operation_mgr->cancel_service_execution(execution_id)) {
+        res.status = StatusCode::NoContent_204;
+      } else {
+        HandlerContext::send_error(
+            res, StatusCode::Conflict_409, ERR_INVALID_REQUEST, "Service execution already started",
+            {{"entity_id", entity_id}, {"operation_id", operation_id}, {"execution_id", execution_id}});
+      }
       return;
     }
 
@@ -703,14 +795,14 @@ void OperationHandlers::handle_update_execution(const httplib::Request & req, ht
   std::string operation_id;
   std::string execution_id;
   try {
-    if (req.matches.size() < 4) {
+    if (path_capture_count(req) < 4) {
       HandlerContext::send_error(res, StatusCode::BadRequest_400, ERR_INVALID_REQUEST, "Invalid request");
       return;
     }
 
-    entity_id = req.matches[1];
-    operation_id = req.matches[2];
-    execution_id = req.matches[3];
+    entity_id = path_capture(req, 1);
+    operation_id = path_capture(req, 2);
+    execution_id = path_capture(req, 3);
 
     auto entity_validation = ctx_.validate_entity_id(entity_id);
     if (!entity_validation) {
@@ -744,6 +836,16 @@ void OperationHandlers::handle_update_execution(const httplib::Request & req, ht
     auto goal_info = operation_mgr->get_tracked_goal(execution_id);
 
     if (!goal_info.has_value()) {
+      if (operation_mgr->get_service_execution(execution_id).has_value()) {
+        HandlerContext::send_error(res, StatusCode::BadRequest_400, ERR_INVALID_PARAMETER,
+                                   "Capability not supported for service executions",
+                                   {{"entity_id", entity_id},
+                                    {"operation_id", operation_id},
+                                    {"execution_id", execution_id},
+                                    {"capability", capability},
+                                    {"details", "Use DELETE to cancel a queued service execution"}});
+        return;
+      }
       HandlerContext::send_error(
           res, StatusCode::NotFound_404, ERR_RESOURCE_NOT_FOUND, "Execution not found",
           {{"entity_id", entity_id}, {"operation_id", operation_id}, {"execution_id", execution_id}});
@@ -0,0 +1,343 @@
+// Copyright 2026 bburda
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+#include "ros2_medkit_gateway/http/handlers/sse_execution_handler.hpp"
+
+#include <algorithm>
+#include <chrono>
+#include <cstring>
+#include <sstream>
+#include <utility>
+
+#include "ros2_medkit_gateway/gateway_node.hpp"
+#include "ros2_medkit_gateway/http/error_codes.hpp"
+#include "ros2_medkit_gateway/http/handlers/operation_handlers.hpp"
+#include "ros2_medkit_gateway/http/route_dispatcher.hpp"
+#include "ros2_medkit_gateway/http/x_medkit.hpp"
+
+using httplib::StatusCode;
+
+namespace ros2_medkit_gateway {
+namespace handlers {
+
+namespace {
+
+bool is_final_status(ActionGoalStatus status) {
+  return status == ActionGoalStatus::SUCCEEDED || status == ActionGoalStatus::CANCELED ||
+         status == ActionGoalStatus::ABORTED;
+}
+
+}  // namespace
+
+SSEExecutionHandler::SSEExecutionHandler(HandlerContext & ctx) : ctx_(ctx) {
+  max_sse_clients_ = static_cast<size_t>(ctx_.node()->get_parameter("sse.max_clients").as_int());
+
+  ctx_.node()->get_operation_manager()->set_goal_event_callback([this](const ActionGoalEvent & event) {
+    on_goal_event(event);
+  });
+}
+
+SSEExecutionHandler::~SSEExecutionHandler() {
+  // Returns once no callback is running, so none can reach this handler afterwards
+  ctx_.node()->get_operation_manager()->set_goal_event_callback(nullptr);
+
+  // Signal shutdown and wake up any waiting clients
+  shutdown_flag_.store(true);
+  queue_cv_.notify_all();
+}
+
+void SSEExecutionHandler::on_goal_event(const ActionGoalEvent & event) {
+  bool final = event.feedback.is_null() && is_final_status(event.status);
+
+  {
+    std::lock_guard<std::mutex> lock(queue_mutex_);
+    uint64_t event_id = next_event_id_++;
+    event_queue_.push_back({event_id, event.goal_id, event.action_path, final, format_sse_event(event, event_id)});
+
+    // Trim old events if buffer is full
+    while (event_queue_.size() > kMaxBufferedEvents) {
+      event_queue_.pop_front();
+    }
+  }
+
+  queue_cv_.notify_all();
+}
+
+void SSEExecutionHandler::handle_operation_stream(const httplib::Request & req, httplib::Response & res) {
+  if (path_capture_count(req) < 3) {
+    HandlerContext::send_error(res, StatusCode::BadRequest_400, ERR_INVALID_REQUEST, "Invalid request");
+    return;
+  }
+
+  std::string entity_id = path_capture(req, 1);
+  std::string operation_id = path_capture(req, 2);
+
+  auto entity_validation = ctx_.validate_entity_id(entity_id);
+  if (!entity_validation) {
+    HandlerContext::send_error(res, StatusCode::BadRequest_400, ERR_INVALID_PARAMETER, "Invalid entity ID",
+                               {{"details", entity_validation.error()}, {"entity_id", entity_id}});
+    return;
+  }
+
+  auto operation_path = resolve_operation_path(entity_id, operation_id);
+  if (!operation_path) {
+    HandlerContext::send_error(res, StatusCode::NotFound_404, ERR_ENTITY_NOT_FOUND, "Entity not found",
+                               {{"entity_id", entity_id}});
+    return;
+  }
+
+  if (!accept_client(req, res)) {
+    return;
+  }
+  stream(
+      res, resume_point(req),
+      [path = *operation_path](const BufferedEvent & event) {
+        return event.action_path == path;
+      },
+      "", false, nullptr);
+}
+
+void SSEExecutionHandler::handle_execution_stream(const httplib::Request & req, httplib::Response & res) {
+  if (path_capture_count(req) < 4) {
+    HandlerContext::send_error(res, StatusCode::BadRequest_400, ERR_INVALID_REQUEST, "Invalid request");
+    return;
+  }
+
+  std::string entity_id = path_capture(req, 1);
+  std::string operation_id = path_capture(req, 2);
+  std::string execution_id = path_capture(req, 3);
+
+  auto entity_validation = ctx_.validate_entity_id(entity_id);
+  if (!entity_validation) {
+    HandlerContext::send_error(res, StatusCode::BadRequest_400, ERR_INVALID_PARAMETER, "Invalid entity ID",
+                               {{"details", entity_validation.error()}, {"entity_id", entity_id}});
+    return;
+  }
+
+  // Taken before reading the goal, so no event after the snapshot is missed
+  uint64_t last_event_id = resume_point(req);
+
+  auto operation_mgr = ctx_.node()->get_operation_manager();
+  auto goal_info = operation_mgr->get_tracked_goal(execution_id);
+  if (!goal_info.has_value()) {
+    if (operation_mgr->get_service_execution(execution_id).has_value()) {
+      HandlerContext::send_error(res, StatusCode::BadRequest_400, ERR_INVALID_REQUEST,
+                                 "Only action executions can be streamed", {{"execution_id", execution_id}});
+      return;
+    }
+    HandlerContext::send_error(
+        res, StatusCode::NotFound_404, ERR_RESOURCE_NOT_FOUND, "Execution not found",
+        {{"entity_id", entity_id}, {"operation_id", operation_id}, {"execution_id", execution_id}});
+    return;
+  }
+
+  // A finished goal has nothing more to stream, so even a resuming client gets its final status and the end
+  if (is_final_status(goal_info->status)) {
+    res.set_content(format_sse_event({goal_info->goal_id, goal_info->action_path, goal_info->status, nullptr}, 0),
+                    "text/event-stream");
+    return;
+  }
+
+  // A new client gets the current state first; a resuming one only what it missed
+  std::string initial;
+  if (!req.has_header("Last-Event-ID")) {
+    initial = format_sse_event({goal_info->goal_id, goal_info->action_path, goal_info->status, nullptr}, 0);
+  }
+
+  if (!accept_client(req, res)) {
+    return;
+  }
+
+  // The final event may never reach the buffer (trimmed, or the goal was cleaned up first): the tracked goal
+  // decides then, so the stream does not hold its sse.max_clients slot forever
+  auto ended = [operation_mgr, execution_id]() -> std::optional<std::string> {
+    auto goal = operation_mgr->get_tracked_goal(execution_id);
+    if (!goal.has_value()) {
+      return std::string();
+    }
+    if (is_final_status(goal->status)) {
+      return format_sse_event({goal->goal_id, goal->action_path, goal->status, nullptr}, 0);
+    }
+    return std::nullopt;
+  };
+  stream(
+      res, last_event_id,
+      [execution_id](const BufferedEvent & event) {
+        return event.goal_id == execution_id;
+      },
+      std::move(initial), true, std::move(ended));
+}
+
+size_t SSEExecutionHandler::connected_clients() const {
+  return client_count_.load();
+}
+
+std::optional<std::string> SSEExecutionHandler::resolve_operation_path(const std::string & entity_id,
+                                                                       const std::string & operation_id) const {
+  const auto & cache = ctx_.node()->get_thread_safe_cache();
+  if (auto component = cache.get_component(entity_id)) {
+    return component->namespace_path + "/" + operation_id;
+  }
+  if (auto app = cache.get_app(entity_id)) {
+    for (const auto & act : app->actions) {
+      if (act.name == operation_id) {
+        return act.full_path;
+      }
+    }
+  }
+  return std::nullopt;
+}
+
+bool SSEExecutionHandler::accept_client(const httplib::Request & req, httplib::Response & res) {
+  // Check if we're at the client limit (shared by all SSE streams) before accepting connection
+  if (ctx_.sse_connections().load() >= max_sse_clients_) {
+    RCLCPP_WARN(HandlerContext::logger(), "SSE client limit reached (%zu), rejecting connection from %s",
+                max_sse_clients_, req.remote_addr.c_str());
+    HandlerContext::send_error(res, StatusCode::ServiceUnavailable_503, ERR_SERVICE_UNAVAILABLE,
+                               "Maximum number of SSE clients reached. Please try again later.");
+    return false;
+  }
+
+  RCLCPP_INFO(HandlerContext::logger(), "SSE execution client connected from %s (%zu/%zu)", req.remote_addr.c_str(),
+              ctx_.sse_connections().load() + 1, max_sse_clients_);
+
+  client_count_.fetch_add(1);
+  ctx_.sse_connections().fetch_add(1);
+
+  // Set SSE headers
+  res.set_header("Cache-Control", "no-cache");
+  res.set_header("Connection", "keep-alive");
+  res.set_header("X-Accel-Buffering", "no");  // Disable nginx buffering
+  return true;
+}
+
+uint64_t SSEExecutionHandler::resume_point(const httplib::Request & req) const {
+  // Parse Last-Event-ID header for reconnection support
+  if (req.has_header("Last-Event-ID")) {
+    try {
+      return std::stoull(req.get_header_value("Last-Event-ID"));
+    } catch (...) {
+      // Ignore invalid Last-Event-ID
+    }
+  }
+
+  // New clients only see events from now on
+  std::lock_guard<std::mutex> lock(queue_mutex_);
+  return next_event_id_ - 1;
+}
+
+void SSEExecutionHandler::stream(httplib::Response & res, uint64_t last_event_id,
+                                 std::function<bool(const BufferedEvent &)> matches, std::string initial,
+                                 bool end_on_final, std::function<std::optional<std::string>()> ended) {
+  res.set_chunked_content_provider(
+      "text/event-stream",
+      [this, last_event_id, matches = std::move(matches), initial = std::move(initial), end_on_final,
+       ended = std::move(ended)](size_t /*offset*/, httplib::DataSink & sink) mutable {
+        if (!initial.empty()) {
+          if (!sink.write(initial.data(), initial.size())) {
+            return false;  // Client disconnected
+          }
+          initial.clear();
+        }
+
+        auto timeout = std::chrono::seconds(kKeepaliveIntervalSec);
+        std::unique_lock<std::mutex> lock(queue_mutex_);
+
+        while (true) {
+          // Check for shutdown
+          if (shutdown_flag_.load()) {
+            return false;  // Handler is shutting down
+          }
+
+          // Next buffered event the client has not seen (ids are increasing)
+          auto it = std::upper_bound(event_queue_.begin(), event_queue_.end(), last_event_id,
+                                     [](uint64_t id, const BufferedEvent & event) {
+                                       return id < event.id;
+                                     });
+          if (it != event_queue_.end()) {
+            last_event_id = it->id;
+            if (!matches(*it)) {
+              continue;
+            }
+
+            // Copy out so the queue can change while writing
+            std::string sse_msg = it->sse;
+            bool final = it->final;
+            lock.unlock();
+            if (!sink.write(sse_msg.data(), sse_msg.size())) {
+              return false;  // Client disconnected
+            }
+            if (final && end_on_final) {
+              sink.done();
+              return true;
+            }
+            lock.lock();
+            continue;
+          }
+
+          // Wait for new event or timeout
+          auto status = queue_cv_.wait_for(lock, timeout);
+
+          if (status == std::cv_status::timeout && !shutdown_flag_.load()) {
+            lock.unlock();
+            if (ended) {
+              if (auto last = ended()) {
+                if (!last->empty() && !sink.write(last->data(), last->size())) {
+                  return false;  // Client disconnected
+                }
+                sink.done();
+                return true;
+              }
+            }
+
+            // Send keepalive comment
+            const char * keepalive = ":keepalive\n\n";
+            if (!sink.write(keepalive, strlen(keepalive))) {
+              return false;  // Client disconnected
+            }
+            lock.lock();
+          }
+        }
+      },
+      [this](bool success) {
+        client_count_.fetch_sub(1);
+        ctx_.sse_connections().fetch_sub(1);
+        RCLCPP_INFO(HandlerContext::logger(), "SSE execution client disconnected (success=%d)", success);
+      });
+}
+
+std::string SSEExecutionHandler::format_sse_event(const ActionGoalEvent & event, uint64_t event_id) {
+  bool is_feedback = !event.feedback.is_null();
+  const char * event_type = is_feedback ? "feedback" : "status";
+
+  nlohmann::json data = {
+      {"event_type", event_type}, {"execution_id", event.goal_id}, {"status", sovd_status_from_ros2(event.status)}};
+  if (is_feedback) {
+    data["parameters"] = event.feedback;
+  }
+  data["x-medkit"] =
+      XMedkit().add("ros2_status", action_status_to_string(event.status)).ros2_action(event.action_path).build();
+  data["timestamp"] = std::chrono::duration<double>(std::chrono::system_clock::now().time_since_epoch()).count();
+
+  std::ostringstream sse;
+  if (event_id != 0) {
+    sse << "id: " << event_id << "\n";
+  }
+  sse << "event: " << event_type << "\n";
+  sse << "data: " << data.dump() << "\n\n";
+  return sse.str();
+}
+
+}  // namespace handlers
+}  // namespace ros2_medkit_gateway
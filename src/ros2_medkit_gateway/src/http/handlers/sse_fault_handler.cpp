@@ -14,9 +14,13 @@
 
 #include "ros2_medkit_gateway/http/handlers/sse_fault_handler.hpp"
 
+#include <algorithm>
+#include <cctype>
 #include <chrono>
 #include <cinttypes>
+#include <cstring>
 #include <sstream>
+#include <vector>
 
 #include "ros2_medkit_gateway/fault_manager.hpp"
 #include "ros2_medkit_gateway/gateway_node.hpp"
@@ -25,6 +29,152 @@
 namespace ros2_medkit_gateway {
 namespace handlers {
 
+namespace {
+
+using ros2_medkit_msgs::msg::FaultEvent;
+using FaultMsg = ros2_medkit_msgs::msg::Fault;
+
+/// Split a comma-separated query value, skipping empty items
+std::vector<std::string> split_list(const std::string & value) {
+  std::vector<std::string> items;
+  std::istringstream stream(value);
+  std::string item;
+  while (std::getline(stream, item, ',')) {
+    if (!item.empty()) {
+      items.push_back(item);
+    }
+  }
+  return items;
+}
+
+std::optional<uint8_t> parse_severity(std::string value) {
+  std::transform(value.begin(), value.end(), value.begin(), [](unsigned char c) {
+    return static_cast<char>(std::tolower(c));
+  });
+  if (value == "info" || value == "0") {
+    return FaultMsg::SEVERITY_INFO;
+  }
+  if (value == "warn" || value == "1") {
+    return FaultMsg::SEVERITY_WARN;
+  }
+  if (value == "error" || value == "2") {
+    return FaultMsg::SEVERITY_ERROR;
+  }
+  if (value == "critical" || value == "3") {
+    return FaultMsg::SEVERITY_CRITICAL;
+  }
+  return std::nullopt;
+}
+
+}  // namespace
+
+// ===== FaultEventFilter =====
+
+uint8_t FaultEventFilter::status_bit(const std::string & status) {
+  if (status == FaultMsg::STATUS_PREFAILED) {
+    return 1 << 0;
+  }
+  if (status == FaultMsg::STATUS_PREPASSED) {
+    return 1 << 1;
+  }
+  if (status == FaultMsg::STATUS_CONFIRMED) {
+    return 1 << 2;
+  }
+  if (status == FaultMsg::STATUS_HEALED) {
+    return 1 << 3;
+  }
+  if (status == FaultMsg::STATUS_CLEARED) {
+    return 1 << 4;
+  }
+  return 0;
+}
+
+uint8_t FaultEventFilter::event_type_bit(const std::string & event_type) {
+  if (event_type == FaultEvent::EVENT_CONFIRMED) {
+    return 1 << 0;
+  }
+  if (event_type == FaultEvent::EVENT_CLEARED) {
+    return 1 << 1;
+  }
+  if (event_type == FaultEvent::EVENT_UPDATED) {
+    return 1 << 2;
+  }
+  return 0;
+}
+
+tl::expected<FaultEventFilter, std::string> FaultEventFilter::from_query(const httplib::Request & req) {
+  FaultEventFilter filter;
+
+  if (req.has_param("status")) {
+    // Same values as the fault listings: pending = PREFAILED, all = no filtering
+    for (const auto & status : split_list(req.get_param_value("status"))) {
+      if (status == "pending") {
+        filter.status_mask |= status_bit(FaultMsg::STATUS_PREFAILED);
+      } else if (status == "confirmed") {
+        filter.status_mask |= status_bit(FaultMsg::STATUS_CONFIRMED);
+      } else if (status == "cleared") {
+        filter.status_mask |= status_bit(FaultMsg::STATUS_CLEARED);
+      } else if (status == "all") {
+        filter.status_mask = 0;
+        break;
+      } else {
+        return tl::make_unexpected("status");
+      }
+    }
+  }
+
+  if (req.has_param("min_severity")) {
+    auto severity = parse_severity(req.get_param_value("min_severity"));
+    if (!severity) {
+      return tl::make_unexpected("min_severity");
+    }
+    filter.min_severity = *severity;
+  }
+
+  if (req.has_param("event_type")) {
+    for (const auto & event_type : split_list(req.get_param_value("event_type"))) {
+      uint8_t bit = event_type_bit(event_type);
+      if (bit == 0) {
+        return tl::make_unexpected("event_type");
+      }
+      filter.event_type_mask |= bit;
+    }
+  }
+
+  return filter;
+}
+
+bool FaultEventFilter::set_entity(const ThreadSafeEntityCache & cache, const std::string & entity_id) {
+  auto entity = cache.find_entity(entity_id);
+  if (!entity) {
+    return false;
+  }
+  // Node FQNs are precomputed by the entity cache; an entity without bound nodes matches no fault
+  source_fqns = cache.get_entity_fqns(entity->type, entity_id);
+  return true;
+}
+
+bool FaultEventFilter::matches(const FaultEvent & event) const {
+  if (event.fault.severity < min_severity) {
+    return false;
+  }
+  if (status_mask != 0 && (status_mask & status_bit(event.fault.status)) == 0) {
+    return false;
+  }
+  if (event_type_mask != 0 && (event_type_mask & event_type_bit(event.event_type)) == 0) {
+    return false;
+  }
+  if (source_fqns) {
+    return std::any_of(event.fault.reporting_sources.begin(), event.fault.reporting_sources.end(),
+                       [this](const std::string & source) {
+                         return source_matches_fqns(source, *source_fqns);
+                       });
+  }
+  return true;
+}
+
+// ===== SSEFaultHandler =====
+
 SSEFaultHandler::SSEFaultHandler(HandlerContext & ctx) : ctx_(ctx) {
   // Read max clients limit from parameter
   max_sse_clients_ = static_cast<size_t>(ctx_.node()->get_parameter("sse.max_clients").as_int());
@@ -50,13 +200,17 @@ SSEFaultHandler::~SSEFaultHandler() {
 }
 
 void SSEFaultHandler::on_fault_event(const ros2_medkit_msgs::msg::FaultEvent::ConstSharedPtr & msg) {
-  uint64_t event_id = next_event_id_.fetch_add(1);
+  // Serialize once, outside the lock; clients only copy the shared pointer
+  std::string body = format_sse_event(*msg);
+  uint64_t event_id = 0;
 
   {
     std::lock_guard<std::mutex> lock(queue_mutex_);
+    event_id = next_event_id_++;
 
     // Add event to queue
-    event_queue_.emplace_back(event_id, *msg);
+    event_queue_.push_back(
+        {event_id, std::make_shared<const std::string>("id: " + std::to_string(event_id) + "\n" + body), msg});
 
     // Trim old events if buffer is full
     while (event_queue_.size() > kMaxBufferedEvents) {
@@ -72,8 +226,26 @@ void SSEFaultHandler::on_fault_event(const ros2_medkit_msgs::msg::FaultEvent::Co
 }
 
 void SSEFaultHandler::handle_stream(const httplib::Request & req, httplib::Response & res) {
-  // Check if we're at the client limit before accepting connection
-  if (client_count_.load() >= max_sse_clients_) {
+  // Compile the filter before accepting the connection
+  auto filter = FaultEventFilter::from_query(req);
+  if (!filter) {
+    HandlerContext::send_error(res, httplib::StatusCode::BadRequest_400, ERR_INVALID_PARAMETER,
+                               "Invalid " + filter.error() + " parameter value",
+                               {{"parameter", filter.error()}, {"value", req.get_param_value(filter.error())}});
+    return;
+  }
+
+  if (req.has_param("entity_id")) {
+    std::string entity_id = req.get_param_value("entity_id");
+    if (!filter->set_entity(ctx_.node()->get_thread_safe_cache(), entity_id)) {
+      HandlerContext::send_error(res, httplib::StatusCode::NotFound_404, ERR_ENTITY_NOT_FOUND, "Entity not found",
+                                 {{"entity_id", entity_id}});
+      return;
+    }
+  }
+
+  // Check if we're at the client limit (shared by all SSE streams) before accepting connection
+  if (ctx_.sse_connections().load() >= max_sse_clients_) {
     RCLCPP_WARN(HandlerContext::logger(), "SSE client limit reached (%zu), rejecting connection from %s",
                 max_sse_clients_, req.remote_addr.c_str());
     HandlerContext::send_error(res, httplib::StatusCode::ServiceUnavailable_503, ERR_SERVICE_UNAVAILABLE,
@@ -82,7 +254,7 @@ void SSEFaultHandler::handle_stream(const httplib::Request & req, httplib::Respo
   }
 
   RCLCPP_INFO(HandlerContext::logger(), "SSE client connected from %s (%zu/%zu)", req.remote_addr.c_str(),
-              client_count_.load() + 1, max_sse_clients_);
+              ctx_.sse_connections().load() + 1, max_sse_clients_);
 
   // Parse Last-Event-ID header for reconnection support
   uint64_t last_event_id = 0;
@@ -95,6 +267,7 @@ void SSEFaultHandler::handle_stream(const httplib::Request & req, httplib::Respo
   }
 
   client_count_.fetch_add(1);
+  ctx_.sse_connections().fetch_add(1);
 
   // Set SSE headers
   res.set_header("Content-Type", "text/event-stream");
@@ -105,22 +278,7 @@ void SSEFaultHandler::handle_stream(const httplib::Request & req, httplib::Respo
   // Use chunked content provider for streaming
   res.set_chunked_content_provider(
       "text/event-stream",
-      [this, last_event_id](size_t /*offset*/, httplib::DataSink & sink) mutable {
-        // First, send any buffered events the client missed (for reconnection)
-        {
-          std::lock_guard<std::mutex> lock(queue_mutex_);
-          for (const auto & [id, event] : event_queue_) {
-            if (id > last_event_id) {
-              std::string sse_msg = format_sse_event(event, id);
-              if (!sink.write(sse_msg.data(), sse_msg.size())) {
-                return false;  // Client disconnected
-              }
-              last_event_id = id;
-            }
-          }
-        }
-
-        // Wait for new events or keepalive timeout
+      [this, last_event_id, filter = std::move(*filter)](size_t /*offset*/, httplib::DataSink & sink) mutable {
         auto timeout = std::chrono::seconds(kKeepaliveIntervalSec);
         std::unique_lock<std::mutex> lock(queue_mutex_);
 
@@ -130,15 +288,32 @@ void SSEFaultHandler::handle_stream(const httplib::Request & req, httplib::Respo
             return false;  // Handler is shutting down
           }
 
-          // Wait for new event or timeout
-          auto status = queue_cv_.wait_for(lock, timeout);
+          // Next buffered event the client has not seen; this also replays missed events on reconnection
+          auto it = std::upper_bound(event_queue_.begin(), event_queue_.end(), last_event_id,
+                                     [](uint64_t id, const BufferedEvent & event) {
+                                       return id < event.id;
+                                     });
+          if (it != event_queue_.end()) {
+            if (!filter.matches(*it->event)) {
+              last_event_id = it->id;
+              continue;
+            }
 
-          // Check for shutdown after wakeup
-          if (shutdown_flag_.load()) {
-            return false;  // Handler is shutting down
+            // Hold a reference so the queue can change while writing
+            std::shared_ptr<const std::string> sse_msg = it->sse;
+            last_event_id = it->id;
+            lock.unlock();
+            if (!sink.write(sse_msg->data(), sse_msg->size())) {
+              return false;  // Client disconnected
+            }
+            lock.lock();
+            continue;
           }
 
-          if (status == std::cv_status::timeout) {
+          // Wait for new event or timeout
+          auto status = queue_cv_.wait_for(lock, timeout);
+
+          if (status == std::cv_status::timeout && !shutdown_flag_.load()) {
             // Send keepalive comment
             const char * keepalive = ":keepalive\n\n";
             lock.unlock();
@@ -146,34 +321,12 @@ void SSEFaultHandler::handle_stream(const httplib::Request & req, httplib::Respo
               return false;  // Client disconnected
             }
             lock.lock();
-            continue;
-          }
-
-          // Check for new events
-          bool found_new = false;
-          for (const auto & [id, event] : event_queue_) {
-            if (id > last_event_id) {
-              std::string sse_msg = format_sse_event(event, id);
-              lock.unlock();
-              if (!sink.write(sse_msg.data(), sse_msg.size())) {
-                return false;  // Client disconnected
-              }
-              lock.lock();
-              last_event_id = id;
-              found_new = true;
-            }
-          }
-
-          if (!found_new) {
-            // Spurious wakeup, continue waiting
-            continue;
           }
         }
-
-        return true;
       },
       [this, addr = req.remote_addr](bool success) {
         client_count_.fetch_sub(1);
+        ctx_.sse_connections().fetch_sub(1);
         RCLCPP_INFO(HandlerContext::logger(), "SSE client disconnected from %s (success=%d)", addr.c_str(), success);
       });
 }
@@ -182,7 +335,7 @@ size_t SSEFaultHandler::connected_clients() const {
   return client_count_.load();
 }
 
-std::string SSEFaultHandler::format_sse_event(const ros2_medkit_msgs::msg::FaultEvent & event, uint64_t event_id) {
+std::string SSEFaultHandler::format_sse_event(const ros2_medkit_msgs::msg::FaultEvent & event) {
   nlohmann::json json_event;
   json_event["event_type"] = event.event_type;
   json_event["fault"] = FaultManager::fault_to_json(event.fault);
@@ -191,12 +344,7 @@ std::string SSEFaultHandler::format_sse_event(const ros2_medkit_msgs::msg::Fault
   double timestamp_sec = static_cast<double>(event.timestamp.sec) + static_cast<double>(event.timestamp.nanosec) * 1e-9;
   json_event["timestamp"] = timestamp_sec;
 
-  std::ostringstream sse;
-  sse << "id: " << event_id << "\n";
-  sse << "event: " << event.event_type << "\n";
-  sse << "data: " << json_event.dump() << "\n\n";
-
-  return sse.str();
+  return "event: " + event.event_type + "\n" + "data: " + json_event.dump() + "\n\n";
 }
 
 }  // namespace handlers
@@ -17,9 +17,12 @@
 #include <rclcpp/rclcpp.hpp>
 #include <stdexcept>
 
+#include "ros2_medkit_gateway/http/worker_pool.hpp"
+
 namespace ros2_medkit_gateway {
 
-HttpServerManager::HttpServerManager(const TlsConfig & tls_config) : tls_config_(tls_config) {
+HttpServerManager::HttpServerManager(const TlsConfig & tls_config, const ServerLimitsConfig & limits)
+  : tls_config_(tls_config), limits_(limits) {
 #ifdef CPPHTTPLIB_OPENSSL_SUPPORT
   if (tls_config_.enabled) {
     // Create SSL server with certificate and key
@@ -49,6 +52,27 @@ HttpServerManager::HttpServerManager(const TlsConfig & tls_config) : tls_config_
   }
   server_ = std::make_unique<httplib::Server>();
 #endif
+  configure_limits();
+}
+
+void HttpServerManager::configure_limits() {
+  httplib::Server * srv = get_server();
+  if (!srv) {
+    return;
+  }
+
+  // httplib creates the task queue when listen() starts and owns it afterwards
+  const size_t worker_threads = limits_.worker_threads;
+  const size_t max_queued = limits_.max_queued_connections;
+  srv->new_task_queue = [worker_threads, max_queued]() {
+    return new WorkerPool(worker_threads, max_queued);
+  };
+  srv->set_keep_alive_max_count(limits_.keep_alive_max_count);
+  srv->set_keep_alive_timeout(limits_.keep_alive_timeout_sec);
+
+  RCLCPP_DEBUG(rclcpp::get_logger("http_server"),
+               "Worker pool: %zu threads, %zu queued connections; keep-alive: %zu requests, %ds", worker_threads,
+               max_queued, limits_.keep_alive_max_count, limits_.keep_alive_timeout_sec);
 }
 
 httplib::Server * HttpServerManager::get_server() {
@@ -0,0 +1,231 @@
+// Copyright 2026 bburda
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+#include "ros2_medkit_gateway/http/response_compression.hpp"
+
+#include <zlib.h>
+#include <zstd.h>
+
+#include <algorithm>
+#include <cctype>
+#include <cstdlib>
+#include <utility>
+
+namespace ros2_medkit_gateway {
+
+namespace {
+
+std::string trim_lower(const std::string & s) {
+  size_t start = s.find_first_not_of(" \t");
+  if (start == std::string::npos) {
+    return "";
+  }
+  size_t end = s.find_last_not_of(" \t");
+  std::string out = s.substr(start, end - start + 1);
+  std::transform(out.begin(), out.end(), out.begin(), [](unsigned char c) {
+    return static_cast<char>(std::tolower(c));
+  });
+  return out;
+}
+
+/// Parse the q parameter of a coding (defaults to 1.0)
+double parse_quality(const std::string & params) {
+  size_t pos = 0;
+  while (pos < params.size()) {
+    size_t next = params.find(';', pos);
+    std::string param = trim_lower(params.substr(pos, next == std::string::npos ? std::string::npos : next - pos));
+    if (param.rfind("q=", 0) == 0) {
+      char * end = nullptr;
+      double q = std::strtod(param.c_str() + 2, &end);
+      if (end == param.c_str() + 2) {
+        return 1.0;
+      }
+      return std::clamp(q, 0.0, 1.0);
+    }
+    if (next == std::string::npos) {
+      break;
+    }
+    pos = next + 1;
+  }
+  return 1.0;
+}
+
+std::optional<std::string> gzip_compress(const std::string & body, int level) {
+  z_stream stream{};
+  // windowBits 15 + 16 selects the gzip wrapper instead of raw zlib
+  if (deflateInit2(&stream, level, Z_DEFLATED, 15 + 16, 8, Z_DEFAULT_STRATEGY) != Z_OK) {
+    return std::nullopt;
+  }
+
+  std::string out;
+  out.resize(deflateBound(&stream, static_cast<uLong>(body.size())));
+  stream.next_in = reinterpret_cast<Bytef *>(const_cast<char *>(body.data()));
+  stream.avail_in = static_cast<uInt>(body.size());
+  stream.next_out = reinterpret_cast<Bytef *>(out.data());
+  stream.avail_out = static_cast<uInt>(out.size());
+
+  int ret = deflate(&stream, Z_FINISH);
+  deflateEnd(&stream);
+  if (ret != Z_STREAM_END) {
+    return std::nullopt;
+  }
+  out.resize(stream.total_out);
+  return out;
+}
+
+std::optional<std::string> zstd_compress(const std::string & body, int level) {
+  std::string out;
+  out.resize(ZSTD_compressBound(body.size()));
+  size_t written = ZSTD_compress(out.data(), out.size(), body.data(), body.size(), level);
+  if (ZSTD_isError(written)) {
+    return std::nullopt;
+  }
+  out.resize(written);
+  return out;
+}
+
+bool is_path_excluded(const std::string & path, const std::vector<std::string> & excluded_paths) {
+  return std::any_of(excluded_paths.begin(), excluded_paths.end(), [&path](const std::string & pattern) {
+    return !pattern.empty() && path.find(pattern) != std::string::npos;
+  });
+}
+
+}  // namespace
+
+ContentEncoding negotiate_content_encoding(const std::string & accept_encoding) {
+  double gzip_q = 0.0;
+  double zstd_q = 0.0;
+  double wildcard_q = -1.0;  // -1 = not listed
+  bool gzip_listed = false;
+  bool zstd_listed = false;
+
+  size_t pos = 0;
+  while (pos < accept_encoding.size()) {
+    size_t next = accept_encoding.find(',', pos);
+    std::string entry = accept_encoding.substr(pos, next == std::string::npos ? std::string::npos : next - pos);
+    pos = next == std::string::npos ? accept_encoding.size() : next + 1;
+
+    size_t semicolon = entry.find(';');
+    std::string coding = trim_lower(entry.substr(0, semicolon));
+    double q = semicolon == std::string::npos ? 1.0 : parse_quality(entry.substr(semicolon + 1));
+
+    if (coding == "zstd") {
+      zstd_q = q;
+      zstd_listed = true;
+    } else if (coding == "gzip" || coding == "x-gzip") {
+      gzip_q = q;
+      gzip_listed = true;
+    } else if (coding == "*") {
+      wildcard_q = q;
+    }
+  }
+
+  // A wildcard covers gzip unless gzip was listed explicitly
+  if (!gzip_listed && wildcard_q > 0.0) {
+    gzip_q = wildcard_q;
+  }
+
+  if (zstd_listed && zstd_q > 0.0 && zstd_q >= gzip_q) {
+    return ContentEncoding::ZSTD;
+  }
+  if (gzip_q > 0.0) {
+    return ContentEncoding::GZIP;
+  }
+  return ContentEncoding::IDENTITY;
+}
+
+const char * content_encoding_token(ContentEncoding encoding) {
+  switch (encoding) {
+    case ContentEncoding::GZIP:
+      return "gzip";
+    case ContentEncoding::ZSTD:
+      return "zstd";
+    case ContentEncoding::IDENTITY:
+    default:
+      return "";
+  }
+}
+
+bool is_compressible_content_type(const std::string & content_type) {
+  std::string type = trim_lower(content_type.substr(0, content_type.find(';')));
+  if (type.empty()) {
+    return false;
+  }
+  if (type == "text/event-stream") {
+    return false;  // SSE must be flushed event by event
+  }
+  if (type.rfind("text/", 0) == 0) {
+    return true;
+  }
+  return type == "application/json" || type == "application/cbor" || type == "application/msgpack" ||
+         type == "application/x-msgpack" || type == "application/vnd.msgpack" || type == "application/xml" ||
+         type == "application/yaml" || type == "application/x-yaml" || type == "application/javascript" ||
+         (type.size() > 5 && type.compare(type.size() - 5, 5, "+json") == 0);
+}
+
+std::optional<std::string> compress_body(const std::string & body, ContentEncoding encoding, int level) {
+  switch (encoding) {
+    case ContentEncoding::GZIP:
+      return gzip_compress(body, level);
+    case ContentEncoding::ZSTD:
+      return zstd_compress(body, level);
+    case ContentEncoding::IDENTITY:
+    default:
+      return std::nullopt;
+  }
+}
+
+bool apply_response_compression(const httplib::Request & req, httplib::Response & res,
+                                const CompressionConfig & config) {
+  if (!config.enabled) {
+    return false;
+  }
+  // Streamed responses (SSE, bulk-data downloads) have no buffered body
+  if (res.body.empty() || res.content_provider_) {
+    return false;
+  }
+  if (res.has_header("Content-Encoding")) {
+    return false;
+  }
+  if (!is_compressible_content_type(res.get_header_value("Content-Type"))) {
+    return false;
+  }
+  if (is_path_excluded(req.path, config.excluded_paths)) {
+    return false;
+  }
+
+  // The representation now depends on Accept-Encoding, even if it stays uncompressed below
+  res.set_header("Vary", "Accept-Encoding");
+
+  if (res.body.size() < config.min_size_bytes) {
+    return false;
+  }
+
+  ContentEncoding encoding = negotiate_content_encoding(req.get_header_value("Accept-Encoding"));
+  if (encoding == ContentEncoding::IDENTITY) {
+    return false;
+  }
+
+  int level = encoding == ContentEncoding::ZSTD ? config.zstd_level : config.gzip_level;
+  auto compressed = compress_body(res.body, encoding, level);
+  if (!compressed || compressed->size() >= res.body.size()) {
+    return false;
+  }
+
+  res.body = std::move(*compressed);
+  res.set_header("Content-Encoding", content_encoding_token(encoding));
+  return true;
+}
+
+}  // namespace ros2_medkit_gateway
@@ -21,21 +21,39 @@
 #include "ros2_medkit_gateway/gateway_node.hpp"
 #include "ros2_medkit_gateway/http/error_codes.hpp"
 #include "ros2_medkit_gateway/http/http_utils.hpp"
+#include "ros2_medkit_gateway/http/response_compression.hpp"
 
 using httplib::StatusCode;
 
 namespace ros2_medkit_gateway {
 
+namespace {
+
+/// Adapt a handler member function to a RouteDispatcher::Handler
+template <typename Handlers>
+RouteDispatcher::Handler bind_handler(Handlers * handlers,
+                                      void (Handlers::*method)(const httplib::Request &, httplib::Response &)) {
+  return [handlers, method](const httplib::Request & req, httplib::Response & res) {
+    (handlers->*method)(req, res);
+  };
+}
+
+}  // namespace
+
 RESTServer::RESTServer(GatewayNode * node, const std::string & host, int port, const CorsConfig & cors_config,
-                       const AuthConfig & auth_config, const TlsConfig & tls_config)
+                       const AuthConfig & auth_config, const TlsConfig & tls_config,
+                       const CompressionConfig & compression_config, const ServerLimitsConfig & server_limits)
   : node_(node)
   , host_(host)
   , port_(port)
   , cors_config_(cors_config)
   , auth_config_(auth_config)
-  , tls_config_(tls_config) {
+  , tls_config_(tls_config)
+  , compression_config_(compression_config)
+  , server_limits_(server_limits)
+  , slow_routes_(server_limits.slow_route_concurrency, server_limits.slow_route_queue) {
   // Create HTTP/HTTPS server manager
-  http_server_ = std::make_unique<HttpServerManager>(tls_config_);
+  http_server_ = std::make_unique<HttpServerManager>(tls_config_, server_limits_);
 
   // Initialize auth manager and middleware if auth is enabled
   if (auth_config_.enabled) {
@@ -52,7 +70,7 @@ RESTServer::RESTServer(GatewayNode * node, const std::string & host, int port, c
   handler_ctx_ =
       std::make_unique<handlers::HandlerContext>(node_, cors_config_, auth_config_, tls_config_, auth_manager_.get());
 
-  health_handlers_ = std::make_unique<handlers::HealthHandlers>(*handler_ctx_);
+  health_handlers_ = std::make_unique<handlers::HealthHandlers>(*handler_ctx_, routes_);
   discovery_handlers_ = std::make_unique<handlers::DiscoveryHandlers>(*handler_ctx_);
   data_handlers_ = std::make_unique<handlers::DataHandlers>(*handler_ctx_);
   operation_handlers_ = std::make_unique<handlers::OperationHandlers>(*handler_ctx_);
@@ -60,12 +78,15 @@ RESTServer::RESTServer(GatewayNode * node, const std::string & host, int port, c
   fault_handlers_ = std::make_unique<handlers::FaultHandlers>(*handler_ctx_);
   auth_handlers_ = std::make_unique<handlers::AuthHandlers>(*handler_ctx_);
   sse_fault_handler_ = std::make_unique<handlers::SSEFaultHandler>(*handler_ctx_);
+  sse_execution_handler_ = std::make_unique<handlers::SSEExecutionHandler>(*handler_ctx_);
   bulkdata_handlers_ = std::make_unique<handlers::BulkDataHandlers>(*handler_ctx_);
 
   // Set up global error handlers for SOVD GenericError compliance
   setup_global_error_handlers();
   // Set up pre-routing handler for CORS and Authentication
   setup_pre_routing_handler();
+  // Set up post-routing handler for response compression
+  setup_post_routing_handler();
   setup_routes();
 }
 
@@ -106,6 +127,13 @@ void RESTServer::setup_pre_routing_handler() {
       }
     }
 
+    // Connections that overflowed the worker queue are only told to retry later;
+    // health checks are cheap and cache-free, so they are still answered
+    if (WorkerPool::is_overflow_task() && req.path != api_path("/health")) {
+      send_overloaded(res, "worker_queue");
+      return httplib::Server::HandlerResponse::Handled;
+    }
+
     // Handle Authentication if enabled
     if (auth_middleware_ && auth_middleware_->is_enabled()) {
       // Use AuthMiddleware to process the request
@@ -122,6 +150,43 @@ void RESTServer::setup_pre_routing_handler() {
   });
 }
 
+void RESTServer::setup_post_routing_handler() {
+  httplib::Server * srv = http_server_->get_server();
+  if (!srv || !compression_config_.enabled) {
+    return;
+  }
+
+  RCLCPP_INFO(rclcpp::get_logger("rest_server"),
+              "Response compression enabled - min_size: %zu bytes, gzip_level: %d, zstd_level: %d",
+              compression_config_.min_size_bytes, compression_config_.gzip_level, compression_config_.zstd_level);
+
+  // Runs after the route (and error/exception) handlers, before headers are written
+  srv->set_post_routing_handler([this](const httplib::Request & req, httplib::Response & res) {
+    apply_response_compression(req, res, compression_config_);
+  });
+}
+
+RouteDispatcher::Handler RESTServer::limit_slow(RouteDispatcher::Handler handler) {
+  return [this, handler = std::move(handler)](const httplib::Request & req, httplib::Response & res) {
+    auto permit = slow_routes_.acquire();
+    if (!permit) {
+      send_overloaded(res, "slow_routes");
+      return;
+    }
+    handler(req, res);
+  };
+}
+
+void RESTServer::send_overloaded(httplib::Response & res, const char * reason) const {
+  handlers::HandlerContext::send_error(res, StatusCode::ServiceUnavailable_503, ERR_SERVICE_UNAVAILABLE,
+                                       "Gateway is saturated, retry later");
+  res.set_header("Retry-After", std::to_string(server_limits_.retry_after_sec));
+  res.set_header("Connection", "close");
+  if (MetricsRegistry * metrics = node_->get_metrics_registry()) {
+    metrics->increment("medkit_http_rejected_requests_total", {{"reason", reason}});
+  }
+}
+
 void RESTServer::setup_global_error_handlers() {
   httplib::Server * srv = http_server_->get_server();
   if (!srv) {
@@ -173,6 +238,9 @@ void RESTServer::setup_global_error_handlers() {
 
 RESTServer::~RESTServer() {
   stop();
+  if (sse_metrics_collector_ != 0) {
+    node_->get_metrics_registry()->remove_collector(sse_metrics_collector_);
+  }
 }
 
 void RESTServer::setup_routes() {
@@ -181,668 +249,163 @@ void RESTServer::setup_routes() {
     throw std::runtime_error("No server instance available for route setup");
   }
 
-  // Health check
-  srv->Get(api_path("/health"), [this](const httplib::Request & req, httplib::Response & res) {
-    health_handlers_->handle_health(req, res);
-  });
+  // All routes are declared here as path templates and compiled into a segment trie
+  // (see RouteDispatcher): {name} captures one segment, {name+} captures the rest of
+  // the path including slashes (topic and parameter names decoded from %2F).
+  auto & r = routes_;
 
-  // Root - server capabilities and entry points (REQ_INTEROP_010)
-  srv->Get(api_path("/"), [this](const httplib::Request & req, httplib::Response & res) {
-    health_handlers_->handle_root(req, res);
-  });
+  // Handlers that block on ROS round-trips (topic sampling, service and parameter calls,
+  // fault manager queries) share a bounded number of workers; the rest stay free for
+  // cache-served routes and health checks.
+  auto slow = [this](RouteDispatcher::Handler handler) {
+    return limit_slow(std::move(handler));
+  };
 
+  // Health check
+  r.add("GET", api_path("/health"), bind_handler(health_handlers_.get(), &handlers::HealthHandlers::handle_health));
+  // Root - server capabilities and entry points (REQ_INTEROP_010)
+  r.add("GET", api_path("/"), bind_handler(health_handlers_.get(), &handlers::HealthHandlers::handle_root));
   // Version info (REQ_INTEROP_001)
-  srv->Get(api_path("/version-info"), [this](const httplib::Request & req, httplib::Response & res) {
-    health_handlers_->handle_version_info(req, res);
-  });
-
-  // Areas
-  srv->Get(api_path("/areas"), [this](const httplib::Request & req, httplib::Response & res) {
-    discovery_handlers_->handle_list_areas(req, res);
-  });
-
-  // Apps - must register before /apps/{id} to avoid regex conflict
-  srv->Get(api_path("/apps"), [this](const httplib::Request & req, httplib::Response & res) {
-    discovery_handlers_->handle_list_apps(req, res);
-  });
-
-  // App data item (specific topic) - register before /apps/{id}/data
-  srv->Get((api_path("/apps") + R"(/([^/]+)/data/(.+)$)"),
-           [this](const httplib::Request & req, httplib::Response & res) {
-             data_handlers_->handle_get_data_item(req, res);
-           });
-
-  // App data write (PUT) - publish data to topic
-  srv->Put((api_path("/apps") + R"(/([^/]+)/data/(.+)$)"),
-           [this](const httplib::Request & req, httplib::Response & res) {
-             data_handlers_->handle_put_data_item(req, res);
-           });
-
-  // App data-categories (not implemented for ROS 2)
-  srv->Get((api_path("/apps") + R"(/([^/]+)/data-categories$)"),
-           [this](const httplib::Request & req, httplib::Response & res) {
-             data_handlers_->handle_data_categories(req, res);
-           });
-
-  // App data-groups (not implemented for ROS 2)
-  srv->Get((api_path("/apps") + R"(/([^/]+)/data-groups$)"),
-           [this](const httplib::Request & req, httplib::Response & res) {
-             data_handlers_->handle_data_groups(req, res);
-           });
-
-  // App data (all topics)
-  srv->Get((api_path("/apps") + R"(/([^/]+)/data$)"), [this](const httplib::Request & req, httplib::Response & res) {
-    data_handlers_->handle_list_data(req, res);
-  });
-
-  // App operations
-  srv->Get((api_path("/apps") + R"(/([^/]+)/operations$)"),
-           [this](const httplib::Request & req, httplib::Response & res) {
-             operation_handlers_->handle_list_operations(req, res);
-           });
-
-  // App operation details (GET) - get single operation info
-  srv->Get((api_path("/apps") + R"(/([^/]+)/operations/([^/]+)$)"),
-           [this](const httplib::Request & req, httplib::Response & res) {
-             operation_handlers_->handle_get_operation(req, res);
-           });
-
-  // Execution endpoints for apps
-  // POST /{entity}/operations/{op-id}/executions - start execution
-  srv->Post((api_path("/apps") + R"(/([^/]+)/operations/([^/]+)/executions$)"),
-            [this](const httplib::Request & req, httplib::Response & res) {
-              operation_handlers_->handle_create_execution(req, res);
-            });
-
-  // GET /{entity}/operations/{op-id}/executions - list executions
-  srv->Get((api_path("/apps") + R"(/([^/]+)/operations/([^/]+)/executions$)"),
-           [this](const httplib::Request & req, httplib::Response & res) {
-             operation_handlers_->handle_list_executions(req, res);
-           });
-
-  // GET /{entity}/operations/{op-id}/executions/{exec-id} - get execution status
-  srv->Get((api_path("/apps") + R"(/([^/]+)/operations/([^/]+)/executions/([^/]+)$)"),
-           [this](const httplib::Request & req, httplib::Response & res) {
-             operation_handlers_->handle_get_execution(req, res);
-           });
-
-  // PUT /{entity}/operations/{op-id}/executions/{exec-id} - update execution
-  srv->Put((api_path("/apps") + R"(/([^/]+)/operations/([^/]+)/executions/([^/]+)$)"),
-           [this](const httplib::Request & req, httplib::Response & res) {
-             operation_handlers_->handle_update_execution(req, res);
-           });
-
-  // DELETE /{entity}/operations/{op-id}/executions/{exec-id} - cancel execution
-  srv->Delete((api_path("/apps") + R"(/([^/]+)/operations/([^/]+)/executions/([^/]+)$)"),
-              [this](const httplib::Request & req, httplib::Response & res) {
-                operation_handlers_->handle_cancel_execution(req, res);
-              });
-
-  // App configurations - list all
-  srv->Get((api_path("/apps") + R"(/([^/]+)/configurations$)"),
-           [this](const httplib::Request & req, httplib::Response & res) {
-             config_handlers_->handle_list_configurations(req, res);
-           });
-
-  // App configurations - get specific
-  // Use (.+) for config_id to accept slashes from percent-encoded URLs (%2F -> /)
-  // ROS2 parameters like qos_overrides./parameter_events.publisher.depth contain slashes
-  srv->Get((api_path("/apps") + R"(/([^/]+)/configurations/(.+)$)"),
-           [this](const httplib::Request & req, httplib::Response & res) {
-             config_handlers_->handle_get_configuration(req, res);
-           });
-
-  // App configurations - set
-  srv->Put((api_path("/apps") + R"(/([^/]+)/configurations/(.+)$)"),
-           [this](const httplib::Request & req, httplib::Response & res) {
-             config_handlers_->handle_set_configuration(req, res);
-           });
-
-  // App configurations - delete single
-  srv->Delete((api_path("/apps") + R"(/([^/]+)/configurations/(.+)$)"),
-              [this](const httplib::Request & req, httplib::Response & res) {
-                config_handlers_->handle_delete_configuration(req, res);
-              });
-
-  // App configurations - delete all
-  srv->Delete((api_path("/apps") + R"(/([^/]+)/configurations$)"),
-              [this](const httplib::Request & req, httplib::Response & res) {
-                config_handlers_->handle_delete_all_configurations(req, res);
-              });
-
-  // App depends-on (relationship endpoint)
-  srv->Get((api_path("/apps") + R"(/([^/]+)/depends-on$)"),
-           [this](const httplib::Request & req, httplib::Response & res) {
-             discovery_handlers_->handle_app_depends_on(req, res);
-           });
-
-  // Single app (capabilities) - must be after more specific routes
-  srv->Get((api_path("/apps") + R"(/([^/]+)$)"), [this](const httplib::Request & req, httplib::Response & res) {
-    discovery_handlers_->handle_get_app(req, res);
-  });
-
-  // Functions - list all functions
-  srv->Get(api_path("/functions"), [this](const httplib::Request & req, httplib::Response & res) {
-    discovery_handlers_->handle_list_functions(req, res);
-  });
-
-  // Function hosts
-  srv->Get((api_path("/functions") + R"(/([^/]+)/hosts$)"),
-           [this](const httplib::Request & req, httplib::Response & res) {
-             discovery_handlers_->handle_function_hosts(req, res);
-           });
-
-  // Function data item (specific topic) - register before /functions/{id}/data
-  srv->Get((api_path("/functions") + R"(/([^/]+)/data/(.+)$)"),
-           [this](const httplib::Request & req, httplib::Response & res) {
-             data_handlers_->handle_get_data_item(req, res);
-           });
-
-  // Function data write (PUT) - publish data to topic
-  srv->Put((api_path("/functions") + R"(/([^/]+)/data/(.+)$)"),
-           [this](const httplib::Request & req, httplib::Response & res) {
-             data_handlers_->handle_put_data_item(req, res);
-           });
-
-  // Function data (aggregated from host apps)
-  srv->Get((api_path("/functions") + R"(/([^/]+)/data$)"),
-           [this](const httplib::Request & req, httplib::Response & res) {
-             data_handlers_->handle_list_data(req, res);
-           });
-
-  // Function operations (aggregated from host apps)
-  srv->Get((api_path("/functions") + R"(/([^/]+)/operations$)"),
-           [this](const httplib::Request & req, httplib::Response & res) {
-             operation_handlers_->handle_list_operations(req, res);
-           });
-
-  // Function operation details (GET) - get single operation info
-  srv->Get((api_path("/functions") + R"(/([^/]+)/operations/([^/]+)$)"),
-           [this](const httplib::Request & req, httplib::Response & res) {
-             operation_handlers_->handle_get_operation(req, res);
-           });
-
-  // Execution endpoints for functions
-  srv->Post((api_path("/functions") + R"(/([^/]+)/operations/([^/]+)/executions$)"),
-            [this](const httplib::Request & req, httplib::Response & res) {
-              operation_handlers_->handle_create_execution(req, res);
-            });
-
-  srv->Get((api_path("/functions") + R"(/([^/]+)/operations/([^/]+)/executions$)"),
-           [this](const httplib::Request & req, httplib::Response & res) {
-             operation_handlers_->handle_list_executions(req, res);
-           });
-
-  srv->Get((api_path("/functions") + R"(/([^/]+)/operations/([^/]+)/executions/([^/]+)$)"),
-           [this](const httplib::Request & req, httplib::Response & res) {
-             operation_handlers_->handle_get_execution(req, res);
-           });
-
-  srv->Put((api_path("/functions") + R"(/([^/]+)/operations/([^/]+)/executions/([^/]+)$)"),
-           [this](const httplib::Request & req, httplib::Response & res) {
-             operation_handlers_->handle_update_execution(req, res);
-           });
-
-  srv->Delete((api_path("/functions") + R"(/([^/]+)/operations/([^/]+)/executions/([^/]+)$)"),
-              [this](const httplib::Request & req, httplib::Response & res) {
-                operation_handlers_->handle_cancel_execution(req, res);
-              });
-
-  // Function configurations
-  srv->Get((api_path("/functions") + R"(/([^/]+)/configurations$)"),
-           [this](const httplib::Request & req, httplib::Response & res) {
-             config_handlers_->handle_list_configurations(req, res);
-           });
-
-  srv->Get((api_path("/functions") + R"(/([^/]+)/configurations/(.+)$)"),
-           [this](const httplib::Request & req, httplib::Response & res) {
-             config_handlers_->handle_get_configuration(req, res);
-           });
-
-  srv->Put((api_path("/functions") + R"(/([^/]+)/configurations/(.+)$)"),
-           [this](const httplib::Request & req, httplib::Response & res) {
-             config_handlers_->handle_set_configuration(req, res);
-           });
-
-  srv->Delete((api_path("/functions") + R"(/([^/]+)/configurations/(.+)$)"),
-              [this](const httplib::Request & req, httplib::Response & res) {
-                config_handlers_->handle_delete_configuration(req, res);
-              });
-
-  srv->Delete((api_path("/functions") + R"(/([^/]+)/configurations$)"),
-              [this](const httplib::Request & req, httplib::Response & res) {
-                config_handlers_->handle_delete_all_configurations(req, res);
-              });
-
-  // Function faults
-  srv->Get((api_path("/functions") + R"(/([^/]+)/faults$)"),
-           [this](const httplib::Request & req, httplib::Response & res) {
-             fault_handlers_->handle_list_faults(req, res);
-           });
-
-  srv->Get((api_path("/functions") + R"(/([^/]+)/faults/([^/]+)$)"),
-           [this](const httplib::Request & req, httplib::Response & res) {
-             fault_handlers_->handle_get_fault(req, res);
-           });
-
-  srv->Delete((api_path("/functions") + R"(/([^/]+)/faults/([^/]+)$)"),
-              [this](const httplib::Request & req, httplib::Response & res) {
-                fault_handlers_->handle_clear_fault(req, res);
-              });
-
-  srv->Delete((api_path("/functions") + R"(/([^/]+)/faults$)"),
-              [this](const httplib::Request & req, httplib::Response & res) {
-                fault_handlers_->handle_clear_all_faults(req, res);
-              });
-
-  // Single function (capabilities) - must be after more specific routes
-  srv->Get((api_path("/functions") + R"(/([^/]+)$)"), [this](const httplib::Request & req, httplib::Response & res) {
-    discovery_handlers_->handle_get_function(req, res);
-  });
-
-  // Components
-  srv->Get(api_path("/components"), [this](const httplib::Request & req, httplib::Response & res) {
-    discovery_handlers_->handle_list_components(req, res);
-  });
-
-  // Area components
-  srv->Get((api_path("/areas") + R"(/([^/]+)/components)"),
-           [this](const httplib::Request & req, httplib::Response & res) {
-             discovery_handlers_->handle_area_components(req, res);
-           });
-
-  // Area subareas (relationship endpoint)
-  srv->Get((api_path("/areas") + R"(/([^/]+)/subareas$)"),
-           [this](const httplib::Request & req, httplib::Response & res) {
-             discovery_handlers_->handle_get_subareas(req, res);
-           });
-
-  // Area contains
-  srv->Get((api_path("/areas") + R"(/([^/]+)/contains$)"),
-           [this](const httplib::Request & req, httplib::Response & res) {
-             discovery_handlers_->handle_get_contains(req, res);
-           });
-
-  // Area data item (specific topic) - register before /areas/{id}/data
-  srv->Get((api_path("/areas") + R"(/([^/]+)/data/(.+)$)"),
-           [this](const httplib::Request & req, httplib::Response & res) {
-             data_handlers_->handle_get_data_item(req, res);
-           });
-
-  // Area data write (PUT) - publish data to topic
-  srv->Put((api_path("/areas") + R"(/([^/]+)/data/(.+)$)"),
-           [this](const httplib::Request & req, httplib::Response & res) {
-             data_handlers_->handle_put_data_item(req, res);
-           });
-
-  // Area data (aggregated from contained components)
-  srv->Get((api_path("/areas") + R"(/([^/]+)/data$)"), [this](const httplib::Request & req, httplib::Response & res) {
-    data_handlers_->handle_list_data(req, res);
-  });
-
-  // Area operations
-  srv->Get((api_path("/areas") + R"(/([^/]+)/operations$)"),
-           [this](const httplib::Request & req, httplib::Response & res) {
-             operation_handlers_->handle_list_operations(req, res);
-           });
-
-  // Area operation details (GET) - get single operation info
-  srv->Get((api_path("/areas") + R"(/([^/]+)/operations/([^/]+)$)"),
-           [this](const httplib::Request & req, httplib::Response & res) {
-             operation_handlers_->handle_get_operation(req, res);
-           });
-
-  // Execution endpoints for areas
-  srv->Post((api_path("/areas") + R"(/([^/]+)/operations/([^/]+)/executions$)"),
-            [this](const httplib::Request & req, httplib::Response & res) {
-              operation_handlers_->handle_create_execution(req, res);
-            });
-
-  srv->Get((api_path("/areas") + R"(/([^/]+)/operations/([^/]+)/executions$)"),
-           [this](const httplib::Request & req, httplib::Response & res) {
-             operation_handlers_->handle_list_executions(req, res);
-           });
-
-  srv->Get((api_path("/areas") + R"(/([^/]+)/operations/([^/]+)/executions/([^/]+)$)"),
-           [this](const httplib::Request & req, httplib::Response & res) {
-             operation_handlers_->handle_get_execution(req, res);
-           });
-
-  srv->Put((api_path("/areas") + R"(/([^/]+)/operations/([^/]+)/executions/([^/]+)$)"),
-           [this](const httplib::Request & req, httplib::Response & res) {
-             operation_handlers_->handle_update_execution(req, res);
-           });
-
-  srv->Delete((api_path("/areas") + R"(/([^/]+)/operations/([^/]+)/executions/([^/]+)$)"),
-              [this](const httplib::Request & req, httplib::Response & res) {
-                operation_handlers_->handle_cancel_execution(req, res);
-              });
-
-  // Area configurations
-  srv->Get((api_path("/areas") + R"(/([^/]+)/configurations$)"),
-           [this](const httplib::Request & req, httplib::Response & res) {
-             config_handlers_->handle_list_configurations(req, res);
-           });
-
-  srv->Get((api_path("/areas") + R"(/([^/]+)/configurations/(.+)$)"),
-           [this](const httplib::Request & req, httplib::Response & res) {
-             config_handlers_->handle_get_configuration(req, res);
-           });
-
-  srv->Put((api_path("/areas") + R"(/([^/]+)/configurations/(.+)$)"),
-           [this](const httplib::Request & req, httplib::Response & res) {
-             config_handlers_->handle_set_configuration(req, res);
-           });
-
-  srv->Delete((api_path("/areas") + R"(/([^/]+)/configurations/(.+)$)"),
-              [this](const httplib::Request & req, httplib::Response & res) {
-                config_handlers_->handle_delete_configuration(req, res);
-              });
-
-  srv->Delete((api_path("/areas") + R"(/([^/]+)/configurations$)"),
-              [this](const httplib::Request & req, httplib::Response & res) {
-                config_handlers_->handle_delete_all_configurations(req, res);
-              });
-
-  // Area faults
-  srv->Get((api_path("/areas") + R"(/([^/]+)/faults$)"), [this](const httplib::Request & req, httplib::Response & res) {
-    fault_handlers_->handle_list_faults(req, res);
-  });
-
-  srv->Get((api_path("/areas") + R"(/([^/]+)/faults/([^/]+)$)"),
-           [this](const httplib::Request & req, httplib::Response & res) {
-             fault_handlers_->handle_get_fault(req, res);
-           });
-
-  srv->Delete((api_path("/areas") + R"(/([^/]+)/faults/([^/]+)$)"),
-              [this](const httplib::Request & req, httplib::Response & res) {
-                fault_handlers_->handle_clear_fault(req, res);
-              });
-
-  srv->Delete((api_path("/areas") + R"(/([^/]+)/faults$)"),
-              [this](const httplib::Request & req, httplib::Response & res) {
-                fault_handlers_->handle_clear_all_faults(req, res);
-              });
-
-  // Single area (capabilities) - must be after more specific routes
-  srv->Get((api_path("/areas") + R"(/([^/]+)$)"), [this](const httplib::Request & req, httplib::Response & res) {
-    discovery_handlers_->handle_get_area(req, res);
-  });
-
-  // Component topic data (specific topic) - register before general route
-  // Use (.+) for topic_name to accept slashes from percent-encoded URLs (%2F -> /)
-  srv->Get((api_path("/components") + R"(/([^/]+)/data/(.+)$)"),
-           [this](const httplib::Request & req, httplib::Response & res) {
-             data_handlers_->handle_get_data_item(req, res);
-           });
-
-  // Component data (all topics)
-  srv->Get((api_path("/components") + R"(/([^/]+)/data$)"),
-           [this](const httplib::Request & req, httplib::Response & res) {
-             data_handlers_->handle_list_data(req, res);
-           });
-
-  // Component subcomponents (relationship endpoint)
-  srv->Get((api_path("/components") + R"(/([^/]+)/subcomponents$)"),
-           [this](const httplib::Request & req, httplib::Response & res) {
-             discovery_handlers_->handle_get_subcomponents(req, res);
-           });
-
-  // Component hosts
-  srv->Get((api_path("/components") + R"(/([^/]+)/hosts$)"),
-           [this](const httplib::Request & req, httplib::Response & res) {
-             discovery_handlers_->handle_get_hosts(req, res);
-           });
-
-  // Component depends-on (relationship endpoint)
-  srv->Get((api_path("/components") + R"(/([^/]+)/depends-on$)"),
-           [this](const httplib::Request & req, httplib::Response & res) {
-             discovery_handlers_->handle_component_depends_on(req, res);
-           });
-
-  // Single component (capabilities) - must be after more specific routes
-  srv->Get((api_path("/components") + R"(/([^/]+)$)"), [this](const httplib::Request & req, httplib::Response & res) {
-    discovery_handlers_->handle_get_component(req, res);
-  });
+  r.add("GET", api_path("/version-info"),
+        bind_handler(health_handlers_.get(), &handlers::HealthHandlers::handle_version_info));
+
+  // Entity collections
+  auto * discovery = discovery_handlers_.get();
+  r.add("GET", api_path("/areas"), bind_handler(discovery, &handlers::DiscoveryHandlers::handle_list_areas));
+  r.add("GET", api_path("/components"), bind_handler(discovery, &handlers::DiscoveryHandlers::handle_list_components));
+  r.add("GET", api_path("/apps"), bind_handler(discovery, &handlers::DiscoveryHandlers::handle_list_apps));
+  r.add("GET", api_path("/functions"), bind_handler(discovery, &handlers::DiscoveryHandlers::handle_list_functions));
+
+  // Single entity (capabilities)
+  const std::string area = api_path("/areas/{area_id}");
+  const std::string component = api_path("/components/{component_id}");
+  const std::string app = api_path("/apps/{app_id}");
+  const std::string function = api_path("/functions/{function_id}");
+  r.add("GET", area, bind_handler(discovery, &handlers::DiscoveryHandlers::handle_get_area));
+  r.add("GET", component, bind_handler(discovery, &handlers::DiscoveryHandlers::handle_get_component));
+  r.add("GET", app, bind_handler(discovery, &handlers::DiscoveryHandlers::handle_get_app));
+  r.add("GET", function, bind_handler(discovery, &handlers::DiscoveryHandlers::handle_get_function));
+
+  // Relationship endpoints
+  r.add("GET", area + "/components", bind_handler(discovery, &handlers::DiscoveryHandlers::handle_area_components));
+  r.add("GET", area + "/subareas", bind_handler(discovery, &handlers::DiscoveryHandlers::handle_get_subareas));
+  r.add("GET", area + "/contains", bind_handler(discovery, &handlers::DiscoveryHandlers::handle_get_contains));
+  r.add("GET", component + "/subcomponents",
+        bind_handler(discovery, &handlers::DiscoveryHandlers::handle_get_subcomponents));
+  r.add("GET", component + "/hosts", bind_handler(discovery, &handlers::DiscoveryHandlers::handle_get_hosts));
+  r.add("GET", component + "/depends-on",
+        bind_handler(discovery, &handlers::DiscoveryHandlers::handle_component_depends_on));
+  r.add("GET", app + "/depends-on", bind_handler(discovery, &handlers::DiscoveryHandlers::handle_app_depends_on));
+  r.add("GET", function + "/hosts", bind_handler(discovery, &handlers::DiscoveryHandlers::handle_function_hosts));
+
+  // App data-categories and data-groups (not implemented for ROS 2)
+  r.add("GET", app + "/data-categories",
+        bind_handler(data_handlers_.get(), &handlers::DataHandlers::handle_data_categories));
+  r.add("GET", app + "/data-groups", bind_handler(data_handlers_.get(), &handlers::DataHandlers::handle_data_groups));
+
+  // Resource collections shared by all entity types
+  for (const auto & entity : {area, component, app, function}) {
+    // Data - {data_id+} accepts topic names with slashes
+    r.add("GET", entity + "/data", bind_handler(data_handlers_.get(), &handlers::DataHandlers::handle_list_data));
+    r.add("GET", entity + "/data/{data_id+}",
+          slow(bind_handler(data_handlers_.get(), &handlers::DataHandlers::handle_get_data_item)));
+    r.add("PUT", entity + "/data/{data_id+}",
+          slow(bind_handler(data_handlers_.get(), &handlers::DataHandlers::handle_put_data_item)));
+
+    // Operations and executions
+    auto * operations = operation_handlers_.get();
+    const std::string executions = entity + "/operations/{operation_id}/executions";
+    r.add("GET", entity + "/operations",
+          bind_handler(operations, &handlers::OperationHandlers::handle_list_operations));
+    r.add("GET", entity + "/operations/{operation_id}",
+          bind_handler(operations, &handlers::OperationHandlers::handle_get_operation));
+    r.add("POST", executions, slow(bind_handler(operations, &handlers::OperationHandlers::handle_create_execution)));
+    r.add("GET", executions, bind_handler(operations, &handlers::OperationHandlers::handle_list_executions));
+    // SSE streams of action goal status and feedback ("stream" takes precedence over {execution_id})
+    auto * execution_streams = sse_execution_handler_.get();
+    r.add("GET", executions + "/stream",
+          bind_handler(execution_streams, &handlers::SSEExecutionHandler::handle_operation_stream));
+    r.add("GET", executions + "/{execution_id}/stream",
+          bind_handler(execution_streams, &handlers::SSEExecutionHandler::handle_execution_stream));
+    r.add("GET", executions + "/{execution_id}",
+          bind_handler(operations, &handlers::OperationHandlers::handle_get_execution));
+    r.add("PUT", executions + "/{execution_id}",
+          slow(bind_handler(operations, &handlers::OperationHandlers::handle_update_execution)));
+    r.add("DELETE", executions + "/{execution_id}",
+          slow(bind_handler(operations, &handlers::OperationHandlers::handle_cancel_execution)));
+
+    // Configurations - {param_name+} accepts parameter names with slashes
+    // (e.g. qos_overrides./parameter_events.publisher.depth)
+    auto * configs = config_handlers_.get();
+    r.add("GET", entity + "/configurations",
+          slow(bind_handler(configs, &handlers::ConfigHandlers::handle_list_configurations)));
+    r.add("PUT", entity + "/configurations",
+          slow(bind_handler(configs, &handlers::ConfigHandlers::handle_set_all_configurations)));
+    r.add("DELETE", entity + "/configurations",
+          slow(bind_handler(configs, &handlers::ConfigHandlers::handle_delete_all_configurations)));
+    r.add("GET", entity + "/configurations/{param_name+}",
+          slow(bind_handler(configs, &handlers::ConfigHandlers::handle_get_configuration)));
+    r.add("PUT", entity + "/configurations/{param_name+}",
+          slow(bind_handler(configs, &handlers::ConfigHandlers::handle_set_configuration)));
+    r.add("DELETE", entity + "/configurations/{param_name+}",
+          slow(bind_handler(configs, &handlers::ConfigHandlers::handle_delete_configuration)));
+
+    // Faults (REQ_INTEROP_012, REQ_INTEROP_013, REQ_INTEROP_015)
+    // Listings are answered from the local fault mirror, so they do not take a slow-route slot
+    auto * faults = fault_handlers_.get();
+    r.add("GET", entity + "/faults", bind_handler(faults, &handlers::FaultHandlers::handle_list_faults));
+    r.add("DELETE", entity + "/faults", slow(bind_handler(faults, &handlers::FaultHandlers::handle_clear_all_faults)));
+    r.add("GET", entity + "/faults/{fault_code}",
+          slow(bind_handler(faults, &handlers::FaultHandlers::handle_get_fault)));
+    r.add("DELETE", entity + "/faults/{fault_code}",
+          slow(bind_handler(faults, &handlers::FaultHandlers::handle_clear_fault)));
+  }
 
-  // Component topic publish (PUT)
-  // Use (.+) for topic_name to accept slashes from percent-encoded URLs (%2F -> /)
-  srv->Put((api_path("/components") + R"(/([^/]+)/data/(.+)$)"),
-           [this](const httplib::Request & req, httplib::Response & res) {
-             data_handlers_->handle_put_data_item(req, res);
-           });
-
-  // List component operations (GET) - list all services and actions for a component
-  srv->Get((api_path("/components") + R"(/([^/]+)/operations$)"),
-           [this](const httplib::Request & req, httplib::Response & res) {
-             operation_handlers_->handle_list_operations(req, res);
-           });
-
-  // Component operation details (GET) - get single operation info
-  srv->Get((api_path("/components") + R"(/([^/]+)/operations/([^/]+)$)"),
-           [this](const httplib::Request & req, httplib::Response & res) {
-             operation_handlers_->handle_get_operation(req, res);
-           });
-
-  // Execution endpoints for components
-  // POST /{entity}/operations/{op-id}/executions - start execution
-  srv->Post((api_path("/components") + R"(/([^/]+)/operations/([^/]+)/executions$)"),
-            [this](const httplib::Request & req, httplib::Response & res) {
-              operation_handlers_->handle_create_execution(req, res);
-            });
-
-  // GET /{entity}/operations/{op-id}/executions - list executions
-  srv->Get((api_path("/components") + R"(/([^/]+)/operations/([^/]+)/executions$)"),
-           [this](const httplib::Request & req, httplib::Response & res) {
-             operation_handlers_->handle_list_executions(req, res);
-           });
-
-  // GET /{entity}/operations/{op-id}/executions/{exec-id} - get execution status
-  srv->Get((api_path("/components") + R"(/([^/]+)/operations/([^/]+)/executions/([^/]+)$)"),
-           [this](const httplib::Request & req, httplib::Response & res) {
-             operation_handlers_->handle_get_execution(req, res);
-           });
-
-  // PUT /{entity}/operations/{op-id}/executions/{exec-id} - update execution
-  srv->Put((api_path("/components") + R"(/([^/]+)/operations/([^/]+)/executions/([^/]+)$)"),
-           [this](const httplib::Request & req, httplib::Response & res) {
-             operation_handlers_->handle_update_execution(req, res);
-           });
-
-  // DELETE /{entity}/operations/{op-id}/executions/{exec-id} - cancel execution
-  srv->Delete((api_path("/components") + R"(/([^/]+)/operations/([^/]+)/executions/([^/]+)$)"),
-              [this](const httplib::Request & req, httplib::Response & res) {
-                operation_handlers_->handle_cancel_execution(req, res);
-              });
-
-  // Configurations endpoints - SOVD Configurations API mapped to ROS2 parameters
-  // List all configurations (parameters) for a component
-  srv->Get((api_path("/components") + R"(/([^/]+)/configurations$)"),
-           [this](const httplib::Request & req, httplib::Response & res) {
-             config_handlers_->handle_list_configurations(req, res);
-           });
-
-  // Get specific configuration (parameter) - register before general route
-  srv->Get((api_path("/components") + R"(/([^/]+)/configurations/(.+)$)"),
-           [this](const httplib::Request & req, httplib::Response & res) {
-             config_handlers_->handle_get_configuration(req, res);
-           });
-
-  // Set configuration (parameter)
-  srv->Put((api_path("/components") + R"(/([^/]+)/configurations/(.+)$)"),
-           [this](const httplib::Request & req, httplib::Response & res) {
-             config_handlers_->handle_set_configuration(req, res);
-           });
-
-  // Delete (reset) single configuration to default value
-  srv->Delete((api_path("/components") + R"(/([^/]+)/configurations/(.+)$)"),
-              [this](const httplib::Request & req, httplib::Response & res) {
-                config_handlers_->handle_delete_configuration(req, res);
-              });
-
-  // Delete (reset) all configurations to default values
-  srv->Delete((api_path("/components") + R"(/([^/]+)/configurations$)"),
-              [this](const httplib::Request & req, httplib::Response & res) {
-                config_handlers_->handle_delete_all_configurations(req, res);
-              });
+  // === Bulk Data Routes (REQ_INTEROP_071-073) ===
+  const std::string subarea = area + "/subareas/{subarea_id}";
+  const std::string subcomponent = component + "/subcomponents/{subcomponent_id}";
+  for (const auto & entity : {area, component, app, function, subarea, subcomponent}) {
+    auto * bulkdata = bulkdata_handlers_.get();
+    r.add("GET", entity + "/bulk-data", bind_handler(bulkdata, &handlers::BulkDataHandlers::handle_list_categories));
+    r.add("GET", entity + "/bulk-data/{category}",
+          slow(bind_handler(bulkdata, &handlers::BulkDataHandlers::handle_list_descriptors)));
+    r.add("GET", entity + "/bulk-data/{category}/{file_id}",
+          slow(bind_handler(bulkdata, &handlers::BulkDataHandlers::handle_download)));
+  }
 
   // Fault endpoints
-  // SSE stream for real-time fault events - must be registered before /faults to avoid regex conflict
-  srv->Get(api_path("/faults/stream"), [this](const httplib::Request & req, httplib::Response & res) {
-    sse_fault_handler_->handle_stream(req, res);
-  });
-
+  // SSE stream for real-time fault events
+  r.add("GET", api_path("/faults/stream"),
+        bind_handler(sse_fault_handler_.get(), &handlers::SSEFaultHandler::handle_stream));
   // GET /faults - convenience API to retrieve all faults across the system
-  // Useful for dashboards and monitoring tools that need a complete system health view
-  srv->Get(api_path("/faults"), [this](const httplib::Request & req, httplib::Response & res) {
-    fault_handlers_->handle_list_all_faults(req, res);
-  });
-
-  // List all faults for a component (REQ_INTEROP_012)
-  srv->Get((api_path("/components") + R"(/([^/]+)/faults$)"),
-           [this](const httplib::Request & req, httplib::Response & res) {
-             fault_handlers_->handle_list_faults(req, res);
-           });
-
-  // List all faults for an app (same handler, entity-agnostic)
-  srv->Get((api_path("/apps") + R"(/([^/]+)/faults$)"), [this](const httplib::Request & req, httplib::Response & res) {
-    fault_handlers_->handle_list_faults(req, res);
-  });
-
-  // Get specific fault by code (REQ_INTEROP_013)
-  srv->Get((api_path("/components") + R"(/([^/]+)/faults/([^/]+)$)"),
-           [this](const httplib::Request & req, httplib::Response & res) {
-             fault_handlers_->handle_get_fault(req, res);
-           });
-
-  // Get specific fault by code for an app
-  srv->Get((api_path("/apps") + R"(/([^/]+)/faults/([^/]+)$)"),
-           [this](const httplib::Request & req, httplib::Response & res) {
-             fault_handlers_->handle_get_fault(req, res);
-           });
-
-  // Clear a fault (REQ_INTEROP_015)
-  srv->Delete((api_path("/components") + R"(/([^/]+)/faults/([^/]+)$)"),
-              [this](const httplib::Request & req, httplib::Response & res) {
-                fault_handlers_->handle_clear_fault(req, res);
-              });
-
-  // Clear a fault for an app
-  srv->Delete((api_path("/apps") + R"(/([^/]+)/faults/([^/]+)$)"),
-              [this](const httplib::Request & req, httplib::Response & res) {
-                fault_handlers_->handle_clear_fault(req, res);
-              });
-
-  // Clear all faults for a component
-  srv->Delete((api_path("/components") + R"(/([^/]+)/faults$)"),
-              [this](const httplib::Request & req, httplib::Response & res) {
-                fault_handlers_->handle_clear_all_faults(req, res);
-              });
-
-  // Clear all faults for an app
-  srv->Delete((api_path("/apps") + R"(/([^/]+)/faults$)"),
-              [this](const httplib::Request & req, httplib::Response & res) {
-                fault_handlers_->handle_clear_all_faults(req, res);
-              });
-
-  // === Bulk Data Routes (REQ_INTEROP_071-073) ===
-  // List bulk-data categories
-  srv->Get((api_path("/apps") + R"(/([^/]+)/bulk-data$)"),
-           [this](const httplib::Request & req, httplib::Response & res) {
-             bulkdata_handlers_->handle_list_categories(req, res);
-           });
-  srv->Get((api_path("/components") + R"(/([^/]+)/bulk-data$)"),
-           [this](const httplib::Request & req, httplib::Response & res) {
-             bulkdata_handlers_->handle_list_categories(req, res);
-           });
-  srv->Get((api_path("/areas") + R"(/([^/]+)/bulk-data$)"),
-           [this](const httplib::Request & req, httplib::Response & res) {
-             bulkdata_handlers_->handle_list_categories(req, res);
-           });
-  srv->Get((api_path("/functions") + R"(/([^/]+)/bulk-data$)"),
-           [this](const httplib::Request & req, httplib::Response & res) {
-             bulkdata_handlers_->handle_list_categories(req, res);
-           });
-
-  // List bulk-data descriptors (by category)
-  srv->Get((api_path("/apps") + R"(/([^/]+)/bulk-data/([^/]+)$)"),
-           [this](const httplib::Request & req, httplib::Response & res) {
-             bulkdata_handlers_->handle_list_descriptors(req, res);
-           });
-  srv->Get((api_path("/components") + R"(/([^/]+)/bulk-data/([^/]+)$)"),
-           [this](const httplib::Request & req, httplib::Response & res) {
-             bulkdata_handlers_->handle_list_descriptors(req, res);
-           });
-  srv->Get((api_path("/areas") + R"(/([^/]+)/bulk-data/([^/]+)$)"),
-           [this](const httplib::Request & req, httplib::Response & res) {
-             bulkdata_handlers_->handle_list_descriptors(req, res);
-           });
-  srv->Get((api_path("/functions") + R"(/([^/]+)/bulk-data/([^/]+)$)"),
-           [this](const httplib::Request & req, httplib::Response & res) {
-             bulkdata_handlers_->handle_list_descriptors(req, res);
-           });
-
-  // Download bulk-data file
-  srv->Get((api_path("/apps") + R"(/([^/]+)/bulk-data/([^/]+)/([^/]+)$)"),
-           [this](const httplib::Request & req, httplib::Response & res) {
-             bulkdata_handlers_->handle_download(req, res);
-           });
-  srv->Get((api_path("/components") + R"(/([^/]+)/bulk-data/([^/]+)/([^/]+)$)"),
-           [this](const httplib::Request & req, httplib::Response & res) {
-             bulkdata_handlers_->handle_download(req, res);
-           });
-  srv->Get((api_path("/areas") + R"(/([^/]+)/bulk-data/([^/]+)/([^/]+)$)"),
-           [this](const httplib::Request & req, httplib::Response & res) {
-             bulkdata_handlers_->handle_download(req, res);
-           });
-  srv->Get((api_path("/functions") + R"(/([^/]+)/bulk-data/([^/]+)/([^/]+)$)"),
-           [this](const httplib::Request & req, httplib::Response & res) {
-             bulkdata_handlers_->handle_download(req, res);
-           });
-
-  // Nested entities - subareas
-  srv->Get((api_path("/areas") + R"(/([^/]+)/subareas/([^/]+)/bulk-data$)"),
-           [this](const httplib::Request & req, httplib::Response & res) {
-             bulkdata_handlers_->handle_list_categories(req, res);
-           });
-  srv->Get((api_path("/areas") + R"(/([^/]+)/subareas/([^/]+)/bulk-data/([^/]+)$)"),
-           [this](const httplib::Request & req, httplib::Response & res) {
-             bulkdata_handlers_->handle_list_descriptors(req, res);
-           });
-  srv->Get((api_path("/areas") + R"(/([^/]+)/subareas/([^/]+)/bulk-data/([^/]+)/([^/]+)$)"),
-           [this](const httplib::Request & req, httplib::Response & res) {
-             bulkdata_handlers_->handle_download(req, res);
-           });
-
-  // Nested entities - subcomponents
-  srv->Get((api_path("/components") + R"(/([^/]+)/subcomponents/([^/]+)/bulk-data$)"),
-           [this](const httplib::Request & req, httplib::Response & res) {
-             bulkdata_handlers_->handle_list_categories(req, res);
-           });
-  srv->Get((api_path("/components") + R"(/([^/]+)/subcomponents/([^/]+)/bulk-data/([^/]+)$)"),
-           [this](const httplib::Request & req, httplib::Response & res) {
-             bulkdata_handlers_->handle_list_descriptors(req, res);
-           });
-  srv->Get((api_path("/components") + R"(/([^/]+)/subcomponents/([^/]+)/bulk-data/([^/]+)/([^/]+)$)"),
-           [this](const httplib::Request & req, httplib::Response & res) {
-             bulkdata_handlers_->handle_download(req, res);
-           });
+  r.add("GET", api_path("/faults"),
+        bind_handler(fault_handlers_.get(), &handlers::FaultHandlers::handle_list_all_faults));
 
   // Authentication endpoints (REQ_INTEROP_086, REQ_INTEROP_087)
-  // POST /auth/authorize - Authenticate and get tokens (client_credentials grant)
-  srv->Post(api_path("/auth/authorize"), [this](const httplib::Request & req, httplib::Response & res) {
-    auth_handlers_->handle_auth_authorize(req, res);
-  });
-
-  // POST /auth/token - Refresh access token
-  srv->Post(api_path("/auth/token"), [this](const httplib::Request & req, httplib::Response & res) {
-    auth_handlers_->handle_auth_token(req, res);
-  });
+  auto * auth = auth_handlers_.get();
+  r.add("POST", api_path("/auth/authorize"), bind_handler(auth, &handlers::AuthHandlers::handle_auth_authorize));
+  r.add("POST", api_path("/auth/token"), bind_handler(auth, &handlers::AuthHandlers::handle_auth_token));
+  r.add("POST", api_path("/auth/revoke"), bind_handler(auth, &handlers::AuthHandlers::handle_auth_revoke));
+
+  // Prometheus scrape endpoint lives at the conventional /metrics, outside the API prefix
+  if (MetricsRegistry * metrics = node_->get_metrics_registry()) {
+    routes_.set_metrics(metrics);
+    metrics->describe_counter("medkit_http_rejected_requests_total", "Requests answered with 503 by reason");
+    srv->Get("/metrics", [this](const httplib::Request & req, httplib::Response & res) {
+      health_handlers_->handle_metrics(req, res);
+    });
+
+    metrics->describe_gauge("medkit_sse_clients", "Connected SSE clients by stream");
+    sse_metrics_collector_ = metrics->add_collector([this](MetricsRegistry & m) {
+      m.set("medkit_sse_clients", {{"stream", "faults"}}, static_cast<double>(sse_fault_handler_->connected_clients()));
+      m.set("medkit_sse_clients", {{"stream", "executions"}},
+            static_cast<double>(sse_execution_handler_->connected_clients()));
+    });
+  }
 
-  // POST /auth/revoke - Revoke a refresh token
-  srv->Post(api_path("/auth/revoke"), [this](const httplib::Request & req, httplib::Response & res) {
-    auth_handlers_->handle_auth_revoke(req, res);
-  });
+  // One catch-all per method under the API prefix replaces per-route regexes
+  routes_.install(*srv, API_BASE_PATH);
+  RCLCPP_DEBUG(rclcpp::get_logger("rest_server"), "Registered %zu routes", routes_.size());
 }
 
 void RESTServer::start() {
@@ -0,0 +1,311 @@
+// Copyright 2026 bburda
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+#include "ros2_medkit_gateway/http/route_dispatcher.hpp"
+
+#include <chrono>
+#include <stdexcept>
+#include <utility>
+
+namespace ros2_medkit_gateway {
+
+struct RouteDispatcher::Node {
+  /// Literal children, looked up by segment without allocating
+  std::map<std::string, std::unique_ptr<Node>, std::less<>> literals;
+  /// Child for a {name} segment capture
+  std::unique_ptr<Node> param;
+  /// Route whose template ends at this node
+  const Route * route{nullptr};
+  /// Route whose template ends with a {name+} capture after this node
+  const Route * tail_route{nullptr};
+};
+
+namespace {
+
+enum class SegmentKind { LITERAL, PARAM, TAIL };
+
+struct Segment {
+  SegmentKind kind;
+  std::string text;  ///< Literal text or capture name
+};
+
+std::vector<Segment> parse_template(const std::string & pattern) {
+  if (pattern.empty() || pattern[0] != '/') {
+    throw std::invalid_argument("Route template must start with '/': " + pattern);
+  }
+
+  std::vector<Segment> segments;
+  size_t pos = 1;
+  while (true) {
+    size_t end = pattern.find('/', pos);
+    std::string text = pattern.substr(pos, end == std::string::npos ? std::string::npos : end - pos);
+
+    if (text.size() >= 2 && text.front() == '{' && text.back() == '}') {
+      std::string name = text.substr(1, text.size() - 2);
+      bool tail = !name.empty() && name.back() == '+';
+      if (tail) {
+        name.pop_back();
+      }
+      if (name.empty()) {
+        throw std::invalid_argument("Route template has an unnamed capture: " + pattern);
+      }
+      if (tail && end != std::string::npos) {
+        throw std::invalid_argument("Tail capture must be the last segment: " + pattern);
+      }
+      segments.push_back({tail ? SegmentKind::TAIL : SegmentKind::PARAM, name});
+    } else {
+      if (text.find_first_of("{}") != std::string::npos) {
+        throw std::invalid_argument("Route template has a malformed capture: " + pattern);
+      }
+      segments.push_back({SegmentKind::LITERAL, text});
+    }
+
+    if (end == std::string::npos) {
+      break;
+    }
+    pos = end + 1;
+  }
+  return segments;
+}
+
+/// Captures of the request whose handler is running on this thread
+struct ActiveCaptures {
+  const httplib::Request * req{nullptr};
+  const std::vector<std::string_view> * captures{nullptr};
+};
+
+thread_local ActiveCaptures active_captures;
+
+/// Publishes a request's captures for the handler call; restores the previous ones on exit
+class ScopedCaptures {
+ public:
+  ScopedCaptures(const httplib::Request & req, const std::vector<std::string_view> & captures)
+    : previous_(active_captures) {
+    active_captures = {&req, &captures};
+  }
+  ~ScopedCaptures() {
+    active_captures = previous_;
+  }
+
+  ScopedCaptures(const ScopedCaptures &) = delete;
+  ScopedCaptures & operator=(const ScopedCaptures &) = delete;
+
+ private:
+  ActiveCaptures previous_;
+};
+
+}  // namespace
+
+RouteDispatcher::RouteDispatcher() = default;
+RouteDispatcher::~RouteDispatcher() = default;
+
+void RouteDispatcher::add(const std::string & method, const std::string & pattern, Handler handler) {
+  auto segments = parse_template(pattern);
+
+  auto route = std::make_unique<Route>();
+  route->method = method;
+  route->pattern = pattern;
+  route->handler = std::move(handler);
+
+  auto & root = roots_[method];
+  if (!root) {
+    root = std::make_unique<Node>();
+  }
+  Node * node = root.get();
+  for (const auto & segment : segments) {
+    switch (segment.kind) {
+      case SegmentKind::LITERAL: {
+        auto & child = node->literals[segment.text];
+        if (!child) {
+          child = std::make_unique<Node>();
+        }
+        node = child.get();
+        break;
+      }
+      case SegmentKind::PARAM:
+        if (!node->param) {
+          node->param = std::make_unique<Node>();
+        }
+        node = node->param.get();
+        route->captures.push_back(segment.text);
+        break;
+      case SegmentKind::TAIL:
+        route->captures.push_back(segment.text);
+        break;
+    }
+  }
+
+  const Route ** slot = segments.back().kind == SegmentKind::TAIL ? &node->tail_route : &node->route;
+  if (*slot) {
+    throw std::invalid_argument("Duplicate route: " + method + " " + pattern);
+  }
+  *slot = route.get();
+  routes_.push_back(std::move(route));
+}
+
+const RouteDispatcher::Route * RouteDispatcher::match_node(const Node & node, std::string_view path, size_t pos,
+                                                           std::vector<std::string_view> * captures) const {
+  if (pos == std::string_view::npos) {
+    return node.route;
+  }
+
+  size_t end = path.find('/', pos);
+  std::string_view segment = path.substr(pos, end == std::string_view::npos ? std::string_view::npos : end - pos);
+  size_t next = end == std::string_view::npos ? std::string_view::npos : end + 1;
+
+  auto literal = node.literals.find(segment);
+  if (literal != node.literals.end()) {
+    if (const Route * route = match_node(*literal->second, path, next, captures)) {
+      return route;
+    }
+  }
+  if (node.param && !segment.empty()) {
+    if (captures) {
+      captures->push_back(segment);
+    }
+    if (const Route * route = match_node(*node.param, path, next, captures)) {
+      return route;
+    }
+    if (captures) {
+      captures->pop_back();
+    }
+  }
+  if (node.tail_route && pos < path.size()) {
+    if (captures) {
+      captures->push_back(path.substr(pos));
+    }
+    return node.tail_route;
+  }
+  return nullptr;
+}
+
+const RouteDispatcher::Route * RouteDispatcher::find(const std::string & method, std::string_view path,
+                                                     std::vector<std::string_view> * captures) const {
+  auto root = roots_.find(method == "HEAD" ? std::string("GET") : method);
+  if (root == roots_.end() || path.empty() || path[0] != '/') {
+    return nullptr;
+  }
+  return match_node(*root->second, path, 1, captures);
+}
+
+const RouteDispatcher::Route * RouteDispatcher::match(const std::string & method, std::string_view path) const {
+  return find(method, path, nullptr);
+}
+
+const RouteDispatcher::Route * RouteDispatcher::dispatch(const httplib::Request & req, httplib::Response & res) const {
+  // Index 0 is the whole path, captures follow in template order - the layout of req.matches
+  std::vector<std::string_view> captures;
+  captures.reserve(4);
+  captures.push_back(req.path);
+  const Route * route = find(req.method, req.path, &captures);
+  if (!route) {
+    return nullptr;
+  }
+  ScopedCaptures scoped(req, captures);
+  route->handler(req, res);
+  return route;
+}
+
+void RouteDispatcher::set_metrics(MetricsRegistry * metrics) {
+  metrics_ = metrics;
+  if (metrics_) {
+    metrics_->describe_counter("medkit_http_requests_total", "HTTP requests by method, route template and status");
+    metrics_->describe_histogram("medkit_http_request_duration_seconds",
+                                 "HTTP request handling time by method and route template");
+    metrics_->describe_gauge("medkit_http_requests_in_flight", "HTTP requests currently being handled");
+  }
+}
+
+void RouteDispatcher::install(httplib::Server & srv, const std::string & prefix) const {
+  const std::string catch_all = prefix + "/.*";
+  auto handler = [this](const httplib::Request & req, httplib::Response & res) {
+    // Decrements the in-flight gauge even if the handler throws
+    struct InFlight {
+      MetricsRegistry * metrics;
+      explicit InFlight(MetricsRegistry * m) : metrics(m) {
+        if (metrics) {
+          metrics->increment("medkit_http_requests_in_flight", {}, 1.0);
+        }
+      }
+      ~InFlight() {
+        if (metrics) {
+          metrics->increment("medkit_http_requests_in_flight", {}, -1.0);
+        }
+      }
+    } in_flight(metrics_);
+    auto start = std::chrono::steady_clock::now();
+
+    const Route * route = dispatch(req, res);
+    if (!route) {
+      res.status = httplib::StatusCode::NotFound_404;
+    }
+
+    if (metrics_) {
+      std::chrono::duration<double> elapsed = std::chrono::steady_clock::now() - start;
+      const std::string route_label = route ? route->pattern : "unmatched";
+      // httplib fills in 200 after the handler returns when no status was set
+      int status = res.status == -1 ? 200 : res.status;
+      metrics_->increment("medkit_http_requests_total",
+                          {{"method", req.method}, {"route", route_label}, {"status", std::to_string(status)}});
+      metrics_->observe("medkit_http_request_duration_seconds", {{"method", req.method}, {"route", route_label}},
+                        elapsed.count());
+    }
+  };
+
+  for (const auto & [method, root] : roots_) {
+    (void)root;
+    if (method == "GET") {
+      srv.Get(catch_all, handler);
+    } else if (method == "PUT") {
+      srv.Put(catch_all, handler);
+    } else if (method == "POST") {
+      srv.Post(catch_all, handler);
+    } else if (method == "DELETE") {
+      srv.Delete(catch_all, handler);
+    } else if (method == "PATCH") {
+      srv.Patch(catch_all, handler);
+    }
+  }
+}
+
+std::vector<std::string> RouteDispatcher::endpoints() const {
+  std::vector<std::string> result;
+  result.reserve(routes_.size());
+  for (const auto & route : routes_) {
+    std::string pattern = route->pattern;
+    auto tail = pattern.find("+}");
+    if (tail != std::string::npos) {
+      pattern.erase(tail, 1);
+    }
+    result.push_back(route->method + " " + pattern);
+  }
+  return result;
+}
+
+size_t path_capture_count(const httplib::Request & req) {
+  if (active_captures.req == &req) {
+    return active_captures.captures->size();
+  }
+  return req.matches.size();
+}
+
+std::string path_capture(const httplib::Request & req, size_t index) {
+  if (active_captures.req == &req) {
+    const auto & captures = *active_captures.captures;
+    return index < captures.size() ? std::string(captures[index]) : std::string();
+  }
+  return index < req.matches.size() ? req.matches[index].str() : std::string();
+}
+
+}  // namespace ros2_medkit_gateway
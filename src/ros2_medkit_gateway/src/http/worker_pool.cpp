@@ -0,0 +1,184 @@
+// Copyright 2026 bburda
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+#include "ros2_medkit_gateway/http/worker_pool.hpp"
+
+namespace ros2_medkit_gateway {
+
+namespace {
+
+thread_local bool t_overflow_task = false;
+
+}  // namespace
+
+WorkerPool::WorkerPool(size_t worker_threads, size_t max_queued, size_t overflow_threads, size_t max_overflow_queued)
+  : max_queued_(max_queued), max_overflow_queued_(max_overflow_queued) {
+  workers_.threads.reserve(worker_threads);
+  for (size_t i = 0; i < worker_threads; ++i) {
+    workers_.threads.emplace_back([this] {
+      run(workers_, false);
+    });
+  }
+  overflow_.threads.reserve(overflow_threads);
+  for (size_t i = 0; i < overflow_threads; ++i) {
+    overflow_.threads.emplace_back([this] {
+      run(overflow_, true);
+    });
+  }
+}
+
+WorkerPool::~WorkerPool() {
+  shutdown();
+}
+
+WorkerPool::EnqueueResult WorkerPool::enqueue(std::function<void()> fn) {
+  Queue * queue = &workers_;
+  {
+    std::lock_guard<std::mutex> lock(mutex_);
+    if (workers_.tasks.size() >= max_queued_ && !overflow_.threads.empty()) {
+      queue = overflow_.tasks.size() < max_overflow_queued_ ? &overflow_ : nullptr;
+    }
+    if (queue) {
+      queue->tasks.push_back(std::move(fn));
+    }
+  }
+
+  if (!queue) {
+    if constexpr (std::is_same_v<EnqueueResult, bool>) {
+      // httplib closes the socket of a rejected connection
+      return static_cast<EnqueueResult>(false);
+    } else {
+      // httplib closes the socket inside the task, so it must run somewhere: answer it (503) here,
+      // holding off further accepts until it is done
+      bool was_overflow = t_overflow_task;
+      t_overflow_task = true;
+      fn();
+      t_overflow_task = was_overflow;
+      return static_cast<EnqueueResult>(true);
+    }
+  }
+  queue->cv.notify_one();
+
+  // Accepted (true) for cpp-httplib versions whose enqueue() reports rejection; a no-op cast to void otherwise
+  return static_cast<EnqueueResult>(true);
+}
+
+void WorkerPool::shutdown() {
+  {
+    std::lock_guard<std::mutex> lock(mutex_);
+    if (shutdown_) {
+      return;
+    }
+    shutdown_ = true;
+  }
+
+  for (auto * queue : {&workers_, &overflow_}) {
+    queue->cv.notify_all();
+    for (auto & thread : queue->threads) {
+      if (thread.joinable()) {
+        thread.join();
+      }
+    }
+  }
+}
+
+bool WorkerPool::is_overflow_task() {
+  return t_overflow_task;
+}
+
+size_t WorkerPool::queued() const {
+  std::lock_guard<std::mutex> lock(mutex_);
+  return workers_.tasks.size();
+}
+
+size_t WorkerPool::overflow_queued() const {
+  std::lock_guard<std::mutex> lock(mutex_);
+  return overflow_.tasks.size();
+}
+
+void WorkerPool::run(Queue & queue, bool overflow) {
+  t_overflow_task = overflow;
+  while (true) {
+    std::function<void()> task;
+    {
+      std::unique_lock<std::mutex> lock(mutex_);
+      queue.cv.wait(lock, [&] {
+        return !queue.tasks.empty() || shutdown_;
+      });
+      // Drain remaining connections before exiting so their sockets get closed
+      if (queue.tasks.empty()) {
+        return;
+      }
+      task = std::move(queue.tasks.front());
+      queue.tasks.pop_front();
+    }
+    task();
+  }
+}
+
+ConcurrencyLimiter::Permit::~Permit() {
+  if (limiter_) {
+    limiter_->release();
+  }
+}
+
+ConcurrencyLimiter::Permit & ConcurrencyLimiter::Permit::operator=(Permit && other) noexcept {
+  if (this != &other) {
+    if (limiter_) {
+      limiter_->release();
+    }
+    limiter_ = std::exchange(other.limiter_, nullptr);
+  }
+  return *this;
+}
+
+ConcurrencyLimiter::ConcurrencyLimiter(size_t max_active, size_t max_waiting)
+  : max_active_(max_active), max_waiting_(max_waiting) {
+}
+
+ConcurrencyLimiter::Permit ConcurrencyLimiter::acquire() {
+  std::unique_lock<std::mutex> lock(mutex_);
+  if (active_ >= max_active_) {
+    if (waiting_ >= max_waiting_) {
+      return Permit{};
+    }
+    ++waiting_;
+    cv_.wait(lock, [this] {
+      return active_ < max_active_;
+    });
+    --waiting_;
+  }
+  ++active_;
+  return Permit{this};
+}
+
+size_t ConcurrencyLimiter::active() const {
+  std::lock_guard<std::mutex> lock(mutex_);
+  return active_;
+}
+
+size_t ConcurrencyLimiter::waiting() const {
+  std::lock_guard<std::mutex> lock(mutex_);
+  return waiting_;
+}
+
+void ConcurrencyLimiter::release() {
+  {
+    std::lock_guard<std::mutex> lock(mutex_);
+    --active_;
+  }
+  cv_.notify_one();
+}
+
+}  // namespace ros2_medkit_gateway
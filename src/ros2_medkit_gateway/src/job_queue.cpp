@@ -0,0 +1,86 @@
+// Copyright 2026 bburda
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+#include "ros2_medkit_gateway/job_queue.hpp"
+
+#include <utility>
+
+namespace ros2_medkit_gateway {
+
+JobQueue::JobQueue(size_t worker_threads, size_t max_queued) : max_queued_(max_queued) {
+  threads_.reserve(worker_threads);
+  for (size_t i = 0; i < worker_threads; ++i) {
+    threads_.emplace_back([this] {
+      run();
+    });
+  }
+}
+
+JobQueue::~JobQueue() {
+  shutdown();
+}
+
+bool JobQueue::submit(std::function<void()> job) {
+  {
+    std::lock_guard<std::mutex> lock(mutex_);
+    if (shutdown_ || jobs_.size() >= max_queued_) {
+      return false;
+    }
+    jobs_.push_back(std::move(job));
+  }
+  cv_.notify_one();
+  return true;
+}
+
+void JobQueue::shutdown() {
+  {
+    std::lock_guard<std::mutex> lock(mutex_);
+    if (shutdown_) {
+      return;
+    }
+    shutdown_ = true;
+    jobs_.clear();
+  }
+  cv_.notify_all();
+  for (auto & thread : threads_) {
+    if (thread.joinable()) {
+      thread.join();
+    }
+  }
+}
+
+size_t JobQueue::queued() const {
+  std::lock_guard<std::mutex> lock(mutex_);
+  return jobs_.size();
+}
+
+void JobQueue::run() {
+  while (true) {
+    std::function<void()> job;
+    {
+      std::unique_lock<std::mutex> lock(mutex_);
+      cv_.wait(lock, [this] {
+        return !jobs_.empty() || shutdown_;
+      });
+      if (shutdown_) {
+        return;
+      }
+      job = std::move(jobs_.front());
+      jobs_.pop_front();
+    }
+    job();
+  }
+}
+
+}  // namespace ros2_medkit_gateway
@@ -0,0 +1,275 @@
+// Copyright 2026 bburda
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+#include "ros2_medkit_gateway/metrics_registry.hpp"
+
+#include <algorithm>
+#include <cmath>
+#include <cstdio>
+
+namespace ros2_medkit_gateway {
+
+namespace {
+
+/// Atomically add to a double (std::atomic<double>::fetch_add is C++20)
+void atomic_add(std::atomic<double> & target, double value) {
+  double current = target.load(std::memory_order_relaxed);
+  while (!target.compare_exchange_weak(current, current + value, std::memory_order_relaxed)) {
+  }
+}
+
+std::string format_value(double value) {
+  if (std::isnan(value)) {
+    return "NaN";
+  }
+  if (std::isinf(value)) {
+    return value > 0 ? "+Inf" : "-Inf";
+  }
+  char buf[32];
+  std::snprintf(buf, sizeof(buf), "%.15g", value);
+  return buf;
+}
+
+void append_escaped(std::string & out, const std::string & value) {
+  for (char c : value) {
+    switch (c) {
+      case '\\':
+        out += "\\\\";
+        break;
+      case '"':
+        out += "\\\"";
+        break;
+      case '\n':
+        out += "\\n";
+        break;
+      default:
+        out += c;
+    }
+  }
+}
+
+/// Serialize labels as the body of a Prometheus label set (without braces)
+std::string serialize_labels(const MetricLabels & labels) {
+  std::string out;
+  for (const auto & [key, value] : labels) {
+    if (!out.empty()) {
+      out += ',';
+    }
+    out += key;
+    out += "=\"";
+    append_escaped(out, value);
+    out += '"';
+  }
+  return out;
+}
+
+std::string with_extra_label(const std::string & labels, const std::string & extra) {
+  return "{" + (labels.empty() ? extra : labels + "," + extra) + "}";
+}
+
+}  // namespace
+
+struct MetricsRegistry::Series {
+  explicit Series(size_t bucket_count) : buckets(bucket_count) {
+  }
+
+  std::atomic<double> value{0.0};              ///< Counter/gauge value, histogram sum
+  std::atomic<uint64_t> count{0};              ///< Histogram observation count
+  std::vector<std::atomic<uint64_t>> buckets;  ///< Non-cumulative histogram bucket counts
+};
+
+struct MetricsRegistry::Family {
+  MetricType type;
+  std::string help;
+  std::vector<double> buckets;
+
+  std::shared_mutex mutex;
+  std::map<std::string, std::unique_ptr<Series>> series;  ///< Keyed by serialized labels
+};
+
+const std::vector<double> & MetricsRegistry::default_latency_buckets() {
+  static const std::vector<double> buckets = {0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1,
+                                              0.25,  0.5,    1.0,   2.5,  5.0,   10.0, 30.0};
+  return buckets;
+}
+
+MetricsRegistry::MetricsRegistry() = default;
+MetricsRegistry::~MetricsRegistry() = default;
+
+void MetricsRegistry::describe(const std::string & name, const std::string & help, MetricType type,
+                               const std::vector<double> & buckets) {
+  std::unique_lock lock(families_mutex_);
+  if (families_.count(name) > 0) {
+    return;
+  }
+  auto family = std::make_unique<Family>();
+  family->type = type;
+  family->help = help;
+  family->buckets = buckets;
+  std::sort(family->buckets.begin(), family->buckets.end());
+  families_.emplace(name, std::move(family));
+}
+
+void MetricsRegistry::describe_counter(const std::string & name, const std::string & help) {
+  describe(name, help, MetricType::COUNTER, {});
+}
+
+void MetricsRegistry::describe_gauge(const std::string & name, const std::string & help) {
+  describe(name, help, MetricType::GAUGE, {});
+}
+
+void MetricsRegistry::describe_histogram(const std::string & name, const std::string & help,
+                                         const std::vector<double> & buckets) {
+  describe(name, help, MetricType::HISTOGRAM, buckets);
+}
+
+std::pair<const MetricsRegistry::Family *, MetricsRegistry::Series *>
+MetricsRegistry::get_series(const std::string & name, const MetricLabels & labels, bool histogram) {
+  // Families are never removed, so the pointer stays valid after the lock is released
+  Family * family = nullptr;
+  {
+    std::shared_lock lock(families_mutex_);
+    auto it = families_.find(name);
+    if (it == families_.end()) {
+      return {nullptr, nullptr};
+    }
+    family = it->second.get();
+  }
+  if ((family->type == MetricType::HISTOGRAM) != histogram) {
+    return {nullptr, nullptr};
+  }
+
+  std::string key = serialize_labels(labels);
+  {
+    std::shared_lock lock(family->mutex);
+    auto it = family->series.find(key);
+    if (it != family->series.end()) {
+      return {family, it->second.get()};
+    }
+  }
+
+  std::unique_lock lock(family->mutex);
+  auto & series = family->series[key];
+  if (!series) {
+    series = std::make_unique<Series>(family->buckets.size());
+  }
+  return {family, series.get()};
+}
+
+void MetricsRegistry::increment(const std::string & name, const MetricLabels & labels, double value) {
+  if (auto [family, series] = get_series(name, labels, false); series) {
+    (void)family;
+    atomic_add(series->value, value);
+  }
+}
+
+void MetricsRegistry::set(const std::string & name, const MetricLabels & labels, double value) {
+  if (auto [family, series] = get_series(name, labels, false); series) {
+    (void)family;
+    series->value.store(value, std::memory_order_relaxed);
+  }
+}
+
+void MetricsRegistry::observe(const std::string & name, const MetricLabels & labels, double value) {
+  auto [family, series] = get_series(name, labels, true);
+  if (!series) {
+    return;
+  }
+  // Bucket bounds are fixed at describe() time, so they can be read without a lock
+  auto bound = std::lower_bound(family->buckets.begin(), family->buckets.end(), value);
+  size_t index = static_cast<size_t>(bound - family->buckets.begin());
+  if (index < series->buckets.size()) {
+    series->buckets[index].fetch_add(1, std::memory_order_relaxed);
+  }
+  series->count.fetch_add(1, std::memory_order_relaxed);
+  atomic_add(series->value, value);
+}
+
+size_t MetricsRegistry::add_collector(Collector collector) {
+  std::lock_guard<std::mutex> lock(collectors_mutex_);
+  size_t handle = next_collector_handle_++;
+  collectors_.emplace(handle, std::move(collector));
+  return handle;
+}
+
+void MetricsRegistry::remove_collector(size_t handle) {
+  std::lock_guard<std::mutex> lock(collectors_mutex_);
+  collectors_.erase(handle);
+}
+
+std::string MetricsRegistry::render() {
+  {
+    std::lock_guard<std::mutex> lock(collectors_mutex_);
+    for (auto & [handle, collector] : collectors_) {
+      (void)handle;
+      collector(*this);
+    }
+  }
+
+  std::string out;
+  std::shared_lock families_lock(families_mutex_);
+  for (const auto & [name, family] : families_) {
+    std::shared_lock lock(family->mutex);
+    if (family->series.empty()) {
+      continue;
+    }
+
+    out += "# HELP " + name + " " + family->help + "\n";
+    switch (family->type) {
+      case MetricType::COUNTER:
+        out += "# TYPE " + name + " counter\n";
+        break;
+      case MetricType::GAUGE:
+        out += "# TYPE " + name + " gauge\n";
+        break;
+      case MetricType::HISTOGRAM:
+        out += "# TYPE " + name + " histogram\n";
+        break;
+    }
+
+    for (const auto & [labels, series] : family->series) {
+      if (family->type != MetricType::HISTOGRAM) {
+        out += name + (labels.empty() ? "" : "{" + labels + "}") + " " +
+               format_value(series->value.load(std::memory_order_relaxed)) + "\n";
+        continue;
+      }
+
+      uint64_t cumulative = 0;
+      for (size_t i = 0; i < family->buckets.size(); ++i) {
+        cumulative += series->buckets[i].load(std::memory_order_relaxed);
+        out += name + "_bucket" + with_extra_label(labels, "le=\"" + format_value(family->buckets[i]) + "\"") + " " +
+               std::to_string(cumulative) + "\n";
+      }
+      uint64_t count = series->count.load(std::memory_order_relaxed);
+      std::string suffix = labels.empty() ? "" : "{" + labels + "}";
+      out += name + "_bucket" + with_extra_label(labels, "le=\"+Inf\"") + " " + std::to_string(count) + "\n";
+      out += name + "_sum" + suffix + " " + format_value(series->value.load(std::memory_order_relaxed)) + "\n";
+      out += name + "_count" + suffix + " " + std::to_string(count) + "\n";
+    }
+  }
+  return out;
+}
+
+ScopedLatency::ScopedLatency(MetricsRegistry * registry, std::string name, MetricLabels labels)
+  : registry_(registry), name_(std::move(name)), labels_(std::move(labels)), start_(std::chrono::steady_clock::now()) {
+}
+
+ScopedLatency::~ScopedLatency() {
+  if (registry_) {
+    std::chrono::duration<double> elapsed = std::chrono::steady_clock::now() - start_;
+    registry_->observe(name_, labels_, elapsed.count());
+  }
+}
+
+}  // namespace ros2_medkit_gateway
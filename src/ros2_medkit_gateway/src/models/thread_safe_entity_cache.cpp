@@ -20,6 +20,17 @@
 
 namespace ros2_medkit_gateway {
 
+namespace {
+
+/// Find a requested ID in an index keyed by interned ID (an ID never interned is in no index)
+template <typename Index>
+typename Index::const_iterator find_id(const Index & index, const std::string & id) {
+  auto handle = InternedString::lookup(id);
+  return handle ? index.find(*handle) : index.end();
+}
+
+}  // namespace
+
 // ============================================================================
 // Writer methods (exclusive lock)
 // ============================================================================
@@ -43,6 +54,8 @@ void ThreadSafeEntityCache::update_areas(std::vector<Area> areas) {
   last_update_ = std::chrono::system_clock::now();
   rebuild_area_index();
   rebuild_relationship_indexes();
+  rebuild_fqn_indexes();
+  rebuild_aggregations();
 }
 
 void ThreadSafeEntityCache::update_components(std::vector<Component> components) {
@@ -52,6 +65,8 @@ void ThreadSafeEntityCache::update_components(std::vector<Component> components)
   rebuild_component_index();
   rebuild_relationship_indexes();
   rebuild_operation_index();
+  rebuild_fqn_indexes();
+  rebuild_aggregations();
 }
 
 void ThreadSafeEntityCache::update_apps(std::vector<App> apps) {
@@ -61,6 +76,8 @@ void ThreadSafeEntityCache::update_apps(std::vector<App> apps) {
   rebuild_app_index();
   rebuild_relationship_indexes();
   rebuild_operation_index();
+  rebuild_fqn_indexes();
+  rebuild_aggregations();
 }
 
 void ThreadSafeEntityCache::update_functions(std::vector<Function> functions) {
@@ -69,6 +86,8 @@ void ThreadSafeEntityCache::update_functions(std::vector<Function> functions) {
   last_update_ = std::chrono::system_clock::now();
   rebuild_function_index();
   rebuild_relationship_indexes();
+  rebuild_fqn_indexes();
+  rebuild_aggregations();
 }
 
 void ThreadSafeEntityCache::update_topic_types(std::unordered_map<std::string, std::string> topic_types) {
@@ -104,8 +123,10 @@ std::string ThreadSafeEntityCache::get_topic_type(const std::string & topic_name
   std::shared_lock lock(mutex_);
   auto it = topic_type_cache_.find(topic_name);
   if (it != topic_type_cache_.end()) {
+    topic_type_hits_.fetch_add(1, std::memory_order_relaxed);
     return it->second;
   }
+  topic_type_misses_.fetch_add(1, std::memory_order_relaxed);
   return "";
 }
 
@@ -115,37 +136,45 @@ std::string ThreadSafeEntityCache::get_topic_type(const std::string & topic_name
 
 std::optional<Area> ThreadSafeEntityCache::get_area(const std::string & id) const {
   std::shared_lock lock(mutex_);
-  auto it = area_index_.find(id);
+  auto it = find_id(area_index_, id);
   if (it != area_index_.end() && it->second < areas_.size()) {
+    entity_lookup_hits_.fetch_add(1, std::memory_order_relaxed);
     return areas_[it->second];
   }
+  entity_lookup_misses_.fetch_add(1, std::memory_order_relaxed);
   return std::nullopt;
 }
 
 std::optional<Component> ThreadSafeEntityCache::get_component(const std::string & id) const {
   std::shared_lock lock(mutex_);
-  auto it = component_index_.find(id);
+  auto it = find_id(component_index_, id);
   if (it != component_index_.end() && it->second < components_.size()) {
+    entity_lookup_hits_.fetch_add(1, std::memory_order_relaxed);
     return components_[it->second];
   }
+  entity_lookup_misses_.fetch_add(1, std::memory_order_relaxed);
   return std::nullopt;
 }
 
 std::optional<App> ThreadSafeEntityCache::get_app(const std::string & id) const {
   std::shared_lock lock(mutex_);
-  auto it = app_index_.find(id);
+  auto it = find_id(app_index_, id);
   if (it != app_index_.end() && it->second < apps_.size()) {
+    entity_lookup_hits_.fetch_add(1, std::memory_order_relaxed);
     return apps_[it->second];
   }
+  entity_lookup_misses_.fetch_add(1, std::memory_order_relaxed);
   return std::nullopt;
 }
 
 std::optional<Function> ThreadSafeEntityCache::get_function(const std::string & id) const {
   std::shared_lock lock(mutex_);
-  auto it = function_index_.find(id);
+  auto it = find_id(function_index_, id);
   if (it != function_index_.end() && it->second < functions_.size()) {
+    entity_lookup_hits_.fetch_add(1, std::memory_order_relaxed);
     return functions_[it->second];
   }
+  entity_lookup_misses_.fetch_add(1, std::memory_order_relaxed);
   return std::nullopt;
 }
 
@@ -155,22 +184,22 @@ std::optional<Function> ThreadSafeEntityCache::get_function(const std::string &
 
 bool ThreadSafeEntityCache::has_area(const std::string & id) const {
   std::shared_lock lock(mutex_);
-  return area_index_.count(id) > 0;
+  return find_id(area_index_, id) != area_index_.end();
 }
 
 bool ThreadSafeEntityCache::has_component(const std::string & id) const {
   std::shared_lock lock(mutex_);
-  return component_index_.count(id) > 0;
+  return find_id(component_index_, id) != component_index_.end();
 }
 
 bool ThreadSafeEntityCache::has_app(const std::string & id) const {
   std::shared_lock lock(mutex_);
-  return app_index_.count(id) > 0;
+  return find_id(app_index_, id) != app_index_.end();
 }
 
 bool ThreadSafeEntityCache::has_function(const std::string & id) const {
   std::shared_lock lock(mutex_);
-  return function_index_.count(id) > 0;
+  return find_id(function_index_, id) != function_index_.end();
 }
 
 // ============================================================================
@@ -180,20 +209,31 @@ bool ThreadSafeEntityCache::has_function(const std::string & id) const {
 std::optional<EntityRef> ThreadSafeEntityCache::find_entity(const std::string & id) const {
   std::shared_lock lock(mutex_);
 
+  auto handle = InternedString::lookup(id);
+  if (!handle) {
+    entity_lookup_misses_.fetch_add(1, std::memory_order_relaxed);
+    return std::nullopt;
+  }
+
   // Search order: Component, App, Area, Function
-  if (auto it = component_index_.find(id); it != component_index_.end()) {
+  if (auto it = component_index_.find(*handle); it != component_index_.end()) {
+    entity_lookup_hits_.fetch_add(1, std::memory_order_relaxed);
     return EntityRef{SovdEntityType::COMPONENT, it->second};
   }
-  if (auto it = app_index_.find(id); it != app_index_.end()) {
+  if (auto it = app_index_.find(*handle); it != app_index_.end()) {
+    entity_lookup_hits_.fetch_add(1, std::memory_order_relaxed);
     return EntityRef{SovdEntityType::APP, it->second};
   }
-  if (auto it = area_index_.find(id); it != area_index_.end()) {
+  if (auto it = area_index_.find(*handle); it != area_index_.end()) {
+    entity_lookup_hits_.fetch_add(1, std::memory_order_relaxed);
     return EntityRef{SovdEntityType::AREA, it->second};
   }
-  if (auto it = function_index_.find(id); it != function_index_.end()) {
+  if (auto it = function_index_.find(*handle); it != function_index_.end()) {
+    entity_lookup_hits_.fetch_add(1, std::memory_order_relaxed);
     return EntityRef{SovdEntityType::FUNCTION, it->second};
   }
 
+  entity_lookup_misses_.fetch_add(1, std::memory_order_relaxed);
   return std::nullopt;
 }
 
@@ -210,7 +250,7 @@ std::vector<std::string> ThreadSafeEntityCache::get_apps_for_component(const std
   std::shared_lock lock(mutex_);
   std::vector<std::string> result;
 
-  auto it = component_to_apps_.find(component_id);
+  auto it = find_id(component_to_apps_, component_id);
   if (it != component_to_apps_.end()) {
     result.reserve(it->second.size());
     for (size_t idx : it->second) {
@@ -226,7 +266,7 @@ std::vector<std::string> ThreadSafeEntityCache::get_components_for_area(const st
   std::shared_lock lock(mutex_);
   std::vector<std::string> result;
 
-  auto it = area_to_components_.find(area_id);
+  auto it = find_id(area_to_components_, area_id);
   if (it != area_to_components_.end()) {
     result.reserve(it->second.size());
     for (size_t idx : it->second) {
@@ -242,7 +282,7 @@ std::vector<std::string> ThreadSafeEntityCache::get_apps_for_function(const std:
   std::shared_lock lock(mutex_);
   std::vector<std::string> result;
 
-  auto it = function_to_apps_.find(function_id);
+  auto it = find_id(function_to_apps_, function_id);
   if (it != function_to_apps_.end()) {
     result.reserve(it->second.size());
     for (size_t idx : it->second) {
@@ -258,7 +298,7 @@ std::vector<std::string> ThreadSafeEntityCache::get_subareas(const std::string &
   std::shared_lock lock(mutex_);
   std::vector<std::string> result;
 
-  auto it = area_to_subareas_.find(area_id);
+  auto it = find_id(area_to_subareas_, area_id);
   if (it != area_to_subareas_.end()) {
     result.reserve(it->second.size());
     for (size_t idx : it->second) {
@@ -270,6 +310,99 @@ std::vector<std::string> ThreadSafeEntityCache::get_subareas(const std::string &
   return result;
 }
 
+// ============================================================================
+// Precomputed aggregations (component / area / function)
+// ============================================================================
+
+AggregatedOperations ThreadSafeEntityCache::get_component_operations(const std::string & component_id) const {
+  std::shared_lock lock(mutex_);
+  auto it = find_id(component_aggregations_, component_id);
+  if (it != component_aggregations_.end()) {
+    return it->second.operations;
+  }
+  return compute_component_operations(
+      InternedString::lookup(component_id).value_or(InternedString()));  // Unknown entity: empty result
+}
+
+AggregatedOperations ThreadSafeEntityCache::get_area_operations(const std::string & area_id) const {
+  std::shared_lock lock(mutex_);
+  auto it = find_id(area_aggregations_, area_id);
+  if (it != area_aggregations_.end()) {
+    return it->second.operations;
+  }
+  return compute_area_operations(
+      InternedString::lookup(area_id).value_or(InternedString()));  // Unknown entity: empty result
+}
+
+AggregatedOperations ThreadSafeEntityCache::get_function_operations(const std::string & function_id) const {
+  std::shared_lock lock(mutex_);
+  auto it = find_id(function_aggregations_, function_id);
+  if (it != function_aggregations_.end()) {
+    return it->second.operations;
+  }
+  return compute_function_operations(
+      InternedString::lookup(function_id).value_or(InternedString()));  // Unknown entity: empty result
+}
+
+AggregatedData ThreadSafeEntityCache::get_component_data(const std::string & component_id) const {
+  std::shared_lock lock(mutex_);
+  auto it = find_id(component_aggregations_, component_id);
+  if (it != component_aggregations_.end()) {
+    return it->second.data;
+  }
+  return compute_component_data(
+      InternedString::lookup(component_id).value_or(InternedString()));  // Unknown entity: empty result
+}
+
+AggregatedData ThreadSafeEntityCache::get_area_data(const std::string & area_id) const {
+  std::shared_lock lock(mutex_);
+  auto it = find_id(area_aggregations_, area_id);
+  if (it != area_aggregations_.end()) {
+    return it->second.data;
+  }
+  return compute_area_data(InternedString::lookup(area_id).value_or(InternedString()));  // Unknown entity: empty result
+}
+
+AggregatedData ThreadSafeEntityCache::get_function_data(const std::string & function_id) const {
+  std::shared_lock lock(mutex_);
+  auto it = find_id(function_aggregations_, function_id);
+  if (it != function_aggregations_.end()) {
+    return it->second.data;
+  }
+  return compute_function_data(
+      InternedString::lookup(function_id).value_or(InternedString()));  // Unknown entity: empty result
+}
+
+AggregatedConfigurations ThreadSafeEntityCache::get_component_configurations(const std::string & component_id) const {
+  std::shared_lock lock(mutex_);
+  auto it = find_id(component_aggregations_, component_id);
+  if (it != component_aggregations_.end()) {
+    return it->second.configurations;
+  }
+  return compute_component_configurations(
+      InternedString::lookup(component_id).value_or(InternedString()));  // Unknown entity: empty result
+}
+
+AggregatedConfigurations ThreadSafeEntityCache::get_area_configurations(const std::string & area_id) const {
+  std::shared_lock lock(mutex_);
+  auto it = find_id(area_aggregations_, area_id);
+  if (it != area_aggregations_.end()) {
+    return it->second.configurations;
+  }
+  return compute_area_configurations(
+      InternedString::lookup(area_id).value_or(InternedString()));  // Unknown entity: empty result
+}
+
+AggregatedConfigurations ThreadSafeEntityCache::get_function_configurations(const std::string & function_id) const {
+  std::shared_lock lock(mutex_);
+  auto it = find_id(function_aggregations_, function_id);
+  if (it != function_aggregations_.end()) {
+    return it->second.configurations;
+  }
+  return compute_function_configurations(
+      InternedString::lookup(function_id).value_or(InternedString()));  // Unknown entity: empty result
+}
+
 // ============================================================================
 // Aggregation methods
 // ============================================================================
@@ -280,7 +413,7 @@ AggregatedOperations ThreadSafeEntityCache::get_app_operations(const std::string
   result.aggregation_level = "app";
   result.is_aggregated = false;
 
-  auto it = app_index_.find(app_id);
+  auto it = find_id(app_index_, app_id);
   if (it == app_index_.end() || it->second >= apps_.size()) {
     return result;
   }
@@ -293,8 +426,7 @@ AggregatedOperations ThreadSafeEntityCache::get_app_operations(const std::string
   return result;
 }
 
-AggregatedOperations ThreadSafeEntityCache::get_component_operations(const std::string & component_id) const {
-  std::shared_lock lock(mutex_);
+AggregatedOperations ThreadSafeEntityCache::compute_component_operations(const InternedString & component_id) const {
   AggregatedOperations result;
   result.aggregation_level = "component";
 
@@ -321,8 +453,7 @@ AggregatedOperations ThreadSafeEntityCache::get_component_operations(const std::
   return result;
 }
 
-AggregatedOperations ThreadSafeEntityCache::get_area_operations(const std::string & area_id) const {
-  std::shared_lock lock(mutex_);
+AggregatedOperations ThreadSafeEntityCache::compute_area_operations(const InternedString & area_id) const {
   AggregatedOperations result;
   result.aggregation_level = "area";
   result.is_aggregated = true;  // Area operations are always aggregated
@@ -358,8 +489,7 @@ AggregatedOperations ThreadSafeEntityCache::get_area_operations(const std::strin
   return result;
 }
 
-AggregatedOperations ThreadSafeEntityCache::get_function_operations(const std::string & function_id) const {
-  std::shared_lock lock(mutex_);
+AggregatedOperations ThreadSafeEntityCache::compute_function_operations(const InternedString & function_id) const {
   AggregatedOperations result;
   result.aggregation_level = "function";
   result.is_aggregated = true;  // Function operations are always aggregated
@@ -411,7 +541,7 @@ AggregatedConfigurations ThreadSafeEntityCache::get_app_configurations(const std
   result.aggregation_level = "app";
   result.is_aggregated = false;
 
-  auto it = app_index_.find(app_id);
+  auto it = find_id(app_index_, app_id);
   if (it == app_index_.end() || it->second >= apps_.size()) {
     return result;
   }
@@ -431,8 +561,8 @@ AggregatedConfigurations ThreadSafeEntityCache::get_app_configurations(const std
   return result;
 }
 
-AggregatedConfigurations ThreadSafeEntityCache::get_component_configurations(const std::string & component_id) const {
-  std::shared_lock lock(mutex_);
+AggregatedConfigurations
+ThreadSafeEntityCache::compute_component_configurations(const InternedString & component_id) const {
   AggregatedConfigurations result;
   result.aggregation_level = "component";
 
@@ -468,8 +598,7 @@ AggregatedConfigurations ThreadSafeEntityCache::get_component_configurations(con
   return result;
 }
 
-AggregatedConfigurations ThreadSafeEntityCache::get_area_configurations(const std::string & area_id) const {
-  std::shared_lock lock(mutex_);
+AggregatedConfigurations ThreadSafeEntityCache::compute_area_configurations(const InternedString & area_id) const {
   AggregatedConfigurations result;
   result.aggregation_level = "area";
 
@@ -518,8 +647,8 @@ AggregatedConfigurations ThreadSafeEntityCache::get_area_configurations(const st
   return result;
 }
 
-AggregatedConfigurations ThreadSafeEntityCache::get_function_configurations(const std::string & function_id) const {
-  std::shared_lock lock(mutex_);
+AggregatedConfigurations
+ThreadSafeEntityCache::compute_function_configurations(const InternedString & function_id) const {
   AggregatedConfigurations result;
   result.aggregation_level = "function";
 
@@ -555,6 +684,37 @@ AggregatedConfigurations ThreadSafeEntityCache::get_function_configurations(cons
   return result;
 }
 
+// ============================================================================
+// Node FQN indexes
+// ============================================================================
+
+std::unordered_set<std::string> ThreadSafeEntityCache::get_entity_fqns(SovdEntityType type,
+                                                                       const std::string & entity_id) const {
+  std::shared_lock lock(mutex_);
+  const std::unordered_map<InternedString, std::unordered_set<std::string>> * index = nullptr;
+  switch (type) {
+    case SovdEntityType::APP:
+      index = &app_fqns_;
+      break;
+    case SovdEntityType::COMPONENT:
+      index = &component_fqns_;
+      break;
+    case SovdEntityType::AREA:
+      index = &area_fqns_;
+      break;
+    case SovdEntityType::FUNCTION:
+      index = &function_fqns_;
+      break;
+    default:
+      return {};
+  }
+  auto it = find_id(*index, entity_id);
+  if (it != index->end()) {
+    return it->second;
+  }
+  return {};
+}
+
 // ============================================================================
 // Operation lookup
 // ============================================================================
@@ -581,6 +741,10 @@ EntityCacheStats ThreadSafeEntityCache::get_stats() const {
   stats.function_count = functions_.size();
   stats.total_operations = operation_index_.size();
   stats.last_update = last_update_;
+  stats.entity_lookup_hits = entity_lookup_hits_.load(std::memory_order_relaxed);
+  stats.entity_lookup_misses = entity_lookup_misses_.load(std::memory_order_relaxed);
+  stats.topic_type_hits = topic_type_hits_.load(std::memory_order_relaxed);
+  stats.topic_type_misses = topic_type_misses_.load(std::memory_order_relaxed);
   return stats;
 }
 
@@ -625,7 +789,7 @@ std::string ThreadSafeEntityCache::validate() const {
   }
 
   // Check for duplicate IDs
-  std::unordered_set<std::string> seen_ids;
+  std::unordered_set<InternedString> seen_ids;
   for (const auto & area : areas_) {
     if (!seen_ids.insert(area.id).second) {
       errors << "Duplicate area ID: " << area.id << "\n";
@@ -666,6 +830,8 @@ void ThreadSafeEntityCache::rebuild_all_indexes() {
   rebuild_function_index();
   rebuild_relationship_indexes();
   rebuild_operation_index();
+  rebuild_fqn_indexes();
+  rebuild_aggregations();
 }
 
 void ThreadSafeEntityCache::rebuild_area_index() {
@@ -734,7 +900,7 @@ void ThreadSafeEntityCache::rebuild_relationship_indexes() {
   // Note: Function.hosts contains app IDs that implement this function
   for (const auto & func : functions_) {
     for (const auto & app_id : func.hosts) {
-      auto app_it = app_index_.find(app_id);
+      auto app_it = find_id(app_index_, app_id);
       if (app_it != app_index_.end()) {
         function_to_apps_[func.id].push_back(app_it->second);
       }
@@ -742,6 +908,29 @@ void ThreadSafeEntityCache::rebuild_relationship_indexes() {
   }
 }
 
+void ThreadSafeEntityCache::rebuild_aggregations() {
+  component_aggregations_.clear();
+  area_aggregations_.clear();
+  function_aggregations_.clear();
+  component_aggregations_.reserve(components_.size());
+  area_aggregations_.reserve(areas_.size());
+  function_aggregations_.reserve(functions_.size());
+
+  // Walk the hierarchy once per update so aggregated reads are a lookup
+  for (const auto & comp : components_) {
+    component_aggregations_[comp.id] = {compute_component_data(comp.id), compute_component_operations(comp.id),
+                                        compute_component_configurations(comp.id)};
+  }
+  for (const auto & area : areas_) {
+    area_aggregations_[area.id] = {compute_area_data(area.id), compute_area_operations(area.id),
+                                   compute_area_configurations(area.id)};
+  }
+  for (const auto & func : functions_) {
+    function_aggregations_[func.id] = {compute_function_data(func.id), compute_function_operations(func.id),
+                                       compute_function_configurations(func.id)};
+  }
+}
+
 void ThreadSafeEntityCache::rebuild_operation_index() {
   operation_index_.clear();
 
@@ -768,6 +957,45 @@ void ThreadSafeEntityCache::rebuild_operation_index() {
   }
 }
 
+void ThreadSafeEntityCache::rebuild_fqn_indexes() {
+  app_fqns_.clear();
+  component_fqns_.clear();
+  area_fqns_.clear();
+  function_fqns_.clear();
+
+  auto add_apps = [this](std::unordered_set<std::string> & fqns, const std::vector<size_t> & app_indexes) {
+    for (size_t idx : app_indexes) {
+      if (idx < apps_.size() && apps_[idx].bound_fqn.has_value() && !apps_[idx].bound_fqn->empty()) {
+        fqns.insert(*apps_[idx].bound_fqn);
+      }
+    }
+  };
+
+  for (size_t i = 0; i < apps_.size(); ++i) {
+    if (apps_[i].bound_fqn.has_value() && !apps_[i].bound_fqn->empty()) {
+      app_fqns_[apps_[i].id].insert(*apps_[i].bound_fqn);
+    }
+  }
+  for (const auto & [component_id, app_indexes] : component_to_apps_) {
+    add_apps(component_fqns_[component_id], app_indexes);
+  }
+  for (const auto & [area_id, comp_indexes] : area_to_components_) {
+    auto & fqns = area_fqns_[area_id];
+    for (size_t comp_idx : comp_indexes) {
+      if (comp_idx >= components_.size()) {
+        continue;
+      }
+      auto apps_it = component_to_apps_.find(components_[comp_idx].id);
+      if (apps_it != component_to_apps_.end()) {
+        add_apps(fqns, apps_it->second);
+      }
+    }
+  }
+  for (const auto & [function_id, app_indexes] : function_to_apps_) {
+    add_apps(function_fqns_[function_id], app_indexes);
+  }
+}
+
 // ============================================================================
 // Aggregation helpers
 // ============================================================================
@@ -846,7 +1074,7 @@ AggregatedData ThreadSafeEntityCache::get_entity_data(const std::string & entity
 AggregatedData ThreadSafeEntityCache::get_app_data(const std::string & app_id) const {
   std::shared_lock lock(mutex_);
 
-  auto it = app_index_.find(app_id);
+  auto it = find_id(app_index_, app_id);
   if (it == app_index_.end()) {
     return {};
   }
@@ -861,9 +1089,7 @@ AggregatedData ThreadSafeEntityCache::get_app_data(const std::string & app_id) c
   return result;
 }
 
-AggregatedData ThreadSafeEntityCache::get_component_data(const std::string & component_id) const {
-  std::shared_lock lock(mutex_);
-
+AggregatedData ThreadSafeEntityCache::compute_component_data(const InternedString & component_id) const {
   auto comp_it = component_index_.find(component_id);
   if (comp_it == component_index_.end()) {
     return {};
@@ -887,9 +1113,7 @@ AggregatedData ThreadSafeEntityCache::get_component_data(const std::string & com
   return result;
 }
 
-AggregatedData ThreadSafeEntityCache::get_area_data(const std::string & area_id) const {
-  std::shared_lock lock(mutex_);
-
+AggregatedData ThreadSafeEntityCache::compute_area_data(const InternedString & area_id) const {
   auto area_it = area_index_.find(area_id);
   if (area_it == area_index_.end()) {
     return {};
@@ -904,12 +1128,12 @@ AggregatedData ThreadSafeEntityCache::get_area_data(const std::string & area_id)
 
   // Collect from all components in this area **and its subareas** (recursive)
   std::vector<size_t> component_indices;
-  std::unordered_set<std::string> visited_areas;
-  std::vector<std::string> pending_areas;
+  std::unordered_set<InternedString> visited_areas;
+  std::vector<InternedString> pending_areas;
   pending_areas.push_back(area_id);
 
   while (!pending_areas.empty()) {
-    const std::string current_area = pending_areas.back();
+    const InternedString current_area = pending_areas.back();
     pending_areas.pop_back();
 
     // Skip already-visited areas to prevent infinite loops in case of cycles
@@ -949,9 +1173,7 @@ AggregatedData ThreadSafeEntityCache::get_area_data(const std::string & area_id)
   return result;
 }
 
-AggregatedData ThreadSafeEntityCache::get_function_data(const std::string & function_id) const {
-  std::shared_lock lock(mutex_);
-
+AggregatedData ThreadSafeEntityCache::compute_function_data(const InternedString & function_id) const {
   auto func_it = function_index_.find(function_id);
   if (func_it == function_index_.end()) {
     return {};
@@ -198,7 +198,8 @@ std::string NativeTopicSampler::get_topic_type(const std::string & topic_name) {
   return "";
 }
 
-TopicSampleResult NativeTopicSampler::sample_topic(const std::string & topic_name, double timeout_sec) {
+TopicSampleResult NativeTopicSampler::sample_topic(const std::string & topic_name, double timeout_sec,
+                                                   const ros2_medkit_serialization::ProjectionOptions & projection) {
   RCLCPP_DEBUG(node_->get_logger(), "sample_topic: START topic='%s', timeout=%.2f", topic_name.c_str(), timeout_sec);
   TopicSampleResult result;
   result.topic_name = topic_name;
@@ -216,6 +217,16 @@ TopicSampleResult NativeTopicSampler::sample_topic(const std::string & topic_nam
   RCLCPP_DEBUG(node_->get_logger(), "sample_topic: topic='%s' type='%s' pubs=%zu subs=%zu", topic_name.c_str(),
                info->type.c_str(), info->publisher_count, info->subscriber_count);
 
+  // Reject unknown fields from the type description, so a quiet topic does not hide a bad projection
+  if (!projection.fields.selects_all()) {
+    try {
+      serializer_->validate_projection(info->type, projection.fields);
+    } catch (const ros2_medkit_serialization::TypeNotFoundError & e) {
+      RCLCPP_DEBUG(node_->get_logger(), "sample_topic: Cannot check fields for type '%s': %s", info->type.c_str(),
+                   e.what());
+    }
+  }
+
   result.message_type = info->type;
   result.publisher_count = info->publisher_count;
   result.subscriber_count = info->subscriber_count;
@@ -296,13 +307,16 @@ TopicSampleResult NativeTopicSampler::sample_topic(const std::string & topic_nam
     // Deserialize message using JsonSerializer
     try {
       auto serialized_msg = message_future.get();
-      result.data = serializer_->deserialize(info->type, serialized_msg);
+      result.data = serializer_->deserialize(info->type, serialized_msg, projection);
       result.has_data = true;
       RCLCPP_DEBUG(node_->get_logger(), "sample_topic: Sampled data from topic '%s'", topic_name.c_str());
     } catch (const ros2_medkit_serialization::TypeNotFoundError & e) {
       RCLCPP_WARN(node_->get_logger(), "Unknown type '%s' for topic '%s': %s", info->type.c_str(), topic_name.c_str(),
                   e.what());
       result.has_data = false;
+    } catch (const ros2_medkit_serialization::FieldProjectionError &) {
+      // Invalid projection is a client error, let the caller report it
+      throw;
     } catch (const ros2_medkit_serialization::SerializationError & e) {
       RCLCPP_WARN(node_->get_logger(), "Failed to deserialize message from '%s': %s", topic_name.c_str(), e.what());
       result.has_data = false;
@@ -311,6 +325,8 @@ TopicSampleResult NativeTopicSampler::sample_topic(const std::string & topic_nam
       result.has_data = false;
     }
 
+  } catch (const ros2_medkit_serialization::FieldProjectionError &) {
+    throw;
   } catch (const std::exception & e) {
     RCLCPP_WARN(node_->get_logger(), "Exception sampling topic '%s': %s", topic_name.c_str(), e.what());
     result.has_data = false;
@@ -15,10 +15,8 @@
 #include "ros2_medkit_gateway/operation_manager.hpp"
 
 #include <algorithm>
-#include <iomanip>
 #include <regex>
 #include <set>
-#include <sstream>
 
 #include "ros2_medkit_serialization/json_serializer.hpp"
 #include "ros2_medkit_serialization/message_cleanup.hpp"
@@ -34,6 +32,57 @@ constexpr size_t kUuidHexLength = 32;
 /// Default timeout for service calls in seconds
 constexpr int kDefaultServiceCallTimeoutSec = 10;
 
+/// Default number of threads running asynchronous service calls
+constexpr int kDefaultServiceExecutionWorkers = 4;
+
+/// Default number of asynchronous service calls waiting for a worker
+constexpr int kDefaultServiceExecutionQueueSize = 64;
+
+/// Default maximum number of tracked action goals
+constexpr int kDefaultMaxTrackedGoals = 1000;
+
+/// Default idle time after which unused action clients are dropped
+constexpr int kDefaultActionClientIdleTimeoutSec = 300;
+
+namespace {
+
+/// Goal reached a terminal state (succeeded, canceled, aborted)
+bool is_finished_status(ActionGoalStatus status) {
+  return status == ActionGoalStatus::SUCCEEDED || status == ActionGoalStatus::CANCELED ||
+         status == ActionGoalStatus::ABORTED;
+}
+
+/// Write the hex form of a goal UUID into @p out (no allocation)
+void uuid_to_hex(const std::array<uint8_t, 16> & uuid, char (&out)[kUuidHexLength]) {
+  static constexpr char kDigits[] = "0123456789abcdef";
+  for (size_t i = 0; i < uuid.size(); ++i) {
+    out[2 * i] = kDigits[uuid[i] >> 4];
+    out[2 * i + 1] = kDigits[uuid[i] & 0x0f];
+  }
+}
+
+/// Map an action_msgs status code to ActionGoalStatus
+ActionGoalStatus from_goal_status_code(int8_t code) {
+  switch (code) {
+    case action_msgs::msg::GoalStatus::STATUS_ACCEPTED:
+      return ActionGoalStatus::ACCEPTED;
+    case action_msgs::msg::GoalStatus::STATUS_EXECUTING:
+      return ActionGoalStatus::EXECUTING;
+    case action_msgs::msg::GoalStatus::STATUS_CANCELING:
+      return ActionGoalStatus::CANCELING;
+    case action_msgs::msg::GoalStatus::STATUS_SUCCEEDED:
+      return ActionGoalStatus::SUCCEEDED;
+    case action_msgs::msg::GoalStatus::STATUS_CANCELED:
+      return ActionGoalStatus::CANCELED;
+    case action_msgs::msg::GoalStatus::STATUS_ABORTED:
+      return ActionGoalStatus::ABORTED;
+    default:
+      return ActionGoalStatus::UNKNOWN;
+  }
+}
+
+}  // namespace
+
 OperationManager::OperationManager(rclcpp::Node * node, DiscoveryManager * discovery_manager)
   : node_(node)
   , discovery_manager_(discovery_manager)
@@ -41,9 +90,54 @@ OperationManager::OperationManager(rclcpp::Node * node, DiscoveryManager * disco
   , serializer_(std::make_shared<ros2_medkit_serialization::JsonSerializer>())
   , service_call_timeout_sec_(
         static_cast<int>(node->declare_parameter<int64_t>("service_call_timeout_sec", kDefaultServiceCallTimeoutSec))) {
+  // Validate service_execution_workers against allowed range [1, 64]
+  auto workers = node_->declare_parameter<int64_t>("service_execution_workers", kDefaultServiceExecutionWorkers);
+  if (workers < 1 || workers > 64) {
+    RCLCPP_WARN(node_->get_logger(), "service_execution_workers (%ld) out of valid range (1-64), using default: %d",
+                static_cast<long>(workers), kDefaultServiceExecutionWorkers);
+    workers = kDefaultServiceExecutionWorkers;
+  }
+
+  // Validate service_execution_queue_size against allowed range [1, 4096]
+  auto queue_size =
+      node_->declare_parameter<int64_t>("service_execution_queue_size", kDefaultServiceExecutionQueueSize);
+  if (queue_size < 1 || queue_size > 4096) {
+    RCLCPP_WARN(node_->get_logger(),
+                "service_execution_queue_size (%ld) out of valid range (1-4096), using default: %d",
+                static_cast<long>(queue_size), kDefaultServiceExecutionQueueSize);
+    queue_size = kDefaultServiceExecutionQueueSize;
+  }
+
+  service_jobs_ = std::make_unique<JobQueue>(static_cast<size_t>(workers), static_cast<size_t>(queue_size));
+
+  // Validate max_tracked_goals against allowed range [1, 1000000]
+  auto max_goals = node_->declare_parameter<int64_t>("max_tracked_goals", kDefaultMaxTrackedGoals);
+  if (max_goals < 1 || max_goals > 1000000) {
+    RCLCPP_WARN(node_->get_logger(), "max_tracked_goals (%ld) out of valid range (1-1000000), using default: %d",
+                static_cast<long>(max_goals), kDefaultMaxTrackedGoals);
+    max_goals = kDefaultMaxTrackedGoals;
+  }
+  max_tracked_goals_ = static_cast<size_t>(max_goals);
+
+  // Validate action_client_idle_timeout_sec against allowed range [1, 86400]
+  auto idle_timeout =
+      node_->declare_parameter<int64_t>("action_client_idle_timeout_sec", kDefaultActionClientIdleTimeoutSec);
+  if (idle_timeout < 1 || idle_timeout > 86400) {
+    RCLCPP_WARN(node_->get_logger(),
+                "action_client_idle_timeout_sec (%ld) out of valid range (1-86400), using default: %d",
+                static_cast<long>(idle_timeout), kDefaultActionClientIdleTimeoutSec);
+    idle_timeout = kDefaultActionClientIdleTimeoutSec;
+  }
+  action_client_idle_timeout_ = std::chrono::seconds(idle_timeout);
+
   RCLCPP_INFO(node_->get_logger(), "OperationManager initialized with native serialization");
 }
 
+OperationManager::~OperationManager() {
+  // Finish running service calls before the state they update goes away
+  service_jobs_->shutdown();
+}
+
 bool OperationManager::is_valid_message_type(const std::string & type) {
   // Valid formats:
   // - package/srv/Type (service)
@@ -108,6 +202,7 @@ rclcpp::GenericClient::SharedPtr OperationManager::get_or_create_service_client(
 ServiceCallResult OperationManager::call_service(const std::string & service_path, const std::string & service_type,
                                                  const json & request) {
   ServiceCallResult result;
+  ScopedLatency latency(metrics_, "medkit_ros_service_call_duration_seconds", {{"service", service_path}});
 
   try {
     using ros2_medkit_serialization::ServiceActionTypes;
@@ -115,9 +210,10 @@ ServiceCallResult OperationManager::call_service(const std::string & service_pat
     // Step 1: Get or create cached client
     auto client = get_or_create_service_client(service_path, service_type);
 
-    // Step 2: Wait for service availability
-    if (!client->wait_for_service(std::chrono::seconds(5))) {
+    // Step 2: Check service availability
+    if (!wait_for_server(availability_, client, std::chrono::seconds(5))) {
       result.success = false;
+      result.service_unavailable = true;
       result.error_message = "Service not available: " + service_path;
       return result;
     }
@@ -275,6 +371,101 @@ ServiceCallResult OperationManager::call_component_service(const std::string & c
   return call_service(service_path, resolved_type, request);
 }
 
+// ==================== ASYNCHRONOUS SERVICE EXECUTIONS ====================
+
+ServiceSubmitResult OperationManager::submit_service_call(const std::string & service_path,
+                                                          const std::string & service_type, const json & request) {
+  ServiceSubmitResult result;
+  result.success = false;
+
+  std::string execution_id = uuid_bytes_to_hex(generate_uuid());
+  {
+    std::lock_guard<std::mutex> lock(service_executions_mutex_);
+    ServiceExecutionInfo info;
+    info.execution_id = execution_id;
+    info.service_path = service_path;
+    info.service_type = service_type;
+    info.status = ActionGoalStatus::ACCEPTED;
+    info.result.success = false;
+    info.created_at = std::chrono::system_clock::now();
+    info.last_update = info.created_at;
+    service_executions_[execution_id] = info;
+  }
+
+  bool queued = service_jobs_->submit([this, execution_id, service_path, service_type, request]() {
+    {
+      std::lock_guard<std::mutex> lock(service_executions_mutex_);
+      auto it = service_executions_.find(execution_id);
+      if (it == service_executions_.end() || it->second.status != ActionGoalStatus::ACCEPTED) {
+        return;  // Canceled while queued
+      }
+      it->second.status = ActionGoalStatus::EXECUTING;
+      it->second.last_update = std::chrono::system_clock::now();
+    }
+
+    auto call_result = call_service(service_path, service_type, request);
+
+    std::lock_guard<std::mutex> lock(service_executions_mutex_);
+    auto it = service_executions_.find(execution_id);
+    if (it != service_executions_.end()) {
+      it->second.status = call_result.success ? ActionGoalStatus::SUCCEEDED : ActionGoalStatus::ABORTED;
+      it->second.result = std::move(call_result);
+      it->second.last_update = std::chrono::system_clock::now();
+    }
+  });
+
+  if (!queued) {
+    std::lock_guard<std::mutex> lock(service_executions_mutex_);
+    service_executions_.erase(execution_id);
+    result.error_message = "Service execution queue is full";
+    return result;
+  }
+
+  RCLCPP_DEBUG(node_->get_logger(), "Queued service call %s with execution ID: %s", service_path.c_str(),
+               execution_id.c_str());
+  result.success = true;
+  result.execution_id = execution_id;
+  return result;
+}
+
+std::optional<ServiceExecutionInfo> OperationManager::get_service_execution(const std::string & execution_id) const {
+  std::lock_guard<std::mutex> lock(service_executions_mutex_);
+  auto it = service_executions_.find(execution_id);
+  if (it != service_executions_.end()) {
+    return it->second;
+  }
+  return std::nullopt;
+}
+
+std::vector<ServiceExecutionInfo> OperationManager::get_service_executions(const std::string & service_path) const {
+  std::vector<ServiceExecutionInfo> executions;
+  {
+    std::lock_guard<std::mutex> lock(service_executions_mutex_);
+    for (const auto & [id, info] : service_executions_) {
+      if (info.service_path == service_path) {
+        executions.push_back(info);
+      }
+    }
+  }
+
+  std::sort(executions.begin(), executions.end(), [](const ServiceExecutionInfo & a, const ServiceExecutionInfo & b) {
+    return a.created_at > b.created_at;
+  });
+  return executions;
+}
+
+bool OperationManager::cancel_service_execution(const std::string & execution_id) {
+  std::lock_guard<std::mutex> lock(service_executions_mutex_);
+  auto it = service_executions_.find(execution_id);
+  if (it == service_executions_.end() || it->second.status != ActionGoalStatus::ACCEPTED) {
+    return false;
+  }
+  // The queued job sees the new status and skips the call
+  it->second.status = ActionGoalStatus::CANCELED;
+  it->second.last_update = std::chrono::system_clock::now();
+  return true;
+}
+
 // ==================== ACTION OPERATIONS ====================
 
 std::string action_status_to_string(ActionGoalStatus status) {
@@ -298,6 +489,23 @@ std::string action_status_to_string(ActionGoalStatus status) {
   }
 }
 
+void OperationManager::set_metrics_registry(MetricsRegistry * metrics) {
+  metrics_ = metrics;
+  if (metrics_) {
+    metrics_->describe_histogram("medkit_ros_service_call_duration_seconds",
+                                 "ROS 2 service call latency by target service");
+  }
+}
+
+void OperationManager::set_service_availability(ServiceAvailability * availability) {
+  availability_ = availability;
+}
+
+size_t OperationManager::action_client_count() const {
+  std::shared_lock<std::shared_mutex> lock(clients_mutex_);
+  return action_clients_.size();
+}
+
 std::array<uint8_t, 16> OperationManager::generate_uuid() {
   std::lock_guard<std::mutex> lock(rng_mutex_);
   std::array<uint8_t, 16> uuid;
@@ -329,52 +537,138 @@ json OperationManager::uuid_hex_to_json_array(const std::string & uuid_hex) {
   return array;
 }
 
-OperationManager::ActionClientSet & OperationManager::get_or_create_action_clients(const std::string & action_path,
-                                                                                   const std::string & action_type) {
+std::shared_ptr<OperationManager::ActionClientSet>
+OperationManager::get_or_create_action_clients(const std::string & action_path, const std::string & action_type) {
   std::unique_lock<std::shared_mutex> lock(clients_mutex_);
 
   auto it = action_clients_.find(action_path);
   if (it != action_clients_.end()) {
+    it->second->last_used = std::chrono::steady_clock::now();
     return it->second;
   }
 
   using namespace ros2_medkit_serialization;
 
-  ActionClientSet clients;
-  clients.action_type = action_type;
+  auto clients = std::make_shared<ActionClientSet>();
+  clients->action_type = action_type;
+  clients->last_used = std::chrono::steady_clock::now();
 
   // Send goal service: {action}/_action/send_goal
   std::string send_goal_service = action_path + "/_action/send_goal";
   std::string send_goal_type = ServiceActionTypes::get_action_send_goal_service_type(action_type);
-  clients.send_goal_client = node_->create_generic_client(send_goal_service, send_goal_type);
+  clients->send_goal_client = node_->create_generic_client(send_goal_service, send_goal_type);
 
   // Get result service: {action}/_action/get_result
   std::string get_result_service = action_path + "/_action/get_result";
   std::string get_result_type = ServiceActionTypes::get_action_get_result_service_type(action_type);
-  clients.get_result_client = node_->create_generic_client(get_result_service, get_result_type);
+  clients->get_result_client = node_->create_generic_client(get_result_service, get_result_type);
 
   // Cancel goal service (standard type for all actions)
   std::string cancel_service = action_path + "/_action/cancel_goal";
-  clients.cancel_goal_client = node_->create_generic_client(cancel_service, "action_msgs/srv/CancelGoal");
+  clients->cancel_goal_client = node_->create_generic_client(cancel_service, "action_msgs/srv/CancelGoal");
 
   RCLCPP_DEBUG(node_->get_logger(), "Created action clients for %s (type: %s)", action_path.c_str(),
                action_type.c_str());
 
-  action_clients_[action_path] = std::move(clients);
-  return action_clients_[action_path];
+  action_clients_[action_path] = clients;
+  return clients;
+}
+
+void OperationManager::evict_idle_action_clients() {
+  // Actions with tracked goals keep their clients
+  std::set<std::string> active_actions;
+  {
+    std::lock_guard<std::mutex> lock(goals_mutex_);
+    for (const auto & entry : goals_by_action_) {
+      active_actions.insert(entry.first);
+    }
+  }
+
+  std::unique_lock<std::shared_mutex> lock(clients_mutex_);
+  auto now = std::chrono::steady_clock::now();
+  for (auto it = action_clients_.begin(); it != action_clients_.end();) {
+    if (active_actions.count(it->first) == 0 && now - it->second->last_used > action_client_idle_timeout_) {
+      RCLCPP_DEBUG(node_->get_logger(), "Dropped idle action clients for %s", it->first.c_str());
+      it = action_clients_.erase(it);
+    } else {
+      ++it;
+    }
+  }
+}
+
+bool OperationManager::can_track_new_goal() const {
+  std::lock_guard<std::mutex> lock(goals_mutex_);
+  return tracked_goals_.size() < max_tracked_goals_ || !finished_goals_.empty();
 }
 
 void OperationManager::track_goal(const std::string & goal_id, const std::string & action_path,
                                   const std::string & action_type) {
-  std::lock_guard<std::mutex> lock(goals_mutex_);
-  ActionGoalInfo info;
-  info.goal_id = goal_id;
-  info.action_path = action_path;
-  info.action_type = action_type;
-  info.status = ActionGoalStatus::ACCEPTED;
-  info.created_at = std::chrono::system_clock::now();
-  info.last_update = info.created_at;
-  tracked_goals_[goal_id] = info;
+  std::vector<std::string> emptied_actions;
+
+  {
+    std::lock_guard<std::mutex> lock(goals_mutex_);
+    auto existing = tracked_goals_.find(goal_id);
+    if (existing != tracked_goals_.end()) {
+      erase_goal_locked(existing, emptied_actions);
+    }
+
+    // Keep memory bounded: drop the oldest finished goals. Running goals stay tracked, so a goal sent
+    // while another request took the last free slot goes over the limit instead of hiding a running one
+    while (tracked_goals_.size() >= max_tracked_goals_ && !finished_goals_.empty()) {
+      erase_goal_locked(tracked_goals_.find(finished_goals_.begin()->second), emptied_actions);
+    }
+    if (tracked_goals_.size() >= max_tracked_goals_) {
+      RCLCPP_WARN(node_->get_logger(), "max_tracked_goals (%zu) reached with all goals running, tracking %s anyway",
+                  max_tracked_goals_, goal_id.c_str());
+    }
+
+    ActionGoalInfo info;
+    info.goal_id = goal_id;
+    info.action_path = action_path;
+    info.action_type = action_type;
+    info.status = ActionGoalStatus::ACCEPTED;
+    info.created_at = std::chrono::system_clock::now();
+    info.last_update = info.created_at;
+    goals_by_action_[action_path].emplace(info.created_at, goal_id);
+    tracked_goals_.emplace(goal_id, std::move(info));
+
+    // The new goal may belong to an action whose last goal was just evicted
+    emptied_actions.erase(std::remove(emptied_actions.begin(), emptied_actions.end(), action_path),
+                          emptied_actions.end());
+  }  // Release goals_mutex_ before touching subscriptions
+
+  for (const auto & path : emptied_actions) {
+    unsubscribe_from_action_status(path);
+  }
+}
+
+void OperationManager::set_goal_status_locked(ActionGoalInfo & info, ActionGoalStatus status,
+                                              std::chrono::system_clock::time_point now) {
+  if (is_finished_status(info.status)) {
+    finished_goals_.erase({info.last_update, info.goal_id});
+  }
+  info.status = status;
+  info.last_update = now;
+  if (is_finished_status(status)) {
+    finished_goals_.emplace(now, info.goal_id);
+  }
+}
+
+void OperationManager::erase_goal_locked(GoalMap::iterator it, std::vector<std::string> & emptied_actions) {
+  const ActionGoalInfo & info = it->second;
+  if (is_finished_status(info.status)) {
+    finished_goals_.erase({info.last_update, info.goal_id});
+  }
+
+  auto action_it = goals_by_action_.find(info.action_path);
+  if (action_it != goals_by_action_.end()) {
+    action_it->second.erase({info.created_at, info.goal_id});
+    if (action_it->second.empty()) {
+      emptied_actions.push_back(info.action_path);
+      goals_by_action_.erase(action_it);
+    }
+  }
+  tracked_goals_.erase(it);
 }
 
 ActionSendGoalResult OperationManager::send_action_goal(const std::string & action_path,
@@ -382,15 +676,24 @@ ActionSendGoalResult OperationManager::send_action_goal(const std::string & acti
   ActionSendGoalResult result;
   result.success = false;
   result.goal_accepted = false;
+  ScopedLatency latency(metrics_, "medkit_ros_service_call_duration_seconds",
+                        {{"service", action_path + "/_action/send_goal"}});
 
   try {
     using namespace ros2_medkit_serialization;
 
+    // Goals are not sent when they could not be tracked: that would mean dropping a running goal
+    if (!can_track_new_goal()) {
+      result.goal_limit_reached = true;
+      result.error_message = "Too many running goals (max_tracked_goals: " + std::to_string(max_tracked_goals_) + ")";
+      return result;
+    }
+
     // Step 1: Get or create action clients
-    auto & clients = get_or_create_action_clients(action_path, action_type);
+    auto clients = get_or_create_action_clients(action_path, action_type);
 
     // Step 2: Wait for send_goal service
-    if (!clients.send_goal_client->wait_for_service(std::chrono::seconds(5))) {
+    if (!wait_for_server(availability_, clients->send_goal_client, std::chrono::seconds(5))) {
       result.error_message = "Action server not available: " + action_path;
       return result;
     }
@@ -417,14 +720,14 @@ ActionSendGoalResult OperationManager::send_action_goal(const std::string & acti
     RCLCPP_INFO(node_->get_logger(), "Sending action goal: %s (type: %s)", action_path.c_str(), action_type.c_str());
 
     // Send using GenericClient (expects void* to deserialized message)
-    auto future_and_id = clients.send_goal_client->async_send_request(ros_request.data);
+    auto future_and_id = clients->send_goal_client->async_send_request(ros_request.data);
 
     // Wait for response with timeout
     auto timeout = std::chrono::seconds(service_call_timeout_sec_);
     auto future_status = future_and_id.wait_for(timeout);
 
     if (future_status != std::future_status::ready) {
-      clients.send_goal_client->remove_pending_request(future_and_id.request_id);
+      clients->send_goal_client->remove_pending_request(future_and_id.request_id);
       ros2_medkit_serialization::destroy_ros_message(&ros_request);
       result.error_message = "Send goal timed out";
       return result;
@@ -455,7 +758,7 @@ ActionSendGoalResult OperationManager::send_action_goal(const std::string & acti
     if (result.goal_accepted) {
       result.goal_id = uuid_bytes_to_hex(uuid_bytes);
       track_goal(result.goal_id, action_path, action_type);
-      subscribe_to_action_status(action_path);
+      subscribe_to_action_status(action_path, action_type);
       update_goal_status(result.goal_id, ActionGoalStatus::EXECUTING);
       RCLCPP_INFO(node_->get_logger(), "Action goal accepted with ID: %s", result.goal_id.c_str());
     } else {
@@ -537,9 +840,9 @@ ActionCancelResult OperationManager::cancel_action_goal(const std::string & acti
     }
 
     // Get or create action clients (use tracked type)
-    auto & clients = get_or_create_action_clients(action_path, goal_info->action_type);
+    auto clients = get_or_create_action_clients(action_path, goal_info->action_type);
 
-    if (!clients.cancel_goal_client->wait_for_service(std::chrono::seconds(2))) {
+    if (!wait_for_server(availability_, clients->cancel_goal_client, std::chrono::seconds(2))) {
       result.error_message = "Cancel service not available";
       return result;
     }
@@ -555,11 +858,11 @@ ActionCancelResult OperationManager::cancel_action_goal(const std::string & acti
     RCLCPP_INFO(node_->get_logger(), "Canceling action goal: %s (goal_id: %s)", action_path.c_str(), goal_id.c_str());
 
     // Send using GenericClient (expects void* to deserialized message)
-    auto future_and_id = clients.cancel_goal_client->async_send_request(ros_request.data);
+    auto future_and_id = clients->cancel_goal_client->async_send_request(ros_request.data);
 
     auto future_status = future_and_id.wait_for(std::chrono::seconds(5));
     if (future_status != std::future_status::ready) {
-      clients.cancel_goal_client->remove_pending_request(future_and_id.request_id);
+      clients->cancel_goal_client->remove_pending_request(future_and_id.request_id);
       ros2_medkit_serialization::destroy_ros_message(&ros_request);
       result.error_message = "Cancel request timed out";
       return result;
@@ -629,9 +932,9 @@ ActionGetResultResult OperationManager::get_action_result(const std::string & ac
     using namespace ros2_medkit_serialization;
 
     // Get or create action clients
-    auto & clients = get_or_create_action_clients(action_path, action_type);
+    auto clients = get_or_create_action_clients(action_path, action_type);
 
-    if (!clients.get_result_client->wait_for_service(std::chrono::seconds(2))) {
+    if (!wait_for_server(availability_, clients->get_result_client, std::chrono::seconds(2))) {
       result.error_message = "Get result service not available";
       return result;
     }
@@ -649,11 +952,11 @@ ActionGetResultResult OperationManager::get_action_result(const std::string & ac
     RCLCPP_INFO(node_->get_logger(), "Getting action result: %s (goal_id: %s)", action_path.c_str(), goal_id.c_str());
 
     // Send using GenericClient (expects void* to deserialized message)
-    auto future_and_id = clients.get_result_client->async_send_request(ros_request.data);
+    auto future_and_id = clients->get_result_client->async_send_request(ros_request.data);
 
     auto future_status = future_and_id.wait_for(std::chrono::seconds(service_call_timeout_sec_));
     if (future_status != std::future_status::ready) {
-      clients.get_result_client->remove_pending_request(future_and_id.request_id);
+      clients->get_result_client->remove_pending_request(future_and_id.request_id);
       ros2_medkit_serialization::destroy_ros_message(&ros_request);
       result.error_message = "Get result timed out";
       return result;
@@ -724,95 +1027,127 @@ std::vector<ActionGoalInfo> OperationManager::list_tracked_goals() const {
 
 std::vector<ActionGoalInfo> OperationManager::get_goals_for_action(const std::string & action_path) const {
   std::vector<ActionGoalInfo> goals;
+  std::lock_guard<std::mutex> lock(goals_mutex_);
+  auto action_it = goals_by_action_.find(action_path);
+  if (action_it == goals_by_action_.end()) {
+    return goals;
+  }
 
-  // Copy data under lock
-  {
-    std::lock_guard<std::mutex> lock(goals_mutex_);
-    for (const auto & [id, info] : tracked_goals_) {
-      if (info.action_path == action_path) {
-        goals.push_back(info);
-      }
-    }
-  }  // Release lock before sorting
-
-  // Sort by created_at, newest first (most recently created goal)
-  std::sort(goals.begin(), goals.end(), [](const ActionGoalInfo & a, const ActionGoalInfo & b) {
-    return a.created_at > b.created_at;
-  });
+  // Index is ordered by created_at, newest first (most recently created goal)
+  goals.reserve(action_it->second.size());
+  for (const auto & key : action_it->second) {
+    goals.push_back(tracked_goals_.at(key.second));
+  }
   return goals;
 }
 
 std::optional<ActionGoalInfo> OperationManager::get_latest_goal_for_action(const std::string & action_path) const {
-  auto goals = get_goals_for_action(action_path);
-  if (goals.empty()) {
+  std::lock_guard<std::mutex> lock(goals_mutex_);
+  auto action_it = goals_by_action_.find(action_path);
+  if (action_it == goals_by_action_.end()) {
     return std::nullopt;
   }
-  return goals.front();  // Already sorted newest first
+  return tracked_goals_.at(action_it->second.begin()->second);
 }
 
 void OperationManager::update_goal_status(const std::string & goal_id, ActionGoalStatus status) {
-  std::lock_guard<std::mutex> lock(goals_mutex_);
-  auto it = tracked_goals_.find(goal_id);
-  if (it != tracked_goals_.end()) {
-    it->second.status = status;
-    it->second.last_update = std::chrono::system_clock::now();
+  ActionGoalEvent event;
+  {
+    std::lock_guard<std::mutex> lock(goals_mutex_);
+    auto it = tracked_goals_.find(goal_id);
+    if (it == tracked_goals_.end()) {
+      return;
+    }
+    bool changed = it->second.status != status;
+    set_goal_status_locked(it->second, status, std::chrono::system_clock::now());
+    if (!changed) {
+      return;
+    }
+    event = {goal_id, it->second.action_path, status, nullptr};
   }
+  emit_goal_event(event);
 }
 
 void OperationManager::update_goal_feedback(const std::string & goal_id, const json & feedback) {
-  std::lock_guard<std::mutex> lock(goals_mutex_);
-  auto it = tracked_goals_.find(goal_id);
-  if (it != tracked_goals_.end()) {
+  ActionGoalEvent event;
+  {
+    std::lock_guard<std::mutex> lock(goals_mutex_);
+    auto it = tracked_goals_.find(goal_id);
+    if (it == tracked_goals_.end()) {
+      return;
+    }
     it->second.last_feedback = feedback;
-    it->second.last_update = std::chrono::system_clock::now();
+    set_goal_status_locked(it->second, it->second.status, std::chrono::system_clock::now());
+    event = {goal_id, it->second.action_path, it->second.status, feedback};
   }
+  emit_goal_event(event);
 }
 
 void OperationManager::cleanup_old_goals(std::chrono::seconds max_age) {
-  std::set<std::string> actions_to_check;
+  std::vector<std::string> emptied_actions;
 
   {
     std::lock_guard<std::mutex> lock(goals_mutex_);
     auto now = std::chrono::system_clock::now();
 
-    for (auto it = tracked_goals_.begin(); it != tracked_goals_.end();) {
-      // Only remove completed goals (succeeded, canceled, aborted)
-      if (it->second.status == ActionGoalStatus::SUCCEEDED || it->second.status == ActionGoalStatus::CANCELED ||
-          it->second.status == ActionGoalStatus::ABORTED) {
-        auto age = std::chrono::duration_cast<std::chrono::seconds>(now - it->second.last_update);
-        if (age > max_age) {
-          actions_to_check.insert(it->second.action_path);
-          it = tracked_goals_.erase(it);
-          continue;
-        }
-      }
-      ++it;
+    // Only completed goals (succeeded, canceled, aborted) are indexed here, oldest update first
+    while (!finished_goals_.empty() && now - finished_goals_.begin()->first > max_age) {
+      erase_goal_locked(tracked_goals_.find(finished_goals_.begin()->second), emptied_actions);
     }
-  }  // Release goals_mutex_ before checking subscriptions
+  }  // Release goals_mutex_ before touching subscriptions
 
-  // Check if any action paths need to be unsubscribed
-  for (const auto & action_path : actions_to_check) {
-    auto remaining_goals = get_goals_for_action(action_path);
-    if (remaining_goals.empty()) {
-      unsubscribe_from_action_status(action_path);
+  {
+    std::lock_guard<std::mutex> lock(service_executions_mutex_);
+    auto now = std::chrono::system_clock::now();
+    for (auto it = service_executions_.begin(); it != service_executions_.end();) {
+      bool finished =
+          it->second.status != ActionGoalStatus::ACCEPTED && it->second.status != ActionGoalStatus::EXECUTING;
+      if (finished && std::chrono::duration_cast<std::chrono::seconds>(now - it->second.last_update) > max_age) {
+        it = service_executions_.erase(it);
+      } else {
+        ++it;
+      }
     }
   }
+
+  // Unsubscribe from actions that have no goals left
+  for (const auto & action_path : emptied_actions) {
+    unsubscribe_from_action_status(action_path);
+  }
+
+  evict_idle_action_clients();
 }
 
 // ==================== NATIVE STATUS SUBSCRIPTION ====================
 
 std::string OperationManager::uuid_bytes_to_hex(const std::array<uint8_t, 16> & uuid) const {
-  std::ostringstream ss;
-  ss << std::hex << std::setfill('0');
-  for (const auto & byte : uuid) {
-    ss << std::setw(2) << static_cast<int>(byte);
-  }
-  return ss.str();
+  char hex[kUuidHexLength];
+  uuid_to_hex(uuid, hex);
+  return std::string(hex, kUuidHexLength);
 }
 
-void OperationManager::subscribe_to_action_status(const std::string & action_path) {
+void OperationManager::subscribe_to_action_status(const std::string & action_path, const std::string & action_type) {
   std::lock_guard<std::mutex> lock(subscriptions_mutex_);
 
+  // Feedback needs the action type, which may only be known on a later call
+  if (!action_type.empty() && feedback_subscriptions_.count(action_path) == 0) {
+    std::string feedback_topic = action_path + "/_action/feedback";
+    std::string feedback_type =
+        ros2_medkit_serialization::ServiceActionTypes::get_action_feedback_message_type(action_type);
+    // NOLINTNEXTLINE(performance-unnecessary-value-param) - GenericSubscription requires value type in callback
+    auto feedback_callback = [this, action_path, feedback_type](std::shared_ptr<const rclcpp::SerializedMessage> msg) {
+      on_action_feedback(action_path, feedback_type, *msg);
+    };
+    try {
+      feedback_subscriptions_[action_path] =
+          node_->create_generic_subscription(feedback_topic, feedback_type, rclcpp::QoS(10), feedback_callback);
+      RCLCPP_INFO(node_->get_logger(), "Subscribed to action feedback: %s", feedback_topic.c_str());
+    } catch (const std::exception & e) {
+      RCLCPP_WARN(node_->get_logger(), "Failed to subscribe to action feedback '%s': %s", feedback_topic.c_str(),
+                  e.what());
+    }
+  }
+
   // Check if already subscribed
   if (status_subscriptions_.count(action_path) > 0) {
     return;
@@ -840,53 +1175,77 @@ void OperationManager::unsubscribe_from_action_status(const std::string & action
     status_subscriptions_.erase(it);
     RCLCPP_INFO(node_->get_logger(), "Unsubscribed from action status: %s/_action/status", action_path.c_str());
   }
+  feedback_subscriptions_.erase(action_path);
+}
+
+void OperationManager::set_goal_event_callback(std::function<void(const ActionGoalEvent &)> callback) {
+  std::lock_guard<std::mutex> lock(goal_event_mutex_);
+  goal_event_callback_ = std::move(callback);
+}
+
+void OperationManager::emit_goal_event(const ActionGoalEvent & event) {
+  std::lock_guard<std::mutex> lock(goal_event_mutex_);
+  if (goal_event_callback_) {
+    goal_event_callback_(event);
+  }
+}
+
+void OperationManager::on_action_feedback(const std::string & action_path, const std::string & feedback_type,
+                                          const rclcpp::SerializedMessage & msg) {
+  json message;
+  try {
+    message = serializer_->deserialize(feedback_type, msg);
+  } catch (const std::exception & e) {
+    RCLCPP_WARN(node_->get_logger(), "Failed to decode feedback of %s: %s", action_path.c_str(), e.what());
+    return;
+  }
+
+  // FeedbackMessage: {goal_id: {uuid: [16 bytes]}, feedback: {...}}
+  const auto & uuid = message["goal_id"]["uuid"];
+  if (!uuid.is_array() || uuid.size() != 16) {
+    return;
+  }
+  std::array<uint8_t, 16> uuid_bytes{};
+  for (size_t i = 0; i < uuid_bytes.size(); ++i) {
+    uuid_bytes[i] = uuid[i].get<uint8_t>();
+  }
+  update_goal_feedback(uuid_bytes_to_hex(uuid_bytes), message["feedback"]);
 }
 
 void OperationManager::on_action_status(const std::string & action_path,
                                         const action_msgs::msg::GoalStatusArray::ConstSharedPtr & msg) {
-  std::lock_guard<std::mutex> lock(goals_mutex_);
-
-  for (const auto & status : msg->status_list) {
-    // Convert UUID bytes to hex string
-    std::string goal_id = uuid_bytes_to_hex(status.goal_info.goal_id.uuid);
+  struct Transition {
+    std::string goal_id;
+    ActionGoalStatus from;
+    ActionGoalStatus to;
+  };
+  std::vector<Transition> transitions;  // Only allocates when a goal changed status
 
-    // Find if we're tracking this goal
-    auto it = tracked_goals_.find(goal_id);
-    if (it != tracked_goals_.end() && it->second.action_path == action_path) {
-      // Map status code to our enum
-      ActionGoalStatus new_status;
-      switch (status.status) {
-        case action_msgs::msg::GoalStatus::STATUS_ACCEPTED:
-          new_status = ActionGoalStatus::ACCEPTED;
-          break;
-        case action_msgs::msg::GoalStatus::STATUS_EXECUTING:
-          new_status = ActionGoalStatus::EXECUTING;
-          break;
-        case action_msgs::msg::GoalStatus::STATUS_CANCELING:
-          new_status = ActionGoalStatus::CANCELING;
-          break;
-        case action_msgs::msg::GoalStatus::STATUS_SUCCEEDED:
-          new_status = ActionGoalStatus::SUCCEEDED;
-          break;
-        case action_msgs::msg::GoalStatus::STATUS_CANCELED:
-          new_status = ActionGoalStatus::CANCELED;
-          break;
-        case action_msgs::msg::GoalStatus::STATUS_ABORTED:
-          new_status = ActionGoalStatus::ABORTED;
-          break;
-        default:
-          new_status = ActionGoalStatus::UNKNOWN;
-          break;
+  {
+    std::lock_guard<std::mutex> lock(goals_mutex_);
+    auto now = std::chrono::system_clock::now();
+    char goal_id[kUuidHexLength];
+    for (const auto & status : msg->status_list) {
+      // Find if we're tracking this goal; the status array also lists goals of other clients
+      uuid_to_hex(status.goal_info.goal_id.uuid, goal_id);
+      auto it = tracked_goals_.find(std::string_view(goal_id, kUuidHexLength));
+      if (it == tracked_goals_.end() || it->second.action_path != action_path) {
+        continue;
       }
 
       // Only update if status changed
+      ActionGoalStatus new_status = from_goal_status_code(status.status);
       if (it->second.status != new_status) {
-        RCLCPP_INFO(node_->get_logger(), "Goal %s status update: %s -> %s", goal_id.c_str(),
-                    action_status_to_string(it->second.status).c_str(), action_status_to_string(new_status).c_str());
-        it->second.status = new_status;
-        it->second.last_update = std::chrono::system_clock::now();
+        transitions.push_back({it->first, it->second.status, new_status});
+        set_goal_status_locked(it->second, new_status, now);
       }
     }
+  }  // Release goals_mutex_ before logging and reporting
+
+  for (const auto & t : transitions) {
+    RCLCPP_INFO(node_->get_logger(), "Goal %s status update: %s -> %s", t.goal_id.c_str(),
+                action_status_to_string(t.from).c_str(), action_status_to_string(t.to).c_str());
+    emit_goal_event({t.goal_id, action_path, t.to, nullptr});
   }
 }
 
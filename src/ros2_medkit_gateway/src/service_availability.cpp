@@ -0,0 +1,163 @@
+// Copyright 2026 bburda
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+#include "ros2_medkit_gateway/service_availability.hpp"
+
+#include <algorithm>
+#include <mutex>
+#include <utility>
+
+namespace ros2_medkit_gateway {
+
+namespace {
+
+/// How often the watch thread checks for shutdown while no graph change arrives
+constexpr std::chrono::milliseconds kGraphWaitSlice{100};
+
+/// True if @p client was already looked up through @p clients
+bool is_tracked(const std::vector<std::weak_ptr<rclcpp::ClientBase>> & clients, const rclcpp::ClientBase * client) {
+  return std::any_of(clients.begin(), clients.end(), [client](const std::weak_ptr<rclcpp::ClientBase> & tracked) {
+    return tracked.lock().get() == client;
+  });
+}
+
+}  // namespace
+
+ServiceAvailability::ServiceAvailability(rclcpp::Node * node, std::chrono::milliseconds first_use_wait)
+  : node_(node), first_use_wait_(first_use_wait) {
+  watch_thread_ = std::thread([this] {
+    watch_graph();
+  });
+}
+
+ServiceAvailability::~ServiceAvailability() {
+  running_ = false;
+  if (watch_thread_.joinable()) {
+    watch_thread_.join();
+  }
+}
+
+bool ServiceAvailability::is_available(const rclcpp::ClientBase::SharedPtr & client, std::chrono::nanoseconds timeout) {
+  const std::string name = client->get_service_name();
+  bool known_client = false;
+  {
+    std::shared_lock<std::shared_mutex> lock(mutex_);
+    auto it = entries_.find(name);
+    if (it != entries_.end()) {
+      if (it->second.available) {
+        return true;
+      }
+      known_client = is_tracked(it->second.clients, client.get());
+    }
+  }
+
+  bool available = false;
+  if (known_client) {
+    // Last seen down: ask the graph directly (no waiting), so a server that just started
+    // is found before its graph event has been processed
+    available = client->service_is_ready();
+  } else {
+    // First lookup of this client: it may not have discovered a running server yet
+    available = client->wait_for_service(std::min(timeout, std::chrono::nanoseconds(first_use_wait_)));
+  }
+
+  std::unique_lock<std::shared_mutex> lock(mutex_);
+  auto & entry = entries_[name];
+  if (!is_tracked(entry.clients, client.get())) {
+    entry.clients.push_back(client);
+  }
+  entry.available = available;
+  return available;
+}
+
+size_t ServiceAvailability::tracked_count() const {
+  std::shared_lock<std::shared_mutex> lock(mutex_);
+  return entries_.size();
+}
+
+void ServiceAvailability::watch_graph() {
+  rclcpp::Event::SharedPtr event;
+  try {
+    event = node_->get_graph_event();
+  } catch (const std::exception & e) {
+    RCLCPP_WARN(node_->get_logger(), "Service availability tracking disabled: %s", e.what());
+    return;
+  }
+
+  while (running_) {
+    try {
+      node_->wait_for_graph_change(event, kGraphWaitSlice);
+    } catch (const std::exception & e) {
+      RCLCPP_WARN(node_->get_logger(), "Stopped watching graph changes: %s", e.what());
+      return;
+    }
+    if (event->check_and_clear()) {
+      refresh();
+    }
+  }
+}
+
+void ServiceAvailability::refresh() {
+  std::vector<std::pair<std::string, rclcpp::ClientBase::SharedPtr>> clients;
+  {
+    std::shared_lock<std::shared_mutex> lock(mutex_);
+    clients.reserve(entries_.size());
+    for (const auto & [name, entry] : entries_) {
+      for (const auto & tracked : entry.clients) {
+        if (auto client = tracked.lock()) {
+          clients.emplace_back(name, std::move(client));
+          break;  // One live client per service answers for all of them
+        }
+      }
+    }
+  }
+
+  // Graph queries run without the lock so lookups are never blocked by them
+  std::vector<std::pair<std::string, bool>> states;
+  states.reserve(clients.size());
+  for (const auto & [name, client] : clients) {
+    try {
+      states.emplace_back(name, client->service_is_ready());
+    } catch (const std::exception &) {
+      states.emplace_back(name, false);  // Context shutting down
+    }
+  }
+
+  std::unique_lock<std::shared_mutex> lock(mutex_);
+  for (const auto & [name, available] : states) {
+    auto it = entries_.find(name);
+    if (it != entries_.end()) {
+      it->second.available = available;
+    }
+  }
+  for (auto it = entries_.begin(); it != entries_.end();) {
+    auto & tracked = it->second.clients;
+    tracked.erase(std::remove_if(tracked.begin(), tracked.end(),
+                                 [](const std::weak_ptr<rclcpp::ClientBase> & client) {
+                                   return client.expired();
+                                 }),
+                  tracked.end());
+    it = tracked.empty() ? entries_.erase(it) : std::next(it);
+  }
+}
+
+bool wait_for_server(ServiceAvailability * availability, const rclcpp::ClientBase::SharedPtr & client,
+                     std::chrono::duration<double> timeout) {
+  if (availability) {
+    return availability->is_available(client, std::chrono::duration_cast<std::chrono::nanoseconds>(timeout));
+  }
+  return client->wait_for_service(timeout);
+}
+
+}  // namespace ros2_medkit_gateway
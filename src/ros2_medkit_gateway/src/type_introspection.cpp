@@ -16,14 +16,15 @@
 
 #include <sstream>
 #include <stdexcept>
+#include <utility>
 
 #include "ros2_medkit_serialization/json_serializer.hpp"
 #include "ros2_medkit_serialization/serialization_error.hpp"
 
 namespace ros2_medkit_gateway {
 
-TypeIntrospection::TypeIntrospection(const std::string & /* scripts_path */)
-  : serializer_(std::make_shared<ros2_medkit_serialization::JsonSerializer>()) {
+TypeIntrospection::TypeIntrospection(const std::string & /* scripts_path */, size_t max_cache_size)
+  : serializer_(std::make_shared<ros2_medkit_serialization::JsonSerializer>()), max_cache_size_(max_cache_size) {
   // scripts_path is deprecated and ignored - we use native serialization now
 }
 
@@ -48,40 +49,116 @@ nlohmann::json TypeIntrospection::get_type_schema(const std::string & type_name)
 }
 
 TopicTypeInfo TypeIntrospection::get_type_info(const std::string & type_name) {
-  // Check cache first
+  return *get_type_info_ptr(type_name);
+}
+
+TopicTypeInfoPtr TypeIntrospection::get_type_info_ptr(const std::string & type_name) {
+  // Fast path: shared lock, concurrent readers do not block each other
   {
-    std::lock_guard<std::mutex> lock(cache_mutex_);
+    std::shared_lock<std::shared_mutex> lock(cache_mutex_);
     auto it = type_cache_.find(type_name);
     if (it != type_cache_.end()) {
-      return it->second;
+      it->second->last_used.store(++access_tick_, std::memory_order_relaxed);
+      cache_hits_.fetch_add(1, std::memory_order_relaxed);
+      return it->second->info;
+    }
+  }
+
+  cache_misses_.fetch_add(1, std::memory_order_relaxed);
+
+  // Build outside the lock - schema generation walks the full type tree
+  auto info = build_type_info(type_name);
+
+  // Cache it (another thread may have built the same type concurrently - keep the first one)
+  std::unique_lock<std::shared_mutex> lock(cache_mutex_);
+  auto it = type_cache_.find(type_name);
+  if (it != type_cache_.end()) {
+    return it->second->info;
+  }
+  evict_if_full();
+  type_cache_.emplace(type_name, std::make_unique<CacheEntry>(info, ++access_tick_));
+  return info;
+}
+
+size_t TypeIntrospection::prewarm(const std::vector<std::string> & type_names) {
+  size_t built = 0;
+  for (const auto & type_name : type_names) {
+    if (type_name.empty()) {
+      continue;
+    }
+    {
+      std::shared_lock<std::shared_mutex> lock(cache_mutex_);
+      if (type_cache_.count(type_name) > 0) {
+        continue;
+      }
+      // Never evict on prewarm - entries in use by requests are worth more than speculative ones
+      if (max_cache_size_ != 0 && type_cache_.size() >= max_cache_size_) {
+        break;
+      }
+    }
+    auto info = build_type_info(type_name);
+
+    std::unique_lock<std::shared_mutex> lock(cache_mutex_);
+    if (type_cache_.count(type_name) > 0) {
+      continue;
+    }
+    if (max_cache_size_ != 0 && type_cache_.size() >= max_cache_size_) {
+      break;
     }
+    type_cache_.emplace(type_name, std::make_unique<CacheEntry>(std::move(info), ++access_tick_));
+    ++built;
   }
+  return built;
+}
+
+size_t TypeIntrospection::cache_size() const {
+  std::shared_lock<std::shared_mutex> lock(cache_mutex_);
+  return type_cache_.size();
+}
+
+void TypeIntrospection::clear_cache() {
+  std::unique_lock<std::shared_mutex> lock(cache_mutex_);
+  type_cache_.clear();
+}
 
-  // Build type info using native serializer
-  TopicTypeInfo info;
-  info.name = type_name;
+TopicTypeInfoPtr TypeIntrospection::build_type_info(const std::string & type_name) {
+  auto info = std::make_shared<TopicTypeInfo>();
+  info->name = type_name;
 
   // Get template (default values)
   try {
-    info.default_value = get_type_template(type_name);
+    info->default_value = get_type_template(type_name);
   } catch (const std::exception & e) {
     // If template fails, use empty object
-    info.default_value = nlohmann::json::object();
+    info->default_value = nlohmann::json::object();
   }
 
   // Get schema (type structure)
   try {
-    info.schema = get_type_schema(type_name);
+    info->schema = get_type_schema(type_name);
   } catch (const std::exception & e) {
     // If schema fails, use empty object
-    info.schema = nlohmann::json::object();
+    info->schema = nlohmann::json::object();
   }
 
-  // Cache it (use try_emplace to avoid overwriting if another thread added it first)
-  {
-    std::lock_guard<std::mutex> lock(cache_mutex_);
-    auto [it, inserted] = type_cache_.try_emplace(type_name, info);
-    return it->second;  // Return cached version (may be from another thread)
+  return info;
+}
+
+void TypeIntrospection::evict_if_full() {
+  if (max_cache_size_ == 0) {
+    return;
+  }
+  // Inserts are rare compared to lookups, so a linear scan for the LRU entry is cheaper
+  // than maintaining an ordered list that would need an exclusive lock on every hit.
+  while (type_cache_.size() >= max_cache_size_) {
+    auto oldest = type_cache_.begin();
+    for (auto it = type_cache_.begin(); it != type_cache_.end(); ++it) {
+      if (it->second->last_used.load(std::memory_order_relaxed) <
+          oldest->second->last_used.load(std::memory_order_relaxed)) {
+        oldest = it;
+      }
+    }
+    type_cache_.erase(oldest);
   }
 }
 
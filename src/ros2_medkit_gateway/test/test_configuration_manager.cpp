@@ -15,6 +15,8 @@
 #include <gtest/gtest.h>
 
 #include <atomic>
+#include <chrono>
+#include <future>
 #include <memory>
 #include <rclcpp/rclcpp.hpp>
 #include <thread>
@@ -263,6 +265,71 @@ TEST_F(TestConfigurationManager, test_set_parameter_different_types) {
   EXPECT_EQ(bool_result.data["type"], "bool");
 }
 
+TEST_F(TestConfigurationManager, test_set_several_parameters) {
+  node_->declare_parameter("batch_int", 1);
+  node_->declare_parameter("batch_str", std::string("a"));
+  rcl_interfaces::msg::ParameterDescriptor read_only;
+  read_only.read_only = true;
+  node_->declare_parameter("batch_read_only", 5, read_only);
+
+  // Results are per parameter and in request order; failures do not stop the others
+  auto results =
+      config_manager_->set_parameters("/test_config_manager_node", {{"batch_int", nlohmann::json(2)},
+                                                                    {"batch_str", nlohmann::json("b")},
+                                                                    {"batch_read_only", nlohmann::json(6)},
+                                                                    {"batch_undeclared", nlohmann::json(1)}});
+  ASSERT_EQ(results.size(), 4u);
+  EXPECT_TRUE(results[0].success);
+  EXPECT_EQ(results[0].data["value"], 2);
+  EXPECT_EQ(results[0].data["type"], "int");
+  EXPECT_TRUE(results[1].success);
+  EXPECT_EQ(results[1].data["value"], "b");
+  EXPECT_FALSE(results[2].success);
+  EXPECT_EQ(results[2].error_code, ParameterErrorCode::READ_ONLY);
+  EXPECT_FALSE(results[3].success);
+  EXPECT_EQ(node_->get_parameter("batch_int").as_int(), 2);
+  EXPECT_EQ(node_->get_parameter("batch_str").as_string(), "b");
+
+  // Atomic: one rejected value leaves every parameter unchanged
+  auto atomic_results = config_manager_->set_parameters(
+      "/test_config_manager_node", {{"batch_int", nlohmann::json(3)}, {"batch_read_only", nlohmann::json(7)}}, true);
+  ASSERT_EQ(atomic_results.size(), 2u);
+  EXPECT_FALSE(atomic_results[0].success);
+  EXPECT_FALSE(atomic_results[1].success);
+  EXPECT_EQ(node_->get_parameter("batch_int").as_int(), 2);
+}
+
+TEST_F(TestConfigurationManager, test_set_several_parameters_atomic_invalid_value) {
+  node_->declare_parameter("atomic_int", 1);
+  node_->declare_parameter("atomic_str", std::string("a"));
+  node_->declare_parameter("atomic_int_array", std::vector<int64_t>{1, 2});
+
+  // The array value cannot be converted to int_array, so nothing is sent to the node
+  auto results = config_manager_->set_parameters("/test_config_manager_node",
+                                                 {{"atomic_int", nlohmann::json(2)},
+                                                  {"atomic_int_array", nlohmann::json::array({"x", "y"})},
+                                                  {"atomic_str", nlohmann::json("b")}},
+                                                 true);
+  ASSERT_EQ(results.size(), 3u);
+  for (const auto & result : results) {
+    EXPECT_FALSE(result.success);
+    EXPECT_EQ(result.error_code, ParameterErrorCode::INVALID_VALUE);
+  }
+  EXPECT_EQ(node_->get_parameter("atomic_int").as_int(), 1);
+  EXPECT_EQ(node_->get_parameter("atomic_str").as_string(), "a");
+  EXPECT_EQ(node_->get_parameter("atomic_int_array").as_integer_array(), (std::vector<int64_t>{1, 2}));
+}
+
+TEST_F(TestConfigurationManager, test_set_several_parameters_nonexistent_node) {
+  auto results =
+      config_manager_->set_parameters("/nonexistent_node", {{"a", nlohmann::json(1)}, {"b", nlohmann::json(2)}});
+  ASSERT_EQ(results.size(), 2u);
+  for (const auto & result : results) {
+    EXPECT_FALSE(result.success);
+    EXPECT_EQ(result.error_code, ParameterErrorCode::SERVICE_UNAVAILABLE);
+  }
+}
+
 // ==================== ARRAY PARAMETER TESTS ====================
 
 TEST_F(TestConfigurationManager, test_set_and_get_array_parameters) {
@@ -348,8 +415,8 @@ TEST_F(TestConfigurationManager, test_concurrent_parameter_access) {
 TEST_F(TestConfigurationManager, test_concurrent_parameter_operations_no_executor_error) {
   // Regression test: concurrent parameter operations must not cause
   // "Node has already been added to an executor" error.
-  // SyncParametersClient internally spins param_node_ - without proper
-  // serialization, concurrent calls would cause executor conflicts.
+  // Parameter clients used to spin param_node_ on the calling thread; all
+  // responses must now be delivered by the manager's own executor thread.
 
   node_->declare_parameter("concurrent_test_int", 0);
   node_->declare_parameter("concurrent_test_str", std::string("init"));
@@ -450,6 +517,100 @@ TEST_F(TestConfigurationManager, test_concurrent_parameter_operations_no_executo
   EXPECT_EQ(success_count.load(), kNumThreads * kOpsPerThread);
 }
 
+TEST_F(TestConfigurationManager, test_list_parameters_of_many_nodes_concurrently) {
+  // Operations on different nodes are not serialized against each other
+  constexpr int kNumNodes = 6;
+  std::vector<std::shared_ptr<rclcpp::Node>> targets;
+  for (int i = 0; i < kNumNodes; ++i) {
+    auto target = std::make_shared<rclcpp::Node>("config_target_" + std::to_string(i));
+    target->declare_parameter("index", i);
+    executor_->add_node(target);
+    targets.push_back(target);
+  }
+
+  std::vector<std::future<ParameterResult>> futures;
+  for (int i = 0; i < kNumNodes; ++i) {
+    futures.push_back(std::async(std::launch::async, [this, i]() {
+      return config_manager_->list_parameters("/config_target_" + std::to_string(i));
+    }));
+  }
+
+  for (int i = 0; i < kNumNodes; ++i) {
+    auto result = futures[i].get();
+    ASSERT_TRUE(result.success) << "Node " << i << ": " << result.error_message;
+    bool found_index = false;
+    for (const auto & param : result.data) {
+      if (param["name"] == "index") {
+        EXPECT_EQ(param["value"], i);
+        found_index = true;
+      }
+    }
+    EXPECT_TRUE(found_index);
+  }
+
+  // Defaults were captured by the listing, so a reset works without another snapshot
+  ASSERT_TRUE(config_manager_->set_parameter("/config_target_0", "index", 42).success);
+  auto reset = config_manager_->reset_parameter("/config_target_0", "index");
+  ASSERT_TRUE(reset.success) << reset.error_message;
+  EXPECT_EQ(reset.data["value"], 0);
+
+  for (auto & target : targets) {
+    executor_->remove_node(target);
+  }
+}
+
+TEST_F(TestConfigurationManager, test_cached_parameters_follow_parameter_events) {
+  node_->declare_parameter("cached_param", 1);
+  auto first = config_manager_->list_parameters("/test_config_manager_node");
+  ASSERT_TRUE(first.success) << first.error_message;
+
+  auto cached_value = [this]() {
+    auto result = config_manager_->list_parameters("/test_config_manager_node");
+    for (const auto & param : result.data) {
+      if (param["name"] == "cached_param") {
+        return param["value"].get<int64_t>();
+      }
+    }
+    return int64_t{-1};
+  };
+
+  // Changed outside the gateway: the cache picks it up from /parameter_events
+  node_->set_parameter(rclcpp::Parameter("cached_param", 7));
+  auto deadline = std::chrono::steady_clock::now() + std::chrono::seconds(5);
+  while (cached_value() != 7 && std::chrono::steady_clock::now() < deadline) {
+    std::this_thread::sleep_for(std::chrono::milliseconds(20));
+  }
+  EXPECT_EQ(cached_value(), 7);
+
+  // Parameters declared later are added to the cached listing as well
+  node_->declare_parameter("late_param", std::string("late"));
+  auto fresh = config_manager_->get_parameter("/test_config_manager_node", "late_param", true);
+  ASSERT_TRUE(fresh.success) << fresh.error_message;
+  EXPECT_EQ(fresh.data["value"], "late");
+  auto cached = config_manager_->get_parameter("/test_config_manager_node", "late_param");
+  ASSERT_TRUE(cached.success) << cached.error_message;
+  EXPECT_EQ(cached.data["value"], "late");
+}
+
+TEST_F(TestConfigurationManager, test_cached_parameters_not_served_for_stopped_node) {
+  auto target = std::make_shared<rclcpp::Node>("config_cache_target");
+  executor_->add_node(target);
+  auto listed = config_manager_->list_parameters("/config_cache_target");
+  ASSERT_TRUE(listed.success) << listed.error_message;
+
+  executor_->remove_node(target);
+  target.reset();
+
+  // Wait for the node's services to leave the graph
+  auto deadline = std::chrono::steady_clock::now() + std::chrono::seconds(5);
+  ParameterResult result = config_manager_->list_parameters("/config_cache_target");
+  while (result.success && std::chrono::steady_clock::now() < deadline) {
+    std::this_thread::sleep_for(std::chrono::milliseconds(50));
+    result = config_manager_->list_parameters("/config_cache_target");
+  }
+  EXPECT_FALSE(result.success);
+}
+
 int main(int argc, char ** argv) {
   ::testing::InitGoogleTest(&argc, argv);
   return RUN_ALL_TESTS();
@@ -0,0 +1,104 @@
+// Copyright 2026 bburda
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+#include <gtest/gtest.h>
+
+#include <httplib.h>
+
+#include "ros2_medkit_gateway/http/content_negotiation.hpp"
+#include "ros2_medkit_gateway/http/handlers/handler_context.hpp"
+
+using namespace ros2_medkit_gateway;
+using json = nlohmann::json;
+
+// ==================== negotiate_response_format tests ====================
+
+TEST(ContentNegotiationTest, DefaultsToJson) {
+  EXPECT_EQ(negotiate_response_format(""), ResponseFormat::JSON);
+  EXPECT_EQ(negotiate_response_format("*/*"), ResponseFormat::JSON);
+  EXPECT_EQ(negotiate_response_format("application/json"), ResponseFormat::JSON);
+  EXPECT_EQ(negotiate_response_format("text/html, application/xml"), ResponseFormat::JSON);
+}
+
+TEST(ContentNegotiationTest, SelectsBinaryFormats) {
+  EXPECT_EQ(negotiate_response_format("application/cbor"), ResponseFormat::CBOR);
+  EXPECT_EQ(negotiate_response_format("application/msgpack"), ResponseFormat::MSGPACK);
+  EXPECT_EQ(negotiate_response_format("application/x-msgpack"), ResponseFormat::MSGPACK);
+  EXPECT_EQ(negotiate_response_format("application/vnd.msgpack"), ResponseFormat::MSGPACK);
+}
+
+TEST(ContentNegotiationTest, MediaTypesAreCaseInsensitive) {
+  EXPECT_EQ(negotiate_response_format("Application/CBOR"), ResponseFormat::CBOR);
+}
+
+TEST(ContentNegotiationTest, HonorsQualityValues) {
+  EXPECT_EQ(negotiate_response_format("application/json;q=0.5, application/cbor"), ResponseFormat::CBOR);
+  EXPECT_EQ(negotiate_response_format("application/cbor;q=0.5, */*"), ResponseFormat::JSON);
+  EXPECT_EQ(negotiate_response_format("application/msgpack; q=0.9, application/json; q=0.8"), ResponseFormat::MSGPACK);
+}
+
+TEST(ContentNegotiationTest, ZeroQualityIsNotAcceptable) {
+  EXPECT_EQ(negotiate_response_format("application/cbor;q=0"), ResponseFormat::JSON);
+}
+
+TEST(ContentNegotiationTest, FirstListedWinsOnTie) {
+  EXPECT_EQ(negotiate_response_format("application/cbor, application/json"), ResponseFormat::CBOR);
+  EXPECT_EQ(negotiate_response_format("application/json, application/cbor"), ResponseFormat::JSON);
+}
+
+// ==================== encode_response_body tests ====================
+
+TEST(ContentNegotiationTest, BinaryEncodingsRoundTrip) {
+  json data = {{"items", {{{"id", "imu"}, {"value", {0.1, -9.81, 1e-7}}}}}, {"x-medkit", {{"total_count", 1}}}};
+
+  EXPECT_EQ(json::from_cbor(encode_response_body(data, ResponseFormat::CBOR)), data);
+  EXPECT_EQ(json::from_msgpack(encode_response_body(data, ResponseFormat::MSGPACK)), data);
+  EXPECT_EQ(encode_response_body(data, ResponseFormat::JSON), data.dump(2));
+}
+
+TEST(ContentNegotiationTest, ContentTypes) {
+  EXPECT_STREQ(content_type_for(ResponseFormat::JSON), "application/json");
+  EXPECT_STREQ(content_type_for(ResponseFormat::CBOR), "application/cbor");
+  EXPECT_STREQ(content_type_for(ResponseFormat::MSGPACK), "application/msgpack");
+}
+
+// ==================== HandlerContext::send_json tests ====================
+
+TEST(ContentNegotiationTest, SendJsonNegotiatesFromAcceptHeader) {
+  json data = {{"timestamps", {1700000000000000000LL, 1700000000500000000LL}}};
+
+  httplib::Request req;
+  req.set_header("Accept", "application/cbor");
+  httplib::Response res;
+  handlers::HandlerContext::send_json(req, res, data);
+
+  EXPECT_EQ(res.get_header_value("Content-Type"), "application/cbor");
+  EXPECT_EQ(res.get_header_value("Vary"), "Accept");
+  EXPECT_EQ(json::from_cbor(res.body), data);
+  EXPECT_LT(res.body.size(), data.dump(2).size());
+}
+
+TEST(ContentNegotiationTest, SendJsonWithoutAcceptMatchesPlainJson) {
+  json data = {{"id", "engine"}};
+
+  httplib::Request req;
+  httplib::Response negotiated;
+  handlers::HandlerContext::send_json(req, negotiated, data);
+
+  httplib::Response plain;
+  handlers::HandlerContext::send_json(plain, data);
+
+  EXPECT_EQ(negotiated.body, plain.body);
+  EXPECT_EQ(negotiated.get_header_value("Content-Type"), plain.get_header_value("Content-Type"));
+}
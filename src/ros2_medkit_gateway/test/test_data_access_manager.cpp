@@ -15,11 +15,13 @@
 #include <gtest/gtest.h>
 
 #include <chrono>
+#include <future>
 #include <memory>
 #include <rclcpp/rclcpp.hpp>
 #include <std_msgs/msg/float32.hpp>
 #include <std_msgs/msg/string.hpp>
 #include <thread>
+#include <vector>
 
 #include "ros2_medkit_gateway/data_access_manager.hpp"
 #include "ros2_medkit_gateway/exceptions.hpp"
@@ -97,6 +99,47 @@ TEST_F(TypeIntrospectionTest, get_type_info_for_unknown_type_returns_empty) {
   EXPECT_TRUE(info.schema.is_object());
 }
 
+TEST_F(TypeIntrospectionTest, get_type_info_ptr_returns_shared_cached_entry) {
+  auto info1 = introspection_->get_type_info_ptr("std_msgs/msg/String");
+  auto info2 = introspection_->get_type_info_ptr("std_msgs/msg/String");
+
+  ASSERT_NE(info1, nullptr);
+  // Same cached object - no schema rebuild and no deep copy
+  EXPECT_EQ(info1.get(), info2.get());
+  EXPECT_EQ(introspection_->cache_misses(), 1u);
+  EXPECT_EQ(introspection_->cache_hits(), 1u);
+}
+
+TEST_F(TypeIntrospectionTest, cache_is_bounded_and_evicts_least_recently_used) {
+  TypeIntrospection bounded("", 2);
+
+  auto string_info = bounded.get_type_info_ptr("std_msgs/msg/String");
+  bounded.get_type_info_ptr("std_msgs/msg/Float32");
+  // Touch String so Float32 becomes the LRU entry
+  bounded.get_type_info_ptr("std_msgs/msg/String");
+  bounded.get_type_info_ptr("std_msgs/msg/Bool");
+
+  EXPECT_EQ(bounded.cache_size(), 2u);
+  EXPECT_EQ(bounded.get_type_info_ptr("std_msgs/msg/String").get(), string_info.get());
+}
+
+TEST_F(TypeIntrospectionTest, prewarm_builds_only_missing_types) {
+  introspection_->get_type_info_ptr("std_msgs/msg/String");
+
+  size_t built = introspection_->prewarm({"std_msgs/msg/String", "std_msgs/msg/Float32", "", "std_msgs/msg/Float32"});
+
+  EXPECT_EQ(built, 1u);
+  EXPECT_EQ(introspection_->cache_size(), 2u);
+}
+
+TEST_F(TypeIntrospectionTest, prewarm_does_not_evict_when_full) {
+  TypeIntrospection bounded("", 1);
+  auto string_info = bounded.get_type_info_ptr("std_msgs/msg/String");
+
+  EXPECT_EQ(bounded.prewarm({"std_msgs/msg/Float32"}), 0u);
+  EXPECT_EQ(bounded.get_type_info_ptr("std_msgs/msg/String").get(), string_info.get());
+}
+
 // =============================================================================
 // DataAccessManager Tests
 // =============================================================================
@@ -283,6 +326,35 @@ TEST_F(DataAccessManagerWithPublisherTest, get_topic_sample_native_returns_metad
   EXPECT_TRUE(result.contains("status"));
 }
 
+TEST_F(DataAccessManagerWithPublisherTest, concurrent_identical_samples_share_one_sample) {
+  std::this_thread::sleep_for(200ms);
+
+  // Nothing is published, so every sample waits for its timeout and the requests overlap
+  ros2_medkit_serialization::ProjectionOptions projection;
+  projection.fields = ros2_medkit_serialization::FieldMask::parse("data");
+  constexpr int kRequests = 6;
+  std::promise<void> go;
+  std::shared_future<void> start = go.get_future().share();
+  std::vector<std::future<TopicSampleResult>> results;
+  for (int i = 0; i < kRequests; ++i) {
+    results.push_back(std::async(std::launch::async, [&, start]() {
+      start.wait();
+      return data_manager_->sample_topic("/test_sample_topic", projection, 1.0);
+    }));
+  }
+  go.set_value();
+  for (auto & result : results) {
+    EXPECT_EQ(result.get().message_type, "std_msgs/msg/String");
+  }
+  EXPECT_EQ(data_manager_->coalesced_samples(), static_cast<uint64_t>(kRequests - 1));
+
+  // A different projection is a different sample
+  ros2_medkit_serialization::ProjectionOptions decimated;
+  decimated.arrays.max_length = 1;
+  data_manager_->sample_topic("/test_sample_topic", decimated, 0.1);
+  EXPECT_EQ(data_manager_->coalesced_samples(), static_cast<uint64_t>(kRequests - 1));
+}
+
 // =============================================================================
 // Parameter Validation Tests
 // =============================================================================
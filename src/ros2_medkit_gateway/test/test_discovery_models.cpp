@@ -29,11 +29,13 @@
 #include "ros2_medkit_gateway/discovery/models/common.hpp"
 #include "ros2_medkit_gateway/discovery/models/component.hpp"
 #include "ros2_medkit_gateway/discovery/models/function.hpp"
+#include "ros2_medkit_gateway/discovery/models/interned_string.hpp"
 
 using ros2_medkit_gateway::App;
 using ros2_medkit_gateway::Area;
 using ros2_medkit_gateway::Component;
 using ros2_medkit_gateway::Function;
+using ros2_medkit_gateway::InternedString;
 using ros2_medkit_gateway::json;
 
 // =============================================================================
@@ -441,6 +443,64 @@ TEST(CommonTypesTest, QosProfile_ToJson) {
   EXPECT_EQ(j["liveliness"], "automatic");
 }
 
+// =============================================================================
+// InternedString Tests
+// =============================================================================
+
+TEST(InternedStringTest, EqualValuesShareOneHandle) {
+  InternedString a = std::string("interned_test_engine");
+  InternedString b = "interned_test_engine";
+
+  EXPECT_EQ(a, b);
+  EXPECT_EQ(&a.str(), &b.str());
+  EXPECT_EQ(a.hash(), b.hash());
+  EXPECT_EQ(a, std::string("interned_test_engine"));
+  EXPECT_NE(a, InternedString("interned_test_brakes"));
+}
+
+TEST(InternedStringTest, DefaultIsEmpty) {
+  InternedString empty;
+
+  EXPECT_TRUE(empty.empty());
+  EXPECT_EQ(empty, InternedString(""));
+  EXPECT_EQ(empty, "");
+}
+
+TEST(InternedStringTest, LookupDoesNotGrowPool) {
+  InternedString known = "interned_test_known";
+  size_t size = InternedString::pool_size();
+
+  auto found = InternedString::lookup("interned_test_known");
+  auto missing = InternedString::lookup("interned_test_never_interned");
+
+  ASSERT_TRUE(found.has_value());
+  EXPECT_EQ(*found, known);
+  EXPECT_FALSE(missing.has_value());
+  EXPECT_EQ(InternedString::pool_size(), size);
+}
+
+TEST(InternedStringTest, ModelCopiesShareIds) {
+  App app;
+  app.id = "interned_test_app";
+  app.component_id = "interned_test_component";
+
+  App copy = app;
+  Component component;
+  component.id = std::string("interned_test_component");
+
+  EXPECT_EQ(&copy.id.str(), &app.id.str());
+  EXPECT_EQ(copy.component_id, component.id);
+}
+
+TEST(InternedStringTest, JsonRoundTrip) {
+  InternedString value = "interned_test_json";
+
+  json j = value;
+  EXPECT_EQ(j, "interned_test_json");
+  EXPECT_EQ(j.get<InternedString>(), value);
+  EXPECT_EQ(j, value);
+}
+
 // =============================================================================
 // Main
 // =============================================================================
@@ -14,9 +14,12 @@
 
 #include <gtest/gtest.h>
 
+#include <algorithm>
 #include <atomic>
 #include <chrono>
+#include <string>
 #include <thread>
+#include <unordered_set>
 #include <vector>
 
 #include "ros2_medkit_gateway/models/aggregation_service.hpp"
@@ -255,6 +258,17 @@ TEST_F(EntityCacheTest, GetByIdReturnsNulloptForUnknown) {
   EXPECT_FALSE(cache_.get_app("unknown").has_value());
 }
 
+TEST_F(EntityCacheTest, LookupOfUnknownIdDoesNotInternIt) {
+  cache_.update_all(areas_, components_, apps_, {});
+  size_t pool_size = InternedString::pool_size();
+
+  EXPECT_FALSE(cache_.find_entity("cache_test_unknown_id").has_value());
+  EXPECT_TRUE(cache_.get_entity_fqns(SovdEntityType::APP, "cache_test_unknown_id").empty());
+  EXPECT_TRUE(cache_.get_apps_for_component("cache_test_unknown_id").empty());
+  EXPECT_TRUE(cache_.get_component_operations("cache_test_unknown_id").empty());
+  EXPECT_EQ(InternedString::pool_size(), pool_size);
+}
+
 TEST_F(EntityCacheTest, HasEntityReturnsCorrectValue) {
   cache_.update_all(areas_, components_, apps_, {});
 
@@ -500,6 +514,87 @@ TEST_F(EntityCacheTest, GetStatsReturnsCorrectCounts) {
   EXPECT_GT(stats.total_operations, 0ul);
 }
 
+TEST_F(EntityCacheTest, GetStatsCountsLookupHitsAndMisses) {
+  cache_.update_all(areas_, components_, apps_, {});
+  cache_.update_topic_types({{"/scan", "sensor_msgs/msg/LaserScan"}});
+
+  cache_.get_area("perception");
+  cache_.get_app("unknown");
+  cache_.find_entity("nav2");
+  cache_.get_topic_type("/scan");
+  cache_.get_topic_type("/unknown");
+
+  auto stats = cache_.get_stats();
+  EXPECT_EQ(stats.entity_lookup_hits, 2u);
+  EXPECT_EQ(stats.entity_lookup_misses, 1u);
+  EXPECT_EQ(stats.topic_type_hits, 1u);
+  EXPECT_EQ(stats.topic_type_misses, 1u);
+}
+
+TEST_F(EntityCacheTest, FqnIndexesCoverAllEntityTypes) {
+  apps_[0].bound_fqn = "/perception/lidar_driver";
+  apps_[1].bound_fqn = "/nav2/controller_server";
+  apps_[2].bound_fqn = "/nav2/planner_server";
+  Function navigation;
+  navigation.id = "navigation";
+  navigation.hosts = {"controller", "lidar_app"};
+  cache_.update_all(areas_, components_, apps_, {navigation});
+
+  using FqnSet = std::unordered_set<std::string>;
+  EXPECT_EQ(cache_.get_entity_fqns(SovdEntityType::APP, "lidar_app"), (FqnSet{"/perception/lidar_driver"}));
+  EXPECT_EQ(cache_.get_entity_fqns(SovdEntityType::COMPONENT, "nav2"),
+            (FqnSet{"/nav2/controller_server", "/nav2/planner_server"}));
+  EXPECT_EQ(cache_.get_entity_fqns(SovdEntityType::AREA, "control"),
+            (FqnSet{"/nav2/controller_server", "/nav2/planner_server"}));
+  EXPECT_EQ(cache_.get_entity_fqns(SovdEntityType::FUNCTION, "navigation"),
+            (FqnSet{"/nav2/controller_server", "/perception/lidar_driver"}));
+  EXPECT_TRUE(cache_.get_entity_fqns(SovdEntityType::COMPONENT, "unknown").empty());
+  EXPECT_TRUE(cache_.get_entity_fqns(SovdEntityType::COMPONENT, "lidar_app").empty());
+
+  // Indexes follow partial updates
+  apps_[2].bound_fqn.reset();
+  cache_.update_apps(apps_);
+  EXPECT_EQ(cache_.get_entity_fqns(SovdEntityType::COMPONENT, "nav2"), (FqnSet{"/nav2/controller_server"}));
+  EXPECT_EQ(cache_.get_entity_fqns(SovdEntityType::AREA, "control"), (FqnSet{"/nav2/controller_server"}));
+}
+
+TEST_F(EntityCacheTest, FqnIndexesKeepSameIdEntitiesApart) {
+  // Runtime discovery names an area and a topic-only component after the same namespace
+  areas_.push_back(make_area("sensors", "Sensors"));
+  components_.push_back(make_component("sensors", "Sensors", "sensors"));
+  components_.push_back(make_component("imu", "IMU", "sensors"));
+  apps_.push_back(make_app("imu_driver", "IMU Driver", "imu"));
+  apps_.push_back(make_app("sensor_hub", "Sensor Hub", "sensors"));
+  apps_[3].bound_fqn = "/sensors/imu_driver";
+  apps_[4].bound_fqn = "/sensors/sensor_hub";
+  cache_.update_all(areas_, components_, apps_, {});
+
+  using FqnSet = std::unordered_set<std::string>;
+  EXPECT_EQ(cache_.get_entity_fqns(SovdEntityType::COMPONENT, "sensors"), (FqnSet{"/sensors/sensor_hub"}));
+  EXPECT_EQ(cache_.get_entity_fqns(SovdEntityType::AREA, "sensors"),
+            (FqnSet{"/sensors/imu_driver", "/sensors/sensor_hub"}));
+}
+
+TEST_F(EntityCacheTest, IndexesFollowPartialUpdates) {
+  cache_.update_all(areas_, components_, apps_, {});
+
+  // Renamed app: the old ID and its operations must no longer resolve
+  apps_[2].id = "global_planner";
+  cache_.update_apps(apps_);
+
+  EXPECT_FALSE(cache_.has_app("planner"));
+  EXPECT_FALSE(cache_.find_entity("planner").has_value());
+  ASSERT_TRUE(cache_.get_app("global_planner").has_value());
+  EXPECT_EQ(cache_.get_apps_for_component("nav2"), (std::vector<std::string>{"controller", "global_planner"}));
+  auto owner = cache_.find_operation_owner("/nav2/compute_path");
+  ASSERT_TRUE(owner.has_value());
+  EXPECT_EQ(owner->type, SovdEntityType::APP);
+  EXPECT_EQ(owner->index, 2u);
+
+  auto error = cache_.validate();
+  EXPECT_TRUE(error.empty()) << "Validation failed: " << error;
+}
+
 // ============================================================================
 // AggregationService Tests
 // ============================================================================
@@ -720,6 +815,37 @@ TEST_F(DataAggregationTest, UnknownEntityReturnsEmptyData) {
   EXPECT_TRUE(result.aggregation_level.empty());
 }
 
+TEST_F(DataAggregationTest, AreaAggregationIncludesSubareasAndFollowsUpdates) {
+  Area lidar_area = make_area("lidar_area", "LiDAR");
+  lidar_area.parent_area_id = "perception";
+  areas_.push_back(lidar_area);
+  components_.push_back(make_component("lidar_stack", "LiDAR Stack", "lidar_area"));
+  cache_.update_all(areas_, components_, apps_, {});
+
+  App filter = make_app_minimal("lidar_filter", "lidar_stack");
+  filter.topics.publishes = {"/lidar/filtered"};
+  apps_.push_back(filter);
+  cache_.update_apps(apps_);
+
+  auto has_topic = [](const AggregatedData & data, const std::string & name) {
+    for (const auto & topic : data.topics) {
+      if (topic.name == name) {
+        return true;
+      }
+    }
+    return false;
+  };
+
+  // Precomputed aggregations are rebuilt by partial updates, down the whole area tree
+  EXPECT_TRUE(has_topic(cache_.get_component_data("lidar_stack"), "/lidar/filtered"));
+  EXPECT_TRUE(has_topic(cache_.get_area_data("lidar_area"), "/lidar/filtered"));
+  EXPECT_TRUE(has_topic(cache_.get_area_data("perception"), "/lidar/filtered"));
+
+  // Component-scoped lookups do not answer for other entity types
+  EXPECT_TRUE(cache_.get_component_data("perception").topics.empty());
+  EXPECT_EQ(cache_.get_component_operations("perception").aggregation_level, "component");
+}
+
 int main(int argc, char ** argv) {
   testing::InitGoogleTest(&argc, argv);
   return RUN_ALL_TESTS();
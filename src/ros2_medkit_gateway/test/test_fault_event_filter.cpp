@@ -0,0 +1,152 @@
+// Copyright 2026 bburda
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+#include <gtest/gtest.h>
+
+#include <string>
+
+#include "ros2_medkit_gateway/http/handlers/sse_fault_handler.hpp"
+#include "ros2_medkit_msgs/msg/fault.hpp"
+#include "ros2_medkit_msgs/msg/fault_event.hpp"
+
+using ros2_medkit_gateway::App;
+using ros2_medkit_gateway::Area;
+using ros2_medkit_gateway::Component;
+using ros2_medkit_gateway::ThreadSafeEntityCache;
+using ros2_medkit_gateway::handlers::FaultEventFilter;
+using ros2_medkit_msgs::msg::Fault;
+using ros2_medkit_msgs::msg::FaultEvent;
+
+namespace {
+
+FaultEvent make_event(const std::string & event_type, const std::string & status, uint8_t severity,
+                      const std::string & source) {
+  FaultEvent event;
+  event.event_type = event_type;
+  event.fault.fault_code = "TEST_FAULT";
+  event.fault.status = status;
+  event.fault.severity = severity;
+  event.fault.reporting_sources = {source};
+  return event;
+}
+
+httplib::Request make_request(std::initializer_list<std::pair<std::string, std::string>> params) {
+  httplib::Request req;
+  for (const auto & [key, value] : params) {
+    req.params.emplace(key, value);
+  }
+  return req;
+}
+
+}  // namespace
+
+TEST(FaultEventFilterTest, EmptyQueryMatchesEverything) {
+  auto filter = FaultEventFilter::from_query(make_request({}));
+  ASSERT_TRUE(filter.has_value());
+  EXPECT_TRUE(filter->matches(
+      make_event(FaultEvent::EVENT_UPDATED, Fault::STATUS_PREPASSED, Fault::SEVERITY_INFO, "/some/node")));
+}
+
+TEST(FaultEventFilterTest, MinSeverity) {
+  auto filter = FaultEventFilter::from_query(make_request({{"min_severity", "ERROR"}}));
+  ASSERT_TRUE(filter.has_value());
+  EXPECT_FALSE(
+      filter->matches(make_event(FaultEvent::EVENT_CONFIRMED, Fault::STATUS_CONFIRMED, Fault::SEVERITY_WARN, "/a")));
+  EXPECT_TRUE(
+      filter->matches(make_event(FaultEvent::EVENT_CONFIRMED, Fault::STATUS_CONFIRMED, Fault::SEVERITY_ERROR, "/a")));
+  EXPECT_TRUE(filter->matches(
+      make_event(FaultEvent::EVENT_CONFIRMED, Fault::STATUS_CONFIRMED, Fault::SEVERITY_CRITICAL, "/a")));
+
+  auto numeric = FaultEventFilter::from_query(make_request({{"min_severity", "3"}}));
+  ASSERT_TRUE(numeric.has_value());
+  EXPECT_EQ(numeric->min_severity, Fault::SEVERITY_CRITICAL);
+}
+
+TEST(FaultEventFilterTest, StatusAndEventTypeSets) {
+  auto filter = FaultEventFilter::from_query(
+      make_request({{"status", "confirmed,cleared"}, {"event_type", "fault_confirmed,fault_cleared"}}));
+  ASSERT_TRUE(filter.has_value());
+  EXPECT_TRUE(
+      filter->matches(make_event(FaultEvent::EVENT_CONFIRMED, Fault::STATUS_CONFIRMED, Fault::SEVERITY_INFO, "/a")));
+  EXPECT_TRUE(
+      filter->matches(make_event(FaultEvent::EVENT_CLEARED, Fault::STATUS_CLEARED, Fault::SEVERITY_INFO, "/a")));
+  EXPECT_FALSE(
+      filter->matches(make_event(FaultEvent::EVENT_UPDATED, Fault::STATUS_CONFIRMED, Fault::SEVERITY_INFO, "/a")));
+  EXPECT_FALSE(
+      filter->matches(make_event(FaultEvent::EVENT_CONFIRMED, Fault::STATUS_PREFAILED, Fault::SEVERITY_INFO, "/a")));
+
+  auto all = FaultEventFilter::from_query(make_request({{"status", "all"}}));
+  ASSERT_TRUE(all.has_value());
+  EXPECT_TRUE(all->matches(make_event(FaultEvent::EVENT_UPDATED, Fault::STATUS_HEALED, Fault::SEVERITY_INFO, "/a")));
+}
+
+TEST(FaultEventFilterTest, SourceFqns) {
+  FaultEventFilter filter;
+  filter.source_fqns = std::unordered_set<std::string>{"/perception/lidar/driver"};
+  EXPECT_TRUE(filter.matches(make_event(FaultEvent::EVENT_CONFIRMED, Fault::STATUS_CONFIRMED, Fault::SEVERITY_INFO,
+                                        "/perception/lidar/driver/sensor")));
+  EXPECT_FALSE(filter.matches(
+      make_event(FaultEvent::EVENT_CONFIRMED, Fault::STATUS_CONFIRMED, Fault::SEVERITY_INFO, "/perception/camera")));
+
+  // Entity without bound nodes matches nothing
+  filter.source_fqns = std::unordered_set<std::string>{};
+  EXPECT_FALSE(filter.matches(make_event(FaultEvent::EVENT_CONFIRMED, Fault::STATUS_CONFIRMED, Fault::SEVERITY_INFO,
+                                         "/perception/lidar/driver")));
+}
+
+TEST(FaultEventFilterTest, EntityIgnoresSameIdEntityOfOtherType) {
+  // Runtime discovery names an area and a topic-only component after the same namespace
+  Area area;
+  area.id = "sensors";
+  Component hub;
+  hub.id = "sensors";
+  hub.area = "sensors";
+  Component imu;
+  imu.id = "imu";
+  imu.area = "sensors";
+  App hub_app;
+  hub_app.id = "sensor_hub";
+  hub_app.component_id = "sensors";
+  hub_app.bound_fqn = "/sensors/sensor_hub";
+  App imu_app;
+  imu_app.id = "imu_driver";
+  imu_app.component_id = "imu";
+  imu_app.bound_fqn = "/sensors/imu_driver";
+  ThreadSafeEntityCache cache;
+  cache.update_all({area}, {hub, imu}, {hub_app, imu_app}, {});
+
+  // The ID resolves to the component, whose nodes do not include the rest of the area
+  FaultEventFilter filter;
+  ASSERT_TRUE(filter.set_entity(cache, "sensors"));
+  EXPECT_TRUE(filter.matches(
+      make_event(FaultEvent::EVENT_CONFIRMED, Fault::STATUS_CONFIRMED, Fault::SEVERITY_INFO, "/sensors/sensor_hub")));
+  EXPECT_FALSE(filter.matches(
+      make_event(FaultEvent::EVENT_CONFIRMED, Fault::STATUS_CONFIRMED, Fault::SEVERITY_INFO, "/sensors/imu_driver")));
+
+  EXPECT_FALSE(filter.set_entity(cache, "unknown"));
+}
+
+TEST(FaultEventFilterTest, InvalidValuesNameTheParameter) {
+  auto bad_status = FaultEventFilter::from_query(make_request({{"status", "confirmed,bogus"}}));
+  ASSERT_FALSE(bad_status.has_value());
+  EXPECT_EQ(bad_status.error(), "status");
+
+  auto bad_severity = FaultEventFilter::from_query(make_request({{"min_severity", "fatal"}}));
+  ASSERT_FALSE(bad_severity.has_value());
+  EXPECT_EQ(bad_severity.error(), "min_severity");
+
+  auto bad_type = FaultEventFilter::from_query(make_request({{"event_type", "fault_exploded"}}));
+  ASSERT_FALSE(bad_type.has_value());
+  EXPECT_EQ(bad_type.error(), "event_type");
+}
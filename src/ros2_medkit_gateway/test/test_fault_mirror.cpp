@@ -0,0 +1,176 @@
+// Copyright 2026 bburda
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+#include <gtest/gtest.h>
+
+#include <string>
+#include <vector>
+
+#include "ros2_medkit_gateway/fault_mirror.hpp"
+
+using namespace ros2_medkit_gateway;
+using ros2_medkit_msgs::msg::Fault;
+using ros2_medkit_msgs::msg::FaultEvent;
+
+namespace {
+
+Fault make_fault(const std::string & code, const std::string & status, const std::vector<std::string> & sources) {
+  Fault fault;
+  fault.fault_code = code;
+  fault.status = status;
+  fault.reporting_sources = sources;
+  fault.occurrence_count = 1;
+  return fault;
+}
+
+FaultEvent make_event(uint64_t sequence, const Fault & fault) {
+  FaultEvent event;
+  event.event_type = FaultEvent::EVENT_UPDATED;
+  event.fault = fault;
+  event.sequence = sequence;
+  return event;
+}
+
+std::vector<std::string> codes(const std::vector<Fault> & faults) {
+  std::vector<std::string> result;
+  for (const auto & fault : faults) {
+    result.push_back(fault.fault_code);
+  }
+  return result;
+}
+
+}  // namespace
+
+class FaultMirrorTest : public ::testing::Test {
+ protected:
+  void SetUp() override {
+    mirror_.begin_sync();
+    mirror_.complete_sync({make_fault("MOTOR_OVERHEAT", Fault::STATUS_CONFIRMED, {"/powertrain/motor"}),
+                           make_fault("LIDAR_TIMEOUT", Fault::STATUS_PREFAILED, {"/perception/lidar/driver"}),
+                           make_fault("OLD_FAULT", Fault::STATUS_CLEARED, {"/perception/camera"})},
+                          2, 1);
+  }
+
+  FaultMirror mirror_;
+};
+
+TEST(FaultMirrorStateTest, UnsyncedMirrorAnswersNothing) {
+  FaultMirror mirror;
+  EXPECT_FALSE(mirror.is_synced());
+  EXPECT_FALSE(mirror.list("", {}).has_value());
+  EXPECT_FALSE(mirror.find("ANY").has_value());
+
+  // Events before the first snapshot only establish the sequence
+  EXPECT_TRUE(mirror.apply(make_event(7, make_fault("A", Fault::STATUS_CONFIRMED, {"/a"}))));
+  EXPECT_FALSE(mirror.is_synced());
+  EXPECT_EQ(mirror.size(), 0u);
+}
+
+TEST_F(FaultMirrorTest, ListsByStatusInFaultCodeOrder) {
+  auto all = mirror_.list("", {Fault::STATUS_PREFAILED, Fault::STATUS_CONFIRMED, Fault::STATUS_CLEARED});
+  ASSERT_TRUE(all.has_value());
+  EXPECT_EQ(codes(*all), (std::vector<std::string>{"LIDAR_TIMEOUT", "MOTOR_OVERHEAT", "OLD_FAULT"}));
+
+  // Empty status list defaults to CONFIRMED, like ListFaults
+  auto confirmed = mirror_.list("", {});
+  ASSERT_TRUE(confirmed.has_value());
+  EXPECT_EQ(codes(*confirmed), (std::vector<std::string>{"MOTOR_OVERHEAT"}));
+
+  EXPECT_EQ(mirror_.muted_count(), 2u);
+  EXPECT_EQ(mirror_.cluster_count(), 1u);
+}
+
+TEST_F(FaultMirrorTest, FiltersBySourcePrefix) {
+  std::vector<std::string> statuses{Fault::STATUS_PREFAILED, Fault::STATUS_CONFIRMED, Fault::STATUS_CLEARED};
+
+  auto perception = mirror_.list("/perception", statuses);
+  ASSERT_TRUE(perception.has_value());
+  EXPECT_EQ(codes(*perception), (std::vector<std::string>{"LIDAR_TIMEOUT", "OLD_FAULT"}));
+
+  auto lidar = mirror_.list("/perception/lidar", {Fault::STATUS_PREFAILED});
+  ASSERT_TRUE(lidar.has_value());
+  EXPECT_EQ(codes(*lidar), (std::vector<std::string>{"LIDAR_TIMEOUT"}));
+
+  auto none = mirror_.list("/navigation", statuses);
+  ASSERT_TRUE(none.has_value());
+  EXPECT_TRUE(none->empty());
+}
+
+TEST_F(FaultMirrorTest, EventsUpsertAndReindex) {
+  // Status change moves the fault between status indexes
+  auto cleared = make_fault("MOTOR_OVERHEAT", Fault::STATUS_CLEARED, {"/powertrain/motor"});
+  ASSERT_TRUE(mirror_.apply(make_event(1, cleared)));
+  EXPECT_TRUE(mirror_.list("", {Fault::STATUS_CONFIRMED})->empty());
+  EXPECT_EQ(codes(*mirror_.list("/powertrain", {Fault::STATUS_CLEARED})), (std::vector<std::string>{"MOTOR_OVERHEAT"}));
+
+  // New source is indexed, new fault is added
+  auto lidar = make_fault("LIDAR_TIMEOUT", Fault::STATUS_CONFIRMED, {"/perception/lidar/driver", "/safety/monitor"});
+  ASSERT_TRUE(mirror_.apply(make_event(2, lidar)));
+  ASSERT_TRUE(mirror_.apply(make_event(3, make_fault("NEW_FAULT", Fault::STATUS_CONFIRMED, {"/safety/monitor"}))));
+  EXPECT_EQ(codes(*mirror_.list("/safety", {Fault::STATUS_CONFIRMED})),
+            (std::vector<std::string>{"LIDAR_TIMEOUT", "NEW_FAULT"}));
+  EXPECT_EQ(mirror_.size(), 4u);
+
+  auto found = mirror_.find("LIDAR_TIMEOUT");
+  ASSERT_TRUE(found.has_value());
+  EXPECT_EQ(found->status, Fault::STATUS_CONFIRMED);
+}
+
+TEST_F(FaultMirrorTest, MarkClearedMovesFaultsToCleared) {
+  mirror_.mark_cleared({"MOTOR_OVERHEAT", "UNKNOWN"});
+  EXPECT_TRUE(mirror_.list("", {Fault::STATUS_CONFIRMED})->empty());
+  EXPECT_EQ(codes(*mirror_.list("", {Fault::STATUS_CLEARED})),
+            (std::vector<std::string>{"MOTOR_OVERHEAT", "OLD_FAULT"}));
+  EXPECT_EQ(mirror_.size(), 3u);
+}
+
+TEST_F(FaultMirrorTest, SequenceGapUnsyncsUntilNextSnapshot) {
+  ASSERT_TRUE(mirror_.apply(make_event(1, make_fault("A", Fault::STATUS_CONFIRMED, {"/a"}))));
+  EXPECT_FALSE(mirror_.apply(make_event(3, make_fault("B", Fault::STATUS_CONFIRMED, {"/b"}))));
+  EXPECT_FALSE(mirror_.is_synced());
+  EXPECT_FALSE(mirror_.list("", {}).has_value());
+
+  mirror_.begin_sync();
+  mirror_.complete_sync({make_fault("B", Fault::STATUS_CONFIRMED, {"/b"})}, 0, 0);
+  EXPECT_TRUE(mirror_.is_synced());
+  EXPECT_TRUE(mirror_.apply(make_event(4, make_fault("C", Fault::STATUS_CONFIRMED, {"/c"}))));
+  EXPECT_EQ(codes(*mirror_.list("", {})), (std::vector<std::string>{"B", "C"}));
+}
+
+TEST_F(FaultMirrorTest, RestartedPublisherTriggersResync) {
+  ASSERT_TRUE(mirror_.apply(make_event(5, make_fault("A", Fault::STATUS_CONFIRMED, {"/a"}))));
+  // A restarted FaultManager numbers its events from 1 again
+  EXPECT_FALSE(mirror_.apply(make_event(1, make_fault("A", Fault::STATUS_CONFIRMED, {"/a"}))));
+  EXPECT_FALSE(mirror_.is_synced());
+}
+
+TEST_F(FaultMirrorTest, EventsDuringSyncAreReplayedOnSnapshot) {
+  mirror_.begin_sync();
+  ASSERT_TRUE(mirror_.apply(make_event(1, make_fault("RACING", Fault::STATUS_CONFIRMED, {"/a"}))));
+
+  // Snapshot taken before the racing event was processed
+  mirror_.complete_sync({make_fault("MOTOR_OVERHEAT", Fault::STATUS_CONFIRMED, {"/powertrain/motor"})}, 0, 0);
+  EXPECT_TRUE(mirror_.is_synced());
+  EXPECT_EQ(codes(*mirror_.list("", {})), (std::vector<std::string>{"MOTOR_OVERHEAT", "RACING"}));
+}
+
+TEST_F(FaultMirrorTest, GapDuringSyncKeepsMirrorUnsynced) {
+  mirror_.begin_sync();
+  ASSERT_TRUE(mirror_.apply(make_event(1, make_fault("A", Fault::STATUS_CONFIRMED, {"/a"}))));
+  EXPECT_FALSE(mirror_.apply(make_event(3, make_fault("B", Fault::STATUS_CONFIRMED, {"/b"}))));
+
+  mirror_.complete_sync({}, 0, 0);
+  EXPECT_FALSE(mirror_.is_synced());
+  EXPECT_FALSE(mirror_.is_syncing());
+}
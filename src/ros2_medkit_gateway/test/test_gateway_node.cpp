@@ -15,14 +15,20 @@
 #include <gtest/gtest.h>
 #include <httplib.h>  // NOLINT(build/include_order)
 
+#include <algorithm>
 #include <chrono>
+#include <example_interfaces/action/fibonacci.hpp>
 #include <memory>
 #include <nlohmann/json.hpp>
 #include <rclcpp/rclcpp.hpp>
+#include <rclcpp_action/rclcpp_action.hpp>
+#include <string>
 #include <thread>
+#include <vector>
 
 #include "ros2_medkit_gateway/gateway_node.hpp"
 #include "ros2_medkit_gateway/http/http_utils.hpp"
+#include "ros2_medkit_msgs/msg/fault_event.hpp"
 
 using namespace std::chrono_literals;
 using httplib::StatusCode;
@@ -111,6 +117,14 @@ TEST_F(TestGatewayNode, test_root_endpoint) {
   EXPECT_TRUE(json_response.contains("version"));
   EXPECT_TRUE(json_response.contains("endpoints"));
   EXPECT_TRUE(json_response["endpoints"].is_array());
+  // Endpoints are listed from the route table; auth endpoints only when auth is enabled
+  const auto & endpoints = json_response["endpoints"];
+  auto listed = [&endpoints](const std::string & endpoint) {
+    return std::find(endpoints.begin(), endpoints.end(), endpoint) != endpoints.end();
+  };
+  EXPECT_TRUE(listed("GET /api/v1/apps/{app_id}/data/{data_id}"));
+  EXPECT_TRUE(listed("GET /api/v1/faults/stream"));
+  EXPECT_FALSE(listed("POST /api/v1/auth/token"));
   EXPECT_TRUE(json_response.contains("capabilities"));
   EXPECT_TRUE(json_response["capabilities"]["discovery"]);
   EXPECT_TRUE(json_response["capabilities"]["data_access"]);
@@ -498,6 +512,124 @@ TEST_F(TestGatewayNode, test_execution_not_found) {
   EXPECT_EQ(res->status, StatusCode::NotFound_404);
 }
 
+TEST_F(TestGatewayNode, test_execution_stream_not_found) {
+  auto client = create_client();
+
+  auto res = client.Get(std::string(API_BASE_PATH) +
+                        "/components/gateway_node/operations/test/executions/nonexistent-id/stream");
+
+  ASSERT_TRUE(res);
+  EXPECT_EQ(res->status, StatusCode::NotFound_404);
+}
+
+TEST_F(TestGatewayNode, test_execution_stream_follows_fibonacci_goal) {
+  using Fibonacci = example_interfaces::action::Fibonacci;
+  using GoalHandle = rclcpp_action::ServerGoalHandle<Fibonacci>;
+
+  // Action server that publishes feedback for each step before succeeding
+  std::thread worker;
+  auto server_node = std::make_shared<rclcpp::Node>("test_execution_stream_server");
+  auto server = rclcpp_action::create_server<Fibonacci>(
+      server_node, "execution_stream_fibonacci",
+      [](const rclcpp_action::GoalUUID &, std::shared_ptr<const Fibonacci::Goal>) {
+        return rclcpp_action::GoalResponse::ACCEPT_AND_EXECUTE;
+      },
+      [](std::shared_ptr<GoalHandle>) {
+        return rclcpp_action::CancelResponse::ACCEPT;
+      },
+      [&worker](std::shared_ptr<GoalHandle> goal_handle) {
+        worker = std::thread([goal_handle] {
+          // Give the stream client time to connect
+          std::this_thread::sleep_for(500ms);
+          auto feedback = std::make_shared<Fibonacci::Feedback>();
+          feedback->sequence = {0, 1};
+          for (int i = 1; i < goal_handle->get_goal()->order; ++i) {
+            feedback->sequence.push_back(feedback->sequence[i] + feedback->sequence[i - 1]);
+            goal_handle->publish_feedback(feedback);
+            std::this_thread::sleep_for(100ms);
+          }
+          auto result = std::make_shared<Fibonacci::Result>();
+          result->sequence = feedback->sequence;
+          goal_handle->succeed(result);
+        });
+      });
+
+  rclcpp::executors::MultiThreadedExecutor executor;
+  executor.add_node(server_node);
+  executor.add_node(node_);
+  std::thread spinner([&executor] {
+    executor.spin();
+  });
+
+  auto sent = node_->get_operation_manager()->send_action_goal("/execution_stream_fibonacci",
+                                                               "example_interfaces/action/Fibonacci", {{"order", 8}});
+  ASSERT_TRUE(sent.goal_accepted) << sent.error_message;
+
+  // Returns only once the server has ended the stream
+  auto client = create_client();
+  client.set_read_timeout(std::chrono::seconds(10));
+  auto res = client.Get(std::string(API_BASE_PATH) + "/components/gateway_node/operations/execution_stream_fibonacci/" +
+                        "executions/" + sent.goal_id + "/stream");
+
+  executor.cancel();
+  spinner.join();
+  if (worker.joinable()) {
+    worker.join();
+  }
+
+  ASSERT_TRUE(res);
+  EXPECT_EQ(res->status, StatusCode::OK_200);
+  EXPECT_EQ(res->get_header_value("Content-Type"), "text/event-stream");
+
+  std::vector<std::string> types;
+  std::vector<nlohmann::json> events;
+  size_t pos = 0;
+  while ((pos = res->body.find("event: ", pos)) != std::string::npos) {
+    auto type_end = res->body.find('\n', pos);
+    types.push_back(res->body.substr(pos + 7, type_end - pos - 7));
+    auto data_start = res->body.find("data: ", type_end) + 6;
+    auto data_end = res->body.find('\n', data_start);
+    events.push_back(nlohmann::json::parse(res->body.substr(data_start, data_end - data_start)));
+    pos = data_end;
+  }
+
+  // Current status first, then feedback as it arrives, and the final status last
+  ASSERT_GE(events.size(), 3u);
+  EXPECT_EQ(types.front(), "status");
+  EXPECT_NE(std::find(types.begin(), types.end(), "feedback"), types.end());
+  for (size_t i = 0; i < events.size(); ++i) {
+    EXPECT_EQ(events[i]["execution_id"], sent.goal_id);
+    if (types[i] == "feedback") {
+      EXPECT_TRUE(events[i]["parameters"].contains("sequence"));
+    }
+  }
+  EXPECT_EQ(types.back(), "status");
+  EXPECT_EQ(events.back()["x-medkit"]["ros2_status"], "succeeded");
+
+  // A client resuming after the goal finished gets the final status and the end of the stream
+  auto resumed = client.Get(std::string(API_BASE_PATH) +
+                                "/components/gateway_node/operations/execution_stream_fibonacci/executions/" +
+                                sent.goal_id + "/stream",
+                            {{"Last-Event-ID", "1"}});
+  ASSERT_TRUE(resumed);
+  EXPECT_EQ(resumed->status, StatusCode::OK_200);
+  auto data_start = resumed->body.find("data: ");
+  ASSERT_NE(data_start, std::string::npos);
+  EXPECT_EQ(resumed->body.find("event: ", data_start), std::string::npos);
+  auto data = nlohmann::json::parse(
+      resumed->body.substr(data_start + 6, resumed->body.find('\n', data_start) - data_start - 6));
+  EXPECT_EQ(data["x-medkit"]["ros2_status"], "succeeded");
+}
+
+TEST_F(TestGatewayNode, test_operation_stream_invalid_component_id) {
+  auto client = create_client();
+
+  auto res = client.Get(std::string(API_BASE_PATH) + "/components/invalid@id/operations/test/executions/stream");
+
+  ASSERT_TRUE(res);
+  EXPECT_EQ(res->status, StatusCode::BadRequest_400);
+}
+
 // @verifies REQ_INTEROP_038
 TEST_F(TestGatewayNode, test_execution_update_invalid_component_id) {
   auto client = create_client();
@@ -698,6 +830,141 @@ TEST_F(TestGatewayNode, test_invalid_function_id_bad_request) {
   EXPECT_EQ(res->status, StatusCode::BadRequest_400);
 }
 
+// =============================================================================
+// Fault event stream (SSE) tests
+// =============================================================================
+
+namespace {
+
+/// Publishes fault events on /fault_manager/events while spinning the gateway, so its SSE handler buffers them
+class FaultEventSource {
+ public:
+  explicit FaultEventSource(const std::shared_ptr<rclcpp::Node> & gateway)
+    : node_(std::make_shared<rclcpp::Node>("test_fault_event_source")) {
+    publisher_ = node_->create_publisher<ros2_medkit_msgs::msg::FaultEvent>("/fault_manager/events",
+                                                                            rclcpp::QoS(100).reliable());
+    executor_.add_node(gateway);
+    spinner_ = std::thread([this] {
+      executor_.spin();
+    });
+  }
+
+  ~FaultEventSource() {
+    executor_.cancel();
+    spinner_.join();
+  }
+
+  /// Wait for the gateway's subscription, then publish confirmations of SSE_FAULT_<first>..SSE_FAULT_<last>
+  bool publish(int first, int last) {
+    auto deadline = std::chrono::steady_clock::now() + 10s;
+    while (publisher_->get_subscription_count() == 0) {
+      if (std::chrono::steady_clock::now() > deadline) {
+        return false;
+      }
+      std::this_thread::sleep_for(20ms);
+    }
+    for (int i = first; i <= last; ++i) {
+      ros2_medkit_msgs::msg::FaultEvent event;
+      event.event_type = ros2_medkit_msgs::msg::FaultEvent::EVENT_CONFIRMED;
+      event.fault.fault_code = "SSE_FAULT_" + std::to_string(i);
+      event.fault.status = "CONFIRMED";
+      event.timestamp.sec = i;
+      publisher_->publish(event);
+      std::this_thread::sleep_for(1ms);  // Stay within the subscription's queue depth
+    }
+    return true;
+  }
+
+ private:
+  std::shared_ptr<rclcpp::Node> node_;
+  rclcpp::Publisher<ros2_medkit_msgs::msg::FaultEvent>::SharedPtr publisher_;
+  rclcpp::executors::SingleThreadedExecutor executor_;
+  std::thread spinner_;
+};
+
+/// Read @p count events (keepalives skipped) from the fault stream, then disconnect
+std::vector<std::string> read_fault_events(httplib::Client client, size_t count,
+                                           const httplib::Headers & headers = {}) {
+  std::vector<std::string> events;
+  std::string pending;
+  client.set_read_timeout(std::chrono::seconds(10));
+  client.Get(std::string(API_BASE_PATH) + "/faults/stream", headers, [&](const char * data, size_t length) {
+    pending.append(data, length);
+    size_t end = 0;
+    while (events.size() < count && (end = pending.find("\n\n")) != std::string::npos) {
+      std::string event = pending.substr(0, end + 2);
+      pending.erase(0, end + 2);
+      if (event[0] != ':') {
+        events.push_back(std::move(event));
+      }
+    }
+    return events.size() < count;
+  });
+  return events;
+}
+
+/// Id of an event as sent on its "id:" line
+uint64_t event_id(const std::string & event) {
+  return event.rfind("id: ", 0) == 0 ? std::stoull(event.substr(4)) : 0;
+}
+
+}  // namespace
+
+TEST_F(TestGatewayNode, test_fault_stream_replays_after_last_event_id) {
+  FaultEventSource source(node_);
+  ASSERT_TRUE(source.publish(1, 5));
+
+  // Only events after the client's Last-Event-ID are sent, in order
+  auto events = read_fault_events(create_client(), 3, {{"Last-Event-ID", "2"}});
+  ASSERT_EQ(events.size(), 3u);
+  for (size_t i = 0; i < events.size(); ++i) {
+    EXPECT_EQ(event_id(events[i]), i + 3);
+    EXPECT_NE(events[i].find("event: fault_confirmed\n"), std::string::npos);
+    EXPECT_NE(events[i].find("\"SSE_FAULT_" + std::to_string(i + 3) + "\""), std::string::npos);
+  }
+}
+
+TEST_F(TestGatewayNode, test_fault_stream_replay_buffer_trimmed) {
+  FaultEventSource source(node_);
+  ASSERT_TRUE(source.publish(1, 105));
+
+  // Waits until the last event has been buffered
+  auto last = read_fault_events(create_client(), 1, {{"Last-Event-ID", "104"}});
+  ASSERT_EQ(last.size(), 1u);
+  EXPECT_EQ(event_id(last[0]), 105u);
+
+  // The buffer keeps the newest 100 events, so a replay from the start begins at event 6
+  auto replayed = read_fault_events(create_client(), 100, {{"Last-Event-ID", "0"}});
+  ASSERT_EQ(replayed.size(), 100u);
+  EXPECT_EQ(event_id(replayed.front()), 6u);
+  EXPECT_EQ(event_id(replayed.back()), 105u);
+  EXPECT_NE(replayed.front().find("\"SSE_FAULT_6\""), std::string::npos);
+}
+
+TEST_F(TestGatewayNode, test_fault_stream_clients_share_formatted_events) {
+  FaultEventSource source(node_);
+  ASSERT_TRUE(source.publish(1, 3));
+
+  // Two clients streaming at the same time; new clients start with the buffered events
+  std::vector<std::string> first;
+  std::vector<std::string> second;
+  std::thread first_reader([&] {
+    first = read_fault_events(create_client(), 3);
+  });
+  std::thread second_reader([&] {
+    second = read_fault_events(create_client(), 3);
+  });
+  first_reader.join();
+  second_reader.join();
+
+  // Every client gets the same bytes for an event, id line included
+  ASSERT_EQ(first.size(), 3u);
+  EXPECT_EQ(first, second);
+  for (size_t i = 0; i < first.size(); ++i) {
+    EXPECT_EQ(event_id(first[i]), i + 1);
+  }
+}
+
 // =============================================================================
 // Entity type path extraction tests
 // =============================================================================
@@ -0,0 +1,93 @@
+// Copyright 2026 bburda
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+#include <gtest/gtest.h>
+
+#include <atomic>
+#include <chrono>
+#include <future>
+#include <thread>
+
+#include "ros2_medkit_gateway/job_queue.hpp"
+
+using namespace ros2_medkit_gateway;
+using namespace std::chrono_literals;
+
+TEST(JobQueueTest, RunsSubmittedJobs) {
+  JobQueue queue(2, 16);
+  std::atomic<int> done{0};
+  std::promise<void> all_done;
+  for (int i = 0; i < 10; ++i) {
+    ASSERT_TRUE(queue.submit([&] {
+      if (++done == 10) {
+        all_done.set_value();
+      }
+    }));
+  }
+  ASSERT_EQ(all_done.get_future().wait_for(5s), std::future_status::ready);
+  EXPECT_EQ(done.load(), 10);
+}
+
+TEST(JobQueueTest, RejectsJobsBeyondQueueLimit) {
+  JobQueue queue(1, 1);
+  std::promise<void> started;
+  std::promise<void> release;
+  std::shared_future<void> released = release.get_future().share();
+
+  // Occupy the only worker, then fill the single queue slot
+  ASSERT_TRUE(queue.submit([&] {
+    started.set_value();
+    released.wait();
+  }));
+  ASSERT_EQ(started.get_future().wait_for(5s), std::future_status::ready);
+  ASSERT_TRUE(queue.submit([] {}));
+  EXPECT_EQ(queue.queued(), 1u);
+
+  EXPECT_FALSE(queue.submit([] {}));
+
+  release.set_value();
+}
+
+TEST(JobQueueTest, ShutdownDropsPendingJobsAndFinishesRunningOne) {
+  JobQueue queue(1, 4);
+  std::promise<void> started;
+  std::promise<void> release;
+  std::shared_future<void> released = release.get_future().share();
+  std::atomic<bool> running_finished{false};
+  std::atomic<bool> pending_ran{false};
+
+  ASSERT_TRUE(queue.submit([&] {
+    started.set_value();
+    released.wait();
+    running_finished = true;
+  }));
+  ASSERT_EQ(started.get_future().wait_for(5s), std::future_status::ready);
+  ASSERT_TRUE(queue.submit([&] {
+    pending_ran = true;
+  }));
+
+  auto stopped = std::async(std::launch::async, [&] {
+    queue.shutdown();
+  });
+  // The worker is still busy, so the pending job can only leave the queue by being dropped
+  while (queue.queued() > 0) {
+    std::this_thread::sleep_for(1ms);
+  }
+  release.set_value();
+  ASSERT_EQ(stopped.wait_for(5s), std::future_status::ready);
+
+  EXPECT_TRUE(running_finished.load());
+  EXPECT_FALSE(pending_ran.load());
+  EXPECT_FALSE(queue.submit([] {}));
+}
@@ -0,0 +1,294 @@
+// Copyright 2026 bburda
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+#include <gtest/gtest.h>
+
+#include <filesystem>
+#include <fstream>
+#include <string>
+
+#include "ros2_medkit_gateway/discovery/manifest/manifest_cache.hpp"
+#include "ros2_medkit_gateway/discovery/manifest/manifest_manager.hpp"
+
+using namespace ros2_medkit_gateway;
+using namespace ros2_medkit_gateway::discovery;
+
+namespace fs = std::filesystem;
+
+class ManifestCacheTest : public ::testing::Test {
+ protected:
+  void SetUp() override {
+    temp_dir_ = fs::temp_directory_path() / "manifest_cache_test";
+    fs::remove_all(temp_dir_);
+    fs::create_directories(temp_dir_);
+    cache_dir_ = (temp_dir_ / "cache").string();
+  }
+
+  void TearDown() override {
+    fs::remove_all(temp_dir_);
+  }
+
+  std::string write_temp_file(const std::string & filename, const std::string & content) {
+    fs::path file_path = temp_dir_ / filename;
+    std::ofstream ofs(file_path);
+    ofs << content;
+    return file_path.string();
+  }
+
+  size_t cache_file_count() const {
+    size_t count = 0;
+    if (fs::exists(cache_dir_)) {
+      for (const auto & entry : fs::directory_iterator(cache_dir_)) {
+        (void)entry;
+        ++count;
+      }
+    }
+    return count;
+  }
+
+  static CompiledManifest make_compiled() {
+    CompiledManifest compiled;
+    auto & manifest = compiled.manifest;
+    manifest.manifest_version = "1.0";
+    manifest.metadata.name = "cached";
+    manifest.metadata.version = "2.1.0";
+    manifest.config.unmanifested_nodes = ManifestConfig::UnmanifestedNodePolicy::IGNORE;
+
+    Area area;
+    area.id = "powertrain";
+    area.name = "Powertrain";
+    area.tags = {"drive"};
+    manifest.areas.push_back(area);
+
+    Component comp;
+    comp.id = "engine";
+    comp.name = "Engine ECU";
+    comp.area = "powertrain";
+    comp.depends_on = {"sensors"};
+    manifest.components.push_back(comp);
+
+    App app;
+    app.id = "controller";
+    app.name = "Controller";
+    app.component_id = "engine";
+    App::RosBinding binding;
+    binding.node_name = "engine_controller";
+    binding.namespace_pattern = "/powertrain";
+    binding.topic_namespace = "/engine";
+    app.ros_binding = binding;
+    manifest.apps.push_back(app);
+
+    App external;
+    external.id = "cloud";
+    external.name = "Cloud";
+    external.external = true;
+    manifest.apps.push_back(external);
+
+    Function func;
+    func.id = "drive";
+    func.name = "Drive";
+    func.hosts = {"controller"};
+    manifest.functions.push_back(func);
+
+    manifest.capabilities["engine"] = {{"faults", true}};
+
+    compiled.validation.add_warning("R009", "Function 'drive' hosts non-existent entity: x", "functions[0]");
+    return compiled;
+  }
+
+  fs::path temp_dir_;
+  std::string cache_dir_;
+};
+
+// Manifest whose only validation issue is a warning (function hosts a missing entity)
+const std::string manifest_with_warning = R"(
+manifest_version: "1.0"
+metadata:
+  name: "with-warning"
+  version: "1.0.0"
+areas:
+  - id: "area1"
+    name: "Area 1"
+components:
+  - id: "comp1"
+    name: "Component 1"
+    area: "area1"
+apps:
+  - id: "app1"
+    name: "App 1"
+    is_located_on: "comp1"
+    ros_binding:
+      node_name: "app1_node"
+      namespace: "/area1"
+functions:
+  - id: "func1"
+    name: "Function 1"
+    hosts: ["app1", "missing_app"]
+)";
+
+// Manifest with a broken reference (validation error)
+const std::string manifest_with_error = R"(
+manifest_version: "1.0"
+metadata:
+  name: "with-error"
+  version: "1.0.0"
+components:
+  - id: "comp1"
+    name: "Component 1"
+    area: "nonexistent_area"
+)";
+
+TEST_F(ManifestCacheTest, ContentHashIsStableAndContentSensitive) {
+  auto hash = ManifestCache::content_hash("manifest_version: \"1.0\"");
+  EXPECT_EQ(hash.size(), 16u);
+  EXPECT_EQ(hash, ManifestCache::content_hash("manifest_version: \"1.0\""));
+  EXPECT_NE(hash, ManifestCache::content_hash("manifest_version: \"1.1\""));
+}
+
+TEST_F(ManifestCacheTest, StoreAndLoadRoundTrip) {
+  ManifestCache cache(cache_dir_);
+  auto original = make_compiled();
+  ASSERT_TRUE(cache.store("0123456789abcdef", original));
+  EXPECT_TRUE(fs::exists(cache.cache_path("0123456789abcdef")));
+
+  auto loaded = cache.load("0123456789abcdef");
+  ASSERT_TRUE(loaded.has_value());
+  const auto & manifest = loaded->manifest;
+  EXPECT_EQ(manifest.metadata.name, "cached");
+  EXPECT_EQ(manifest.metadata.version, "2.1.0");
+  EXPECT_EQ(manifest.config.unmanifested_nodes, ManifestConfig::UnmanifestedNodePolicy::IGNORE);
+
+  ASSERT_EQ(manifest.areas.size(), 1u);
+  EXPECT_EQ(manifest.areas[0].tags, std::vector<std::string>{"drive"});
+  ASSERT_EQ(manifest.components.size(), 1u);
+  EXPECT_EQ(manifest.components[0].area, "powertrain");
+  EXPECT_EQ(manifest.components[0].depends_on, std::vector<std::string>{"sensors"});
+
+  ASSERT_EQ(manifest.apps.size(), 2u);
+  ASSERT_TRUE(manifest.apps[0].ros_binding.has_value());
+  EXPECT_EQ(manifest.apps[0].ros_binding->node_name, "engine_controller");
+  EXPECT_EQ(manifest.apps[0].ros_binding->namespace_pattern, "/powertrain");
+  EXPECT_EQ(manifest.apps[0].ros_binding->topic_namespace, "/engine");
+  EXPECT_FALSE(manifest.apps[1].ros_binding.has_value());
+  EXPECT_TRUE(manifest.apps[1].external);
+
+  ASSERT_EQ(manifest.functions.size(), 1u);
+  EXPECT_EQ(manifest.functions[0].hosts, std::vector<std::string>{"controller"});
+  ASSERT_EQ(manifest.capabilities.count("engine"), 1u);
+  EXPECT_EQ(manifest.capabilities.at("engine")["faults"], true);
+
+  ASSERT_EQ(loaded->validation.warnings.size(), 1u);
+  EXPECT_EQ(loaded->validation.warnings[0].rule_id, "R009");
+  EXPECT_FALSE(loaded->validation.has_errors());
+}
+
+TEST_F(ManifestCacheTest, LoadMissesUnknownHash) {
+  ManifestCache cache(cache_dir_);
+  EXPECT_FALSE(cache.load("0123456789abcdef").has_value());
+
+  ASSERT_TRUE(cache.store("0123456789abcdef", make_compiled()));
+  EXPECT_FALSE(cache.load("fedcba9876543210").has_value());
+}
+
+TEST_F(ManifestCacheTest, CorruptFileIsAMiss) {
+  ManifestCache cache(cache_dir_);
+  ASSERT_TRUE(cache.store("0123456789abcdef", make_compiled()));
+
+  // Truncate the payload after the header
+  auto path = cache.cache_path("0123456789abcdef");
+  fs::resize_file(path, 12);
+  EXPECT_FALSE(cache.load("0123456789abcdef").has_value());
+
+  // Not a cache file at all
+  std::ofstream(path, std::ios::trunc) << "manifest_version: \"1.0\"";
+  EXPECT_FALSE(cache.load("0123456789abcdef").has_value());
+}
+
+TEST_F(ManifestCacheTest, StoreKeepsOnlyCurrentManifest) {
+  ManifestCache cache(cache_dir_);
+  ASSERT_TRUE(cache.store("0000000000000001", make_compiled()));
+  ASSERT_TRUE(cache.store("0000000000000002", make_compiled()));
+
+  EXPECT_EQ(cache_file_count(), 1u);
+  EXPECT_FALSE(cache.load("0000000000000001").has_value());
+  EXPECT_TRUE(cache.load("0000000000000002").has_value());
+}
+
+// =============================================================================
+// ManifestManager with cache
+// =============================================================================
+
+TEST_F(ManifestCacheTest, ManagerWritesCacheAndLoadsFromIt) {
+  std::string path = write_temp_file("manifest.yaml", manifest_with_warning);
+  auto hash = ManifestCache::content_hash(manifest_with_warning);
+  ManifestCache cache(cache_dir_);
+
+  ManifestManager first;
+  first.set_cache_dir(cache_dir_);
+  ASSERT_TRUE(first.load_manifest(path, false));
+  ASSERT_TRUE(cache.load(hash).has_value());
+
+  // Replace the cached entities so a cache hit is observable
+  auto compiled = cache.load(hash);
+  compiled->manifest.apps[0].name = "From Cache";
+  ASSERT_TRUE(cache.store(hash, *compiled));
+
+  ManifestManager second;
+  second.set_cache_dir(cache_dir_);
+  ASSERT_TRUE(second.load_manifest(path, false));
+  auto app = second.get_app("app1");
+  ASSERT_TRUE(app.has_value());
+  EXPECT_EQ(app->name, "From Cache");
+  ASSERT_TRUE(app->ros_binding.has_value());
+  EXPECT_EQ(app->ros_binding->node_name, "app1_node");
+  EXPECT_EQ(second.get_validation_result().warnings.size(), first.get_validation_result().warnings.size());
+}
+
+TEST_F(ManifestCacheTest, ManagerStrictModeRejectsCachedWarnings) {
+  std::string path = write_temp_file("manifest.yaml", manifest_with_warning);
+
+  ManifestManager warm;
+  warm.set_cache_dir(cache_dir_);
+  ASSERT_TRUE(warm.load_manifest(path, false));
+
+  ManifestManager strict;
+  strict.set_cache_dir(cache_dir_);
+  EXPECT_FALSE(strict.load_manifest(path, true));
+  EXPECT_FALSE(strict.is_manifest_active());
+  EXPECT_TRUE(strict.get_validation_result().has_warnings());
+}
+
+TEST_F(ManifestCacheTest, ManagerRevalidatesChangedManifest) {
+  std::string path = write_temp_file("manifest.yaml", manifest_with_warning);
+
+  ManifestManager manager;
+  manager.set_cache_dir(cache_dir_);
+  ASSERT_TRUE(manager.load_manifest(path, false));
+  ASSERT_EQ(manager.get_apps().size(), 1u);
+
+  // An edited manifest has a new hash: it is parsed and validated again
+  write_temp_file("manifest.yaml", manifest_with_error);
+  EXPECT_FALSE(manager.reload_manifest());
+  EXPECT_TRUE(manager.is_manifest_active());
+  EXPECT_EQ(manager.get_apps().size(), 1u);
+
+  // Invalid manifests are not cached
+  ManifestCache cache(cache_dir_);
+  EXPECT_FALSE(cache.load(ManifestCache::content_hash(manifest_with_error)).has_value());
+}
+
+int main(int argc, char ** argv) {
+  testing::InitGoogleTest(&argc, argv);
+  return RUN_ALL_TESTS();
+}
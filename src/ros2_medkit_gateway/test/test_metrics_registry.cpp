@@ -0,0 +1,130 @@
+// Copyright 2026 bburda
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+#include <gtest/gtest.h>
+
+#include <string>
+#include <thread>
+#include <vector>
+
+#include "ros2_medkit_gateway/metrics_registry.hpp"
+
+using namespace ros2_medkit_gateway;
+
+namespace {
+
+bool contains(const std::string & text, const std::string & needle) {
+  return text.find(needle) != std::string::npos;
+}
+
+}  // namespace
+
+TEST(MetricsRegistryTest, RendersCountersAndGaugesPerLabelSet) {
+  MetricsRegistry metrics;
+  metrics.describe_counter("requests_total", "Requests");
+  metrics.describe_gauge("in_flight", "In-flight requests");
+
+  metrics.increment("requests_total", {{"route", "/a"}});
+  metrics.increment("requests_total", {{"route", "/a"}});
+  metrics.increment("requests_total", {{"route", "/b"}}, 5);
+  metrics.set("in_flight", {}, 3);
+
+  std::string text = metrics.render();
+  EXPECT_TRUE(contains(text, "# HELP requests_total Requests\n# TYPE requests_total counter\n"));
+  EXPECT_TRUE(contains(text, "requests_total{route=\"/a\"} 2\n"));
+  EXPECT_TRUE(contains(text, "requests_total{route=\"/b\"} 5\n"));
+  EXPECT_TRUE(contains(text, "# TYPE in_flight gauge\nin_flight 3\n"));
+}
+
+TEST(MetricsRegistryTest, RendersCumulativeHistogramBuckets) {
+  MetricsRegistry metrics;
+  metrics.describe_histogram("latency_seconds", "Latency", {0.1, 1.0});
+
+  metrics.observe("latency_seconds", {{"route", "/a"}}, 0.05);
+  metrics.observe("latency_seconds", {{"route", "/a"}}, 0.5);
+  metrics.observe("latency_seconds", {{"route", "/a"}}, 2.0);
+
+  std::string text = metrics.render();
+  EXPECT_TRUE(contains(text, "# TYPE latency_seconds histogram\n"));
+  EXPECT_TRUE(contains(text, "latency_seconds_bucket{route=\"/a\",le=\"0.1\"} 1\n"));
+  EXPECT_TRUE(contains(text, "latency_seconds_bucket{route=\"/a\",le=\"1\"} 2\n"));
+  EXPECT_TRUE(contains(text, "latency_seconds_bucket{route=\"/a\",le=\"+Inf\"} 3\n"));
+  EXPECT_TRUE(contains(text, "latency_seconds_sum{route=\"/a\"} 2.55\n"));
+  EXPECT_TRUE(contains(text, "latency_seconds_count{route=\"/a\"} 3\n"));
+}
+
+TEST(MetricsRegistryTest, EscapesLabelValues) {
+  MetricsRegistry metrics;
+  metrics.describe_counter("calls_total", "Calls");
+  metrics.increment("calls_total", {{"service", "a\"b\\c\nd"}});
+
+  EXPECT_TRUE(contains(metrics.render(), "calls_total{service=\"a\\\"b\\\\c\\nd\"} 1\n"));
+}
+
+TEST(MetricsRegistryTest, IgnoresUndescribedAndMismatchedMetrics) {
+  MetricsRegistry metrics;
+  metrics.describe_counter("calls_total", "Calls");
+
+  metrics.increment("unknown_total");
+  metrics.observe("calls_total", {}, 1.0);
+
+  // Families without series are not rendered
+  EXPECT_EQ(metrics.render(), "");
+}
+
+TEST(MetricsRegistryTest, CollectorsRunOnRenderUntilRemoved) {
+  MetricsRegistry metrics;
+  metrics.describe_gauge("clients", "Clients");
+
+  int clients = 2;
+  size_t handle = metrics.add_collector([&clients](MetricsRegistry & m) {
+    m.set("clients", {}, clients);
+  });
+  EXPECT_TRUE(contains(metrics.render(), "clients 2\n"));
+
+  clients = 4;
+  EXPECT_TRUE(contains(metrics.render(), "clients 4\n"));
+
+  metrics.remove_collector(handle);
+  clients = 7;
+  EXPECT_TRUE(contains(metrics.render(), "clients 4\n"));
+}
+
+TEST(MetricsRegistryTest, ConcurrentUpdatesAreNotLost) {
+  MetricsRegistry metrics;
+  metrics.describe_counter("events_total", "Events");
+
+  std::vector<std::thread> threads;
+  for (int t = 0; t < 4; ++t) {
+    threads.emplace_back([&metrics] {
+      for (int i = 0; i < 1000; ++i) {
+        metrics.increment("events_total", {{"kind", "x"}});
+      }
+    });
+  }
+  for (auto & thread : threads) {
+    thread.join();
+  }
+
+  EXPECT_TRUE(contains(metrics.render(), "events_total{kind=\"x\"} 4000\n"));
+}
+
+TEST(MetricsRegistryTest, ScopedLatencyObservesOnceAndToleratesNullRegistry) {
+  MetricsRegistry metrics;
+  metrics.describe_histogram("call_seconds", "Calls");
+  { ScopedLatency latency(&metrics, "call_seconds", {{"service", "/svc"}}); }
+  { ScopedLatency latency(nullptr, "call_seconds", {{"service", "/svc"}}); }
+
+  EXPECT_TRUE(contains(metrics.render(), "call_seconds_count{service=\"/svc\"} 1\n"));
+}
@@ -14,8 +14,16 @@
 
 #include <gtest/gtest.h>
 
+#include <chrono>
+#include <example_interfaces/action/fibonacci.hpp>
 #include <memory>
+#include <mutex>
+#include <optional>
 #include <rclcpp/rclcpp.hpp>
+#include <rclcpp_action/rclcpp_action.hpp>
+#include <string>
+#include <thread>
+#include <vector>
 
 #include "ros2_medkit_gateway/discovery/discovery_manager.hpp"
 #include "ros2_medkit_gateway/operation_manager.hpp"
@@ -163,6 +171,236 @@ TEST_F(TestOperationManager, test_cleanup_old_goals_empty) {
   EXPECT_NO_THROW(operation_manager_->cleanup_old_goals(std::chrono::seconds(0)));
 }
 
+TEST_F(TestOperationManager, test_tracked_goals_bounded_and_indexed) {
+  using Fibonacci = example_interfaces::action::Fibonacci;
+
+  // Action server that finishes every goal as soon as it is accepted
+  auto server_node = std::make_shared<rclcpp::Node>("test_goal_tracking_server");
+  auto server = rclcpp_action::create_server<Fibonacci>(
+      server_node, "goal_tracking",
+      [](const rclcpp_action::GoalUUID &, std::shared_ptr<const Fibonacci::Goal>) {
+        return rclcpp_action::GoalResponse::ACCEPT_AND_EXECUTE;
+      },
+      [](std::shared_ptr<rclcpp_action::ServerGoalHandle<Fibonacci>>) {
+        return rclcpp_action::CancelResponse::ACCEPT;
+      },
+      [](std::shared_ptr<rclcpp_action::ServerGoalHandle<Fibonacci>> goal_handle) {
+        goal_handle->succeed(std::make_shared<Fibonacci::Result>());
+      });
+
+  rclcpp::NodeOptions options;
+  options.parameter_overrides({rclcpp::Parameter("service_call_timeout_sec", static_cast<int64_t>(5)),
+                               rclcpp::Parameter("max_tracked_goals", static_cast<int64_t>(3))});
+  auto node = std::make_shared<rclcpp::Node>("test_operation_manager_goals_node", options);
+  OperationManager manager(node.get(), discovery_manager_.get());
+
+  rclcpp::executors::MultiThreadedExecutor executor;
+  executor.add_node(server_node);
+  executor.add_node(node);
+  std::thread spinner([&executor] {
+    executor.spin();
+  });
+
+  const std::string action_path = "/goal_tracking";
+  std::vector<std::string> goal_ids;
+  for (int i = 0; i < 5; ++i) {
+    auto sent = manager.send_action_goal(action_path, "example_interfaces/action/Fibonacci", {{"order", 1}});
+    ASSERT_TRUE(sent.goal_accepted) << sent.error_message;
+    goal_ids.push_back(sent.goal_id);
+
+    // Only finished goals make room for new ones, so let the status topic report this one first
+    auto deadline = std::chrono::steady_clock::now() + std::chrono::seconds(10);
+    while (manager.get_tracked_goal(sent.goal_id)->status != ActionGoalStatus::SUCCEEDED &&
+           std::chrono::steady_clock::now() < deadline) {
+      std::this_thread::sleep_for(std::chrono::milliseconds(10));
+    }
+    ASSERT_EQ(manager.get_tracked_goal(sent.goal_id)->status, ActionGoalStatus::SUCCEEDED);
+  }
+
+  // Only the newest max_tracked_goals goals are kept, newest first
+  EXPECT_EQ(manager.list_tracked_goals().size(), 3u);
+  EXPECT_FALSE(manager.get_tracked_goal(goal_ids[0]).has_value());
+  auto goals = manager.get_goals_for_action(action_path);
+  ASSERT_EQ(goals.size(), 3u);
+  EXPECT_EQ(goals[0].goal_id, goal_ids[4]);
+  EXPECT_GE(goals[0].created_at, goals[1].created_at);
+  EXPECT_GE(goals[1].created_at, goals[2].created_at);
+  EXPECT_EQ(manager.get_latest_goal_for_action(action_path)->goal_id, goal_ids[4]);
+
+  // Cleanup removes finished goals
+  manager.update_goal_status(goal_ids[2], ActionGoalStatus::SUCCEEDED);
+  manager.cleanup_old_goals(std::chrono::seconds(-1));
+  EXPECT_FALSE(manager.get_tracked_goal(goal_ids[2]).has_value());
+  manager.update_goal_status(goal_ids[3], ActionGoalStatus::ABORTED);
+  manager.update_goal_status(goal_ids[4], ActionGoalStatus::SUCCEEDED);
+  manager.cleanup_old_goals(std::chrono::seconds(-1));
+  EXPECT_TRUE(manager.list_tracked_goals().empty());
+  EXPECT_FALSE(manager.get_latest_goal_for_action(action_path).has_value());
+
+  executor.cancel();
+  spinner.join();
+}
+
+TEST_F(TestOperationManager, test_running_goals_are_not_evicted) {
+  using Fibonacci = example_interfaces::action::Fibonacci;
+  using GoalHandle = rclcpp_action::ServerGoalHandle<Fibonacci>;
+
+  // Action server that keeps every goal running until the test aborts it
+  std::mutex handles_mutex;
+  std::vector<std::shared_ptr<GoalHandle>> handles;
+  auto server_node = std::make_shared<rclcpp::Node>("test_goal_limit_server");
+  auto server = rclcpp_action::create_server<Fibonacci>(
+      server_node, "goal_limit",
+      [](const rclcpp_action::GoalUUID &, std::shared_ptr<const Fibonacci::Goal>) {
+        return rclcpp_action::GoalResponse::ACCEPT_AND_EXECUTE;
+      },
+      [](std::shared_ptr<GoalHandle>) {
+        return rclcpp_action::CancelResponse::ACCEPT;
+      },
+      [&](std::shared_ptr<GoalHandle> goal_handle) {
+        std::lock_guard<std::mutex> lock(handles_mutex);
+        handles.push_back(goal_handle);
+      });
+
+  rclcpp::NodeOptions options;
+  options.parameter_overrides({rclcpp::Parameter("service_call_timeout_sec", static_cast<int64_t>(5)),
+                               rclcpp::Parameter("max_tracked_goals", static_cast<int64_t>(2))});
+  auto node = std::make_shared<rclcpp::Node>("test_operation_manager_goal_limit_node", options);
+  OperationManager manager(node.get(), discovery_manager_.get());
+
+  rclcpp::executors::MultiThreadedExecutor executor;
+  executor.add_node(server_node);
+  executor.add_node(node);
+  std::thread spinner([&executor] {
+    executor.spin();
+  });
+
+  const std::string action_path = "/goal_limit";
+  std::vector<std::string> goal_ids;
+  for (int i = 0; i < 2; ++i) {
+    auto sent = manager.send_action_goal(action_path, "example_interfaces/action/Fibonacci", {{"order", 1}});
+    ASSERT_TRUE(sent.goal_accepted) << sent.error_message;
+    goal_ids.push_back(sent.goal_id);
+  }
+
+  // Full with running goals only: the new goal is refused before it reaches the server
+  auto refused = manager.send_action_goal(action_path, "example_interfaces/action/Fibonacci", {{"order", 1}});
+  EXPECT_FALSE(refused.success);
+  EXPECT_FALSE(refused.goal_accepted);
+  EXPECT_TRUE(refused.goal_limit_reached);
+  EXPECT_EQ(manager.list_tracked_goals().size(), 2u);
+  EXPECT_TRUE(manager.get_tracked_goal(goal_ids[0]).has_value());
+  EXPECT_TRUE(manager.get_tracked_goal(goal_ids[1]).has_value());
+  {
+    std::lock_guard<std::mutex> lock(handles_mutex);
+    EXPECT_EQ(handles.size(), 2u);
+  }
+
+  // A finished goal makes room again
+  {
+    std::lock_guard<std::mutex> lock(handles_mutex);
+    handles[0]->abort(std::make_shared<Fibonacci::Result>());
+  }
+  auto deadline = std::chrono::steady_clock::now() + std::chrono::seconds(10);
+  while (manager.get_tracked_goal(goal_ids[0])->status != ActionGoalStatus::ABORTED &&
+         std::chrono::steady_clock::now() < deadline) {
+    std::this_thread::sleep_for(std::chrono::milliseconds(10));
+  }
+  ASSERT_EQ(manager.get_tracked_goal(goal_ids[0])->status, ActionGoalStatus::ABORTED);
+  auto sent = manager.send_action_goal(action_path, "example_interfaces/action/Fibonacci", {{"order", 1}});
+  ASSERT_TRUE(sent.goal_accepted) << sent.error_message;
+  EXPECT_FALSE(manager.get_tracked_goal(goal_ids[0]).has_value());
+  EXPECT_TRUE(manager.get_tracked_goal(goal_ids[1]).has_value());
+
+  {
+    std::lock_guard<std::mutex> lock(handles_mutex);
+    for (const auto & handle : handles) {
+      if (handle->is_active()) {
+        handle->abort(std::make_shared<Fibonacci::Result>());
+      }
+    }
+  }
+  executor.cancel();
+  spinner.join();
+}
+
+TEST_F(TestOperationManager, test_idle_action_clients_dropped) {
+  using Fibonacci = example_interfaces::action::Fibonacci;
+  using GoalHandle = rclcpp_action::ServerGoalHandle<Fibonacci>;
+
+  // Action server that keeps the goal running until the test aborts it
+  std::mutex handles_mutex;
+  std::vector<std::shared_ptr<GoalHandle>> handles;
+  auto server_node = std::make_shared<rclcpp::Node>("test_idle_clients_server");
+  auto server = rclcpp_action::create_server<Fibonacci>(
+      server_node, "idle_clients",
+      [](const rclcpp_action::GoalUUID &, std::shared_ptr<const Fibonacci::Goal>) {
+        return rclcpp_action::GoalResponse::ACCEPT_AND_EXECUTE;
+      },
+      [](std::shared_ptr<GoalHandle>) {
+        return rclcpp_action::CancelResponse::ACCEPT;
+      },
+      [&](std::shared_ptr<GoalHandle> goal_handle) {
+        std::lock_guard<std::mutex> lock(handles_mutex);
+        handles.push_back(goal_handle);
+      });
+
+  rclcpp::NodeOptions options;
+  options.parameter_overrides({rclcpp::Parameter("service_call_timeout_sec", static_cast<int64_t>(5)),
+                               rclcpp::Parameter("action_client_idle_timeout_sec", static_cast<int64_t>(1))});
+  auto node = std::make_shared<rclcpp::Node>("test_operation_manager_idle_clients_node", options);
+  OperationManager manager(node.get(), discovery_manager_.get());
+
+  rclcpp::executors::MultiThreadedExecutor executor;
+  executor.add_node(server_node);
+  executor.add_node(node);
+  std::thread spinner([&executor] {
+    executor.spin();
+  });
+
+  const std::string action_path = "/idle_clients";
+  auto sent = manager.send_action_goal(action_path, "example_interfaces/action/Fibonacci", {{"order", 1}});
+  ASSERT_TRUE(sent.goal_accepted) << sent.error_message;
+  EXPECT_EQ(manager.action_client_count(), 1u);
+
+  // Past the idle timeout, but the running goal keeps its action's clients
+  std::this_thread::sleep_for(std::chrono::milliseconds(1100));
+  manager.cleanup_old_goals(std::chrono::seconds(-1));
+  EXPECT_TRUE(manager.get_tracked_goal(sent.goal_id).has_value());
+  EXPECT_EQ(manager.action_client_count(), 1u);
+
+  // Once the goal has finished and is cleaned up, the idle clients are dropped
+  {
+    std::lock_guard<std::mutex> lock(handles_mutex);
+    ASSERT_EQ(handles.size(), 1u);
+    handles[0]->abort(std::make_shared<Fibonacci::Result>());
+  }
+  auto deadline = std::chrono::steady_clock::now() + std::chrono::seconds(10);
+  while (manager.get_tracked_goal(sent.goal_id)->status != ActionGoalStatus::ABORTED &&
+         std::chrono::steady_clock::now() < deadline) {
+    std::this_thread::sleep_for(std::chrono::milliseconds(10));
+  }
+  manager.cleanup_old_goals(std::chrono::seconds(-1));
+  EXPECT_FALSE(manager.get_tracked_goal(sent.goal_id).has_value());
+  EXPECT_EQ(manager.action_client_count(), 0u);
+
+  // The next goal creates them again
+  auto resent = manager.send_action_goal(action_path, "example_interfaces/action/Fibonacci", {{"order", 1}});
+  ASSERT_TRUE(resent.goal_accepted) << resent.error_message;
+  EXPECT_EQ(manager.action_client_count(), 1u);
+
+  {
+    std::lock_guard<std::mutex> lock(handles_mutex);
+    for (const auto & handle : handles) {
+      if (handle->is_active()) {
+        handle->abort(std::make_shared<Fibonacci::Result>());
+      }
+    }
+  }
+  executor.cancel();
+  spinner.join();
+}
+
 // ==================== SERVICE CALL TESTS ====================
 
 TEST_F(TestOperationManager, test_call_service_unavailable) {
@@ -356,6 +594,71 @@ TEST_F(TestOperationManager, test_get_action_result_action_unavailable) {
   EXPECT_TRUE(result.error_message.find("not available") != std::string::npos);
 }
 
+// ==================== ASYNCHRONOUS SERVICE EXECUTION TESTS ====================
+
+TEST_F(TestOperationManager, test_get_service_execution_not_found) {
+  EXPECT_FALSE(operation_manager_->get_service_execution("00000000000000000000000000000000").has_value());
+  EXPECT_TRUE(operation_manager_->get_service_executions("/nonexistent/service").empty());
+  EXPECT_FALSE(operation_manager_->cancel_service_execution("00000000000000000000000000000000"));
+}
+
+TEST_F(TestOperationManager, test_submit_service_call_records_failure) {
+  auto submitted =
+      operation_manager_->submit_service_call("/nonexistent/service", "std_srvs/srv/Trigger", nlohmann::json{});
+  ASSERT_TRUE(submitted.success);
+  EXPECT_TRUE(OperationManager::is_valid_uuid_hex(submitted.execution_id));
+
+  auto executions = operation_manager_->get_service_executions("/nonexistent/service");
+  ASSERT_EQ(executions.size(), 1u);
+  EXPECT_EQ(executions[0].execution_id, submitted.execution_id);
+
+  // The worker fails the call once the service does not appear
+  auto deadline = std::chrono::steady_clock::now() + std::chrono::seconds(15);
+  std::optional<ServiceExecutionInfo> execution;
+  do {
+    std::this_thread::sleep_for(std::chrono::milliseconds(50));
+    execution = operation_manager_->get_service_execution(submitted.execution_id);
+    ASSERT_TRUE(execution.has_value());
+  } while (execution->status != ActionGoalStatus::ABORTED && std::chrono::steady_clock::now() < deadline);
+
+  EXPECT_EQ(execution->status, ActionGoalStatus::ABORTED);
+  EXPECT_FALSE(execution->result.success);
+  EXPECT_FALSE(execution->result.error_message.empty());
+  // Finished executions cannot be canceled
+  EXPECT_FALSE(operation_manager_->cancel_service_execution(submitted.execution_id));
+
+  operation_manager_->cleanup_old_goals(std::chrono::seconds(-1));
+  EXPECT_FALSE(operation_manager_->get_service_execution(submitted.execution_id).has_value());
+}
+
+TEST_F(TestOperationManager, test_submit_service_call_bounded_queue) {
+  rclcpp::NodeOptions options;
+  options.parameter_overrides({rclcpp::Parameter("service_execution_workers", static_cast<int64_t>(1)),
+                               rclcpp::Parameter("service_execution_queue_size", static_cast<int64_t>(1))});
+  auto node = std::make_shared<rclcpp::Node>("test_operation_manager_queue_node", options);
+  OperationManager manager(node.get(), discovery_manager_.get());
+
+  // First call occupies the only worker (waiting for the service), second one is queued
+  auto running = manager.submit_service_call("/nonexistent/service", "std_srvs/srv/Trigger", nlohmann::json{});
+  ASSERT_TRUE(running.success);
+  auto deadline = std::chrono::steady_clock::now() + std::chrono::seconds(5);
+  while (manager.get_service_execution(running.execution_id)->status == ActionGoalStatus::ACCEPTED &&
+         std::chrono::steady_clock::now() < deadline) {
+    std::this_thread::sleep_for(std::chrono::milliseconds(10));
+  }
+  auto queued = manager.submit_service_call("/nonexistent/service", "std_srvs/srv/Trigger", nlohmann::json{});
+  ASSERT_TRUE(queued.success);
+
+  auto rejected = manager.submit_service_call("/nonexistent/service", "std_srvs/srv/Trigger", nlohmann::json{});
+  EXPECT_FALSE(rejected.success);
+  EXPECT_FALSE(rejected.error_message.empty());
+
+  // A queued execution can be canceled before it starts
+  EXPECT_TRUE(manager.cancel_service_execution(queued.execution_id));
+  EXPECT_EQ(manager.get_service_execution(queued.execution_id)->status, ActionGoalStatus::CANCELED);
+  EXPECT_EQ(manager.get_service_executions("/nonexistent/service").size(), 2u);
+}
+
 // ==================== SUBSCRIPTION TESTS ====================
 
 TEST_F(TestOperationManager, test_subscribe_unsubscribe_action_status) {
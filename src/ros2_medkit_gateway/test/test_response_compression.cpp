@@ -0,0 +1,202 @@
+// Copyright 2026 bburda
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+#include <gtest/gtest.h>
+#include <zlib.h>
+#include <zstd.h>
+
+#include <httplib.h>
+
+#include <nlohmann/json.hpp>
+#include <string>
+
+#include "ros2_medkit_gateway/http/response_compression.hpp"
+
+using namespace ros2_medkit_gateway;
+
+namespace {
+
+std::string gunzip(const std::string & data) {
+  z_stream stream{};
+  EXPECT_EQ(inflateInit2(&stream, 15 + 16), Z_OK);
+  std::string out(data.size() * 64, '\0');
+  stream.next_in = reinterpret_cast<Bytef *>(const_cast<char *>(data.data()));
+  stream.avail_in = static_cast<uInt>(data.size());
+  stream.next_out = reinterpret_cast<Bytef *>(out.data());
+  stream.avail_out = static_cast<uInt>(out.size());
+  EXPECT_EQ(inflate(&stream, Z_FINISH), Z_STREAM_END);
+  out.resize(stream.total_out);
+  inflateEnd(&stream);
+  return out;
+}
+
+std::string unzstd(const std::string & data) {
+  unsigned long long size = ZSTD_getFrameContentSize(data.data(), data.size());
+  std::string out(static_cast<size_t>(size), '\0');
+  size_t written = ZSTD_decompress(out.data(), out.size(), data.data(), data.size());
+  EXPECT_FALSE(ZSTD_isError(written));
+  out.resize(written);
+  return out;
+}
+
+/// A typical JSON collection response, large enough to pass the default threshold
+std::string make_json_body() {
+  nlohmann::json items = nlohmann::json::array();
+  for (int i = 0; i < 100; ++i) {
+    items.push_back({{"id", "sensor_" + std::to_string(i)}, {"name", "Sensor"}, {"href", "/api/v1/apps/sensor"}});
+  }
+  return nlohmann::json{{"items", items}}.dump(2);
+}
+
+}  // namespace
+
+// ==================== negotiate_content_encoding tests ====================
+
+TEST(ResponseCompressionTest, NegotiatesIdentityByDefault) {
+  EXPECT_EQ(negotiate_content_encoding(""), ContentEncoding::IDENTITY);
+  EXPECT_EQ(negotiate_content_encoding("identity"), ContentEncoding::IDENTITY);
+  EXPECT_EQ(negotiate_content_encoding("br, deflate"), ContentEncoding::IDENTITY);
+}
+
+TEST(ResponseCompressionTest, NegotiatesSupportedCodings) {
+  EXPECT_EQ(negotiate_content_encoding("gzip"), ContentEncoding::GZIP);
+  EXPECT_EQ(negotiate_content_encoding("x-gzip"), ContentEncoding::GZIP);
+  EXPECT_EQ(negotiate_content_encoding("zstd"), ContentEncoding::ZSTD);
+  EXPECT_EQ(negotiate_content_encoding("gzip, deflate, br, zstd"), ContentEncoding::ZSTD);
+  EXPECT_EQ(negotiate_content_encoding("*"), ContentEncoding::GZIP);
+}
+
+TEST(ResponseCompressionTest, HonorsQualityValues) {
+  EXPECT_EQ(negotiate_content_encoding("zstd;q=0.5, gzip"), ContentEncoding::GZIP);
+  EXPECT_EQ(negotiate_content_encoding("gzip;q=0, zstd;q=0"), ContentEncoding::IDENTITY);
+  EXPECT_EQ(negotiate_content_encoding("*;q=0"), ContentEncoding::IDENTITY);
+  EXPECT_EQ(negotiate_content_encoding("gzip;q=0, *"), ContentEncoding::IDENTITY);
+}
+
+// ==================== content type tests ====================
+
+TEST(ResponseCompressionTest, CompressibleContentTypes) {
+  EXPECT_TRUE(is_compressible_content_type("application/json"));
+  EXPECT_TRUE(is_compressible_content_type("application/json; charset=utf-8"));
+  EXPECT_TRUE(is_compressible_content_type("application/cbor"));
+  EXPECT_TRUE(is_compressible_content_type("application/problem+json"));
+  EXPECT_TRUE(is_compressible_content_type("text/plain"));
+  EXPECT_FALSE(is_compressible_content_type("text/event-stream"));
+  EXPECT_FALSE(is_compressible_content_type("application/octet-stream"));
+  EXPECT_FALSE(is_compressible_content_type("application/gzip"));
+  EXPECT_FALSE(is_compressible_content_type(""));
+}
+
+// ==================== compress_body tests ====================
+
+TEST(ResponseCompressionTest, CodecsRoundTrip) {
+  std::string body = make_json_body();
+
+  auto gz = compress_body(body, ContentEncoding::GZIP, 6);
+  ASSERT_TRUE(gz.has_value());
+  EXPECT_LT(gz->size(), body.size());
+  EXPECT_EQ(gunzip(*gz), body);
+
+  auto zs = compress_body(body, ContentEncoding::ZSTD, 3);
+  ASSERT_TRUE(zs.has_value());
+  EXPECT_LT(zs->size(), body.size());
+  EXPECT_EQ(unzstd(*zs), body);
+
+  EXPECT_FALSE(compress_body(body, ContentEncoding::IDENTITY, 0).has_value());
+}
+
+// ==================== apply_response_compression tests ====================
+
+TEST(ResponseCompressionTest, CompressesNegotiatedResponse) {
+  CompressionConfig config;
+  std::string body = make_json_body();
+
+  httplib::Request req;
+  req.path = "/api/v1/apps";
+  req.set_header("Accept-Encoding", "gzip, zstd");
+  httplib::Response res;
+  res.set_content(body, "application/json");
+
+  EXPECT_TRUE(apply_response_compression(req, res, config));
+  EXPECT_EQ(res.get_header_value("Content-Encoding"), "zstd");
+  EXPECT_EQ(res.get_header_value("Vary"), "Accept-Encoding");
+  EXPECT_EQ(unzstd(res.body), body);
+}
+
+TEST(ResponseCompressionTest, LeavesResponseUntouchedWhenNotEligible) {
+  CompressionConfig config;
+  std::string body = make_json_body();
+
+  httplib::Request req;
+  req.path = "/api/v1/apps";
+  req.set_header("Accept-Encoding", "gzip");
+
+  // Below the size threshold
+  httplib::Response small;
+  small.set_content("{}", "application/json");
+  EXPECT_FALSE(apply_response_compression(req, small, config));
+  EXPECT_EQ(small.body, "{}");
+  EXPECT_FALSE(small.has_header("Content-Encoding"));
+
+  // Binary content type
+  httplib::Response binary;
+  binary.set_content(body, "application/octet-stream");
+  EXPECT_FALSE(apply_response_compression(req, binary, config));
+  EXPECT_EQ(binary.body, body);
+
+  // Client did not ask for compression
+  httplib::Request plain_req;
+  plain_req.path = "/api/v1/apps";
+  httplib::Response plain;
+  plain.set_content(body, "application/json");
+  EXPECT_FALSE(apply_response_compression(plain_req, plain, config));
+  EXPECT_EQ(plain.body, body);
+  EXPECT_EQ(plain.get_header_value("Vary"), "Accept-Encoding");
+
+  // Compression disabled
+  CompressionConfig disabled;
+  disabled.enabled = false;
+  httplib::Response off;
+  off.set_content(body, "application/json");
+  EXPECT_FALSE(apply_response_compression(req, off, disabled));
+  EXPECT_EQ(off.body, body);
+}
+
+TEST(ResponseCompressionTest, ExcludedPathsOptOut) {
+  CompressionConfig config;
+  config.excluded_paths = {"/bulk-data/"};
+  std::string body = make_json_body();
+
+  httplib::Request req;
+  req.path = "/api/v1/apps/camera/bulk-data/rosbags/abc";
+  req.set_header("Accept-Encoding", "gzip");
+  httplib::Response res;
+  res.set_content(body, "application/json");
+
+  EXPECT_FALSE(apply_response_compression(req, res, config));
+  EXPECT_EQ(res.body, body);
+  EXPECT_FALSE(res.has_header("Vary"));
+}
+
+TEST(ResponseCompressionTest, ConfigValidation) {
+  CompressionConfig config;
+  EXPECT_TRUE(config.validate().empty());
+
+  config.gzip_level = 10;
+  EXPECT_FALSE(config.validate().empty());
+
+  config.gzip_level = 6;
+  config.zstd_level = 0;
+  EXPECT_FALSE(config.validate().empty());
+}
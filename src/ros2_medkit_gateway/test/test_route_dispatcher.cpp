@@ -0,0 +1,157 @@
+// Copyright 2026 bburda
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+#include <gtest/gtest.h>
+
+#include <httplib.h>
+
+#include <stdexcept>
+#include <string>
+#include <vector>
+
+#include "ros2_medkit_gateway/http/route_dispatcher.hpp"
+
+using namespace ros2_medkit_gateway;
+
+namespace {
+
+/// Handler that records its name in the response body
+RouteDispatcher::Handler named(const std::string & name) {
+  return [name](const httplib::Request & /*req*/, httplib::Response & res) {
+    res.body = name;
+  };
+}
+
+class RouteDispatcherTest : public ::testing::Test {
+ protected:
+  void SetUp() override {
+    routes_.add("GET", "/api/v1/", named("root"));
+    routes_.add("GET", "/api/v1/apps", named("list_apps"));
+    routes_.add("GET", "/api/v1/apps/{app_id}", named("get_app"));
+    routes_.add("GET", "/api/v1/apps/{app_id}/data", named("list_data"));
+    routes_.add("GET", "/api/v1/apps/{app_id}/data-categories", named("data_categories"));
+    routes_.add("GET", "/api/v1/apps/{app_id}/data/{data_id+}", named("get_data"));
+    routes_.add("PUT", "/api/v1/apps/{app_id}/data/{data_id+}", named("put_data"));
+    routes_.add("GET", "/api/v1/apps/{app_id}/operations/{operation_id}/executions/{execution_id}",
+                named("get_execution"));
+    routes_.add("GET", "/api/v1/faults", named("list_all_faults"));
+    routes_.add("GET", "/api/v1/faults/stream", named("fault_stream"));
+  }
+
+  std::string route_name(const std::string & method, const std::string & path) {
+    httplib::Request req;
+    req.method = method;
+    req.path = path;
+    httplib::Response res;
+    if (!routes_.dispatch(req, res)) {
+      return "";
+    }
+    return res.body;
+  }
+
+  RouteDispatcher routes_;
+};
+
+}  // namespace
+
+TEST_F(RouteDispatcherTest, MatchesLiteralAndCaptureSegments) {
+  EXPECT_EQ(route_name("GET", "/api/v1/"), "root");
+  EXPECT_EQ(route_name("GET", "/api/v1/apps"), "list_apps");
+  EXPECT_EQ(route_name("GET", "/api/v1/apps/engine"), "get_app");
+  EXPECT_EQ(route_name("GET", "/api/v1/apps/engine/data"), "list_data");
+  EXPECT_EQ(route_name("GET", "/api/v1/apps/engine/data-categories"), "data_categories");
+  EXPECT_EQ(route_name("GET", "/api/v1/apps/engine/operations/calibrate/executions/42"), "get_execution");
+}
+
+TEST_F(RouteDispatcherTest, LiteralsTakePrecedenceOverCaptures) {
+  routes_.add("GET", "/api/v1/faults/{fault_code}", named("get_fault"));
+  EXPECT_EQ(route_name("GET", "/api/v1/faults/stream"), "fault_stream");
+  EXPECT_EQ(route_name("GET", "/api/v1/faults/OVERHEAT"), "get_fault");
+}
+
+TEST_F(RouteDispatcherTest, TailCaptureSpansSlashes) {
+  RouteDispatcher routes;
+  std::vector<std::string> captures;
+  routes.add("GET", "/api/v1/apps/{app_id}/data/{data_id+}",
+             [&captures](const httplib::Request & req, httplib::Response & /*res*/) {
+               for (size_t i = 0; i < path_capture_count(req); ++i) {
+                 captures.push_back(path_capture(req, i));
+               }
+             });
+
+  httplib::Request req;
+  req.method = "GET";
+  req.path = "/api/v1/apps/engine/data/powertrain/engine/temperature";
+  httplib::Response res;
+
+  ASSERT_TRUE(routes.dispatch(req, res));
+  ASSERT_EQ(captures.size(), 3u);
+  EXPECT_EQ(captures[0], req.path);
+  EXPECT_EQ(captures[1], "engine");
+  EXPECT_EQ(captures[2], "powertrain/engine/temperature");
+  // Captures are only published while the handler runs
+  EXPECT_EQ(path_capture_count(req), 0u);
+}
+
+TEST_F(RouteDispatcherTest, CapturesFromAbandonedBranchesAreDropped) {
+  RouteDispatcher routes;
+  std::vector<std::string> captures;
+  auto record = [&captures](const httplib::Request & req, httplib::Response & /*res*/) {
+    for (size_t i = 1; i < path_capture_count(req); ++i) {
+      captures.push_back(path_capture(req, i));
+    }
+  };
+  // "/x/{a}/y" is tried first for "/x/1/z" and dead-ends, then "/{b}/{c}/z" matches
+  routes.add("GET", "/x/{a}/y", record);
+  routes.add("GET", "/{b}/{c}/z", record);
+
+  httplib::Request req;
+  req.method = "GET";
+  req.path = "/x/1/z";
+  httplib::Response res;
+
+  ASSERT_TRUE(routes.dispatch(req, res));
+  EXPECT_EQ(captures, (std::vector<std::string>{"x", "1"}));
+}
+
+TEST_F(RouteDispatcherTest, RoutesAreMethodSpecific) {
+  EXPECT_EQ(route_name("PUT", "/api/v1/apps/engine/data/temperature"), "put_data");
+  EXPECT_EQ(route_name("POST", "/api/v1/apps/engine/data/temperature"), "");
+  EXPECT_EQ(route_name("DELETE", "/api/v1/apps"), "");
+  EXPECT_EQ(route_name("HEAD", "/api/v1/apps"), "list_apps");
+}
+
+TEST_F(RouteDispatcherTest, RejectsUnknownAndMalformedPaths) {
+  EXPECT_EQ(route_name("GET", "/api/v1/unknown"), "");
+  EXPECT_EQ(route_name("GET", "/api/v1/apps/engine/"), "");
+  EXPECT_EQ(route_name("GET", "/api/v1/apps//data"), "");
+  EXPECT_EQ(route_name("GET", "/api/v1/apps/engine/data/"), "");
+  EXPECT_EQ(route_name("GET", "/api/v1/apps/engine/operations/calibrate/executions"), "");
+  EXPECT_EQ(route_name("GET", ""), "");
+}
+
+TEST_F(RouteDispatcherTest, RejectsInvalidTemplates) {
+  EXPECT_THROW(routes_.add("GET", "api/v1/apps", named("x")), std::invalid_argument);
+  EXPECT_THROW(routes_.add("GET", "/api/v1/{}", named("x")), std::invalid_argument);
+  EXPECT_THROW(routes_.add("GET", "/api/v1/{rest+}/data", named("x")), std::invalid_argument);
+  EXPECT_THROW(routes_.add("GET", "/api/v1/apps", named("x")), std::invalid_argument);
+}
+
+TEST_F(RouteDispatcherTest, ListsEndpointsInRegistrationOrder) {
+  auto endpoints = routes_.endpoints();
+  ASSERT_EQ(endpoints.size(), routes_.size());
+  EXPECT_EQ(endpoints.front(), "GET /api/v1/");
+  EXPECT_EQ(endpoints[5], "GET /api/v1/apps/{app_id}/data/{data_id}");
+  EXPECT_EQ(endpoints[6], "PUT /api/v1/apps/{app_id}/data/{data_id}");
+}
@@ -14,6 +14,11 @@
 
 #include <gtest/gtest.h>
 
+#include <algorithm>
+#include <memory>
+#include <string>
+#include <vector>
+
 #include "ros2_medkit_gateway/discovery/manifest/runtime_linker.hpp"
 
 using namespace ros2_medkit_gateway::discovery;
@@ -500,6 +505,59 @@ TEST_F(RuntimeLinkerTest, GetLastResult_ReturnsLatest) {
   EXPECT_EQ(last.app_to_node.size(), 1);
 }
 
+// =============================================================================
+// Indexed Matching Tests
+// =============================================================================
+
+TEST_F(RuntimeLinkerTest, SubpathNodeName_MatchesFqnSegments) {
+  std::vector<App> apps = {create_app("costmap", "local_costmap/local_costmap", "/nav")};
+  std::vector<Component> components = {create_component("global_costmap", "/nav/global_costmap"),
+                                       create_component("local_costmap", "/nav/local_costmap")};
+
+  auto result = linker_->link(apps, components, config_);
+
+  EXPECT_EQ(result.linked_apps[0].bound_fqn, "/nav/local_costmap/local_costmap");
+}
+
+TEST_F(RuntimeLinkerTest, FirstMatchingNodeWinsAcrossNameAndTopicMatches) {
+  App app = create_app("app1", "driver", "*");
+  app.ros_binding->topic_namespace = "/sensors";
+
+  Component by_topic = create_component("bridge", "/");
+  by_topic.topics.subscribes = {"/sensors/imu"};
+  std::vector<Component> components = {by_topic, create_component("driver", "/robot")};
+
+  auto result = linker_->link({app}, components, config_);
+  EXPECT_EQ(result.linked_apps[0].bound_fqn, "/bridge");
+
+  // Same nodes in the other order: the name match comes first
+  std::reverse(components.begin(), components.end());
+  result = linker_->link({app}, components, config_);
+  EXPECT_EQ(result.linked_apps[0].bound_fqn, "/robot/driver");
+}
+
+TEST_F(RuntimeLinkerTest, GraphChanged_DetectsNodeAndDataChanges) {
+  std::vector<Component> components = {create_component("node1", "/"), create_component("node2", "/ns")};
+  EXPECT_TRUE(linker_->graph_changed(components));
+
+  linker_->link({create_app("app1", "node1")}, components, config_);
+  EXPECT_FALSE(linker_->graph_changed(components));
+
+  auto with_topic = components;
+  with_topic[1].topics.publishes = {"/ns/status"};
+  EXPECT_TRUE(linker_->graph_changed(with_topic));
+
+  auto without_node = components;
+  without_node.pop_back();
+  EXPECT_TRUE(linker_->graph_changed(without_node));
+
+  // Relinking a changed graph uses the new nodes
+  auto result = linker_->link({create_app("app1", "node1"), create_app("app2", "node3")},
+                              {create_component("node3", "/")}, config_);
+  EXPECT_EQ(result.unlinked_app_ids, (std::vector<std::string>{"app1"}));
+  EXPECT_EQ(result.linked_apps[1].bound_fqn, "/node3");
+}
+
 int main(int argc, char ** argv) {
   testing::InitGoogleTest(&argc, argv);
   return RUN_ALL_TESTS();
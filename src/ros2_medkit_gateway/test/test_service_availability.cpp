@@ -0,0 +1,127 @@
+// Copyright 2026 bburda
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+#include <gtest/gtest.h>
+
+#include <chrono>
+#include <functional>
+#include <memory>
+#include <rcl_interfaces/srv/list_parameters.hpp>
+#include <rclcpp/rclcpp.hpp>
+#include <thread>
+
+#include "ros2_medkit_gateway/service_availability.hpp"
+
+using namespace ros2_medkit_gateway;
+using namespace std::chrono_literals;
+
+class TestServiceAvailability : public ::testing::Test {
+ protected:
+  static void SetUpTestSuite() {
+    rclcpp::init(0, nullptr);
+  }
+
+  static void TearDownTestSuite() {
+    rclcpp::shutdown();
+  }
+
+  void SetUp() override {
+    node_ = std::make_shared<rclcpp::Node>("test_service_availability_node");
+    availability_ = std::make_unique<ServiceAvailability>(node_.get());
+  }
+
+  void TearDown() override {
+    availability_.reset();
+    node_.reset();
+  }
+
+  /// Poll until @p condition holds or @p timeout passes
+  static bool eventually(const std::function<bool()> & condition, std::chrono::milliseconds timeout = 10s) {
+    auto deadline = std::chrono::steady_clock::now() + timeout;
+    while (std::chrono::steady_clock::now() < deadline) {
+      if (condition()) {
+        return true;
+      }
+      std::this_thread::sleep_for(20ms);
+    }
+    return condition();
+  }
+
+  std::shared_ptr<rclcpp::Node> node_;
+  std::unique_ptr<ServiceAvailability> availability_;
+};
+
+TEST_F(TestServiceAvailability, test_missing_service_fails_without_waiting) {
+  auto client = node_->create_client<rcl_interfaces::srv::ListParameters>("/nonexistent_node_xyz/list_parameters");
+
+  // Only the first lookup of a client waits, and for less than the default first-use bound
+  auto start = std::chrono::steady_clock::now();
+  EXPECT_FALSE(availability_->is_available(client));
+  EXPECT_LT(std::chrono::steady_clock::now() - start, 2s);
+
+  start = std::chrono::steady_clock::now();
+  EXPECT_FALSE(availability_->is_available(client));
+  EXPECT_FALSE(wait_for_server(availability_.get(), client, 5s));
+  EXPECT_LT(std::chrono::steady_clock::now() - start, 200ms);
+  EXPECT_EQ(availability_->tracked_count(), 1u);
+}
+
+TEST_F(TestServiceAvailability, test_first_lookup_wait_is_bounded_by_timeout) {
+  auto client = node_->create_client<rcl_interfaces::srv::ListParameters>("/nonexistent_node_xyz/list_parameters");
+
+  auto start = std::chrono::steady_clock::now();
+  EXPECT_FALSE(wait_for_server(availability_.get(), client, 10ms));
+  EXPECT_LT(std::chrono::steady_clock::now() - start, 400ms);
+}
+
+TEST_F(TestServiceAvailability, test_new_client_finds_running_server) {
+  auto target = std::make_shared<rclcpp::Node>("availability_running_target");
+  auto first =
+      node_->create_client<rcl_interfaces::srv::ListParameters>("/availability_running_target/list_parameters");
+  ASSERT_TRUE(first->wait_for_service(10s));
+
+  // A client created after the server is already up is not reported down on its first lookup
+  auto client =
+      node_->create_client<rcl_interfaces::srv::ListParameters>("/availability_running_target/list_parameters");
+  ServiceAvailability availability(node_.get(), 10s);
+  EXPECT_TRUE(availability.is_available(client));
+
+  // Neither is a client that replaces a destroyed one
+  client.reset();
+  first.reset();
+  auto recreated =
+      node_->create_client<rcl_interfaces::srv::ListParameters>("/availability_running_target/list_parameters");
+  EXPECT_TRUE(availability.is_available(recreated));
+}
+
+TEST_F(TestServiceAvailability, test_follows_server_lifetime) {
+  auto client = node_->create_client<rcl_interfaces::srv::ListParameters>("/availability_target/list_parameters");
+  EXPECT_FALSE(availability_->is_available(client));
+
+  auto target = std::make_shared<rclcpp::Node>("availability_target");
+  EXPECT_TRUE(eventually([&] {
+    return availability_->is_available(client);
+  }));
+
+  // Server going away is picked up from graph events, without a request in between
+  target.reset();
+  EXPECT_TRUE(eventually([&] {
+    return !availability_->is_available(client);
+  }));
+}
+
+TEST_F(TestServiceAvailability, test_without_tracker_waits_for_service) {
+  auto client = node_->create_client<rcl_interfaces::srv::ListParameters>("/nonexistent_node_xyz/list_parameters");
+  EXPECT_FALSE(wait_for_server(nullptr, client, 100ms));
+}
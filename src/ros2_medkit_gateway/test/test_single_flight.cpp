@@ -0,0 +1,127 @@
+// Copyright 2026 bburda
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+#include <gtest/gtest.h>
+
+#include <atomic>
+#include <chrono>
+#include <future>
+#include <stdexcept>
+#include <string>
+#include <thread>
+#include <vector>
+
+#include "ros2_medkit_gateway/single_flight.hpp"
+
+using namespace ros2_medkit_gateway;
+using namespace std::chrono_literals;
+
+namespace {
+
+/// Wait until @p flights has an operation in flight (leader entered the operation)
+template <typename Result>
+void wait_for_leader(const SingleFlight<Result> & flights) {
+  while (flights.in_flight() == 0) {
+    std::this_thread::sleep_for(1ms);
+  }
+}
+
+}  // namespace
+
+TEST(SingleFlightTest, ConcurrentIdenticalCallsShareOneExecution) {
+  SingleFlight<int> flights;
+  std::atomic<int> executions{0};
+  std::promise<void> release;
+  std::shared_future<void> released = release.get_future().share();
+
+  auto operation = [&] {
+    ++executions;
+    released.wait();
+    return 42;
+  };
+
+  auto leader = std::async(std::launch::async, [&] {
+    return flights.run("topic", operation);
+  });
+  wait_for_leader(flights);
+
+  std::vector<std::future<int>> followers;
+  for (int i = 0; i < 4; ++i) {
+    followers.push_back(std::async(std::launch::async, [&] {
+      return flights.run("topic", operation);
+    }));
+  }
+  while (flights.shared_calls() < 4) {
+    std::this_thread::sleep_for(1ms);
+  }
+  release.set_value();
+
+  EXPECT_EQ(leader.get(), 42);
+  for (auto & follower : followers) {
+    EXPECT_EQ(follower.get(), 42);
+  }
+  EXPECT_EQ(executions.load(), 1);
+  EXPECT_EQ(flights.in_flight(), 0u);
+}
+
+TEST(SingleFlightTest, DistinctKeysRunIndependently) {
+  SingleFlight<std::string> flights;
+  auto echo = [](const std::string & value) {
+    return [value] {
+      return value;
+    };
+  };
+
+  EXPECT_EQ(flights.run("a", echo("A")), "A");
+  EXPECT_EQ(flights.run("b", echo("B")), "B");
+  EXPECT_EQ(flights.shared_calls(), 0u);
+}
+
+TEST(SingleFlightTest, CompletedCallsAreNotCached) {
+  SingleFlight<int> flights;
+  int executions = 0;
+  auto operation = [&] {
+    return ++executions;
+  };
+
+  EXPECT_EQ(flights.run("node", operation), 1);
+  EXPECT_EQ(flights.run("node", operation), 2);
+}
+
+TEST(SingleFlightTest, ExceptionsReachEverySharedCaller) {
+  SingleFlight<int> flights;
+  std::promise<void> release;
+  std::shared_future<void> released = release.get_future().share();
+
+  auto operation = [&]() -> int {
+    released.wait();
+    throw std::runtime_error("topic not available");
+  };
+
+  auto leader = std::async(std::launch::async, [&] {
+    return flights.run("topic", operation);
+  });
+  wait_for_leader(flights);
+  auto follower = std::async(std::launch::async, [&] {
+    return flights.run("topic", operation);
+  });
+  while (flights.shared_calls() < 1) {
+    std::this_thread::sleep_for(1ms);
+  }
+  release.set_value();
+
+  EXPECT_THROW(leader.get(), std::runtime_error);
+  EXPECT_THROW(follower.get(), std::runtime_error);
+  EXPECT_EQ(flights.in_flight(), 0u);
+}
@@ -0,0 +1,225 @@
+// Copyright 2026 bburda
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+#include <gtest/gtest.h>
+
+#include <atomic>
+#include <chrono>
+#include <functional>
+#include <future>
+#include <thread>
+#include <type_traits>
+
+#include "ros2_medkit_gateway/config.hpp"
+#include "ros2_medkit_gateway/http/worker_pool.hpp"
+
+using namespace ros2_medkit_gateway;
+using namespace std::chrono_literals;
+
+namespace {
+
+/// Enqueue and report whether the connection was accepted (always true when enqueue() returns void)
+template <typename Pool>
+bool enqueue_accepted(Pool & pool, std::function<void()> fn) {
+  if constexpr (std::is_same_v<decltype(pool.enqueue(std::move(fn))), bool>) {
+    return pool.enqueue(std::move(fn));
+  } else {
+    pool.enqueue(std::move(fn));
+    return true;
+  }
+}
+
+}  // namespace
+
+// ============================================================================
+// WorkerPool
+// ============================================================================
+
+TEST(WorkerPoolTest, RunsTasksOnWorkers) {
+  std::atomic<int> done{0};
+  std::atomic<int> overflowed{0};
+  {
+    WorkerPool pool(2, 16);
+    for (int i = 0; i < 10; ++i) {
+      pool.enqueue([&] {
+        if (WorkerPool::is_overflow_task()) {
+          ++overflowed;
+        }
+        ++done;
+      });
+    }
+    pool.shutdown();
+  }
+  EXPECT_EQ(done.load(), 10);
+  EXPECT_EQ(overflowed.load(), 0);
+  EXPECT_FALSE(WorkerPool::is_overflow_task());
+}
+
+TEST(WorkerPoolTest, HandsConnectionsBeyondQueueLimitToOverflowThreads) {
+  std::promise<void> release;
+  std::shared_future<void> released = release.get_future().share();
+  std::atomic<int> overflowed{0};
+  std::atomic<int> done{0};
+
+  WorkerPool pool(1, 1);
+  // Occupy the only worker, then fill the single queue slot
+  std::promise<void> started;
+  pool.enqueue([&] {
+    started.set_value();
+    released.wait();
+    ++done;
+  });
+  started.get_future().wait();
+  pool.enqueue([&] {
+    ++done;
+  });
+  EXPECT_EQ(pool.queued(), 1u);
+
+  // Served right away by an overflow thread while the worker is still blocked
+  std::promise<bool> overflow_result;
+  pool.enqueue([&] {
+    overflow_result.set_value(WorkerPool::is_overflow_task());
+    ++overflowed;
+  });
+  auto overflow_future = overflow_result.get_future();
+  ASSERT_EQ(overflow_future.wait_for(5s), std::future_status::ready);
+  EXPECT_TRUE(overflow_future.get());
+
+  release.set_value();
+  pool.shutdown();
+  EXPECT_EQ(done.load(), 2);
+  EXPECT_EQ(overflowed.load(), 1);
+}
+
+TEST(WorkerPoolTest, RejectsConnectionsBeyondOverflowQueueLimit) {
+  std::promise<void> release;
+  std::shared_future<void> released = release.get_future().share();
+  auto block = [released] {
+    released.wait();
+  };
+
+  // One worker, one queue slot, one overflow thread with one queue slot
+  WorkerPool pool(1, 1, 1, 1);
+  std::promise<void> worker_started;
+  pool.enqueue([&] {
+    worker_started.set_value();
+    released.wait();
+  });
+  worker_started.get_future().wait();
+  pool.enqueue(block);
+  std::promise<void> overflow_started;
+  pool.enqueue([&] {
+    overflow_started.set_value();
+    released.wait();
+  });
+  overflow_started.get_future().wait();
+  pool.enqueue(block);
+  EXPECT_EQ(pool.queued(), 1u);
+  EXPECT_EQ(pool.overflow_queued(), 1u);
+
+  // Every queue is full: the connection is not queued anywhere
+  bool ran = false;
+  bool ran_as_overflow = false;
+  std::thread::id ran_on;
+  auto reject = [&] {
+    ran = true;
+    ran_as_overflow = WorkerPool::is_overflow_task();
+    ran_on = std::this_thread::get_id();
+  };
+  bool accepted = enqueue_accepted(pool, reject);
+  if (std::is_same_v<WorkerPool::EnqueueResult, bool>) {
+    EXPECT_FALSE(accepted);
+    EXPECT_FALSE(ran);
+  } else {
+    // Older cpp-httplib cannot take the connection back; it is answered on the accepting thread
+    EXPECT_TRUE(ran);
+    EXPECT_TRUE(ran_as_overflow);
+    EXPECT_EQ(ran_on, std::this_thread::get_id());
+    EXPECT_FALSE(WorkerPool::is_overflow_task());
+  }
+  EXPECT_EQ(pool.overflow_queued(), 1u);
+
+  release.set_value();
+  pool.shutdown();
+}
+
+// ============================================================================
+// ConcurrencyLimiter
+// ============================================================================
+
+TEST(ConcurrencyLimiterTest, RejectsWhenActiveAndWaitingSlotsAreFull) {
+  ConcurrencyLimiter limiter(1, 0);
+
+  auto first = limiter.acquire();
+  ASSERT_TRUE(first);
+  EXPECT_EQ(limiter.active(), 1u);
+  EXPECT_FALSE(limiter.acquire());
+
+  first = ConcurrencyLimiter::Permit{};
+  EXPECT_EQ(limiter.active(), 0u);
+  EXPECT_TRUE(limiter.acquire());
+}
+
+TEST(ConcurrencyLimiterTest, WaiterGetsSlotWhenReleased) {
+  ConcurrencyLimiter limiter(1, 1);
+  auto first = limiter.acquire();
+  ASSERT_TRUE(first);
+
+  auto waiter = std::async(std::launch::async, [&] {
+    return static_cast<bool>(limiter.acquire());
+  });
+  while (limiter.waiting() == 0) {
+    std::this_thread::sleep_for(1ms);
+  }
+  // Waiter slot taken: a third caller is rejected immediately
+  EXPECT_FALSE(limiter.acquire());
+
+  first = ConcurrencyLimiter::Permit{};
+  ASSERT_EQ(waiter.wait_for(5s), std::future_status::ready);
+  EXPECT_TRUE(waiter.get());
+  EXPECT_EQ(limiter.active(), 0u);
+}
+
+// ============================================================================
+// ServerLimitsConfig
+// ============================================================================
+
+TEST(ServerLimitsConfigTest, DefaultsAreValid) {
+  EXPECT_TRUE(ServerLimitsConfig{}.validate().empty());
+}
+
+TEST(ServerLimitsConfigTest, SlowRoutesMustLeaveWorkersFree) {
+  ServerLimitsConfig config;
+  config.worker_threads = 8;
+  config.slow_route_concurrency = 4;
+  config.slow_route_queue = 4;
+  EXPECT_FALSE(config.validate().empty());
+
+  config.slow_route_queue = 3;
+  EXPECT_TRUE(config.validate().empty());
+}
+
+TEST(ServerLimitsConfigTest, RejectsZeroAndNegativeValues) {
+  ServerLimitsConfig config;
+  config.worker_threads = 0;
+  EXPECT_FALSE(config.validate().empty());
+
+  config = ServerLimitsConfig{};
+  config.keep_alive_timeout_sec = 0;
+  EXPECT_FALSE(config.validate().empty());
+
+  config = ServerLimitsConfig{};
+  config.retry_after_sec = -1;
+  EXPECT_FALSE(config.validate().empty());
+}
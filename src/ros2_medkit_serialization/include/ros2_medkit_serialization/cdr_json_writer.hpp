@@ -0,0 +1,64 @@
+// Copyright 2026 Selfpatch
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+#ifndef ROS2_MEDKIT_SERIALIZATION__CDR_JSON_WRITER_HPP_
+#define ROS2_MEDKIT_SERIALIZATION__CDR_JSON_WRITER_HPP_
+
+#include <cstddef>
+#include <cstdint>
+#include <string>
+
+#include "ros2_medkit_serialization/type_cache.hpp"
+
+namespace ros2_medkit_serialization {
+
+/// Streaming converter from CDR-encoded ROS 2 messages to JSON text.
+///
+/// Walks the serialized buffer with the cached introspection info and
+/// appends compact JSON directly to an output string, skipping the
+/// intermediate ROS message and JSON DOM. Members are emitted in
+/// declaration order; values are typed exactly as by
+/// JsonSerializer::deserialize() (see scalar_typing.hpp).
+///
+/// Handles classic (XCDR1) plain CDR in either byte order, which is what
+/// the Fast DDS and Cyclone DDS RMW implementations produce for ROS 2
+/// message types.
+///
+/// @note All methods are stateless and thread-safe.
+class CdrJsonWriter {
+ public:
+  /// Check whether every member reachable from a type can be streamed
+  ///
+  /// wchar, wstring and long double members have RMW-specific encodings
+  /// and are not supported.
+  ///
+  /// @param type_info Type introspection info
+  /// @return true if write() can convert messages of this type
+  static bool supports(const TypeInfo_Cpp * type_info);
+
+  /// Convert a CDR buffer (including its 4-byte encapsulation header) to JSON
+  ///
+  /// @param type_info Type introspection info
+  /// @param buffer Serialized message bytes
+  /// @param length Number of bytes in buffer
+  /// @param out String the JSON text is appended to
+  /// @return false if the buffer uses an encapsulation other than plain CDR
+  ///         (nothing is appended in that case)
+  /// @throws SerializationError if the buffer is truncated or malformed
+  static bool write(const TypeInfo_Cpp * type_info, const uint8_t * buffer, size_t length, std::string & out);
+};
+
+}  // namespace ros2_medkit_serialization
+
+#endif  // ROS2_MEDKIT_SERIALIZATION__CDR_JSON_WRITER_HPP_
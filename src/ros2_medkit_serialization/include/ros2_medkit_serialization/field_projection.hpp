@@ -0,0 +1,99 @@
+// Copyright 2026 Selfpatch
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+#ifndef ROS2_MEDKIT_SERIALIZATION__FIELD_PROJECTION_HPP_
+#define ROS2_MEDKIT_SERIALIZATION__FIELD_PROJECTION_HPP_
+
+#include <cstddef>
+#include <map>
+#include <string>
+#include <vector>
+
+namespace ros2_medkit_serialization {
+
+/// Tree of selected message fields.
+///
+/// Built from a comma-separated list of dotted paths, e.g.
+/// "header.stamp,pose.position". Each path selects the named field and its
+/// whole subtree. A default-constructed mask selects everything.
+///
+/// Paths apply through sequences transparently: "poses.position" selects
+/// the position of every element of the poses sequence.
+class FieldMask {
+ public:
+  FieldMask() = default;
+
+  /// Parse a comma-separated list of dotted field paths
+  ///
+  /// Whitespace around paths is ignored. An empty list selects everything.
+  ///
+  /// @param field_list Field list (e.g., "header.stamp,pose.position")
+  /// @return Parsed mask
+  /// @throws FieldProjectionError if a path has an empty segment (e.g., "a..b")
+  static FieldMask parse(const std::string & field_list);
+
+  /// Whether the whole subtree at this level is selected
+  bool selects_all() const {
+    return select_all_;
+  }
+
+  /// Get the mask for a child field
+  ///
+  /// @param name Field name
+  /// @return Child mask, or nullptr if the field is not selected
+  const FieldMask * child(const std::string & name) const;
+
+  /// Names of explicitly selected children (empty when selects_all())
+  std::vector<std::string> child_names() const;
+
+ private:
+  /// Add a dotted path split into segments
+  void add_path(const std::vector<std::string> & segments, size_t index);
+
+  bool select_all_{true};
+  std::map<std::string, FieldMask> children_;
+};
+
+/// Array decimation applied to every array/sequence field in a message.
+struct ArrayDecimation {
+  size_t max_length{0};  ///< Maximum number of elements emitted per array (0 = unlimited)
+  size_t stride{1};      ///< Emit every N-th element (1 = every element)
+
+  /// Whether any decimation is applied
+  bool is_identity() const {
+    return max_length == 0 && stride <= 1;
+  }
+
+  /// Number of elements emitted for an array of the given size
+  size_t output_count(size_t size) const;
+};
+
+/// Projection applied while converting a message to JSON.
+///
+/// Unselected subtrees and skipped array elements are never materialized,
+/// which keeps large sensor messages (PointCloud2, Image, OccupancyGrid)
+/// cheap to inspect when a client only needs a few fields.
+struct ProjectionOptions {
+  FieldMask fields;
+  ArrayDecimation arrays;
+
+  /// Whether the projection leaves the message unchanged
+  bool is_identity() const {
+    return fields.selects_all() && arrays.is_identity();
+  }
+};
+
+}  // namespace ros2_medkit_serialization
+
+#endif  // ROS2_MEDKIT_SERIALIZATION__FIELD_PROJECTION_HPP_
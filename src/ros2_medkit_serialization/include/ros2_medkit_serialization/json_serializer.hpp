@@ -23,6 +23,7 @@
 #include <rclcpp/serialized_message.hpp>
 #include <yaml-cpp/yaml.h>
 
+#include "ros2_medkit_serialization/field_projection.hpp"
 #include "ros2_medkit_serialization/serialization_error.hpp"
 #include "ros2_medkit_serialization/type_cache.hpp"
 
@@ -63,6 +64,31 @@ class JsonSerializer {
   /// @throws JsonConversionError if conversion fails
   nlohmann::json to_json(const std::string & type_string, const void * message_data) const;
 
+  /// Convert a ROS 2 message to JSON, materializing only the projected fields
+  ///
+  /// Walks the message directly via introspection data. Fields outside the
+  /// mask and array elements dropped by decimation are never converted.
+  /// Values are typed exactly as by to_json() without projection.
+  ///
+  /// @param type_info Type introspection info
+  /// @param message_data Pointer to the message data
+  /// @param projection Field mask and array decimation to apply
+  /// @return JSON representation of the selected part of the message
+  /// @throws JsonConversionError if conversion fails
+  /// @throws FieldProjectionError if the mask selects a field the type does not have
+  nlohmann::json to_json(const TypeInfo_Cpp * type_info, const void * message_data,
+                         const ProjectionOptions & projection) const;
+
+  /// Check a field mask against a message type without converting any message
+  ///
+  /// Lets callers reject unknown fields before waiting for data.
+  ///
+  /// @param type_string Full type string (e.g., "sensor_msgs/msg/LaserScan")
+  /// @param fields Field mask to check
+  /// @throws TypeNotFoundError if type cannot be loaded
+  /// @throws FieldProjectionError if the mask selects a field the type does not have
+  void validate_projection(const std::string & type_string, const FieldMask & fields) const;
+
   /// Convert JSON to a ROS 2 message
   ///
   /// @param type_info Type introspection info
@@ -136,6 +162,32 @@ class JsonSerializer {
   /// @throws SerializationError if deserialization fails
   nlohmann::json deserialize(const std::string & type_string, const rclcpp::SerializedMessage & serialized_msg) const;
 
+  /// Deserialize CDR data to JSON, materializing only the projected fields
+  ///
+  /// @param type_string Full type string
+  /// @param serialized_msg SerializedMessage containing CDR data
+  /// @param projection Field mask and array decimation to apply
+  /// @return JSON representation of the selected part of the message
+  /// @throws TypeNotFoundError if type cannot be loaded
+  /// @throws FieldProjectionError if the mask selects a field the type does not have
+  /// @throws SerializationError if deserialization fails
+  nlohmann::json deserialize(const std::string & type_string, const rclcpp::SerializedMessage & serialized_msg,
+                             const ProjectionOptions & projection) const;
+
+  /// Deserialize CDR data straight to compact JSON text
+  ///
+  /// Streams the CDR buffer into JSON with CdrJsonWriter, without building
+  /// an intermediate ROS message or JSON DOM. Types or encodings the writer
+  /// does not handle fall back to deserialize() followed by dump().
+  ///
+  /// @param type_string Full type string
+  /// @param serialized_msg SerializedMessage containing CDR data
+  /// @return JSON text of the message
+  /// @throws TypeNotFoundError if type cannot be loaded
+  /// @throws SerializationError if deserialization fails
+  std::string deserialize_to_string(const std::string & type_string,
+                                    const rclcpp::SerializedMessage & serialized_msg) const;
+
   // YAML ↔ JSON conversion utilities
 
   /// Convert YAML node to JSON
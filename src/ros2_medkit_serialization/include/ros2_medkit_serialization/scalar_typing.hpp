@@ -0,0 +1,51 @@
+// Copyright 2026 Selfpatch
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+#ifndef ROS2_MEDKIT_SERIALIZATION__SCALAR_TYPING_HPP_
+#define ROS2_MEDKIT_SERIALIZATION__SCALAR_TYPING_HPP_
+
+#include <cstdint>
+#include <string>
+
+#include <nlohmann/json.hpp>
+#include <yaml-cpp/yaml.h>
+
+namespace ros2_medkit_serialization {
+
+/// JSON typing of leaf values shared by every conversion path.
+///
+/// JsonSerializer::to_json() without projection goes through dynmsg's YAML
+/// encoding, so a value's JSON type depends on its yaml-cpp text: whole
+/// doubles become integers, NaN/infinity become ".nan"/".inf" strings and
+/// numeric-looking strings become numbers. The direct conversions (projected
+/// to_json() and CdrJsonWriter) use these functions to produce the same
+/// values without building YAML nodes on the hot path.
+
+/// Type a YAML scalar: booleans, then integers, then floating point numbers, else string
+nlohmann::json yaml_scalar_to_json(const YAML::Node & scalar);
+
+/// Type a floating point value as its yaml-cpp text (max_digits10 precision) would be
+nlohmann::json floating_to_json(float value);
+nlohmann::json floating_to_json(double value);
+nlohmann::json floating_to_json(long double value);
+
+/// Type a string value; only bool- or number-like strings take the YAML path
+nlohmann::json string_to_json(const std::string & value);
+
+/// Values beyond the int64 range become doubles
+nlohmann::json uint64_to_json(uint64_t value);
+
+}  // namespace ros2_medkit_serialization
+
+#endif  // ROS2_MEDKIT_SERIALIZATION__SCALAR_TYPING_HPP_
@@ -56,6 +56,21 @@ class YamlConversionError : public SerializationError {
   }
 };
 
+/// Error when a field projection is malformed or selects a field the type does not have
+class FieldProjectionError : public SerializationError {
+ public:
+  FieldProjectionError(const std::string & field_path, const std::string & reason)
+    : SerializationError("Invalid field projection '" + field_path + "': " + reason), field_path_(field_path) {
+  }
+
+  const std::string & field_path() const noexcept {
+    return field_path_;
+  }
+
+ private:
+  std::string field_path_;
+};
+
 /// Error when a required field is missing
 class MissingFieldError : public SerializationError {
  public:
@@ -0,0 +1,500 @@
+// Copyright 2026 Selfpatch
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+#include "ros2_medkit_serialization/cdr_json_writer.hpp"
+
+#include <array>
+#include <charconv>
+#include <cmath>
+#include <cstring>
+#include <type_traits>
+#include <utility>
+
+#include "ros2_medkit_serialization/scalar_typing.hpp"
+#include "ros2_medkit_serialization/serialization_error.hpp"
+#include "rosidl_typesupport_introspection_cpp/field_types.hpp"
+
+namespace ros2_medkit_serialization {
+
+namespace {
+
+namespace introspection = rosidl_typesupport_introspection_cpp;
+
+// Encapsulation identifiers (first two bytes of the payload, big-endian)
+constexpr uint16_t kCdrBigEndian = 0x0000;
+constexpr uint16_t kCdrLittleEndian = 0x0001;
+constexpr size_t kEncapsulationSize = 4;
+
+bool host_is_little_endian() {
+  const uint16_t probe = 1;
+  uint8_t first_byte = 0;
+  std::memcpy(&first_byte, &probe, 1);
+  return first_byte == 1;
+}
+
+const TypeInfo_Cpp * nested_type_info(const MemberInfo_Cpp & member) {
+  return static_cast<const TypeInfo_Cpp *>(member.members_->data);
+}
+
+bool is_sequence(const MemberInfo_Cpp & member) {
+  return member.is_array_ && (member.is_upper_bound_ || member.array_size_ == 0);
+}
+
+template <typename T>
+T byteswap(T value) {
+  uint8_t bytes[sizeof(T)];
+  std::memcpy(bytes, &value, sizeof(T));
+  for (size_t i = 0; i < sizeof(T) / 2; ++i) {
+    std::swap(bytes[i], bytes[sizeof(T) - 1 - i]);
+  }
+  std::memcpy(&value, bytes, sizeof(T));
+  return value;
+}
+
+/// Bounds-checked cursor over the CDR payload (alignment is relative to the payload start)
+class CdrReader {
+ public:
+  CdrReader(const uint8_t * data, size_t size, bool swap) : data_(data), size_(size), swap_(swap) {
+  }
+
+  void align(size_t alignment) {
+    pos_ = (pos_ + alignment - 1) & ~(alignment - 1);
+  }
+
+  const uint8_t * take(size_t count) {
+    if (pos_ > size_ || count > size_ - pos_) {
+      throw SerializationError("CDR buffer truncated at offset " + std::to_string(pos_));
+    }
+    const uint8_t * ptr = data_ + pos_;
+    pos_ += count;
+    return ptr;
+  }
+
+  template <typename T>
+  T read() {
+    align(sizeof(T));
+    return load<T>(take(sizeof(T)));
+  }
+
+  template <typename T>
+  T load(const uint8_t * ptr) const {
+    T value;
+    std::memcpy(&value, ptr, sizeof(T));
+    return swap_ ? byteswap(value) : value;
+  }
+
+  /// Read a sequence length and reject counts that cannot fit in the remaining bytes
+  uint32_t read_count(size_t min_element_size) {
+    uint32_t count = read<uint32_t>();
+    if (min_element_size > 0 && count > (size_ - pos_) / min_element_size) {
+      throw SerializationError("CDR sequence length " + std::to_string(count) + " exceeds buffer size");
+    }
+    return count;
+  }
+
+ private:
+  const uint8_t * data_;
+  size_t size_;
+  size_t pos_{0};
+  bool swap_;
+};
+
+/// "0".."255" preformatted for byte arrays (Image, PointCloud2, CompressedImage payloads)
+struct ByteTable {
+  ByteTable() {
+    for (int i = 0; i < 256; ++i) {
+      auto res = std::to_chars(text[i].data(), text[i].data() + text[i].size(), i);
+      length[i] = static_cast<uint8_t>(res.ptr - text[i].data());
+    }
+  }
+  std::array<std::array<char, 3>, 256> text{};
+  std::array<uint8_t, 256> length{};
+};
+
+const ByteTable & byte_table() {
+  static const ByteTable table;
+  return table;
+}
+
+template <typename T>
+void append_integer(std::string & out, T value) {
+  char buf[24];
+  auto res = std::to_chars(buf, buf + sizeof(buf), value);
+  out.append(buf, res.ptr);
+}
+
+/// Shortest round-trip representation, formatted like nlohmann::json::dump()
+void append_floating(std::string & out, double value) {
+  if (!std::isfinite(value)) {
+    out.append("null");
+    return;
+  }
+  char buf[32];
+  auto res = std::to_chars(buf, buf + sizeof(buf), value);
+  bool has_marker = false;
+  for (const char * p = buf; p != res.ptr && !has_marker; ++p) {
+    has_marker = *p == '.' || *p == 'e';
+  }
+  out.append(buf, res.ptr);
+  if (!has_marker) {
+    out.append(".0");
+  }
+}
+
+/// Length of the UTF-8 sequence starting at s[i], or 0 if invalid
+size_t utf8_sequence_length(const uint8_t * s, size_t i, size_t size) {
+  uint8_t c = s[i];
+  size_t len = 0;
+  if (c >= 0xC2 && c <= 0xDF) {
+    len = 2;
+  } else if (c >= 0xE0 && c <= 0xEF) {
+    len = 3;
+  } else if (c >= 0xF0 && c <= 0xF4) {
+    len = 4;
+  } else {
+    return 0;
+  }
+  if (i + len > size) {
+    return 0;
+  }
+  for (size_t k = 1; k < len; ++k) {
+    if ((s[i + k] & 0xC0) != 0x80) {
+      return 0;
+    }
+  }
+  // Reject overlong encodings, surrogates and code points above U+10FFFF
+  if ((c == 0xE0 && s[i + 1] < 0xA0) || (c == 0xED && s[i + 1] > 0x9F) || (c == 0xF0 && s[i + 1] < 0x90) ||
+      (c == 0xF4 && s[i + 1] > 0x8F)) {
+    return 0;
+  }
+  return len;
+}
+
+/// Append a JSON string literal; invalid UTF-8 bytes become U+FFFD
+void append_string(std::string & out, const uint8_t * s, size_t size) {
+  static const char * hex = "0123456789abcdef";
+  out.push_back('"');
+  size_t run_start = 0;
+  size_t i = 0;
+  auto flush = [&]() {
+    out.append(reinterpret_cast<const char *>(s) + run_start, i - run_start);
+  };
+  while (i < size) {
+    uint8_t c = s[i];
+    if (c >= 0x20 && c < 0x80 && c != '"' && c != '\\') {
+      ++i;
+      continue;
+    }
+    if (c >= 0x80) {
+      size_t len = utf8_sequence_length(s, i, size);
+      if (len > 0) {
+        i += len;
+        continue;
+      }
+      flush();
+      out.append("\xEF\xBF\xBD");
+      run_start = ++i;
+      continue;
+    }
+    flush();
+    switch (c) {
+      case '"':
+        out.append("\\\"");
+        break;
+      case '\\':
+        out.append("\\\\");
+        break;
+      case '\b':
+        out.append("\\b");
+        break;
+      case '\f':
+        out.append("\\f");
+        break;
+      case '\n':
+        out.append("\\n");
+        break;
+      case '\r':
+        out.append("\\r");
+        break;
+      case '\t':
+        out.append("\\t");
+        break;
+      default:
+        out.append("\\u00");
+        out.push_back(hex[c >> 4]);
+        out.push_back(hex[c & 0x0F]);
+        break;
+    }
+    run_start = ++i;
+  }
+  flush();
+  out.push_back('"');
+}
+
+/// Append a scalar typed by scalar_typing.hpp
+void append_typed(std::string & out, const nlohmann::json & value) {
+  if (value.is_number_integer()) {
+    append_integer(out, value.get<int64_t>());
+  } else if (value.is_number_float()) {
+    append_floating(out, value.get<double>());
+  } else if (value.is_boolean()) {
+    out.append(value.get<bool>() ? "true" : "false");
+  } else {
+    const auto & str = value.get_ref<const std::string &>();
+    append_string(out, reinterpret_cast<const uint8_t *>(str.data()), str.size());
+  }
+}
+
+void write_string(CdrReader & reader, std::string & out) {
+  // Length includes the terminating NUL
+  uint32_t length = reader.read<uint32_t>();
+  const uint8_t * chars = reader.take(length);
+  size_t size = length > 0 ? length - 1 : 0;
+  // Numeric- and bool-looking strings are typed like the full conversion does
+  nlohmann::json typed = string_to_json(std::string(reinterpret_cast<const char *>(chars), size));
+  if (typed.is_string()) {
+    append_string(out, chars, size);
+  } else {
+    append_typed(out, typed);
+  }
+}
+
+template <typename T>
+void append_value(std::string & out, T value) {
+  if constexpr (std::is_floating_point_v<T>) {
+    append_typed(out, floating_to_json(value));
+  } else if constexpr (std::is_same_v<T, uint64_t>) {
+    append_typed(out, uint64_to_json(value));
+  } else {
+    append_integer(out, value);
+  }
+}
+
+/// Emit `count` contiguous primitives with one bounds check
+template <typename T>
+void write_primitive_block(CdrReader & reader, size_t count, std::string & out) {
+  out.push_back('[');
+  if (count > 0) {
+    reader.align(sizeof(T));
+    const uint8_t * block = reader.take(count * sizeof(T));
+    for (size_t i = 0; i < count; ++i) {
+      if (i > 0) {
+        out.push_back(',');
+      }
+      append_value(out, reader.load<T>(block + i * sizeof(T)));
+    }
+  }
+  out.push_back(']');
+}
+
+void write_byte_block(CdrReader & reader, size_t count, std::string & out) {
+  const ByteTable & table = byte_table();
+  out.push_back('[');
+  if (count > 0) {
+    const uint8_t * block = reader.take(count);
+    out.reserve(out.size() + count * 4 + 1);
+    for (size_t i = 0; i < count; ++i) {
+      if (i > 0) {
+        out.push_back(',');
+      }
+      out.append(table.text[block[i]].data(), table.length[block[i]]);
+    }
+  }
+  out.push_back(']');
+}
+
+void write_bool_block(CdrReader & reader, size_t count, std::string & out) {
+  out.push_back('[');
+  if (count > 0) {
+    const uint8_t * block = reader.take(count);
+    for (size_t i = 0; i < count; ++i) {
+      if (i > 0) {
+        out.push_back(',');
+      }
+      out.append(block[i] != 0 ? "true" : "false");
+    }
+  }
+  out.push_back(']');
+}
+
+void write_message(const TypeInfo_Cpp * type_info, CdrReader & reader, std::string & out);
+
+void write_element(const MemberInfo_Cpp & member, CdrReader & reader, std::string & out) {
+  switch (member.type_id_) {
+    case introspection::ROS_TYPE_FLOAT:
+      append_value(out, reader.read<float>());
+      break;
+    case introspection::ROS_TYPE_DOUBLE:
+      append_value(out, reader.read<double>());
+      break;
+    case introspection::ROS_TYPE_CHAR:
+    case introspection::ROS_TYPE_OCTET:
+    case introspection::ROS_TYPE_UINT8:
+      append_integer(out, reader.read<uint8_t>());
+      break;
+    case introspection::ROS_TYPE_INT8:
+      append_integer(out, reader.read<int8_t>());
+      break;
+    case introspection::ROS_TYPE_UINT16:
+      append_integer(out, reader.read<uint16_t>());
+      break;
+    case introspection::ROS_TYPE_INT16:
+      append_integer(out, reader.read<int16_t>());
+      break;
+    case introspection::ROS_TYPE_BOOLEAN:
+      out.append(reader.read<uint8_t>() != 0 ? "true" : "false");
+      break;
+    case introspection::ROS_TYPE_UINT32:
+      append_integer(out, reader.read<uint32_t>());
+      break;
+    case introspection::ROS_TYPE_INT32:
+      append_integer(out, reader.read<int32_t>());
+      break;
+    case introspection::ROS_TYPE_UINT64:
+      append_value(out, reader.read<uint64_t>());
+      break;
+    case introspection::ROS_TYPE_INT64:
+      append_integer(out, reader.read<int64_t>());
+      break;
+    case introspection::ROS_TYPE_STRING:
+      write_string(reader, out);
+      break;
+    case introspection::ROS_TYPE_MESSAGE:
+      write_message(nested_type_info(member), reader, out);
+      break;
+    default:
+      throw SerializationError("Unsupported member type id for CDR streaming: " + std::to_string(member.type_id_));
+  }
+}
+
+/// Emit an array member (fixed-size or sequence) whose element count is already known
+void write_array(const MemberInfo_Cpp & member, size_t count, CdrReader & reader, std::string & out) {
+  switch (member.type_id_) {
+    case introspection::ROS_TYPE_FLOAT:
+      return write_primitive_block<float>(reader, count, out);
+    case introspection::ROS_TYPE_DOUBLE:
+      return write_primitive_block<double>(reader, count, out);
+    case introspection::ROS_TYPE_CHAR:
+    case introspection::ROS_TYPE_OCTET:
+    case introspection::ROS_TYPE_UINT8:
+      return write_byte_block(reader, count, out);
+    case introspection::ROS_TYPE_INT8:
+      return write_primitive_block<int8_t>(reader, count, out);
+    case introspection::ROS_TYPE_UINT16:
+      return write_primitive_block<uint16_t>(reader, count, out);
+    case introspection::ROS_TYPE_INT16:
+      return write_primitive_block<int16_t>(reader, count, out);
+    case introspection::ROS_TYPE_BOOLEAN:
+      return write_bool_block(reader, count, out);
+    case introspection::ROS_TYPE_UINT32:
+      return write_primitive_block<uint32_t>(reader, count, out);
+    case introspection::ROS_TYPE_INT32:
+      return write_primitive_block<int32_t>(reader, count, out);
+    case introspection::ROS_TYPE_UINT64:
+      return write_primitive_block<uint64_t>(reader, count, out);
+    case introspection::ROS_TYPE_INT64:
+      return write_primitive_block<int64_t>(reader, count, out);
+    default:
+      break;
+  }
+  // Strings and nested messages have variable size - emit element by element
+  out.push_back('[');
+  for (size_t i = 0; i < count; ++i) {
+    if (i > 0) {
+      out.push_back(',');
+    }
+    write_element(member, reader, out);
+  }
+  out.push_back(']');
+}
+
+void write_message(const TypeInfo_Cpp * type_info, CdrReader & reader, std::string & out) {
+  out.push_back('{');
+  for (uint32_t i = 0; i < type_info->member_count_; ++i) {
+    const MemberInfo_Cpp & member = type_info->members_[i];
+    if (i > 0) {
+      out.push_back(',');
+    }
+    out.push_back('"');
+    out.append(member.name_);
+    out.append("\":");
+
+    if (!member.is_array_) {
+      write_element(member, reader, out);
+    } else if (is_sequence(member)) {
+      // Every CDR element occupies at least one byte, which bounds the count before looping
+      uint32_t count = reader.read_count(1);
+      write_array(member, count, reader, out);
+    } else {
+      write_array(member, member.array_size_, reader, out);
+    }
+  }
+  out.push_back('}');
+}
+
+}  // namespace
+
+bool CdrJsonWriter::supports(const TypeInfo_Cpp * type_info) {
+  if (type_info == nullptr) {
+    return false;
+  }
+  for (uint32_t i = 0; i < type_info->member_count_; ++i) {
+    const MemberInfo_Cpp & member = type_info->members_[i];
+    switch (member.type_id_) {
+      case introspection::ROS_TYPE_WCHAR:
+      case introspection::ROS_TYPE_WSTRING:
+      case introspection::ROS_TYPE_LONG_DOUBLE:
+        return false;
+      case introspection::ROS_TYPE_MESSAGE:
+        if (member.members_ == nullptr || !supports(nested_type_info(member))) {
+          return false;
+        }
+        break;
+      default:
+        break;
+    }
+  }
+  return true;
+}
+
+bool CdrJsonWriter::write(const TypeInfo_Cpp * type_info, const uint8_t * buffer, size_t length, std::string & out) {
+  if (type_info == nullptr || (buffer == nullptr && length > 0)) {
+    throw SerializationError("Null type_info or buffer");
+  }
+  if (length < kEncapsulationSize) {
+    throw SerializationError("CDR buffer shorter than its encapsulation header");
+  }
+
+  uint16_t encapsulation = static_cast<uint16_t>((buffer[0] << 8) | buffer[1]);
+  bool swap = false;
+  if (encapsulation == kCdrLittleEndian) {
+    swap = !host_is_little_endian();
+  } else if (encapsulation == kCdrBigEndian) {
+    swap = host_is_little_endian();
+  } else {
+    return false;  // XCDR2 / parameter list encodings
+  }
+
+  CdrReader reader(buffer + kEncapsulationSize, length - kEncapsulationSize, swap);
+  size_t original_size = out.size();
+  try {
+    write_message(type_info, reader, out);
+  } catch (...) {
+    out.resize(original_size);
+    throw;
+  }
+  return true;
+}
+
+}  // namespace ros2_medkit_serialization
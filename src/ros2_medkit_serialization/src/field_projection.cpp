@@ -0,0 +1,118 @@
+// Copyright 2026 Selfpatch
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+#include "ros2_medkit_serialization/field_projection.hpp"
+
+#include "ros2_medkit_serialization/serialization_error.hpp"
+
+namespace ros2_medkit_serialization {
+
+namespace {
+
+std::string trim(const std::string & s) {
+  const char * ws = " \t\r\n";
+  size_t start = s.find_first_not_of(ws);
+  if (start == std::string::npos) {
+    return "";
+  }
+  size_t end = s.find_last_not_of(ws);
+  return s.substr(start, end - start + 1);
+}
+
+std::vector<std::string> split(const std::string & s, char delim) {
+  std::vector<std::string> parts;
+  size_t start = 0;
+  while (true) {
+    size_t pos = s.find(delim, start);
+    if (pos == std::string::npos) {
+      parts.push_back(s.substr(start));
+      break;
+    }
+    parts.push_back(s.substr(start, pos - start));
+    start = pos + 1;
+  }
+  return parts;
+}
+
+}  // namespace
+
+FieldMask FieldMask::parse(const std::string & field_list) {
+  FieldMask mask;
+  for (const auto & raw_path : split(field_list, ',')) {
+    std::string path = trim(raw_path);
+    if (path.empty()) {
+      continue;
+    }
+    auto segments = split(path, '.');
+    for (auto & segment : segments) {
+      segment = trim(segment);
+      if (segment.empty()) {
+        throw FieldProjectionError(path, "empty field name");
+      }
+    }
+    mask.select_all_ = false;
+    mask.add_path(segments, 0);
+  }
+  return mask;
+}
+
+void FieldMask::add_path(const std::vector<std::string> & segments, size_t index) {
+  auto [it, inserted] = children_.try_emplace(segments[index]);
+  FieldMask & child = it->second;
+
+  if (index + 1 == segments.size()) {
+    // Path ends here - the whole subtree is selected, even if a longer path was added before
+    child.select_all_ = true;
+    child.children_.clear();
+    return;
+  }
+  if (inserted) {
+    child.select_all_ = false;
+  } else if (child.select_all_) {
+    // A shorter path already selected this whole subtree
+    return;
+  }
+  child.add_path(segments, index + 1);
+}
+
+const FieldMask * FieldMask::child(const std::string & name) const {
+  if (select_all_) {
+    return this;
+  }
+  auto it = children_.find(name);
+  if (it == children_.end()) {
+    return nullptr;
+  }
+  return &it->second;
+}
+
+std::vector<std::string> FieldMask::child_names() const {
+  std::vector<std::string> names;
+  names.reserve(children_.size());
+  for (const auto & [name, _] : children_) {
+    names.push_back(name);
+  }
+  return names;
+}
+
+size_t ArrayDecimation::output_count(size_t size) const {
+  size_t step = stride > 1 ? stride : 1;
+  size_t count = (size + step - 1) / step;
+  if (max_length > 0 && count > max_length) {
+    count = max_length;
+  }
+  return count;
+}
+
+}  // namespace ros2_medkit_serialization
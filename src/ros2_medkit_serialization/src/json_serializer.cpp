@@ -14,17 +14,262 @@
 
 #include "ros2_medkit_serialization/json_serializer.hpp"
 
+#include <cstring>
 #include <sstream>
 
 #include "rcpputils/shared_library.hpp"
 #include "rmw/rmw.h"
+#include "ros2_medkit_serialization/cdr_json_writer.hpp"
+#include "ros2_medkit_serialization/scalar_typing.hpp"
 #include "ros2_medkit_serialization/vendored/dynmsg/message_reading.hpp"
 #include "ros2_medkit_serialization/vendored/dynmsg/msg_parser.hpp"
+#include "ros2_medkit_serialization/vendored/dynmsg/string_utils.hpp"
+#include "ros2_medkit_serialization/vendored/dynmsg/vector_utils.hpp"
 #include "rosidl_typesupport_cpp/message_type_support.hpp"
 #include "rosidl_typesupport_introspection_cpp/field_types.hpp"
 
 namespace ros2_medkit_serialization {
 
+namespace {
+
+namespace introspection = rosidl_typesupport_introspection_cpp;
+
+const TypeInfo_Cpp * nested_type_info(const MemberInfo_Cpp & member) {
+  return static_cast<const TypeInfo_Cpp *>(member.members_->data);
+}
+
+size_t primitive_size(uint8_t type_id) {
+  switch (type_id) {
+    case introspection::ROS_TYPE_FLOAT:
+      return sizeof(float);
+    case introspection::ROS_TYPE_DOUBLE:
+      return sizeof(double);
+    case introspection::ROS_TYPE_LONG_DOUBLE:
+      return sizeof(long double);
+    case introspection::ROS_TYPE_CHAR:
+    case introspection::ROS_TYPE_OCTET:
+    case introspection::ROS_TYPE_UINT8:
+    case introspection::ROS_TYPE_INT8:
+      return sizeof(uint8_t);
+    case introspection::ROS_TYPE_WCHAR:
+    case introspection::ROS_TYPE_UINT16:
+    case introspection::ROS_TYPE_INT16:
+      return sizeof(uint16_t);
+    case introspection::ROS_TYPE_BOOLEAN:
+      return sizeof(bool);
+    case introspection::ROS_TYPE_UINT32:
+    case introspection::ROS_TYPE_INT32:
+      return sizeof(uint32_t);
+    case introspection::ROS_TYPE_UINT64:
+    case introspection::ROS_TYPE_INT64:
+      return sizeof(uint64_t);
+    case introspection::ROS_TYPE_STRING:
+      return sizeof(std::string);
+    case introspection::ROS_TYPE_WSTRING:
+      return sizeof(std::u16string);
+    default:
+      throw JsonConversionError("Unsupported member type id: " + std::to_string(type_id));
+  }
+}
+
+nlohmann::json message_to_json_projected(const TypeInfo_Cpp * type_info, const uint8_t * data, const FieldMask & mask,
+                                         const ArrayDecimation & arrays);
+
+/// Convert a single (non-array) value of a member
+nlohmann::json element_to_json(const MemberInfo_Cpp & member, const uint8_t * data, const FieldMask & mask,
+                               const ArrayDecimation & arrays) {
+  switch (member.type_id_) {
+    case introspection::ROS_TYPE_FLOAT:
+      return floating_to_json(*reinterpret_cast<const float *>(data));
+    case introspection::ROS_TYPE_DOUBLE:
+      return floating_to_json(*reinterpret_cast<const double *>(data));
+    case introspection::ROS_TYPE_LONG_DOUBLE:
+      return floating_to_json(*reinterpret_cast<const long double *>(data));
+    case introspection::ROS_TYPE_CHAR:
+    case introspection::ROS_TYPE_OCTET:
+    case introspection::ROS_TYPE_UINT8:
+      return *reinterpret_cast<const uint8_t *>(data);
+    case introspection::ROS_TYPE_INT8:
+      return *reinterpret_cast<const int8_t *>(data);
+    case introspection::ROS_TYPE_WCHAR:
+    case introspection::ROS_TYPE_UINT16:
+      return *reinterpret_cast<const uint16_t *>(data);
+    case introspection::ROS_TYPE_INT16:
+      return *reinterpret_cast<const int16_t *>(data);
+    case introspection::ROS_TYPE_BOOLEAN:
+      return *reinterpret_cast<const bool *>(data);
+    case introspection::ROS_TYPE_UINT32:
+      return *reinterpret_cast<const uint32_t *>(data);
+    case introspection::ROS_TYPE_INT32:
+      return *reinterpret_cast<const int32_t *>(data);
+    case introspection::ROS_TYPE_UINT64:
+      return uint64_to_json(*reinterpret_cast<const uint64_t *>(data));
+    case introspection::ROS_TYPE_INT64:
+      return *reinterpret_cast<const int64_t *>(data);
+    case introspection::ROS_TYPE_STRING:
+      return string_to_json(*reinterpret_cast<const std::string *>(data));
+    case introspection::ROS_TYPE_WSTRING:
+      return string_to_json(u16string_to_string(*reinterpret_cast<const std::u16string *>(data)));
+    case introspection::ROS_TYPE_MESSAGE:
+      return message_to_json_projected(nested_type_info(member), data, mask, arrays);
+    default:
+      throw JsonConversionError("Unsupported member type id: " + std::to_string(member.type_id_));
+  }
+}
+
+/// Convert a std::vector<T> member, visiting only the elements kept by decimation
+template <typename T>
+nlohmann::json vector_to_json(const MemberInfo_Cpp & member, const uint8_t * data, const FieldMask & mask,
+                              const ArrayDecimation & arrays) {
+  const auto & vec = *reinterpret_cast<const std::vector<T> *>(data);
+  size_t count = arrays.output_count(vec.size());
+  size_t step = arrays.stride > 1 ? arrays.stride : 1;
+  nlohmann::json out = nlohmann::json::array();
+  out.get_ref<nlohmann::json::array_t &>().reserve(count);
+  for (size_t i = 0; i < count; ++i) {
+    out.push_back(element_to_json(member, reinterpret_cast<const uint8_t *>(&vec[i * step]), mask, arrays));
+  }
+  return out;
+}
+
+/// std::vector<bool> is bit-packed, so elements cannot be addressed through a pointer
+nlohmann::json bool_vector_to_json(const uint8_t * data, const ArrayDecimation & arrays) {
+  const auto & vec = *reinterpret_cast<const std::vector<bool> *>(data);
+  size_t count = arrays.output_count(vec.size());
+  size_t step = arrays.stride > 1 ? arrays.stride : 1;
+  nlohmann::json out = nlohmann::json::array();
+  for (size_t i = 0; i < count; ++i) {
+    out.push_back(static_cast<bool>(vec[i * step]));
+  }
+  return out;
+}
+
+nlohmann::json sequence_to_json(const MemberInfo_Cpp & member, const uint8_t * data, const FieldMask & mask,
+                                const ArrayDecimation & arrays) {
+  switch (member.type_id_) {
+    case introspection::ROS_TYPE_FLOAT:
+      return vector_to_json<float>(member, data, mask, arrays);
+    case introspection::ROS_TYPE_DOUBLE:
+      return vector_to_json<double>(member, data, mask, arrays);
+    case introspection::ROS_TYPE_LONG_DOUBLE:
+      return vector_to_json<long double>(member, data, mask, arrays);
+    case introspection::ROS_TYPE_CHAR:
+    case introspection::ROS_TYPE_OCTET:
+    case introspection::ROS_TYPE_UINT8:
+    case introspection::ROS_TYPE_INT8:
+      return vector_to_json<uint8_t>(member, data, mask, arrays);
+    case introspection::ROS_TYPE_WCHAR:
+    case introspection::ROS_TYPE_UINT16:
+    case introspection::ROS_TYPE_INT16:
+      return vector_to_json<uint16_t>(member, data, mask, arrays);
+    case introspection::ROS_TYPE_BOOLEAN:
+      return bool_vector_to_json(data, arrays);
+    case introspection::ROS_TYPE_UINT32:
+    case introspection::ROS_TYPE_INT32:
+      return vector_to_json<uint32_t>(member, data, mask, arrays);
+    case introspection::ROS_TYPE_UINT64:
+    case introspection::ROS_TYPE_INT64:
+      return vector_to_json<uint64_t>(member, data, mask, arrays);
+    case introspection::ROS_TYPE_STRING:
+      return vector_to_json<std::string>(member, data, mask, arrays);
+    case introspection::ROS_TYPE_WSTRING:
+      return vector_to_json<std::u16string>(member, data, mask, arrays);
+    case introspection::ROS_TYPE_MESSAGE: {
+      // Element type is only known at runtime - use the element size from introspection
+      const TypeInfo_Cpp * nested = nested_type_info(member);
+      size_t element_size = nested->size_of_;
+      const uint8_t * elements = nullptr;
+      std::memcpy(&elements, data, sizeof(void *));
+      size_t size = dynmsg::get_vector_size(data, element_size);
+      size_t count = arrays.output_count(size);
+      size_t step = arrays.stride > 1 ? arrays.stride : 1;
+      nlohmann::json out = nlohmann::json::array();
+      out.get_ref<nlohmann::json::array_t &>().reserve(count);
+      for (size_t i = 0; i < count; ++i) {
+        out.push_back(message_to_json_projected(nested, elements + i * step * element_size, mask, arrays));
+      }
+      return out;
+    }
+    default:
+      throw JsonConversionError("Unsupported member type id: " + std::to_string(member.type_id_));
+  }
+}
+
+nlohmann::json fixed_array_to_json(const MemberInfo_Cpp & member, const uint8_t * data, const FieldMask & mask,
+                                   const ArrayDecimation & arrays) {
+  size_t element_size = member.type_id_ == introspection::ROS_TYPE_MESSAGE ? nested_type_info(member)->size_of_
+                                                                           : primitive_size(member.type_id_);
+  size_t count = arrays.output_count(member.array_size_);
+  size_t step = arrays.stride > 1 ? arrays.stride : 1;
+  nlohmann::json out = nlohmann::json::array();
+  out.get_ref<nlohmann::json::array_t &>().reserve(count);
+  for (size_t i = 0; i < count; ++i) {
+    out.push_back(element_to_json(member, data + i * step * element_size, mask, arrays));
+  }
+  return out;
+}
+
+/// Check that every field selected by @p mask exists in the type, without touching any message
+/// @throws FieldProjectionError naming the first unknown field
+void validate_mask(const TypeInfo_Cpp * type_info, const FieldMask & mask, const std::string & path) {
+  if (mask.selects_all()) {
+    return;
+  }
+  for (const auto & name : mask.child_names()) {
+    const MemberInfo_Cpp * member = nullptr;
+    for (uint32_t i = 0; i < type_info->member_count_ && member == nullptr; ++i) {
+      if (name == type_info->members_[i].name_) {
+        member = &type_info->members_[i];
+      }
+    }
+
+    std::string child_path = path.empty() ? name : path + "." + name;
+    if (member == nullptr) {
+      throw FieldProjectionError(child_path, std::string("no such field in ") + type_info->message_namespace_ +
+                                                 "::" + type_info->message_name_);
+    }
+
+    const FieldMask * child_mask = mask.child(name);
+    if (child_mask->selects_all()) {
+      continue;
+    }
+    if (member->type_id_ != introspection::ROS_TYPE_MESSAGE) {
+      throw FieldProjectionError(child_path + "." + child_mask->child_names().front(),
+                                 "'" + child_path + "' is not a message field");
+    }
+    validate_mask(nested_type_info(*member), *child_mask, child_path);
+  }
+}
+
+/// Convert the fields selected by @p mask (already checked by validate_mask())
+nlohmann::json message_to_json_projected(const TypeInfo_Cpp * type_info, const uint8_t * data, const FieldMask & mask,
+                                         const ArrayDecimation & arrays) {
+  nlohmann::json out = nlohmann::json::object();
+
+  for (uint32_t i = 0; i < type_info->member_count_; ++i) {
+    const MemberInfo_Cpp & member = type_info->members_[i];
+    const FieldMask * child_mask = mask.child(member.name_);
+    if (child_mask == nullptr) {
+      continue;  // Not selected - never materialized
+    }
+
+    const uint8_t * member_data = data + member.offset_;
+    if (member.is_array_) {
+      if (member.is_upper_bound_ || member.array_size_ == 0) {
+        out[member.name_] = sequence_to_json(member, member_data, *child_mask, arrays);
+      } else {
+        out[member.name_] = fixed_array_to_json(member, member_data, *child_mask, arrays);
+      }
+    } else {
+      out[member.name_] = element_to_json(member, member_data, *child_mask, arrays);
+    }
+  }
+
+  return out;
+}
+
+}  // namespace
+
 nlohmann::json JsonSerializer::to_json(const TypeInfo_Cpp * type_info, const void * message_data) const {
   if (type_info == nullptr || message_data == nullptr) {
     throw JsonConversionError("Null type_info or message_data");
@@ -42,6 +287,20 @@ nlohmann::json JsonSerializer::to_json(const TypeInfo_Cpp * type_info, const voi
   return yaml_to_json(yaml_node);
 }
 
+nlohmann::json JsonSerializer::to_json(const TypeInfo_Cpp * type_info, const void * message_data,
+                                       const ProjectionOptions & projection) const {
+  if (type_info == nullptr || message_data == nullptr) {
+    throw JsonConversionError("Null type_info or message_data");
+  }
+  validate_mask(type_info, projection.fields, "");
+  return message_to_json_projected(type_info, static_cast<const uint8_t *>(message_data), projection.fields,
+                                   projection.arrays);
+}
+
+void JsonSerializer::validate_projection(const std::string & type_string, const FieldMask & fields) const {
+  validate_mask(get_type_info_or_throw(type_string), fields, "");
+}
+
 nlohmann::json JsonSerializer::to_json(const std::string & type_string, const void * message_data) const {
   const TypeInfo_Cpp * type_info = get_type_info_or_throw(type_string);
   return to_json(type_info, message_data);
@@ -191,68 +450,8 @@ nlohmann::json JsonSerializer::yaml_to_json(const YAML::Node & yaml) {
     case YAML::NodeType::Null:
       return nullptr;
 
-    case YAML::NodeType::Scalar: {
-      // Try to parse as different types using type detection heuristics.
-      // Empty catch blocks are intentional - we try each type in order and
-      // fall through to the next on failure. This is a common pattern for
-      // YAML scalar type inference.
-
-      // First try boolean
-      try {
-        bool b = yaml.as<bool>();
-        // YAML::as<bool> succeeds for "true"/"false"/"yes"/"no" etc.
-        std::string str = yaml.as<std::string>();
-        if (str == "true" || str == "false" || str == "yes" || str == "no" || str == "True" || str == "False" ||
-            str == "Yes" || str == "No") {
-          return b;
-        }
-      } catch (...) {
-        // Not a boolean - try next type
-      }
-
-      // Try integer
-      try {
-        int64_t i = yaml.as<int64_t>();
-        std::string str = yaml.as<std::string>();
-        // Check if it looks like an integer
-        if (!str.empty() && (std::isdigit(str[0]) || str[0] == '-')) {
-          try {
-            size_t pos;
-            std::stoll(str, &pos);
-            if (pos == str.length()) {
-              return i;
-            }
-          } catch (...) {
-            // String doesn't parse as integer - continue
-          }
-        }
-      } catch (...) {
-        // Not an integer - try next type
-      }
-
-      // Try floating point
-      try {
-        double d = yaml.as<double>();
-        std::string str = yaml.as<std::string>();
-        // Check if it looks like a number
-        if (!str.empty() && (std::isdigit(str[0]) || str[0] == '-' || str[0] == '.')) {
-          try {
-            size_t pos;
-            std::stod(str, &pos);
-            if (pos == str.length()) {
-              return d;
-            }
-          } catch (...) {
-            // String doesn't parse as double - continue
-          }
-        }
-      } catch (...) {
-        // Not a double - fall back to string
-      }
-
-      // Fall back to string
-      return yaml.as<std::string>();
-    }
+    case YAML::NodeType::Scalar:
+      return yaml_scalar_to_json(yaml);
 
     case YAML::NodeType::Sequence: {
       nlohmann::json arr = nlohmann::json::array();
@@ -382,6 +581,12 @@ rclcpp::SerializedMessage JsonSerializer::serialize(const std::string & type_str
 
 nlohmann::json JsonSerializer::deserialize(const std::string & type_string,
                                            const rclcpp::SerializedMessage & serialized_msg) const {
+  return deserialize(type_string, serialized_msg, ProjectionOptions{});
+}
+
+nlohmann::json JsonSerializer::deserialize(const std::string & type_string,
+                                           const rclcpp::SerializedMessage & serialized_msg,
+                                           const ProjectionOptions & projection) const {
   // Get type info for introspection
   const TypeInfo_Cpp * type_info = get_type_info_or_throw(type_string);
 
@@ -420,8 +625,18 @@ nlohmann::json JsonSerializer::deserialize(const std::string & type_string,
       throw SerializationError("rmw_deserialize failed for type: " + type_string);
     }
 
-    // Convert to JSON
-    nlohmann::json result = to_json(type_info, ros_msg.data);
+    // Convert to JSON (projected conversion skips unselected subtrees entirely)
+    nlohmann::json result;
+    try {
+      if (projection.is_identity()) {
+        result = to_json(type_info, ros_msg.data);
+      } else {
+        result = to_json(type_info, ros_msg.data, projection);
+      }
+    } catch (...) {
+      dynmsg::cpp::ros_message_destroy_with_allocator(&ros_msg, &allocator);
+      throw;
+    }
 
     // Clean up
     dynmsg::cpp::ros_message_destroy_with_allocator(&ros_msg, &allocator);
@@ -443,4 +658,20 @@ nlohmann::json JsonSerializer::deserialize(const std::string & type_string,
   }
 }
 
+std::string JsonSerializer::deserialize_to_string(const std::string & type_string,
+                                                  const rclcpp::SerializedMessage & serialized_msg) const {
+  const TypeInfo_Cpp * type_info = get_type_info_or_throw(type_string);
+
+  if (CdrJsonWriter::supports(type_info)) {
+    const auto & buffer = serialized_msg.get_rcl_serialized_message();
+    std::string out;
+    out.reserve(buffer.buffer_length * 2);
+    if (CdrJsonWriter::write(type_info, buffer.buffer, buffer.buffer_length, out)) {
+      return out;
+    }
+  }
+
+  return deserialize(type_string, serialized_msg).dump();
+}
+
 }  // namespace ros2_medkit_serialization
@@ -0,0 +1,184 @@
+// Copyright 2026 Selfpatch
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+#include "ros2_medkit_serialization/scalar_typing.hpp"
+
+#include <cctype>
+#include <cerrno>
+#include <charconv>
+#include <cmath>
+#include <cstdio>
+#include <cstdlib>
+#include <cstring>
+#include <limits>
+#include <type_traits>
+
+namespace ros2_medkit_serialization {
+
+namespace {
+
+template <typename T>
+int format_like_yaml(char * buf, size_t size, T value) {
+  constexpr int digits = std::numeric_limits<T>::max_digits10;
+  if constexpr (std::is_same_v<T, long double>) {
+    return std::snprintf(buf, size, "%.*Lg", digits, value);
+  } else {
+    return std::snprintf(buf, size, "%.*g", digits, static_cast<double>(value));
+  }
+}
+
+template <typename T>
+nlohmann::json floating_impl(T value) {
+  if (std::isnan(value)) {
+    return ".nan";
+  }
+  if (std::isinf(value)) {
+    return value < 0 ? "-.inf" : ".inf";
+  }
+  // yaml-cpp streams the value with max_digits10 significant digits (%g style),
+  // and yaml_scalar_to_json() then prefers an integer over a double
+  char buf[64];
+  int length = format_like_yaml(buf, sizeof(buf), value);
+  if (length <= 0 || static_cast<size_t>(length) >= sizeof(buf)) {
+    return yaml_scalar_to_json(YAML::Node(value));
+  }
+  if (std::strpbrk(buf, ".e") == nullptr) {
+    int64_t integer = 0;
+    auto res = std::from_chars(buf, buf + length, integer);
+    if (res.ec == std::errc() && res.ptr == buf + length) {
+      return integer;
+    }
+  }
+  // Like std::stod in yaml_scalar_to_json(), out-of-range text (subnormals) stays a string
+  errno = 0;
+  double number = std::strtod(buf, nullptr);
+  if (errno == ERANGE) {
+    return std::string(buf, static_cast<size_t>(length));
+  }
+  return number;
+}
+
+bool may_be_typed(const std::string & value) {
+  if (value.empty()) {
+    return false;
+  }
+  // Numbers start with a digit, '-' or '.'; the accepted booleans with t/f/y/n in either case
+  switch (value[0]) {
+    case '-':
+    case '.':
+    case 't':
+    case 'T':
+    case 'f':
+    case 'F':
+    case 'y':
+    case 'Y':
+    case 'n':
+    case 'N':
+      return true;
+    default:
+      return std::isdigit(static_cast<unsigned char>(value[0])) != 0;
+  }
+}
+
+}  // namespace
+
+nlohmann::json yaml_scalar_to_json(const YAML::Node & yaml) {
+  // Empty catch blocks are intentional - we try each type in order and
+  // fall through to the next on failure. This is a common pattern for
+  // YAML scalar type inference.
+
+  // First try boolean
+  try {
+    bool b = yaml.as<bool>();
+    // YAML::as<bool> succeeds for "true"/"false"/"yes"/"no" etc.
+    std::string str = yaml.as<std::string>();
+    if (str == "true" || str == "false" || str == "yes" || str == "no" || str == "True" || str == "False" ||
+        str == "Yes" || str == "No") {
+      return b;
+    }
+  } catch (...) {
+    // Not a boolean - try next type
+  }
+
+  // Try integer
+  try {
+    int64_t i = yaml.as<int64_t>();
+    std::string str = yaml.as<std::string>();
+    // Check if it looks like an integer
+    if (!str.empty() && (std::isdigit(str[0]) || str[0] == '-')) {
+      try {
+        size_t pos;
+        std::stoll(str, &pos);
+        if (pos == str.length()) {
+          return i;
+        }
+      } catch (...) {
+        // String doesn't parse as integer - continue
+      }
+    }
+  } catch (...) {
+    // Not an integer - try next type
+  }
+
+  // Try floating point
+  try {
+    double d = yaml.as<double>();
+    std::string str = yaml.as<std::string>();
+    // Check if it looks like a number
+    if (!str.empty() && (std::isdigit(str[0]) || str[0] == '-' || str[0] == '.')) {
+      try {
+        size_t pos;
+        std::stod(str, &pos);
+        if (pos == str.length()) {
+          return d;
+        }
+      } catch (...) {
+        // String doesn't parse as double - continue
+      }
+    }
+  } catch (...) {
+    // Not a double - fall back to string
+  }
+
+  // Fall back to string
+  return yaml.as<std::string>();
+}
+
+nlohmann::json floating_to_json(float value) {
+  return floating_impl(value);
+}
+
+nlohmann::json floating_to_json(double value) {
+  return floating_impl(value);
+}
+
+nlohmann::json floating_to_json(long double value) {
+  return floating_impl(value);
+}
+
+nlohmann::json string_to_json(const std::string & value) {
+  if (may_be_typed(value)) {
+    return yaml_scalar_to_json(YAML::Node(value));
+  }
+  return value;
+}
+
+nlohmann::json uint64_to_json(uint64_t value) {
+  if (value > static_cast<uint64_t>(std::numeric_limits<int64_t>::max())) {
+    return static_cast<double>(value);
+  }
+  return static_cast<int64_t>(value);
+}
+
+}  // namespace ros2_medkit_serialization
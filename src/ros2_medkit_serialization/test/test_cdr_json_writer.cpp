@@ -0,0 +1,191 @@
+// Copyright 2026 Selfpatch
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+#include <gtest/gtest.h>
+
+#include <cmath>
+#include <geometry_msgs/msg/pose_array.hpp>
+#include <limits>
+#include <rclcpp/serialization.hpp>
+#include <sensor_msgs/msg/laser_scan.hpp>
+#include <std_msgs/msg/string.hpp>
+#include <test_msgs/msg/arrays.hpp>
+#include <test_msgs/msg/basic_types.hpp>
+#include <test_msgs/msg/strings.hpp>
+
+#include "ros2_medkit_serialization/cdr_json_writer.hpp"
+#include "ros2_medkit_serialization/json_serializer.hpp"
+#include "ros2_medkit_serialization/type_cache.hpp"
+
+namespace ros2_medkit_serialization {
+
+class CdrJsonWriterTest : public ::testing::Test {
+ protected:
+  void SetUp() override {
+    TypeCache::instance().clear();
+  }
+
+  template <typename MessageT>
+  static rclcpp::SerializedMessage serialize(const MessageT & msg) {
+    rclcpp::Serialization<MessageT> serialization;
+    rclcpp::SerializedMessage serialized;
+    serialization.serialize_message(&msg, &serialized);
+    return serialized;
+  }
+
+  /// Stream a message through CdrJsonWriter and parse the result
+  template <typename MessageT>
+  static nlohmann::json stream(const TypeInfo_Cpp * type_info, const MessageT & msg) {
+    auto serialized = serialize(msg);
+    const auto & buffer = serialized.get_rcl_serialized_message();
+    std::string out;
+    EXPECT_TRUE(CdrJsonWriter::write(type_info, buffer.buffer, buffer.buffer_length, out));
+    return nlohmann::json::parse(out);
+  }
+
+  /// Reference output: the full deserialize() conversion
+  template <typename MessageT>
+  nlohmann::json baseline(const std::string & type_string, const MessageT & msg) const {
+    return serializer_.deserialize(type_string, serialize(msg));
+  }
+
+  JsonSerializer serializer_;
+};
+
+TEST_F(CdrJsonWriterTest, MatchesDeserializeForNestedSequences) {
+  geometry_msgs::msg::PoseArray msg;
+  msg.header.stamp.sec = 12;
+  msg.header.stamp.nanosec = 345;
+  msg.header.frame_id = "map";
+  msg.poses.resize(3);
+  msg.poses[2].position.x = 1.5;
+  msg.poses[2].orientation.w = 1.0;
+
+  auto type_info = TypeCache::instance().get_message_type_info("geometry_msgs", "PoseArray");
+  ASSERT_NE(type_info, nullptr);
+
+  EXPECT_EQ(stream(type_info, msg).dump(), baseline("geometry_msgs/msg/PoseArray", msg).dump());
+}
+
+TEST_F(CdrJsonWriterTest, MatchesDeserializeForPrimitiveArrays) {
+  sensor_msgs::msg::LaserScan msg;
+  msg.header.frame_id = "laser";
+  msg.angle_min = -1.5f;
+  msg.angle_increment = 0.01f;
+  msg.range_max = 30.0f;
+  for (int i = 0; i < 100; ++i) {
+    msg.ranges.push_back(0.1f * static_cast<float>(i));
+  }
+  msg.ranges.push_back(std::numeric_limits<float>::infinity());
+
+  auto type_info = TypeCache::instance().get_message_type_info("sensor_msgs", "LaserScan");
+  ASSERT_NE(type_info, nullptr);
+
+  EXPECT_EQ(stream(type_info, msg).dump(), baseline("sensor_msgs/msg/LaserScan", msg).dump());
+}
+
+TEST_F(CdrJsonWriterTest, MatchesDeserializeForFixedArrays) {
+  test_msgs::msg::Arrays msg;
+  msg.bool_values = {true, false, true};
+  msg.int8_values = {-128, 0, 127};
+  msg.uint64_values = {0, 1, UINT64_MAX};
+  msg.float64_values = {1.0, -0.0, 0.25};
+  msg.string_values = {"a", "", "c"};
+
+  auto type_info = TypeCache::instance().get_message_type_info("test_msgs", "Arrays");
+  ASSERT_NE(type_info, nullptr);
+  ASSERT_TRUE(CdrJsonWriter::supports(type_info));
+
+  EXPECT_EQ(stream(type_info, msg).dump(), baseline("test_msgs/msg/Arrays", msg).dump());
+}
+
+TEST_F(CdrJsonWriterTest, TypesScalarsLikeDeserialize) {
+  test_msgs::msg::BasicTypes msg;
+  msg.float32_value = 0.1f;  // 0.100000001 in the full conversion
+  msg.float64_value = 1.0;   // Whole doubles come out as integers
+  msg.uint64_value = std::numeric_limits<uint64_t>::max();
+
+  auto type_info = TypeCache::instance().get_message_type_info("test_msgs", "BasicTypes");
+  ASSERT_NE(type_info, nullptr);
+
+  auto streamed = stream(type_info, msg);
+  auto expected = baseline("test_msgs/msg/BasicTypes", msg);
+  EXPECT_EQ(streamed.dump(), expected.dump());
+  EXPECT_TRUE(streamed["float64_value"].is_number_integer());
+
+  // Non-finite values are strings in the full conversion
+  msg.float64_value = std::nan("");
+  msg.float32_value = -std::numeric_limits<float>::infinity();
+  EXPECT_EQ(stream(type_info, msg).dump(), baseline("test_msgs/msg/BasicTypes", msg).dump());
+}
+
+TEST_F(CdrJsonWriterTest, TypesNumericLookingStringsLikeDeserialize) {
+  test_msgs::msg::Strings msg;
+  msg.string_value = "42";
+  msg.bounded_string_value = "true";
+
+  auto type_info = TypeCache::instance().get_message_type_info("test_msgs", "Strings");
+  ASSERT_NE(type_info, nullptr);
+
+  auto streamed = stream(type_info, msg);
+  EXPECT_EQ(streamed.dump(), baseline("test_msgs/msg/Strings", msg).dump());
+  EXPECT_TRUE(streamed["string_value"].is_number_integer());
+  EXPECT_TRUE(streamed["bounded_string_value"].is_boolean());
+}
+
+TEST_F(CdrJsonWriterTest, EscapesStrings) {
+  std_msgs::msg::String msg;
+  msg.data = "quote\" backslash\\ newline\n tab\t ctrl\x01 utf8 \xC3\xA9";
+
+  auto json = nlohmann::json::parse(serializer_.deserialize_to_string("std_msgs/msg/String", serialize(msg)));
+  EXPECT_EQ(json["data"].get<std::string>(), msg.data);
+}
+
+TEST_F(CdrJsonWriterTest, TruncatedBufferThrows) {
+  sensor_msgs::msg::LaserScan msg;
+  msg.ranges = {1.0f, 2.0f, 3.0f};
+  auto serialized = serialize(msg);
+  const auto & buffer = serialized.get_rcl_serialized_message();
+
+  auto type_info = TypeCache::instance().get_message_type_info("sensor_msgs", "LaserScan");
+  ASSERT_NE(type_info, nullptr);
+
+  std::string out = "prefix";
+  EXPECT_THROW(CdrJsonWriter::write(type_info, buffer.buffer, buffer.buffer_length - 5, out), SerializationError);
+  EXPECT_EQ(out, "prefix");
+}
+
+TEST_F(CdrJsonWriterTest, UnsupportedEncapsulationReturnsFalse) {
+  auto type_info = TypeCache::instance().get_message_type_info("std_msgs", "String");
+  ASSERT_NE(type_info, nullptr);
+
+  // XCDR2 little-endian header
+  std::vector<uint8_t> buffer = {0x00, 0x07, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00};
+  std::string out;
+  EXPECT_FALSE(CdrJsonWriter::write(type_info, buffer.data(), buffer.size(), out));
+  EXPECT_TRUE(out.empty());
+}
+
+TEST_F(CdrJsonWriterTest, WideStringTypesAreNotSupported) {
+  auto type_info = TypeCache::instance().get_message_type_info("test_msgs", "WStrings");
+  ASSERT_NE(type_info, nullptr);
+  EXPECT_FALSE(CdrJsonWriter::supports(type_info));
+}
+
+}  // namespace ros2_medkit_serialization
+
+int main(int argc, char ** argv) {
+  testing::InitGoogleTest(&argc, argv);
+  return RUN_ALL_TESTS();
+}
@@ -0,0 +1,254 @@
+// Copyright 2026 Selfpatch
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+#include <gtest/gtest.h>
+
+#include <cmath>
+#include <geometry_msgs/msg/pose_array.hpp>
+#include <limits>
+#include <sensor_msgs/msg/laser_scan.hpp>
+#include <std_msgs/msg/string.hpp>
+#include <test_msgs/msg/basic_types.hpp>
+#include <test_msgs/msg/strings.hpp>
+
+#include "ros2_medkit_serialization/field_projection.hpp"
+#include "ros2_medkit_serialization/json_serializer.hpp"
+#include "ros2_medkit_serialization/type_cache.hpp"
+
+namespace ros2_medkit_serialization {
+
+// FieldMask parsing tests
+
+TEST(FieldMaskTest, DefaultSelectsAll) {
+  FieldMask mask;
+  EXPECT_TRUE(mask.selects_all());
+  EXPECT_EQ(mask.child("anything"), &mask);
+}
+
+TEST(FieldMaskTest, EmptyListSelectsAll) {
+  EXPECT_TRUE(FieldMask::parse("").selects_all());
+  EXPECT_TRUE(FieldMask::parse(" , ").selects_all());
+}
+
+TEST(FieldMaskTest, ParseNestedPaths) {
+  auto mask = FieldMask::parse("header.stamp, pose.position");
+  EXPECT_FALSE(mask.selects_all());
+  EXPECT_EQ(mask.child_names(), (std::vector<std::string>{"header", "pose"}));
+
+  const auto * header = mask.child("header");
+  ASSERT_NE(header, nullptr);
+  EXPECT_FALSE(header->selects_all());
+  ASSERT_NE(header->child("stamp"), nullptr);
+  EXPECT_TRUE(header->child("stamp")->selects_all());
+  EXPECT_EQ(header->child("frame_id"), nullptr);
+  EXPECT_EQ(mask.child("twist"), nullptr);
+}
+
+TEST(FieldMaskTest, ParentPathWinsOverChildPath) {
+  auto child_first = FieldMask::parse("header.stamp,header");
+  ASSERT_NE(child_first.child("header"), nullptr);
+  EXPECT_TRUE(child_first.child("header")->selects_all());
+
+  auto parent_first = FieldMask::parse("header,header.stamp");
+  ASSERT_NE(parent_first.child("header"), nullptr);
+  EXPECT_TRUE(parent_first.child("header")->selects_all());
+}
+
+TEST(FieldMaskTest, EmptySegmentThrows) {
+  EXPECT_THROW(FieldMask::parse("header..stamp"), FieldProjectionError);
+  EXPECT_THROW(FieldMask::parse(".stamp"), FieldProjectionError);
+  EXPECT_THROW(FieldMask::parse("header."), FieldProjectionError);
+}
+
+// ArrayDecimation tests
+
+TEST(ArrayDecimationTest, OutputCount) {
+  ArrayDecimation identity;
+  EXPECT_TRUE(identity.is_identity());
+  EXPECT_EQ(identity.output_count(10), 10u);
+
+  ArrayDecimation stride{0, 3};
+  EXPECT_EQ(stride.output_count(10), 4u);  // 0, 3, 6, 9
+  EXPECT_EQ(stride.output_count(0), 0u);
+
+  ArrayDecimation capped{2, 3};
+  EXPECT_EQ(capped.output_count(10), 2u);
+}
+
+// Projected to_json tests
+
+class FieldProjectionTest : public ::testing::Test {
+ protected:
+  void SetUp() override {
+    TypeCache::instance().clear();
+  }
+
+  JsonSerializer serializer_;
+};
+
+TEST_F(FieldProjectionTest, IdentityProjectionMatchesFullConversion) {
+  geometry_msgs::msg::PoseArray msg;
+  msg.header.frame_id = "map";
+  msg.poses.resize(2);
+  msg.poses[1].position.x = 1.5;
+
+  auto type_info = TypeCache::instance().get_message_type_info("geometry_msgs", "PoseArray");
+  ASSERT_NE(type_info, nullptr);
+
+  // Compare text: json == treats 0 and 0.0 as equal, but clients see different types
+  auto full = serializer_.to_json(type_info, &msg);
+  auto projected = serializer_.to_json(type_info, &msg, ProjectionOptions{});
+  EXPECT_EQ(projected.dump(), full.dump());
+}
+
+TEST_F(FieldProjectionTest, PrimitiveTypingMatchesFullConversion) {
+  test_msgs::msg::BasicTypes msg;
+  msg.bool_value = true;
+  msg.byte_value = 255;
+  msg.char_value = 'A';
+  msg.float32_value = 0.1f;
+  msg.float64_value = 1.0;  // Whole doubles come out as integers in the full conversion
+  msg.int8_value = -5;
+  msg.uint8_value = 200;
+  msg.int16_value = -300;
+  msg.uint16_value = 60000;
+  msg.int32_value = -70000;
+  msg.uint32_value = 4000000000u;
+  msg.int64_value = std::numeric_limits<int64_t>::min();
+  msg.uint64_value = std::numeric_limits<uint64_t>::max();
+
+  auto type_info = TypeCache::instance().get_message_type_info("test_msgs", "BasicTypes");
+  ASSERT_NE(type_info, nullptr);
+
+  EXPECT_EQ(serializer_.to_json(type_info, &msg, ProjectionOptions{}).dump(),
+            serializer_.to_json(type_info, &msg).dump());
+
+  msg.float64_value = std::nan("");
+  msg.float32_value = std::numeric_limits<float>::infinity();
+  EXPECT_EQ(serializer_.to_json(type_info, &msg, ProjectionOptions{}).dump(),
+            serializer_.to_json(type_info, &msg).dump());
+}
+
+TEST_F(FieldProjectionTest, StringTypingMatchesFullConversion) {
+  test_msgs::msg::Strings msg;
+  msg.string_value = "42";
+  msg.bounded_string_value = "true";
+
+  auto type_info = TypeCache::instance().get_message_type_info("test_msgs", "Strings");
+  ASSERT_NE(type_info, nullptr);
+
+  auto full = serializer_.to_json(type_info, &msg);
+  EXPECT_EQ(serializer_.to_json(type_info, &msg, ProjectionOptions{}).dump(), full.dump());
+
+  // A selected field has the same JSON type as in the full conversion
+  ProjectionOptions options;
+  options.fields = FieldMask::parse("string_value");
+  EXPECT_EQ(serializer_.to_json(type_info, &msg, options)["string_value"].dump(), full["string_value"].dump());
+}
+
+TEST_F(FieldProjectionTest, ProjectedFieldsMatchFullConversion) {
+  sensor_msgs::msg::LaserScan msg;
+  msg.header.frame_id = "laser";
+  msg.angle_increment = 0.25f;
+  msg.range_max = 10.0f;
+  msg.ranges = {0.0f, 1.5f, 2.0f, 0.1f};
+
+  auto type_info = TypeCache::instance().get_message_type_info("sensor_msgs", "LaserScan");
+  ASSERT_NE(type_info, nullptr);
+
+  auto full = serializer_.to_json(type_info, &msg);
+  ProjectionOptions options;
+  options.fields = FieldMask::parse("header.frame_id,ranges,range_max");
+  auto projected = serializer_.to_json(type_info, &msg, options);
+
+  EXPECT_EQ(projected["header"]["frame_id"].dump(), full["header"]["frame_id"].dump());
+  EXPECT_EQ(projected["ranges"].dump(), full["ranges"].dump());
+  EXPECT_EQ(projected["range_max"].dump(), full["range_max"].dump());
+}
+
+TEST_F(FieldProjectionTest, SelectsNestedFieldsThroughSequences) {
+  geometry_msgs::msg::PoseArray msg;
+  msg.header.frame_id = "map";
+  msg.poses.resize(3);
+  for (size_t i = 0; i < msg.poses.size(); ++i) {
+    msg.poses[i].position.x = static_cast<double>(i);
+  }
+
+  auto type_info = TypeCache::instance().get_message_type_info("geometry_msgs", "PoseArray");
+  ASSERT_NE(type_info, nullptr);
+
+  ProjectionOptions options;
+  options.fields = FieldMask::parse("header.frame_id,poses.position.x");
+  auto json = serializer_.to_json(type_info, &msg, options);
+
+  EXPECT_EQ(json.size(), 2u);
+  EXPECT_EQ(json["header"], nlohmann::json({{"frame_id", "map"}}));
+  ASSERT_EQ(json["poses"].size(), 3u);
+  EXPECT_EQ(json["poses"][2], nlohmann::json({{"position", {{"x", 2.0}}}}));
+}
+
+TEST_F(FieldProjectionTest, DecimatesPrimitiveArrays) {
+  sensor_msgs::msg::LaserScan msg;
+  msg.angle_increment = 0.5f;
+  msg.ranges = {0.0f, 1.0f, 2.0f, 3.0f, 4.0f, 5.0f, 6.0f, 7.0f};
+
+  auto type_info = TypeCache::instance().get_message_type_info("sensor_msgs", "LaserScan");
+  ASSERT_NE(type_info, nullptr);
+
+  ProjectionOptions options;
+  options.fields = FieldMask::parse("ranges,intensities,angle_increment");
+  options.arrays.stride = 3;
+  options.arrays.max_length = 2;
+  auto json = serializer_.to_json(type_info, &msg, options);
+
+  EXPECT_EQ(json["ranges"], nlohmann::json({0.0, 3.0}));
+  EXPECT_TRUE(json["intensities"].is_array());
+  EXPECT_TRUE(json["intensities"].empty());
+  EXPECT_NEAR(json["angle_increment"].get<double>(), 0.5, 1e-6);
+}
+
+TEST_F(FieldProjectionTest, UnknownFieldThrows) {
+  std_msgs::msg::String msg;
+  auto type_info = TypeCache::instance().get_message_type_info("std_msgs", "String");
+  ASSERT_NE(type_info, nullptr);
+
+  ProjectionOptions options;
+  options.fields = FieldMask::parse("missing");
+  EXPECT_THROW(serializer_.to_json(type_info, &msg, options), FieldProjectionError);
+
+  options.fields = FieldMask::parse("data.length");
+  EXPECT_THROW(serializer_.to_json(type_info, &msg, options), FieldProjectionError);
+}
+
+TEST_F(FieldProjectionTest, ValidateProjectionWithoutMessage) {
+  EXPECT_NO_THROW(
+      serializer_.validate_projection("sensor_msgs/msg/LaserScan", FieldMask::parse("header.stamp,ranges")));
+  EXPECT_NO_THROW(serializer_.validate_projection("sensor_msgs/msg/LaserScan", FieldMask{}));
+
+  try {
+    serializer_.validate_projection("sensor_msgs/msg/LaserScan", FieldMask::parse("header.missing"));
+    FAIL() << "Expected FieldProjectionError";
+  } catch (const FieldProjectionError & e) {
+    EXPECT_EQ(e.field_path(), "header.missing");
+  }
+  EXPECT_THROW(serializer_.validate_projection("sensor_msgs/msg/LaserScan", FieldMask::parse("ranges.x")),
+               FieldProjectionError);
+}
+
+}  // namespace ros2_medkit_serialization
+
+int main(int argc, char ** argv) {
+  testing::InitGoogleTest(&argc, argv);
+  return RUN_ALL_TESTS();
+}